@@ -34,6 +34,8 @@ update_staff() - also performs assign_staff_to_room API if corresponding
 attributes specified
 add_reservation() - also performs check-in/check-out APIs and may call
 update_staff() API if corresponding attributes specified
+book_room() - locks the reserved room and checks its reservations before it
+performs add_reservation() API
 update_reservation() - also performs check-in/check-out APIs and may call
 update_staff() API if corresponding attributes specified
 
@@ -56,9 +58,297 @@ All APIs return Pandas DataFrame to the front-end layer.
 
 # Import required Python and MySQL libraries
 import mysql.connector as maria_db
+import numpy as np
 import pandas as pd
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
+from intervals import RoomIntervalIndex, to_date
+from mysql.connector import errorcode
+from pool import ConnectionPool
 from queries import *
+from replicas import ReplicaSet
+from rollups import DAILY_OCCUPANCY_TABLE, DAILY_REVENUE_TABLE, \
+    get_reservation_transactions, get_room_reservations, \
+    update_daily_occupancy, update_daily_revenue
+from rows import ResultSet, RESULT_FRAME, RESULT_ROWS, RESULT_MODES
+from staffpool import DEDICATED_ROLES, StaffPool
+from statements import StatementCache
+from stats import ApiStats
+
+# Default number of tuples inserted by one multi-row INSERT of the bulk APIs
+BULK_CHUNK_SIZE = 500
+
+# Default number of tuples in one chunk yielded by iter_data_frame()
+EXPORT_CHUNK_SIZE = 10000
+
+# Locking clause of the queries locking free dedicated staff, and the one used
+# if the server does not support SKIP LOCKED (before MariaDB 10.6)
+LOCK_SKIP_LOCKED = 'FOR UPDATE SKIP LOCKED'
+LOCK_FOR_UPDATE = 'FOR UPDATE'
+
+# Fraction of the cost discounted to customers paying with the hotel credit
+# card
+HOTEL_CARD_DISCOUNT = Decimal('0.05')
+
+# Columns of the itemized charges and of the total amount due of a bill
+BILL_ITEMIZED_COLUMNS = ('Transaction ID', 'Amount', 'Description', 'Date')
+BILL_TOTAL_COLUMNS = ('Cost', 'Discount', 'Total Amount Due')
+
+# Attributes identifying a tuple in each table. Tables identified by 'id' use
+# AUTO_INCREMENT to generate it.
+TABLE_KEYS = {
+    'ZipToCityState': ('zip',),
+    'Hotels': ('id',),
+    'Rooms': ('hotel_id', 'room_number'),
+    'Staff': ('id',),
+    'Customers': ('id',),
+    'Reservations': ('id',),
+    'Transactions': ('id',),
+    'Serves': ('staff_id', 'reservation_id')
+}
+
+# Tables of the room catalog. Writes into them (incl. cascading updates and
+# deletes of reservations) discard the in-process interval index.
+ROOM_CATALOG_TABLES = ('ZipToCityState', 'Hotels', 'Rooms')
+
+# Tables written by the cascading foreign keys of each table
+CASCADING_TABLES = {
+    'ZipToCityState': ('Hotels', 'Staff', 'Customers'),
+    'Hotels': ('Rooms', 'Staff'),
+    'Rooms': ('Staff', 'Reservations'),
+    'Customers': ('Reservations',),
+    'Reservations': ('Transactions', 'Serves'),
+    'Staff': ('Serves',)
+}
+
+# Tables read by each report API. Writes into any of them (incl. cascading
+# writes) invalidate the cached results of the report.
+REPORT_TABLES = {
+    'report_occupancy_by_hotel': ('Hotels', 'Rooms', 'Reservations'),
+    'report_occupancy_by_room_type': ('Hotels', 'Rooms', 'Reservations'),
+    'report_occupancy_by_city': ('ZipToCityState', 'Hotels', 'Rooms',
+                                 'Reservations'),
+    'report_occupancy_by_date_range': ('Rooms', 'Reservations'),
+    'report_occupancy_combined': ('ZipToCityState', 'Hotels', 'Rooms',
+                                  'Reservations'),
+    'report_occupancy_time_series': ('Hotels', 'Rooms', 'Reservations'),
+    'report_staff_by_role': ('Staff',),
+    'report_customer_interactions': ('Staff', 'Serves'),
+    'report_revenue_single_hotel': ('Hotels', 'Reservations',
+                                    'Transactions'),
+    'report_revenue_all_hotels': ('Hotels', 'Reservations', 'Transactions')
+}
+
+# Public methods of the Apps class that are not instrumented as APIs. The
+# generator of iter_data_frame() reads its chunks after the call returns.
+UNINSTRUMENTED_METHODS = ('connection', 'discard_local_state',
+                          'commit_local_state', 'fresh_reads',
+                          'iter_data_frame', 'stats', 'reset_stats')
+
+
+def _filter_matches(value, wanted):
+    """
+    Compares a value with a filtering value the way MySQL compares them in a
+    WHERE clause: numbers by value and strings ignoring case and trailing
+    spaces. NULL matches nothing.
+
+    Parameters:
+        :param value: Value of an attribute
+        :param wanted: Filtering value
+
+    Returns:
+        :return: Boolean whether the value matches
+    """
+    if value is None or wanted is None:
+        return False
+    if isinstance(value, (int, long, float, Decimal)):
+        try:
+            return float(value) == float(wanted)
+        except (TypeError, ValueError):
+            return False
+    if isinstance(value, str):
+        value = value.decode('utf-8')
+    if isinstance(wanted, str):
+        wanted = wanted.decode('utf-8')
+    return unicode(value).rstrip(' ').lower() == \
+        unicode(wanted).rstrip(' ').lower()
+
+
+def get_bulk_rows(rows):
+    """
+    Converts rows given to the bulk APIs into a list of dictionaries.
+
+    Rows of a Pandas DataFrame are converted into dictionaries leaving out
+    missing (NaN/None) values, so that the attributes get generated
+    (AUTO_INCREMENT) or set to NULL by MySQL. NumPy values are converted into
+    Python values.
+
+    Parameters:
+        :param rows: List of dictionaries or Pandas DataFrame
+
+    Returns:
+        :return: List of dictionaries of attributes and values
+    """
+    if isinstance(rows, pd.DataFrame):
+        return [{attr: value.item() if isinstance(value, np.generic) else value
+                 for attr, value in record.iteritems() if not pd.isnull(value)}
+                for record in rows.to_dict('records')]
+    return [dict(row) for row in rows]
+
+
+def get_cascading_tables(table_name):
+    """
+    Determines tables written by a write into a table, including the tables
+    written by its cascading foreign keys.
+
+    Parameters:
+        :param table_name: Name of the written table
+
+    Returns:
+        :return: Set of table names, including the given one
+    """
+    tables = set()
+    pending = [table_name]
+    while pending:
+        table = pending.pop()
+        if table not in tables:
+            tables.add(table)
+            pending.extend(CASCADING_TABLES.get(table, ()))
+    return tables
+
+
+def _occupancy_percent(occupied, total):
+    """
+    Computes occupancy percentages the way the occupancy report queries do.
+
+    MariaDB divides the room counts with four decimal places, rounded half up,
+    before the queries multiply by 100. The percentages are rounded the same
+    way in integers, as rounding binary floats leaves values like
+    16.669999999999998 instead of 16.67.
+
+    Parameters:
+        :param occupied: Array or Pandas Series of numbers of occupied rooms
+        :param total: Array or Pandas Series of numbers of total rooms,
+        broadcast against occupied
+
+    Returns:
+        :return: Array of percentages with two decimal places, NaN where the
+        number of total rooms is 0 (MariaDB returns NULL)
+    """
+    occupied = np.asarray(occupied, dtype=np.int64)
+    total = np.asarray(total, dtype=np.int64)
+    divisor = np.where(total > 0, total, 1)
+    # Ten thousandths of the ratio, rounded half up
+    ratio = (occupied * 20000 + divisor) // (2 * divisor)
+    return np.where(total > 0, ratio / 100.0, np.nan)
+
+
+def _group_occupancy(data_frame, columns):
+    """
+    Groups the number of occupied and total rooms of the combined occupancy
+    report.
+
+    Parameters:
+        :param data_frame: Pandas DataFrame with the Rooms Occupied and Total
+        Rooms columns and the grouping columns
+        :param columns: List of grouping columns. The first one is the key of
+        the groups and only the last one is reported.
+
+    Returns:
+        :return: Pandas DataFrame with the last grouping column and the
+        Rooms Occupied, Total Rooms and % Occupancy columns, sorted by the
+        first grouping column
+    """
+    grouped = data_frame.groupby(columns, sort=True)[
+        ['Rooms Occupied', 'Total Rooms']].sum().reset_index()
+    grouped['% Occupancy'] = _occupancy_percent(grouped['Rooms Occupied'],
+                                                grouped['Total Rooms'])
+    return grouped[[columns[-1], 'Rooms Occupied', 'Total Rooms',
+                    '% Occupancy']]
+
+
+def _build_bill(is_hotel_card, charges):
+    """
+    Computes the total amount due of itemized charges.
+
+    Amounts are computed in Decimal and rounded half up to cents, as MariaDB
+    rounds exact values, so the bill is the same as if computed by a query.
+
+    Parameters:
+        :param is_hotel_card: Boolean whether the customer pays with the hotel
+        credit card and gets the discount
+        :param charges: List of tuples with the values of the
+        BILL_ITEMIZED_COLUMNS
+
+    Returns:
+        :return: List with two ResultSets: itemized charges and total amount
+        due. If there are no charges, all values of the total amount due are
+        None.
+    """
+    if charges:
+        cost = sum(charge[1] for charge in charges)
+        discount = cost * (HOTEL_CARD_DISCOUNT if is_hotel_card else 0)
+        totals = [(cost,
+                   discount.quantize(Decimal('0.01'), ROUND_HALF_UP),
+                   (cost - discount).quantize(Decimal('0.01'), ROUND_HALF_UP))]
+    else:
+        totals = [(None, None, None)]
+    return [ResultSet(BILL_ITEMIZED_COLUMNS, charges),
+            ResultSet(BILL_TOTAL_COLUMNS, totals)]
+
+
+def _get_reserved_room_dates(reservation):
+    """
+    Extracts the room and dates of a reservation.
+
+    Parameters:
+        :param reservation: Dictionary of reservation attributes and values
+
+    Returns:
+        :return: Tuple of hotel ID, room number, start date and end date
+    """
+    return (reservation['hotel_id'], reservation['room_number'],
+            reservation['start_date'], reservation['end_date'])
+
+
+def _get_transaction_revenue(transaction):
+    """
+    Extracts the reservation, amount and date of a transaction.
+
+    Parameters:
+        :param transaction: Dictionary of transaction attributes and values
+
+    Returns:
+        :return: Tuple of reservation ID, amount and date
+    """
+    return (transaction['reservation_id'], transaction['amount'],
+            transaction['date'])
+
+
+class _ConnectionBinding(threading.local):
+    """
+    Connection and cursor the APIs use in the current thread.
+
+    This is private class of the module and not intended to be referenced
+    outside of the module. Every thread gets its own binding initialized with
+    the constructor arguments, so threads sharing an Apps object with a
+    ConnectionPool use their own connections and cursors.
+    """
+    def __init__(self, connection=None, cursor=None):
+        self.connection = connection
+        self.cursor = cursor
+        # Number of nested connection() calls
+        self.checkout_depth = 0
+        # Tables written since the last commit_local_state()
+        self.written_tables = set()
+        # Number of nested fresh_reads() calls
+        self.fresh_depth = 0
+        # Time until which reads stay on the primary after committed writes
+        self.primary_until = 0
 
 
 # This is the Apps class that contains all program applications (APIs)
@@ -84,8 +374,112 @@ class Apps(object):
     check parameter:
 
     object = Apps(maria_db_connection)
+
+    Instead of a single MariaDB connection, the class may be instantiated with
+    a ConnectionPool (pool.py). In that case a connection is checked out of the
+    pool per operation, therefore all APIs must be called within the
+    connection() context manager (AppsClient does it for every operation):
+
+    object = Apps(connection_pool)
+    with object.connection():
+        object.add_hotel(hotel_dict)
+
+    The INSERT, UPDATE, DELETE and simple SELECT statements generated by the
+    private helpers are cached per statement shape and executed as server-side
+    prepared statements (statements.py). To execute them as plain text queries
+    instead, disable the prepared parameter:
+
+    object = Apps(maria_db_connection, prepared=False)
+
+    By default, every API that writes into a table queries the written
+    tuple(s) back from the table and returns them. To build the returned
+    tuple(s) from the written values instead (saving one query per write),
+    disable the read_back parameter:
+
+    object = Apps(maria_db_connection, read_back=False)
+
+    The APIs that read data (get_data_frame(), room_availability(),
+    generate_bill() and report APIs) return Pandas DataFrames by default. In
+    the rows result mode they return lightweight ResultSet objects (rows.py)
+    instead, which build the DataFrame only on demand. The mode may be set for
+    all calls or per call of get_data_frame() and report APIs:
+
+    object = Apps(maria_db_connection, result_mode=RESULT_ROWS)
+    result = object.get_data_frame('*', 'Hotels', result_mode=RESULT_ROWS)
+    data_frame = result.to_data_frame()
+
+    Room availability and reservation conflicts may be checked in memory by
+    an interval index of all reservation dates (intervals.py), which is loaded
+    on first use and kept up to date by the reservation APIs of this object.
+    The index is only correct as long as no other process or object writes
+    into the Reservations, Rooms, Hotels or ZipToCityState tables, and it must
+    be discarded by discard_local_state() once a transaction that wrote into
+    them gets rolled back (AppsClient does it automatically):
+
+    object = Apps(maria_db_connection, interval_index=True)
+
+    Call counts, errors, returned rows and latency percentiles of every public
+    API and private query helper are recorded if the stats parameter is
+    enabled (stats.py). Without it, the APIs are not instrumented at all:
+
+    object = Apps(maria_db_connection, stats=True)
+    print object.stats()['room_availability']['p95_ms']
+
+    Statements slower than a threshold may be logged together with their
+    EXPLAIN plans into a rotating local file (slowlog.py):
+
+    object = Apps(maria_db_connection,
+                  slow_query_log=SlowQueryLog('slow_queries.log', 0.2))
+
+    Once the summary tables (rollups.py) are created by the schema migrations,
+    the APIs keep them up to date in the same transaction as the reservations,
+    rooms and transactions they summarize. The occupancy and revenue reports
+    read them instead of the Reservations and Transactions tables if the
+    rollups parameter is enabled:
+
+    object = Apps(maria_db_connection, rollups=True)
+
+    Results of the report APIs may be cached in memory (reportcache.py). The
+    cache is invalidated by every write of the APIs into a table the report
+    reads, so the cached reports are exact within a connection. Writes are
+    published to other connections sharing the cache by commit_local_state()
+    once they get committed, and the cache is cleared by discard_local_state()
+    once they get rolled back (AppsClient does both automatically):
+
+    object = Apps(maria_db_connection, report_cache=ReportCache(ttl=300))
+
+    Free dedicated staff for Presidential Suite check-ins may be taken from an
+    in-process pool (staffpool.py) instead of scanning the Staff table:
+
+    object = Apps(maria_db_connection, staff_pool=True)
+
+    An Apps object given a ConnectionPool may be shared by several threads.
+    Every thread calling connection() checks out its own connection and cursor,
+    which the APIs called by that thread use, while the statement cache, the
+    staff pool and the report cache are shared. The interval index cannot be
+    enabled, since it would miss the reservations of concurrent transactions:
+
+    object = Apps(ConnectionPool(size=4, host=HOST, user=USER,
+                                 password=PASSWORD, database=DATABASE))
+    with object.connection() as con, sql_transaction(con):
+        object.add_reservation(reservation_dict)
+
+    Reports, room availability and bills may be read from replicas
+    (replicas.py), while the writes and all other reads use the primary
+    connection. Reads of a thread stay on the primary while its transaction
+    has written data and for the read-your-writes window of the replica set
+    after commit_local_state() (AppsClient calls it automatically). Callers
+    that need fresh data read from the primary within fresh_reads():
+
+    object = Apps(primary_pool, replicas=ReplicaSet([replica_pool], max_lag=5))
+    with object.fresh_reads():
+        bill = object.generate_bill(reservation_id)
     """
-    def __init__(self, maria_db_connection, check=False):
+    def __init__(self, maria_db_connection, check=False, prepared=True,
+                 read_back=True, result_mode=RESULT_FRAME,
+                 interval_index=False, stats=False, slow_query_log=None,
+                 rollups=False, report_cache=None, staff_pool=False,
+                 replicas=None):
         """
         Constructor method for the Apps class
 
@@ -96,20 +490,268 @@ class Apps(object):
             :param maria_db_connection: MariaDB connection that created in the
             caller application based on the host, user, password, and database
             arguments. For this project host=classdb2.csc.ncsu.edu
+            It may also be a ConnectionPool, from which a connection is checked
+            out per operation by the connection() context manager.
             :param check: MySQL CHECK constraint boolean. Since CHECK
             constraint is ignored by all MySQL engines, all the check
             constraints must be performed at the application level.
+            :param prepared: Boolean whether the statements generated by the
+            private helpers are executed as server-side prepared statements.
+            The generated query text is cached either way.
+            :param read_back: Boolean whether the written tuple(s) are queried
+            back from the table. If False, the returned tuple(s) are built
+            from the written values and the ID generated by the INSERT query.
+            Such values are returned exactly as given (e.g. dates as strings)
+            and attributes not written are NULL.
+            :param result_mode: Default result mode of the APIs that read data:
+            RESULT_FRAME (Pandas DataFrame) or RESULT_ROWS (ResultSet)
+            :param interval_index: Boolean whether room availability and
+            reservation conflicts are checked by the in-process interval index
+            instead of queries. It cannot be enabled with a ConnectionPool.
+            :param stats: Boolean whether calls of the public APIs and private
+            query helpers are recorded and reported by stats()
+            :param slow_query_log: SlowQueryLog logging the statements executed
+            by the query helpers that are slower than its threshold. If None,
+            statements are not timed.
+            :param rollups: Boolean whether the occupancy and revenue reports
+            read the DailyOccupancy and DailyRevenue summary tables instead of
+            the Reservations and Transactions tables
+            :param report_cache: ReportCache keeping the results of the report
+            APIs. If None, reports are not cached.
+            :param staff_pool: Boolean whether free dedicated staff is taken
+            from the in-process staff pool instead of queried from the Staff
+            table
+            :param replicas: ReplicaSet the reports, room availability and
+            bills are read from. If None, all reads use the primary connection.
+            Reports read from a replica are kept in the report cache apart
+            from the ones read from the primary, and at most for the maximum
+            lag of the replica set (the TTL of the cache if it is None), so a
+            cached replica report may miss the writes of up to twice the
+            maximum lag.
 
         Returns:
             :return:
 
         TODO:
         """
-        self.maria_db_connection = maria_db_connection
-        self.cursor = maria_db_connection.cursor()
+        self.pool = None
+        if isinstance(maria_db_connection, ConnectionPool):
+            self.pool = maria_db_connection
+            maria_db_connection = None
+        self._binding = _ConnectionBinding(
+            maria_db_connection, maria_db_connection.cursor()
+            if maria_db_connection is not None else None)
         self.check = check
+        self.statements = StatementCache(prepared=prepared)
+        self.read_back = read_back
+        assert result_mode in RESULT_MODES, \
+            'Exception: Result mode must be one of: {}.\n'.format(
+                ', '.join(RESULT_MODES))
+        self.result_mode = result_mode
+        self._table_columns = {}
+        # The index is loaded from the snapshot of one transaction and checks
+        # conflicts only in memory, so concurrent transactions of the threads
+        # sharing the object could reserve the same room
+        assert not interval_index or self.pool is None, \
+            'Exception: Interval index cannot be shared by the threads of a ' \
+            'connection pool.\n'
+        self.interval_index = RoomIntervalIndex() if interval_index else None
+        self.staff_pool = StaffPool() if staff_pool else None
+        # Locking clause of the queries locking free dedicated staff
+        self._staff_lock_clause = LOCK_SKIP_LOCKED
+        self._room_catalog = None
+        self.slow_query_log = slow_query_log
+        self.rollups = rollups
+        # Table name -> boolean whether the summary table exists
+        self._summary_tables = {}
+        self.report_cache = report_cache
+        assert replicas is None or isinstance(replicas, ReplicaSet), \
+            'Exception: Replicas must be given as ReplicaSet.\n'
+        self.replicas = replicas
+        self._api_stats = None
+        if stats:
+            self._instrument()
+
+    def _instrument(self):
+        """
+        Replaces the public APIs and private query helpers of this object with
+        instrumented wrappers recording every call.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by the
+        constructor when the stats parameter is enabled. The wrappers are
+        attributes of the object, so the class and other objects are not
+        affected.
+
+        Returns:
+            :return:
+        """
+        self._api_stats = ApiStats()
+        for name in dir(type(self)):
+            if name.startswith('_execute_') or \
+                    not name.startswith('_') and \
+                    name not in UNINSTRUMENTED_METHODS:
+                method = getattr(self, name)
+                if callable(method):
+                    setattr(self, name,
+                            self._api_stats.instrument(name, method))
+
+    def stats(self):
+        """
+        Reports the statistics of the calls of the public APIs and private
+        query helpers (_execute_*) recorded since the object was created or
+        since the last reset_stats().
+
+        Returns:
+            :return: Dictionary of API name and dictionary with the following
+            items (empty dictionary if the stats parameter is disabled):
+                - calls: Number of calls
+                - errors: Number of calls that raised an exception
+                - rows: Total number of returned rows
+                - total_ms: Total latency in milliseconds
+                - mean_ms: Mean latency in milliseconds
+                - p50_ms, p95_ms, p99_ms: Percentiles of the latency in
+                milliseconds
+                - max_ms: Maximum latency in milliseconds
+        """
+        if self._api_stats is None:
+            return {}
+        return self._api_stats.report()
+
+    def reset_stats(self):
+        """
+        Removes all recorded statistics of the calls.
+
+        Returns:
+            :return:
+        """
+        if self._api_stats is not None:
+            self._api_stats.reset()
+
+    @property
+    def maria_db_connection(self):
+        """
+        MariaDB connection bound to the APIs in the current thread.
+        """
+        return self._binding.connection
+
+    @property
+    def cursor(self):
+        """
+        Cursor of the connection bound to the APIs in the current thread.
+        """
+        return self._binding.cursor
+
+    @contextmanager
+    def connection(self):
+        """
+        Binds a MariaDB connection to the APIs for the duration of the wrapped
+        code.
+
+        If the class is instantiated with a ConnectionPool, it checks a
+        connection out of the pool, creates a cursor for it, and returns the
+        connection back into the pool once the wrapped code completes. Nested
+        calls reuse the connection that is already bound. If the class is
+        instantiated with a single MariaDB connection, it simply yields that
+        connection.
+
+        Example:
+        with apps.connection() as db:
+            with sql_transaction(db):
+                apps.add_hotel(hotel_dict)
+
+        Returns:
+            :return: MariaDB connection used by the APIs
+        """
+        binding = self._binding
+        if self.pool is None or binding.checkout_depth > 0:
+            binding.checkout_depth += 1
+            try:
+                yield binding.connection
+            finally:
+                binding.checkout_depth -= 1
+            return
+        con = self.pool.get_connection()
+        binding.connection = con
+        binding.cursor = con.cursor()
+        binding.checkout_depth = 1
+        try:
+            yield con
+        finally:
+            binding.checkout_depth = 0
+            try:
+                binding.cursor.close()
+            except maria_db.Error:
+                pass
+            binding.cursor = None
+            binding.connection = None
+            self.pool.put_connection(con)
+
+    def discard_local_state(self):
+        """
+        Discards data kept in memory that mirrors the tables: the interval
+        index of reservation dates, the room catalog, the staff pool and the
+        cached reports. They get loaded again on next use.
+
+        It must be called once a transaction that wrote into the tables gets
+        rolled back, or once any other process or object writes into them.
+
+        Returns:
+            :return:
+        """
+        # Threads still using the previous index or pool keep a consistent
+        # copy, the next use loads new ones
+        if self.interval_index is not None:
+            self.interval_index = RoomIntervalIndex()
+        self._room_catalog = None
+        if self.staff_pool is not None:
+            self.staff_pool = StaffPool()
+        if self.report_cache is not None:
+            self.report_cache.clear()
+        self._binding.written_tables = set()
+
+    def commit_local_state(self):
+        """
+        Publishes the writes of a committed transaction to the report cache.
 
-    def get_data_frame(self, attributes, table_name, where_clause_dict=None):
+        Reports cached by other connections sharing the report cache while
+        the transaction was open do not contain its writes. They are
+        invalidated by this method, which must be called once the transaction
+        gets committed.
+
+        Returns:
+            :return:
+        """
+        if self.report_cache is not None:
+            for table_name in self._binding.written_tables:
+                self.report_cache.invalidate(table_name)
+        if self.replicas is not None and self._binding.written_tables:
+            # Replicas may not have applied the writes yet
+            self._binding.primary_until = \
+                time.time() + self.replicas.read_your_writes
+        self._binding.written_tables = set()
+
+    @contextmanager
+    def fresh_reads(self):
+        """
+        Reads from the primary connection within the wrapped code, even if
+        the APIs would read from a replica.
+
+        Example:
+        with apps.fresh_reads():
+            availability = apps.room_availability(dictionary)
+
+        Returns:
+            :return:
+        """
+        self._binding.fresh_depth += 1
+        try:
+            yield
+        finally:
+            self._binding.fresh_depth -= 1
+
+    def get_data_frame(self, attributes, table_name, where_clause_dict=None,
+                       result_mode=None):
         """
         Generates Pandas DataFrame with desired tuple(s)/row(s) in a table.
 
@@ -127,26 +769,484 @@ class Apps(object):
             :param where_clause_dict: Dictionary of attributes and values used
             for generating WHERE clause. If all tuples/rows in a table are
             desired to be selected at once, this argument must be None.
+            :param result_mode: RESULT_FRAME or RESULT_ROWS. If None, the
+            result mode of the class is used.
 
         Returns:
             :return: Pandas DataFrame (two-dimensional size-mutable,
             heterogeneous tabular data structure with labeled axes) containing
-            desired tuple(s)/row(s)
+            desired tuple(s)/row(s), or ResultSet in the rows result mode
 
         TODO:
         """
         # Build select query
+        select_query, where_values = self._build_select_query(
+            attributes, table_name, where_clause_dict)
+        # Execute select query
+        data_frame = self._read_sql(select_query, where_values, result_mode)
+        return data_frame
+
+    def iter_data_frame(self, attributes, table_name, where_clause_dict=None,
+                        date_window=None, chunk_size=EXPORT_CHUNK_SIZE,
+                        result_mode=None):
+        """
+        Generates desired tuple(s)/row(s) in a table in chunks of fixed size.
+
+        Unlike get_data_frame(), it does not load the whole result into
+        memory. The SELECT query is executed with an unbuffered cursor, which
+        reads the tuples from the server as the chunks are consumed, so the
+        memory used is bounded by the chunk size (e.g. to export Transactions
+        table with years of data). The connection cannot be used by other APIs
+        until the generator is exhausted or closed. Tuples not consumed by a
+        closed generator are skipped. Like the reports, the tuples are read
+        from a replica if the class is instantiated with replicas.
+
+        Example:
+        window = ('date', '2017-01-01', '2017-12-31')
+        for chunk in apps.iter_data_frame('*', 'Transactions', None, window):
+            chunk.to_csv(output, header=False)
+
+        Parameters:
+            :param attributes: Comma-separated list of attributes desired to be
+            shown in the resulting chunks (e.g. '*').
+            :param table_name: Name of the table on which SELECT query is
+            performed
+            :param where_clause_dict: Dictionary of attributes and values used
+            for generating WHERE clause. If all tuples/rows in a table are
+            desired, this argument must be None.
+            :param date_window: Tuple of DATE or DATETIME attribute name, start
+            date and end date (YYYY-MM-DD). Only tuples whose attribute falls
+            on any day from the start date to the end date are generated. If
+            None, dates are not filtered.
+            :param chunk_size: Maximum number of tuples in one chunk
+            :param result_mode: RESULT_FRAME or RESULT_ROWS. If None, the
+            result mode of the class is used.
+
+        Returns:
+            :return: Generator of Pandas DataFrames (or ResultSets in the rows
+            result mode). The first chunk is generated even if it is empty, so
+            the attribute names are always known.
+        """
+        assert chunk_size > 0, 'Exception: Chunk size must be positive.\n'
+        if date_window is not None:
+            assert len(date_window) == 3, \
+                'Exception: Date window must contain attribute name, start ' \
+                'date and end date.\n'
+        if result_mode is None:
+            result_mode = self.result_mode
+        select_query, where_values = self._build_select_query(
+            attributes, table_name, where_clause_dict, date_window)
+        if self._use_replica():
+            with self.replicas.connection() as con:
+                if con is not None:
+                    for chunk in self._iter_sql(con, select_query,
+                                                where_values, chunk_size,
+                                                result_mode):
+                        yield chunk
+                    return
+        for chunk in self._iter_sql(self.maria_db_connection, select_query,
+                                    where_values, chunk_size, result_mode):
+            yield chunk
+
+    @staticmethod
+    def _build_select_query(attributes, table_name, where_clause_dict=None,
+                            date_window=None):
+        """
+        Generates SELECT query for desired attributes of a table.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by
+        get_data_frame() and iter_data_frame().
+
+        Parameters:
+            :param attributes: Comma-separated list of attributes
+            :param table_name: Name of the table
+            :param where_clause_dict: Dictionary of attributes and values used
+            for generating WHERE clause, or None
+            :param date_window: Tuple of attribute name, start date and end
+            date (see iter_data_frame()), or None
+
+        Returns:
+            :return: Tuple of SELECT query and list of its values
+        """
         select_query = 'SELECT {} FROM {}'.format(attributes, table_name)
-        # Add where clause
+        conditions = []
         where_values = []
         if where_clause_dict:
-            select_query += ' WHERE {}'.format(
-                ' AND '.join([key + '=%s' for key in where_clause_dict.keys()]))
+            conditions = [key + '=%s' for key in where_clause_dict.keys()]
             where_values = where_clause_dict.values()
-        # Execute select query
-        data_frame = pd.read_sql(select_query, params=where_values,
-                                 con=self.maria_db_connection)
-        return data_frame
+        if date_window is not None:
+            # Range on the attribute itself may use its index
+            date_attr, start_date, end_date = date_window
+            conditions.append('{0} >= %s AND {0} < DATE_ADD(%s, INTERVAL 1 '
+                              'DAY)'.format(date_attr))
+            where_values = list(where_values) + [start_date, end_date]
+        if conditions:
+            select_query += ' WHERE {}'.format(' AND '.join(conditions))
+        return select_query, where_values
+
+    def _iter_sql(self, con, query, params, chunk_size, result_mode):
+        """
+        Executes SELECT query with an unbuffered cursor and generates its
+        result in chunks.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by
+        iter_data_frame().
+
+        Parameters:
+            :param con: MariaDB connection the query is executed on
+            :param query: SELECT query in python format
+            :param params: List of values used for the query
+            :param chunk_size: Maximum number of tuples in one chunk
+            :param result_mode: RESULT_FRAME or RESULT_ROWS
+
+        Returns:
+            :return: Generator of Pandas DataFrames or ResultSets
+        """
+        cursor = con.cursor(buffered=False)
+        try:
+            cursor.execute(query, params)
+            columns = cursor.column_names
+            # Types let the export writers type attributes that are NULL in
+            # the first chunk
+            types = [column[1] for column in cursor.description]
+            rows = cursor.fetchmany(chunk_size)
+            while True:
+                result = ResultSet(columns, rows, types)
+                yield result.to_data_frame() \
+                    if result_mode == RESULT_FRAME else result
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+        finally:
+            # Unread tuples of a closed generator must be read before the
+            # connection executes another query
+            try:
+                while cursor.fetchmany(chunk_size):
+                    pass
+            except maria_db.Error:
+                pass
+            cursor.close()
+
+    def _read_sql(self, query, params=None, result_mode=None, con=None):
+        """
+        Executes SELECT query and returns its result in desired result mode.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced by all APIs
+        that read data.
+        In the DataFrame result mode, it reads the result by pandas.read_sql().
+        In the rows result mode, it fetches the result with the cursor of the
+        class directly into a ResultSet, without involving Pandas.
+
+        Parameters:
+            :param query: SELECT query in python format
+            :param params: List of values used for the query
+            :param result_mode: RESULT_FRAME or RESULT_ROWS. If None, the
+            result mode of the class is used.
+            :param con: MariaDB connection of a replica the query is executed
+            on with its own cursor. If None, the primary connection is used.
+
+        Returns:
+            :return: Pandas DataFrame or ResultSet
+
+        TODO:
+        """
+        if result_mode is None:
+            result_mode = self.result_mode
+        if con is None:
+            con = self.maria_db_connection
+        if self.slow_query_log is not None:
+            start_time = time.time()
+        if result_mode == RESULT_FRAME:
+            result = pd.read_sql(query, params=params, con=con)
+        elif con is self.maria_db_connection:
+            self.cursor.execute(query, params)
+            result = ResultSet(self.cursor.column_names,
+                               self.cursor.fetchall())
+        else:
+            cursor = con.cursor()
+            try:
+                cursor.execute(query, params)
+                result = ResultSet(cursor.column_names, cursor.fetchall())
+            finally:
+                cursor.close()
+        if self.slow_query_log is not None:
+            self.slow_query_log.record(query, params, time.time() - start_time,
+                                       len(result))
+            # The result is read completely, so the connection is free
+            if self.slow_query_log.has_pending_plans():
+                self.slow_query_log.capture_plans(con)
+        return result
+
+    def _read_replica(self, query, params=None, result_mode=None):
+        """
+        Executes SELECT query on a replica, or on the primary connection if
+        the reads of the current thread must be fresh or no replica is usable.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by the
+        report APIs, room_availability() and the bill APIs.
+
+        Parameters:
+            :param query: SELECT query in python format
+            :param params: List of values used for the query
+            :param result_mode: RESULT_FRAME or RESULT_ROWS. If None, the
+            result mode of the class is used.
+
+        Returns:
+            :return: Pandas DataFrame or ResultSet
+        """
+        if self._use_replica():
+            with self.replicas.connection() as con:
+                if con is not None:
+                    return self._read_sql(query, params, result_mode, con)
+        return self._read_sql(query, params, result_mode)
+
+    def _use_replica(self):
+        """
+        Determines whether the reads of the current thread may use a replica.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. Reads stay on the primary
+        within fresh_reads(), while the open transaction has written data and
+        within the read-your-writes window after its commit.
+
+        Returns:
+            :return: Boolean whether a replica may be used
+        """
+        binding = self._binding
+        return self.replicas is not None and binding.fresh_depth == 0 and \
+            not binding.written_tables and time.time() >= binding.primary_until
+
+    def _read_report(self, report_name, query, params, result_mode=None):
+        """
+        Executes the query of a report API, or returns its cached result.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by the
+        report APIs. A cached DataFrame is copied, so the caller may modify it.
+        A cached ResultSet is shared. Reports read from a replica may miss
+        writes the cache versions already account for, so they are cached
+        apart from the reports read from the primary, and at most for the
+        maximum lag of the replicas.
+
+        Parameters:
+            :param report_name: Name of the report API (key of REPORT_TABLES)
+            :param query: SELECT query in python format
+            :param params: List of values used for the query
+            :param result_mode: RESULT_FRAME or RESULT_ROWS. If None, the
+            result mode of the class is used.
+
+        Returns:
+            :return: Pandas DataFrame or ResultSet
+        """
+        if result_mode is None:
+            result_mode = self.result_mode
+        if self.report_cache is None:
+            return self._read_replica(query, params, result_mode)
+        replica = self._use_replica()
+        tables = REPORT_TABLES[report_name]
+        # Reads that must be fresh never get a result read from a replica
+        key = (query, tuple(params), result_mode, replica)
+        result = self.report_cache.get(key, tables)
+        if result is None:
+            # Versions are taken first, so writes during the query invalidate
+            # the result
+            versions = self.report_cache.get_versions(tables)
+            if replica:
+                result = self._read_replica(query, params, result_mode)
+                self.report_cache.put(key, tables, versions, result,
+                                      self.replicas.max_lag)
+            else:
+                result = self._read_sql(query, params, result_mode)
+                self.report_cache.put(key, tables, versions, result)
+        if isinstance(result, pd.DataFrame):
+            return result.copy()
+        return result
+
+    def _get_table_columns(self, table_name):
+        """
+        Determines names of all attributes of a table in their order.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. The table is queried only once,
+        afterwards the names are taken from the cache.
+
+        Parameters:
+            :param table_name: Name of the table
+
+        Returns:
+            :return: Tuple of attribute names
+
+        TODO:
+        """
+        if table_name not in self._table_columns:
+            self._execute_query(
+                'SELECT * FROM {} LIMIT 0'.format(table_name)).fetchall()
+            self._table_columns[table_name] = tuple(self.cursor.column_names)
+        return self._table_columns[table_name]
+
+    def _build_data_frame(self, attributes, table_name, row, row_count=1):
+        """
+        Builds Pandas DataFrame of written tuple(s) without querying the table.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by
+        internal caller functions when read-back of written tuple(s) is
+        disabled.
+
+        Parameters:
+            :param attributes: Comma-separated list of attributes desired to be
+            shown in the resulting data frame (e.g. '*')
+            :param table_name: Name of the table the tuple(s) got written into
+            :param row: Dictionary of known attributes and values of the
+            written tuple(s)
+            :param row_count: Number of written tuples (all of them share the
+            known values)
+
+        Returns:
+            :return: Pandas DataFrame with row_count identical tuples, or None
+            if values of some of the desired attributes are not known
+
+        TODO:
+        """
+        if attributes.strip() == '*':
+            columns = self._get_table_columns(table_name)
+        else:
+            columns = [attr.strip() for attr in attributes.split(',')]
+        if any(column not in row for column in columns):
+            return None
+        return pd.DataFrame([[row[column] for column in columns]] * row_count,
+                            columns=columns)
+
+    def _get_inserted_data_frame(self, table_name, dictionary, key_dict):
+        """
+        Generates Pandas DataFrame with just inserted tuple.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by
+        internal caller functions.
+        If read-back is enabled, it queries the tuple by calling helper
+        function get_data_frame(). Otherwise, it builds the tuple from the
+        inserted values and the key of the tuple, setting all attributes that
+        are not inserted to NULL.
+
+        Parameters:
+            :param table_name: Name of the table the tuple got inserted into
+            :param dictionary: Dictionary of inserted attributes and values
+            :param key_dict: Dictionary of attributes and values identifying
+            the inserted tuple (e.g. {'id': lastrowid})
+
+        Returns:
+            :return: Pandas DataFrame containing the inserted tuple
+
+        TODO:
+        """
+        if self.read_back:
+            return self.get_data_frame('*', table_name, key_dict,
+                                       RESULT_FRAME)
+        row = dict.fromkeys(self._get_table_columns(table_name))
+        row.update(dictionary)
+        row.update(key_dict)
+        return self._build_data_frame('*', table_name, row)
+
+    def _execute_query(self, query, params=None):
+        """
+        Executes a query with the regular cursor of the class.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by
+        internal functions executing fixed queries (e.g. loads of the interval
+        index and staff pool) and queries with complicated WHERE clause, which
+        are not cached statements. It records the query in the slow query log,
+        if one is given.
+
+        Parameters:
+            :param query: Query in python format
+            :param params: List of values used for the query
+
+        Returns:
+            :return: Cursor used to execute the query. The result of a SELECT
+            query must be fetched from this cursor.
+
+        TODO:
+        """
+        if self.slow_query_log is not None:
+            # Results of previous statements are read by now, so the plans of
+            # previous slow SELECT statements may be captured
+            if self.slow_query_log.has_pending_plans():
+                self.slow_query_log.capture_plans(self.maria_db_connection)
+            start_time = time.time()
+        cursor = self.cursor
+        cursor.execute(query, params)
+        if self.slow_query_log is not None:
+            self.slow_query_log.record(
+                query, params, time.time() - start_time,
+                cursor.rowcount if cursor.rowcount >= 0 else None)
+        return cursor
+
+    def _execute_statement(self, key, build_query, values=()):
+        """
+        Executes a cached statement.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by
+        internal query helper functions.
+        For a given statement shape, query generator and values, it does the
+        following:
+        1) Looks up the query text of the statement shape in the statement
+        cache and generates it only on a cache miss
+        2) Executes the query with the prepared cursor dedicated to this
+        statement on the current connection (or with the regular cursor if
+        prepared statements are disabled)
+        3) Prepares the statement again if the server no longer knows it (e.g.
+        the connection got reconnected)
+        4) Records the statement in the slow query log, if one is given
+
+        Parameters:
+            :param key: Statement shape: operation, table name and ordered
+            column names
+            :param build_query: Function without arguments that generates the
+            query text
+            :param values: List of values bound to the query placeholders
+
+        Returns:
+            :return: Cursor used to execute the statement. The result of a
+            SELECT statement must be fetched from this cursor.
+
+        TODO:
+        """
+        query = self.statements.get(key, build_query)
+        if self.slow_query_log is not None:
+            # Results of previous statements are read by now, so the plans of
+            # previous slow SELECT statements may be captured
+            if self.slow_query_log.has_pending_plans():
+                self.slow_query_log.capture_plans(self.maria_db_connection)
+            start_time = time.time()
+        cursor = self.statements.get_cursor(self.maria_db_connection, query)
+        if cursor is None:
+            cursor = self.cursor
+            cursor.execute(query, values)
+        else:
+            try:
+                cursor.execute(query, values)
+            except maria_db.Error as error:
+                if error.errno != errorcode.ER_UNKNOWN_STMT_HANDLER:
+                    raise error
+                # Server released the prepared statements of this connection
+                self.statements.discard_connection(self.maria_db_connection)
+                cursor = self.statements.get_cursor(self.maria_db_connection,
+                                                    query)
+                cursor.execute(query, values)
+        if self.slow_query_log is not None:
+            # Number of rows of SELECT statements is not known before they
+            # are read
+            self.slow_query_log.record(
+                query, values, time.time() - start_time,
+                cursor.rowcount if cursor.rowcount >= 0 else None)
+        return cursor
 
     def _execute_simple_select_query(self, attributes, table_name,
                                      where_clause_dict=None):
@@ -165,7 +1265,8 @@ class Apps(object):
         2) Generates an SELECT query statement that includes simple WHERE clause
         3) Executes this generated simple SELECT query
         The query is generated within the Python standards to prevent MySQL
-        injection.
+        injection. The query is generated only once per statement shape and
+        executed as cached (prepared) statement.
 
         Parameters:
             :param attributes: String of attributes separated by a comma for
@@ -177,21 +1278,25 @@ class Apps(object):
             desired to be selected at once, this argument can be left out.
 
         Returns:
-            :return:
+            :return: Cursor holding the result of the SELECT query
 
         TODO:
         """
-        # Generate select query statement and execute it
-        if where_clause_dict:
-            # Generate WHERE clause format only with AND key words
-            where_attr_format = ' AND '.join([attr + '=%s' for attr in
-                                              where_clause_dict.iterkeys()])
-            select_query = "SELECT {} FROM {} WHERE {}".format(
-                attributes, table_name, where_attr_format)
-            self.cursor.execute(select_query, where_clause_dict.values())
-        else:
+        where_attrs = tuple(sorted(where_clause_dict or ()))
+
+        def build_query():
+            # Generate select query statement
             select_query = "SELECT {} FROM {}".format(attributes, table_name)
-            self.cursor.execute(select_query)
+            if where_attrs:
+                # Generate WHERE clause format only with AND key words
+                select_query += ' WHERE {}'.format(
+                    ' AND '.join([attr + '=%s' for attr in where_attrs]))
+            return select_query
+
+        # Execute select query
+        return self._execute_statement(
+            ('SELECT', table_name, attributes, where_attrs), build_query,
+            [where_clause_dict[attr] for attr in where_attrs])
 
     def _execute_select_query(self, attributes, table_name, where_clause=None,
                               where_values_list=None):
@@ -221,7 +1326,7 @@ class Apps(object):
             included into SELECT query
 
         Returns:
-            :return:
+            :return: Cursor holding the result of the SELECT query
 
         TODO:
         """
@@ -230,11 +1335,9 @@ class Apps(object):
             select_query = "SELECT {} FROM {} WHERE {}".format(
                 attributes, table_name, where_clause)
             # Execute select query with complicated WHERE clause
-            self.cursor.execute(select_query, where_values_list)
-        else:
-            select_query = "SELECT {} FROM {}".format(attributes, table_name)
-            # Execute select query with complicated WHERE clause
-            self.cursor.execute(select_query)
+            return self._execute_query(select_query, where_values_list)
+        select_query = "SELECT {} FROM {}".format(attributes, table_name)
+        return self._execute_query(select_query)
 
     def _execute_insert_query(self, dictionary, table_name):
         """
@@ -249,7 +1352,8 @@ class Apps(object):
         1) Generates an INSERT query statement
         2) Executes this generated INSERT query
         The query is generated within the Python standards to prevent MySQL
-        injection.
+        injection. The query is generated only once per statement shape and
+        executed as cached (prepared) statement.
 
         Parameters:
             :param dictionary: Dictionary of attributes and values to be stored
@@ -258,16 +1362,129 @@ class Apps(object):
             executed
 
         Returns:
-            :return:
+            :return: Cursor used to execute the INSERT query (holds lastrowid)
 
         TODO:
         """
-        # Generate insert query statement
-        insert_query = "INSERT INTO {} ({}) VALUES ({})".format(
-            table_name, ', '.join(dictionary.keys()), ', '.join(
-                ['%s' for _ in dictionary.iterkeys()]))
+        attrs = tuple(sorted(dictionary))
         # Execute insert query
-        self.cursor.execute(insert_query, dictionary.values())
+        cursor = self._execute_statement(
+            ('INSERT', table_name, attrs),
+            lambda: self._generate_insert_query(table_name, attrs),
+            [dictionary[attr] for attr in attrs])
+        self._invalidate_local_state(table_name)
+        return cursor
+
+    @staticmethod
+    def _generate_insert_query(table_name, attrs):
+        """
+        Generates INSERT query statement in python format.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by
+        internal query helper functions on a statement cache miss.
+
+        Parameters:
+            :param table_name: Name of the table for which INSERT query is
+            generated
+            :param attrs: Tuple of attributes to be stored in the table
+
+        Returns:
+            :return: INSERT query statement
+
+        TODO:
+        """
+        return "INSERT INTO {} ({}) VALUES ({})".format(
+            table_name, ', '.join(attrs), ', '.join(['%s' for _ in attrs]))
+
+    def _execute_bulk_insert(self, rows, table_name, check_row,
+                             chunk_size=BULK_CHUNK_SIZE, add_row=None,
+                             needs_add_row=None):
+        """
+        Validates and inserts multiple tuples into a table at once.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by the
+        add_*_bulk() APIs.
+        For a given rows and table name, it does the following:
+        1) Validates all rows by calling check_row() (if check boolean
+        parameter is enabled) before anything gets inserted
+        2) Groups the rows by their set of attributes, since each group shares
+        one INSERT query statement from the statement cache
+        3) Inserts each group with executemany(), which sends a single
+        multi-row INSERT query statement per chunk of at most chunk_size rows
+        4) Determines key of each inserted tuple. Generated IDs are derived
+        from the first ID of each multi-row INSERT, which relies on InnoDB
+        allocating consecutive AUTO_INCREMENT values to a multi-row INSERT
+        (innodb_autoinc_lock_mode 0 or 1, the MariaDB default)
+        5) Adds rows that require additional operations (e.g. check-in) one
+        by one by calling add_row()
+        The inserted tuples are not queried back.
+
+        Parameters:
+            :param rows: List of dictionaries or Pandas DataFrame of attributes
+            and values to be stored in the table
+            :param table_name: Name of the table for which INSERT queries are
+            executed
+            :param check_row: Function validating a single row
+            :param chunk_size: Maximum number of tuples inserted by one INSERT
+            query statement
+            :param add_row: API adding a single row, used for the rows for
+            which needs_add_row() returns True
+            :param needs_add_row: Function determining whether a single row
+            requires additional operations of its add_row() API
+
+        Returns:
+            :return: Pandas DataFrame with the key attributes of each added
+            tuple, in the order of the given rows
+
+        TODO:
+        """
+        assert chunk_size > 0, \
+            'Exception: Chunk size of the bulk insert must be positive.\n'
+        rows = get_bulk_rows(rows)
+        # Validate all rows before anything gets inserted
+        if self.check:
+            for index, row in enumerate(rows):
+                try:
+                    check_row(row)
+                except AssertionError, error:
+                    raise AssertionError('Exception: Row {}: {}'.format(
+                        index, str(error).replace('Exception: ', '', 1)))
+        key_attrs = TABLE_KEYS[table_name]
+        keys = [None] * len(rows)
+        # Group rows by their attributes, keeping the order of the rows
+        groups = OrderedDict()
+        single_rows = []
+        for index, row in enumerate(rows):
+            if needs_add_row is not None and needs_add_row(row):
+                single_rows.append(index)
+            else:
+                groups.setdefault(tuple(sorted(row)), []).append(index)
+        for attrs, indexes in groups.iteritems():
+            query = self.statements.get(
+                ('INSERT', table_name, attrs),
+                lambda: self._generate_insert_query(table_name, attrs))
+            for start in xrange(0, len(indexes), chunk_size):
+                chunk = indexes[start:start + chunk_size]
+                # The regular cursor rewrites executemany() of an INSERT into
+                # a single multi-row INSERT query statement
+                self.cursor.executemany(
+                    query, [[rows[index][attr] for attr in attrs]
+                            for index in chunk])
+                self._invalidate_local_state(table_name)
+                if key_attrs == ('id',) and 'id' not in attrs:
+                    first_id = self.cursor.lastrowid
+                    for offset, index in enumerate(chunk):
+                        keys[index] = (first_id + offset,)
+                else:
+                    for index in chunk:
+                        keys[index] = tuple(rows[index].get(attr)
+                                            for attr in key_attrs)
+        for index in single_rows:
+            data_frame = add_row(rows[index])
+            keys[index] = tuple(data_frame[attr].ix[0] for attr in key_attrs)
+        return pd.DataFrame(keys, columns=key_attrs)
 
     def _execute_update_query(self, select_attributes, table_name, dictionary,
                               where_clause_dict):
@@ -285,7 +1502,11 @@ class Apps(object):
         3) Generates an WHERE clause for the SELECT query
         4) Calls a helper function get_data_frame() to retrieve updated tuple(s)
         The query is generated within the Python standards to prevent MySQL
-        injection.
+        injection. The query is generated only once per statement shape and
+        executed as cached (prepared) statement.
+        If read-back is disabled and all desired attributes are known from the
+        SET and WHERE clauses, steps 3 and 4 are skipped and the updated
+        tuple(s) are built from these values and the number of matched tuples.
 
         Parameters:
             :param select_attributes: String for the SELECT query (follows by
@@ -307,21 +1528,36 @@ class Apps(object):
 
         TODO:
         """
-        # Get all attributes for SET clause
-        set_attr_format = ', '.join([attr + '=%s' for attr in
-                                     dictionary.iterkeys()])
-        set_attr_args = dictionary.values()
-        # Get all attributes for WHERE clause
-        where_attr_format = ' AND '.join([attr + '=%s' for attr in
-                                          where_clause_dict.iterkeys()])
-        where_attr_args = where_clause_dict.values()
-        # Construct update query statement
-        update_query = "UPDATE {} SET {}".format(
-            table_name, set_attr_format)
-        if where_attr_args:
-            update_query += ' WHERE {}'.format(where_attr_format)
+        # Get all attributes for SET and WHERE clauses
+        set_attrs = tuple(sorted(dictionary))
+        where_attrs = tuple(sorted(where_clause_dict))
+
+        def build_query():
+            # Construct update query statement
+            update_query = "UPDATE {} SET {}".format(
+                table_name, ', '.join([attr + '=%s' for attr in set_attrs]))
+            if where_attrs:
+                update_query += ' WHERE {}'.format(
+                    ' AND '.join([attr + '=%s' for attr in where_attrs]))
+            return update_query
+
         # Execute update query
-        self.cursor.execute(update_query, set_attr_args + where_attr_args)
+        cursor = self._execute_statement(
+            ('UPDATE', table_name, set_attrs, where_attrs), build_query,
+            [dictionary[attr] for attr in set_attrs] +
+            [where_clause_dict[attr] for attr in where_attrs])
+        self._invalidate_local_state(table_name)
+
+        if not self.read_back:
+            # Build updated tuple(s) from the SET and WHERE clause values.
+            # mysql.connector sets CLIENT_FOUND_ROWS by default, so rowcount
+            # is the number of matched (not only changed) tuples.
+            row = dict(where_clause_dict)
+            row.update(dictionary)
+            data_frame = self._build_data_frame(select_attributes, table_name,
+                                                row, cursor.rowcount)
+            if data_frame is not None:
+                return data_frame
 
         # Generate WHERE clause for SELECT query
         select_where_clause_dict = {
@@ -331,7 +1567,8 @@ class Apps(object):
 
         # Query for this updated tuple and return it as Pandas DataFrame
         data_frame = self.get_data_frame(select_attributes, table_name,
-                                         select_where_clause_dict)
+                                         select_where_clause_dict,
+                                         RESULT_FRAME)
         return data_frame
 
     def _execute_delete_query(self, table_name, dictionary):
@@ -349,7 +1586,10 @@ class Apps(object):
         3) Generates an WHERE clause for the SELECT query
         4) Calls a helper function get_data_frame() to retrieve updated tuple(s)
         The query is generated within the Python standards to prevent MySQL
-        injection.
+        injection. The query is generated only once per statement shape and
+        executed as cached (prepared) statement.
+        If read-back is disabled, steps 3 and 4 are skipped and an empty
+        DataFrame with all attributes of the table is returned.
 
         Parameters:
             :param table_name: Name of the table for which DELETE query is
@@ -367,16 +1607,62 @@ class Apps(object):
 
         TODO:
         """
-        where_attr_delete_format = ' AND '.join([attr + '=%s' for attr in
-                                                dictionary.iterkeys()])
+        where_attrs = tuple(sorted(dictionary))
+
+        def build_query():
+            # Generate delete query statement
+            return "DELETE FROM {} WHERE {}".format(
+                table_name, ' AND '.join([attr + '=%s' for attr in
+                                          where_attrs]))
 
-        # Generate delete query statement
-        delete_query = "DELETE FROM {} WHERE {}".format(
-            table_name, where_attr_delete_format)
         # Execute delete query
-        self.cursor.execute(delete_query, dictionary.values())
+        self._execute_statement(('DELETE', table_name, where_attrs),
+                                build_query,
+                                [dictionary[attr] for attr in where_attrs])
+        self._invalidate_local_state(table_name)
+        if not self.read_back:
+            return pd.DataFrame(columns=self._get_table_columns(table_name))
         # Query this deleted tuple and return it as empty Pandas DataFrame
-        data_frame = self.get_data_frame('*', table_name, dictionary)
+        data_frame = self.get_data_frame('*', table_name, dictionary,
+                                         RESULT_FRAME)
+        return data_frame
+
+    def _execute_reservation_update(self, select_attr, reservation_dict,
+                                    where_clause_dict, reservation_ids):
+        """
+        Executes the UPDATE query of reservations and moves their transactions
+        to the new hotel in the DailyRevenue summary table.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by
+        update_reservation(), after the check-in and check-out logic, so the
+        room charge added at the check-out moves as well.
+
+        Parameters:
+            :param select_attr: Attributes of the updated tuples to be queried
+            :param reservation_dict: Dictionary of attributes and values to be
+            updated in the Reservations table
+            :param where_clause_dict: Dictionary of attributes and values used
+            for WHERE clause in the UPDATE query
+            :param reservation_ids: IDs of the updated reservations
+
+        Returns:
+            :return: Pandas DataFrame returned by _execute_update_query()
+        """
+        moved_transactions = []
+        if 'hotel_id' in reservation_dict and reservation_ids and \
+                self._has_summary_table(DAILY_REVENUE_TABLE):
+            moved_transactions = [
+                dict(zip(('reservation_id', 'amount', 'date'), transaction))
+                for transaction in get_reservation_transactions(
+                    self.cursor, reservation_ids)]
+            self._summarize_transactions(removed=moved_transactions)
+        data_frame = self._execute_update_query(
+            select_attr, 'Reservations', reservation_dict, where_clause_dict)
+        if 'id' in reservation_dict:
+            for transaction in moved_transactions:
+                transaction['reservation_id'] = reservation_dict['id']
+        self._summarize_transactions(added=moved_transactions)
         return data_frame
 
     def _check_out(self, reservation_id, check_out_time):
@@ -416,8 +1702,8 @@ class Apps(object):
         TODO: Testing
         """
         # Determine all staff assigned to this reservation
-        self.cursor.execute(QUERY_ASSIGNED_STAFF, [reservation_id])
-        staff_tuples = self.cursor.fetchall()
+        staff_tuples = self._execute_query(
+            QUERY_ASSIGNED_STAFF, [reservation_id]).fetchall()
         staff_df_result = None
         transaction_df = None
         if staff_tuples and staff_tuples[0]:
@@ -437,16 +1723,14 @@ class Apps(object):
                              'assigned_room_number': 'Staff_assigned_room'})
         # Add Room Charge transaction into Transactions table
         # Determine amount needs to be charged for the reservation
-        self._execute_simple_select_query(
+        amount = self._execute_simple_select_query(
             'rate * DATEDIFF(end_date, start_date)',
             'Rooms NATURAL JOIN Reservations',
-            {'id': reservation_id})
-        amount = self.cursor.fetchall()
+            {'id': reservation_id}).fetchall()
         # Determine number of nights customer reserved
-        self._execute_simple_select_query('DATEDIFF(end_date, start_date)',
-                                          'Reservations',
-                                          {'id': reservation_id})
-        number_nights = self.cursor.fetchall()
+        number_nights = self._execute_simple_select_query(
+            'DATEDIFF(end_date, start_date)', 'Reservations',
+            {'id': reservation_id}).fetchall()
         if amount and amount[0] and number_nights and number_nights[0]:
             transaction_df = self.add_transaction(
                 {'amount': amount[0][0],
@@ -500,132 +1784,480 @@ class Apps(object):
         there are some cursor errors.
 
         Parameters:
-            :param hotel_id: ID of a hotel is needed for identifying unique
-            reservation ID or determining whether room category in this hotel
-            is Presidential Suite
-            :param room_number: Room number is needed for identifying unique
-            reservation ID or determining whether room category is Presidential
-            Suite
-            :param staff_id: ID of the staff member that gets assigned to a
-            room. If request comes from Reservation functions, it is set to
-            None.
-            :param reservation_id: Reservation ID is needed to determine
-            whether this reservation for Presidential Suite. If request comes
-            from Staff functions, it is set to None.
+            :param hotel_id: ID of a hotel is needed for identifying unique
+            reservation ID or determining whether room category in this hotel
+            is Presidential Suite
+            :param room_number: Room number is needed for identifying unique
+            reservation ID or determining whether room category is Presidential
+            Suite
+            :param staff_id: ID of the staff member that gets assigned to a
+            room. If request comes from Reservation functions, it is set to
+            None.
+            :param reservation_id: Reservation ID is needed to determine
+            whether this reservation for Presidential Suite. If request comes
+            from Staff functions, it is set to None.
+
+        Returns:
+            :return: Single Pandas DataFrame(s) (two-dimensional
+            size-mutable, heterogeneous tabular data structure with labeled
+            axes) retrieved from internal helper functions:
+                - add_serves() - which contains a tuple with successfully
+                inserted data in the Serves table (add staff to serves)
+                - update_staff() - which contains a tuple with successfully
+                updated data the Staff table (assign staff to a room)
+
+        TODO: Testing
+        """
+        if staff_id is not None and reservation_id is None:
+            # Staff is assigned from add_staff() or update_staff() functions
+            # Determine Reservation ID
+            where_clause = "hotel_id=%s AND room_number=%s AND " \
+                           "check_in_time IS NOT NULL AND " \
+                           "TRIM(check_in_time)<>'' AND " \
+                           "(check_out_time IS NULL OR TRIM(check_out_time)='')"
+            self._execute_select_query('id', 'Reservations', where_clause,
+                                       [hotel_id, room_number])
+            reservation_tuples = self.cursor.fetchall()
+            assert reservation_tuples and len(reservation_tuples) == 1 and \
+                reservation_tuples[0], \
+                'Cannot assign staff to a room \'{}\' in hotel \'{}\' for ' \
+                'which customer either did not check-in or already ' \
+                'checked-out.\n'.format(room_number, hotel_id) \
+                if not reservation_tuples else \
+                'Found multiple active reservations for room \'{}\' in hotel ' \
+                '\'{}\' with a checked-in customer. Cannot assign staff to ' \
+                'multiple room simultaneously.\n'
+            serves_df = self.add_serves(
+                {'staff_id': staff_id,
+                 'reservation_id': reservation_tuples[0][0]})
+            serves_df = serves_df.rename(
+                index=str, columns={'staff_id': 'Serves_staff_id',
+                                    'reservation_id': 'Serves_reservation_id'})
+            return serves_df
+        if reservation_id is not None and staff_id is None:
+            # Staff is assigned from add_reservation() or
+            # update_reservation() functions
+            # Check whether Reservation is Presidential Suite
+            room_tuple = self._execute_simple_select_query(
+                'category', 'Rooms',
+                {'hotel_id': hotel_id, 'room_number': room_number}).fetchall()
+            if room_tuple and len(room_tuple) == 1 and room_tuple[0]:
+                room_category = room_tuple[0][0].split()
+                if 'presidential' in (category.lower() for category in
+                                      room_category):
+                    # This is Presidential Suite.
+                    # Verify that this reservation is still active
+                    reservation_tuple = self._execute_simple_select_query(
+                        'check_out_time', 'Reservations',
+                        {'id': reservation_id}).fetchall()
+                    if reservation_tuple is None or \
+                            not reservation_tuple[0][0] or \
+                            reservation_tuple[0][0] == 'NULL':
+                        # It needs to assign one available Catering staff
+                        # and one Room Service as dedicated staff.
+                        staff_df_result = None
+                        for role in DEDICATED_ROLES:
+                            staff_id = self._take_free_staff(hotel_id, role)
+                            if staff_id is None:
+                                continue
+                            staff_df = self.update_staff(
+                                {'assigned_hotel_id': hotel_id,
+                                 'assigned_room_number': room_number},
+                                {'id': staff_id},
+                                reservation_id=reservation_id)
+                            staff_df_result = staff_df \
+                                if staff_df_result is None else \
+                                staff_df_result.append(staff_df,
+                                                       ignore_index=True)
+                        return staff_df_result
+        return None
+
+    def _invalidate_local_state(self, table_name):
+        """
+        Discards the interval index after a write into a table of the room
+        catalog and the staff pool after a write cascading into the Staff
+        table, and invalidates the cached reports reading the written tables.
+        Writes into the Staff table itself are applied to the staff pool by
+        the Staff APIs.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by
+        internal query helper functions that write into tables.
+
+        Parameters:
+            :param table_name: Name of the table written into
+
+        Returns:
+            :return:
+        """
+        if table_name in ROOM_CATALOG_TABLES and \
+                self._room_catalog is not None:
+            self.interval_index = RoomIntervalIndex()
+            self._room_catalog = None
+        if self.staff_pool is not None and table_name != 'Staff' and \
+                'Staff' in get_cascading_tables(table_name):
+            self.staff_pool = StaffPool()
+        if self.report_cache is not None or self.replicas is not None:
+            for written_table in get_cascading_tables(table_name):
+                if self.report_cache is not None:
+                    self.report_cache.invalidate(written_table)
+                self._binding.written_tables.add(written_table)
+
+    def _lock_free_staff(self, key, build_query, values):
+        """
+        Executes a query locking a free staff member, skipping staff locked by
+        concurrent transactions.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by
+        _take_free_staff(). If the server does not support SKIP LOCKED, the
+        query waits for the locks instead.
+
+        Parameters:
+            :param key: Statement shape used for the statement cache
+            :param build_query: Function of the locking clause that generates
+            the query text
+            :param values: List of values bound to the query placeholders
+
+        Returns:
+            :return: Staff ID of the locked staff member, or None
+        """
+        while True:
+            lock_clause = self._staff_lock_clause
+            try:
+                staff_tuples = self._execute_statement(
+                    key + (lock_clause,), lambda: build_query(lock_clause),
+                    values).fetchall()
+                return staff_tuples[0][0] if staff_tuples else None
+            except maria_db.Error as error:
+                if error.errno != errorcode.ER_PARSE_ERROR or \
+                        lock_clause == LOCK_FOR_UPDATE:
+                    raise error
+                self._staff_lock_clause = LOCK_FOR_UPDATE
+
+    def _take_free_staff(self, hotel_id, role):
+        """
+        Determines and locks one free staff member of a role working for a
+        hotel.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by
+        _assign_staff_to_room(). If the staff pool is enabled, its candidates
+        are locked one by one, dropping candidates that are not free anymore
+        or locked by concurrent transactions. Once the pool has no candidate
+        left (or is disabled), the Staff table is queried.
+
+        Parameters:
+            :param hotel_id: ID of the hotel the staff works for
+            :param role: Role of the staff (e.g. 'Catering')
+
+        Returns:
+            :return: Staff ID, or None if no staff member is free
+        """
+        staff_pool = self.staff_pool
+        if staff_pool is not None:
+            if not staff_pool.loaded:
+                staff_pool.load(
+                    self._execute_query(DEDICATED_STAFF).fetchall())
+            while True:
+                staff_id = staff_pool.take(int(hotel_id), role)
+                if staff_id is None:
+                    break
+                staff_id = self._lock_free_staff(
+                    ('LOCK', 'Staff', 'id'),
+                    lambda lock_clause: QUERY_LOCK_FREE_STAFF.format(
+                        lock_clause), [staff_id])
+                if staff_id is not None:
+                    return staff_id
+        return self._lock_free_staff(
+            ('LOCK', 'Staff', 'works_for_hotel_id', 'title'),
+            lambda lock_clause: QUERY_FREE_STAFF.format(lock_clause),
+            [hotel_id, '%{}%'.format(role)])
+
+    def _update_staff_pool(self, staff_ids=(), staff_dict=None):
+        """
+        Applies a write into the Staff table to the staff pool.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by the
+        APIs writing into the Staff table. Updates that only assign staff to a
+        room or free them are applied to the loaded pool, any other write
+        discards it.
+
+        Parameters:
+            :param staff_ids: List of IDs of the updated staff
+            :param staff_dict: Dictionary of updated attributes and values. If
+            None, the write is not an update (e.g. insert or delete).
+
+        Returns:
+            :return:
+        """
+        staff_pool = self.staff_pool
+        if staff_pool is None or not staff_pool.loaded:
+            return
+        if staff_dict is not None and set(staff_dict) == {
+                'assigned_hotel_id', 'assigned_room_number'}:
+            try:
+                staff_ids = [int(staff_id) for staff_id in staff_ids]
+            except (TypeError, ValueError):
+                self.staff_pool = StaffPool()
+                return
+            if staff_dict['assigned_hotel_id'] is None and \
+                    staff_dict['assigned_room_number'] is None:
+                staff_pool.release(staff_ids)
+            else:
+                staff_pool.assign(staff_ids)
+            return
+        self.staff_pool = StaffPool()
+
+    def _get_interval_index(self):
+        """
+        Returns the interval index of reservation dates, loading it together
+        with the room catalog if it is not loaded yet.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by
+        room_availability() and _check_reservation_conflict() when the interval
+        index is enabled.
+
+        Returns:
+            :return: Tuple of the loaded RoomIntervalIndex and the room catalog
+            ResultSet. Other threads may discard the index meanwhile, so both
+            are read once per call.
+        """
+        index, catalog = self.interval_index, self._room_catalog
+        if not index.loaded or catalog is None:
+            cursor = self._execute_query(ROOM_CATALOG)
+            catalog = ResultSet(cursor.column_names, cursor.fetchall())
+            index.load([(row.Hotel_ID, row.Room_Number) for row in catalog],
+                       self._execute_query(RESERVATION_INTERVALS).fetchall())
+            self._room_catalog = catalog
+        return index, catalog
+
+    def _index_reservations(self, reservations, removed_ids=()):
+        """
+        Applies added, updated or deleted reservations to the interval index.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by the
+        APIs of the Reservations table. Nothing is done if the index is not
+        loaded, since it reads all reservations once it is loaded. If the room
+        or dates of any reservation are not known, the index is discarded.
+
+        Parameters:
+            :param reservations: List of dictionaries of reservation attributes
+            and values (id, hotel_id, room_number, start_date, end_date)
+            :param removed_ids: List of IDs of reservations removed before the
+            given reservations are added (e.g. deleted reservations or previous
+            IDs of updated reservations)
+
+        Returns:
+            :return:
+        """
+        index = self.interval_index
+        if index is None or not index.loaded:
+            return
+        for reservation_id in removed_ids:
+            index.remove(int(reservation_id))
+        try:
+            for reservation in reservations:
+                index.add(
+                    int(reservation['id']), int(reservation['hotel_id']),
+                    int(reservation['room_number']),
+                    reservation['start_date'], reservation['end_date'])
+        except (KeyError, TypeError, ValueError):
+            self.discard_local_state()
+
+    def _has_summary_table(self, table_name):
+        """
+        Checks whether a summary table is created by the schema migrations.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. The result is kept for the
+        lifetime of the object.
+
+        Parameters:
+            :param table_name: Name of the summary table
+
+        Returns:
+            :return: Boolean whether the table exists
+        """
+        if table_name not in self._summary_tables:
+            self._summary_tables[table_name] = self._execute_query(
+                'SELECT COUNT(*) FROM information_schema.tables '
+                'WHERE table_schema = DATABASE() AND table_name = %s',
+                (table_name,)).fetchall()[0][0] > 0
+        return self._summary_tables[table_name]
+
+    def _summarize_reservations(self, added=(), removed=()):
+        """
+        Applies added, updated or deleted reservations to the DailyOccupancy
+        summary table, if it exists.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by the
+        APIs of the Reservations and Rooms tables, in the same transaction as
+        their write.
+
+        Parameters:
+            :param added: List of dictionaries of reservation attributes and
+            values (hotel_id, room_number, start_date, end_date) that start
+            occupying their rooms
+            :param removed: List of dictionaries of reservation attributes and
+            values that stop occupying their rooms
 
         Returns:
-            :return: Single Pandas DataFrame(s) (two-dimensional
-            size-mutable, heterogeneous tabular data structure with labeled
-            axes) retrieved from internal helper functions:
-                - add_serves() - which contains a tuple with successfully
-                inserted data in the Serves table (add staff to serves)
-                - update_staff() - which contains a tuple with successfully
-                updated data the Staff table (assign staff to a room)
+            :return:
+        """
+        if (added or removed) and \
+                self._has_summary_table(DAILY_OCCUPANCY_TABLE):
+            update_daily_occupancy(
+                self.cursor,
+                [_get_reserved_room_dates(reservation)
+                 for reservation in added],
+                [_get_reserved_room_dates(reservation)
+                 for reservation in removed])
+
+    def _summarize_transactions(self, added=(), removed=()):
+        """
+        Applies added, updated or deleted transactions to the DailyRevenue
+        summary table, if it exists.
 
-        TODO: Testing
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by the
+        APIs of the Transactions and Reservations tables, in the same
+        transaction as their write.
+
+        Parameters:
+            :param added: List of dictionaries of transaction attributes and
+            values (reservation_id, amount, date) that are added
+            :param removed: List of dictionaries of transaction attributes and
+            values that are removed
+
+        Returns:
+            :return:
         """
-        if staff_id is not None and reservation_id is None:
-            # Staff is assigned from add_staff() or update_staff() functions
-            # Determine Reservation ID
-            where_clause = "hotel_id=%s AND room_number=%s AND " \
-                           "check_in_time IS NOT NULL AND " \
-                           "TRIM(check_in_time)<>'' AND " \
-                           "(check_out_time IS NULL OR TRIM(check_out_time)='')"
-            self._execute_select_query('id', 'Reservations', where_clause,
-                                       [hotel_id, room_number])
-            reservation_tuples = self.cursor.fetchall()
-            assert reservation_tuples and len(reservation_tuples) == 1 and \
-                reservation_tuples[0], \
-                'Cannot assign staff to a room \'{}\' in hotel \'{}\' for ' \
-                'which customer either did not check-in or already ' \
-                'checked-out.\n'.format(room_number, hotel_id) \
-                if not reservation_tuples else \
-                'Found multiple active reservations for room \'{}\' in hotel ' \
-                '\'{}\' with a checked-in customer. Cannot assign staff to ' \
-                'multiple room simultaneously.\n'
-            serves_df = self.add_serves(
-                {'staff_id': staff_id,
-                 'reservation_id': reservation_tuples[0][0]})
-            serves_df = serves_df.rename(
-                index=str, columns={'staff_id': 'Serves_staff_id',
-                                    'reservation_id': 'Serves_reservation_id'})
-            return serves_df
-        if reservation_id is not None and staff_id is None:
-            # Staff is assigned from add_reservation() or
-            # update_reservation() functions
-            # Check whether Reservation is Presidential Suite
-            self._execute_simple_select_query('category', 'Rooms',
-                                              {'hotel_id': hotel_id,
-                                               'room_number': room_number})
-            room_tuple = self.cursor.fetchall()
-            if room_tuple and len(room_tuple) == 1 and room_tuple[0]:
-                room_category = room_tuple[0][0].split()
-                if 'presidential' in (category.lower() for category in
-                                      room_category):
-                    # This is Presidential Suite.
-                    # Verify that this reservation is still active
-                    self._execute_simple_select_query(
-                        'check_out_time', 'Reservations',
-                        {'id': reservation_id})
-                    reservation_tuple = self.cursor.fetchall()
-                    if reservation_tuple is None or \
-                            not reservation_tuple[0][0] or \
-                            reservation_tuple[0][0] == 'NULL':
-                        # It needs to assign one available Catering staff
-                        # and one Room Service as dedicated staff.
-                        # Determine their Staff ID
-                        catering_staff_df = None
-                        room_service_staff_df = None
-                        where_clause = "works_for_hotel_id=%s AND " \
-                                       "title LIKE '%{}%'  AND " \
-                                       "(assigned_hotel_id IS NULL OR " \
-                                       "assigned_hotel_id='') AND " \
-                                       "(assigned_room_number IS NULL OR " \
-                                       "assigned_room_number='')"
-                        self._execute_select_query(
-                            'id', 'Staff',
-                            where_clause=where_clause.format('Catering'),
-                            where_values_list=[hotel_id])
-                        staff_tuples = self.cursor.fetchall()
-                        if staff_tuples and staff_tuples[0]:
-                            catering_staff_df = self.update_staff(
-                                {'assigned_hotel_id': hotel_id,
-                                 'assigned_room_number': room_number},
-                                {'id': staff_tuples[0][0]},
-                                reservation_id=reservation_id)
-                        self._execute_select_query(
-                            'id', 'Staff',
-                            where_clause=where_clause.format('Room Service'),
-                            where_values_list=[hotel_id])
-                        staff_tuples = self.cursor.fetchall()
-                        if staff_tuples and staff_tuples[0]:
-                            room_service_staff_df = self.update_staff(
-                                {'assigned_hotel_id': hotel_id,
-                                 'assigned_room_number': room_number},
-                                {'id': staff_tuples[0][0]},
-                                reservation_id=reservation_id)
-                        # Returns
-                        if catering_staff_df is not None:
-                            return catering_staff_df.append(
-                                room_service_staff_df, ignore_index=True)
-                        elif room_service_staff_df is not None:
-                            return room_service_staff_df.append(
-                                catering_staff_df, ignore_index=True)
-        return None
+        if (added or removed) and \
+                self._has_summary_table(DAILY_REVENUE_TABLE):
+            update_daily_revenue(
+                self.cursor,
+                [_get_transaction_revenue(transaction)
+                 for transaction in added],
+                [_get_transaction_revenue(transaction)
+                 for transaction in removed])
+
+    def _get_available_rooms(self, dictionary, start_date, end_date):
+        """
+        Determines available rooms by the interval index and the room catalog
+        instead of a query.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by
+        room_availability() when the interval index is enabled.
+        Filters are compared the way MySQL compares them: numbers by value and
+        strings ignoring case and trailing spaces.
 
-    def _check_reservation_conflict(self):
+        Parameters:
+            :param dictionary: Dictionary of filtering attributes and values
+            (without start and end dates)
+            :param start_date: Start date
+            :param end_date: End date
+
+        Returns:
+            :return: ResultSet of available rooms with the columns of the Room
+            Availability query, or None if the filters or dates are not
+            supported by the index
+        """
+        if any(attr not in ROOM_CATALOG_FILTERS for attr in dictionary):
+            return None
+        try:
+            to_date(start_date), to_date(end_date)
+        except ValueError:
+            return None
+        index, catalog = self._get_interval_index()
+        positions = [catalog.columns.index(ROOM_CATALOG_FILTERS[attr])
+                     for attr in dictionary]
+        wanted = dictionary.values()
+        rooms = OrderedDict()
+        for row in catalog:
+            if all(_filter_matches(row[position], value)
+                   for position, value in zip(positions, wanted)):
+                rooms[(row.Hotel_ID, row.Room_Number)] = row
+        free_rooms = index.free_rooms(start_date, end_date, rooms)
+        return ResultSet(catalog.columns, [rooms[room] for room in free_rooms])
+
+    def _check_reservation_conflict(self, reservation_ids):
         """
-        Raise AssertionError if two or more reservations are defined with the
-        same room in overlapping reservation dates.
-        :return: None
+        Raise Exception if any of the given reservations is defined with the
+        same room in overlapping reservation dates as another reservation.
+
+        Only the rooms and dates of the given (just added or updated)
+        reservations are checked, instead of the entire Reservations table.
+        Reservation dates are treated as half-open intervals, so a reservation
+        may start on the end date of another reservation of the same room.
+        If the interval index is enabled, the reservations are checked in
+        memory.
+
+        Parameters:
+            :param reservation_ids: List of IDs of the added or updated
+            reservations
+
+        Returns:
+            :return: None
         """
-        self.cursor.execute(CHECK_RESERVATION_CONFLICT)
-        conflicts = self.cursor.fetchall()
-        if conflicts and len(conflicts) > 0 and conflicts[0]:
-            raise Exception('Exception: A room can only be reserved by one '
-                            'reservation at any given time.')
+        reservation_ids = list(reservation_ids)
+        if self.interval_index is not None and reservation_ids:
+            index = self._get_interval_index()[0]
+            if any(index.has_conflict(int(reservation_id))
+                   for reservation_id in reservation_ids):
+                # The conflicting reservation gets rolled back by the caller
+                self.discard_local_state()
+                raise Exception('Exception: A room can only be reserved by '
+                                'one reservation at any given time.')
+            return
+        for start in xrange(0, len(reservation_ids), BULK_CHUNK_SIZE):
+            chunk = reservation_ids[start:start + BULK_CHUNK_SIZE]
+            conflicts = self._execute_statement(
+                ('CONFLICT', 'Reservations', len(chunk)),
+                lambda: CHECK_RESERVATION_CONFLICT.format(
+                    ', '.join(['%s'] * len(chunk))),
+                chunk).fetchall()
+            if conflicts and len(conflicts) > 0 and conflicts[0]:
+                raise Exception('Exception: A room can only be reserved by '
+                                'one reservation at any given time.')
 
     # Implementation of the program applications for the ZipToCityState table
+    def _check_add_zip(self, zip_dict):
+        """
+        Performs assertions ensuring that zip data to be added obeys MySQL
+        constraints that are ignored by current MySQL MariaDB version.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced by add_zip()
+        and add_zip_bulk() when check boolean parameter is enabled.
+
+        Parameters:
+            :param zip_dict: Dictionary of attributes and values to be
+            stored in the ZipToCityState table
+
+        Returns:
+            :return:
+
+        Exceptions:
+            :raise: Assertion Error exception
+        """
+        assert zip_dict, \
+            'Exception: Cannot add tuple into the table. Required ' \
+            'attributes are not specified.\n'
+        assert 'zip' in zip_dict and len(zip_dict['zip']) >= 5, \
+            'Exception: ZIP code must be specified and must be at ' \
+            'least 5 digits.\n'
+        assert 'city' in zip_dict and zip_dict['city'], \
+            'Exception: City must be specified and must be non-empty.\n'
+        assert 'state' in zip_dict and len(zip_dict['state']) == 2, \
+            'Exception: State must be specified and must be exactly ' \
+            'two characters.\n'
+
     def add_zip(self, zip_dict):
         """
         Adds new tuple of ZIP code into ZipToCityState table.
@@ -663,22 +2295,48 @@ class Apps(object):
         try:
             if self.check:
                 # Perform validation
-                assert zip_dict, \
-                    'Exception: Cannot add tuple into the table. Required ' \
-                    'attributes are not specified.\n'
-                assert 'zip' in zip_dict and len(zip_dict['zip']) >= 5, \
-                    'Exception: ZIP code must be specified and must be at ' \
-                    'least 5 digits.\n'
-                assert 'city' in zip_dict and zip_dict['city'], \
-                    'Exception: City must be specified and must be non-empty.\n'
-                assert 'state' in zip_dict and len(zip_dict['state']) == 2, \
-                    'Exception: State must be specified and must be exactly ' \
-                    'two characters.\n'
+                self._check_add_zip(zip_dict)
             # Execute insert query
             self._execute_insert_query(zip_dict, 'ZipToCityState')
             # Query for this inserted tuple and return it as Pandas DataFrame
-            data_frame = self.get_data_frame('*', 'ZipToCityState',
-                                             {'zip': zip_dict['zip']})
+            data_frame = self._get_inserted_data_frame(
+                'ZipToCityState', zip_dict, {'zip': zip_dict['zip']})
+            return data_frame
+        except AssertionError, error:
+            raise error
+        except maria_db.Error as error:
+            raise error
+
+    def add_zip_bulk(self, zip_rows, chunk_size=BULK_CHUNK_SIZE):
+        """
+        Adds multiple tuples of ZIP codes into ZipToCityState table at once.
+
+        The ZipToCityState table must exist. It validates all given rows first
+        (if check boolean parameter is enabled) and then inserts them with
+        multi-row INSERT query statements of at most chunk_size tuples each by
+        calling private helper function _execute_bulk_insert(). Unlike
+        add_zip(), the inserted tuples are not queried back.
+
+        Parameters:
+            :param zip_rows: List of dictionaries or Pandas DataFrame of zip
+            attributes and values to be stored in the ZipToCityState table.
+            Each row may include the same attributes as the dictionary of
+            add_zip().
+            :param chunk_size: Maximum number of tuples inserted by one INSERT
+            query statement
+
+        Returns:
+            :return: Pandas DataFrame with the ZIP code of each added tuple, in
+            the order of the given rows
+
+        Exceptions:
+            :raise: Assertion Error or MySQL Connector Error exceptions
+
+        TODO:
+        """
+        try:
+            data_frame = self._execute_bulk_insert(
+                zip_rows, 'ZipToCityState', self._check_add_zip, chunk_size)
             return data_frame
         except AssertionError, error:
             raise error
@@ -782,6 +2440,39 @@ class Apps(object):
             raise error
 
     # Implementation of the program applications for the Hotels table
+    def _check_add_hotel(self, hotel_dict):
+        """
+        Performs assertions ensuring that hotel data to be added obeys MySQL
+        constraints that are ignored by current MySQL MariaDB version.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced by add_hotel()
+        and add_hotel_bulk() when check boolean parameter is enabled.
+
+        Parameters:
+            :param hotel_dict: Dictionary of attributes and values to be
+            stored in the Hotels table
+
+        Returns:
+            :return:
+
+        Exceptions:
+            :raise: Assertion Error exception
+        """
+        assert hotel_dict, \
+            'Exception: Cannot add tuple into the table. Required ' \
+            'attributes are not specified.\n'
+        assert 'name' in hotel_dict and hotel_dict['name'], \
+            'Exception: Name of the hotel must be specified and must ' \
+            'be non-empty.\n'
+        assert 'street' in hotel_dict and hotel_dict['street'], \
+            'Exception: Street address of the hotel must be ' \
+            'specified and must be non-empty.\n'
+        assert 'phone_number' in hotel_dict and \
+               hotel_dict['phone_number'], \
+            'Exception: Phone number of the hotel must be specified ' \
+            'and must be non-empty.\n'
+
     def add_hotel(self, hotel_dict):
         """
         Adds new tuple of hotel into Hotels table.
@@ -823,24 +2514,48 @@ class Apps(object):
         try:
             if self.check:
                 # Perform validation
-                assert hotel_dict, \
-                    'Exception: Cannot add tuple into the table. Required ' \
-                    'attributes are not specified.\n'
-                assert 'name' in hotel_dict and hotel_dict['name'], \
-                    'Exception: Name of the hotel must be specified and must ' \
-                    'be non-empty.\n'
-                assert 'street' in hotel_dict and hotel_dict['street'], \
-                    'Exception: Street address of the hotel must be ' \
-                    'specified and must be non-empty.\n'
-                assert 'phone_number' in hotel_dict and \
-                       hotel_dict['phone_number'], \
-                    'Exception: Phone number of the hotel must be specified ' \
-                    'and must be non-empty.\n'
+                self._check_add_hotel(hotel_dict)
             # Execute insert query
-            self._execute_insert_query(hotel_dict, 'Hotels')
+            cursor = self._execute_insert_query(hotel_dict, 'Hotels')
             # Query for this inserted tuple and return it as Pandas DataFrame
-            data_frame = self.get_data_frame(
-                '*', 'Hotels', {'id': self.cursor.lastrowid})
+            data_frame = self._get_inserted_data_frame(
+                'Hotels', hotel_dict, {'id': cursor.lastrowid})
+            return data_frame
+        except AssertionError, error:
+            raise error
+        except maria_db.Error as error:
+            raise error
+
+    def add_hotel_bulk(self, hotel_rows, chunk_size=BULK_CHUNK_SIZE):
+        """
+        Adds multiple tuples of hotels into Hotels table at once.
+
+        The Hotels table must exist. It validates all given rows first (if
+        check boolean parameter is enabled) and then inserts them with multi-
+        row INSERT query statements of at most chunk_size tuples each by
+        calling private helper function _execute_bulk_insert(). Unlike
+        add_hotel(), the inserted tuples are not queried back.
+
+        Parameters:
+            :param hotel_rows: List of dictionaries or Pandas DataFrame of
+            hotel attributes and values to be stored in the Hotels table. Each
+            row may include the same attributes as the dictionary of
+            add_hotel().
+            :param chunk_size: Maximum number of tuples inserted by one INSERT
+            query statement
+
+        Returns:
+            :return: Pandas DataFrame with the ID of each added tuple, in the
+            order of the given rows
+
+        Exceptions:
+            :raise: Assertion Error or MySQL Connector Error exceptions
+
+        TODO:
+        """
+        try:
+            data_frame = self._execute_bulk_insert(
+                hotel_rows, 'Hotels', self._check_add_hotel, chunk_size)
             return data_frame
         except AssertionError, error:
             raise error
@@ -947,6 +2662,39 @@ class Apps(object):
             raise error
 
     # Implementation of the program applications for the Rooms table
+    def _check_add_room(self, room_dict):
+        """
+        Performs assertions ensuring that room data to be added obeys MySQL
+        constraints that are ignored by current MySQL MariaDB version.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced by add_room()
+        and add_room_bulk() when check boolean parameter is enabled.
+
+        Parameters:
+            :param room_dict: Dictionary of attributes and values to be
+            stored in the Rooms table
+
+        Returns:
+            :return:
+
+        Exceptions:
+            :raise: Assertion Error exception
+        """
+        assert room_dict, \
+            'Exception: Cannot add tuple into the table. Required ' \
+            'attributes are not specified.\n'
+        assert 'room_number' in room_dict, \
+            'Exception: Room number must be specified and must be ' \
+            'positive integer.\n'
+        assert 'category' in room_dict and room_dict['category'], \
+            'Exception: Category type of the room must be specified ' \
+            'and must be non-empty.\n'
+        assert 'occupancy' in room_dict and \
+               0 < room_dict['occupancy'] < 10, \
+            'Exception: Maximum occupancy of the room must be ' \
+            'between 1 and 9 inclusive.\n'
+
     def add_room(self, room_dict):
         """
         Adds new tuple of room into Rooms table.
@@ -988,25 +2736,48 @@ class Apps(object):
         try:
             if self.check:
                 # Perform validation
-                assert room_dict, \
-                    'Exception: Cannot add tuple into the table. Required ' \
-                    'attributes are not specified.\n'
-                assert 'room_number' in room_dict, \
-                    'Exception: Room number must be specified and must be ' \
-                    'positive integer.\n'
-                assert 'category' in room_dict and room_dict['category'], \
-                    'Exception: Category type of the room must be specified ' \
-                    'and must be non-empty.\n'
-                assert 'occupancy' in room_dict and \
-                       0 < room_dict['occupancy'] < 10, \
-                    'Exception: Maximum occupancy of the room must be ' \
-                    'between 1 and 9 inclusive.\n'
+                self._check_add_room(room_dict)
             # Execute insert query
             self._execute_insert_query(room_dict, 'Rooms')
             # Query for this inserted tuple and return it as Pandas DataFrame
-            data_frame = self.get_data_frame(
-                '*', 'Rooms', {'hotel_id': room_dict['hotel_id'],
-                               'room_number': room_dict['room_number']})
+            data_frame = self._get_inserted_data_frame(
+                'Rooms', room_dict, {'hotel_id': room_dict['hotel_id'],
+                                     'room_number': room_dict['room_number']})
+            return data_frame
+        except AssertionError, error:
+            raise error
+        except maria_db.Error as error:
+            raise error
+
+    def add_room_bulk(self, room_rows, chunk_size=BULK_CHUNK_SIZE):
+        """
+        Adds multiple tuples of rooms into Rooms table at once.
+
+        The Rooms table must exist. It validates all given rows first (if check
+        boolean parameter is enabled) and then inserts them with multi-row
+        INSERT query statements of at most chunk_size tuples each by calling
+        private helper function _execute_bulk_insert(). Unlike add_room(), the
+        inserted tuples are not queried back.
+
+        Parameters:
+            :param room_rows: List of dictionaries or Pandas DataFrame of room
+            attributes and values to be stored in the Rooms table. Each row may
+            include the same attributes as the dictionary of add_room().
+            :param chunk_size: Maximum number of tuples inserted by one INSERT
+            query statement
+
+        Returns:
+            :return: Pandas DataFrame with the hotel ID and room number of each
+            added tuple, in the order of the given rows
+
+        Exceptions:
+            :raise: Assertion Error or MySQL Connector Error exceptions
+
+        TODO:
+        """
+        try:
+            data_frame = self._execute_bulk_insert(
+                room_rows, 'Rooms', self._check_add_room, chunk_size)
             return data_frame
         except AssertionError, error:
             raise error
@@ -1067,10 +2838,29 @@ class Apps(object):
                     select_attr = 'room_number, ' + select_attr
                 if 'hotel_id' not in room_dict.iterkeys():
                     select_attr = 'hotel_id, ' + select_attr
+            # Reservations of the rooms are summarized by room category, so
+            # they move to the new category or room of the updated rooms
+            moved_reservations = []
+            if any(attr in room_dict for attr in
+                   ('hotel_id', 'room_number', 'category')) and \
+                    self._has_summary_table(DAILY_OCCUPANCY_TABLE):
+                moved_reservations = [
+                    dict(zip(('hotel_id', 'room_number', 'start_date',
+                              'end_date'), reservation))
+                    for reservation in get_room_reservations(
+                        self.cursor, self._execute_simple_select_query(
+                            'hotel_id, room_number', 'Rooms',
+                            where_clause_dict).fetchall())]
+                self._summarize_reservations(removed=moved_reservations)
             # Execute update query
             # Also queries for updated tuple and returns it as Pandas DataFrame
             data_frame = self._execute_update_query(
                 select_attr, 'Rooms', room_dict, where_clause_dict)
+            self._summarize_reservations(added=[
+                dict(reservation, **{attr: room_dict[attr] for attr in
+                                     ('hotel_id', 'room_number')
+                                     if attr in room_dict})
+                for reservation in moved_reservations])
             return data_frame
         except AssertionError, error:
             raise error
@@ -1115,6 +2905,61 @@ class Apps(object):
             raise error
 
     # Implementation of the program applications for the Staff table
+    def _check_add_staff(self, staff_dict):
+        """
+        Performs assertions ensuring that staff data to be added obeys MySQL
+        constraints that are ignored by current MySQL MariaDB version.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced by add_staff()
+        and add_staff_bulk() when check boolean parameter is enabled.
+
+        Parameters:
+            :param staff_dict: Dictionary of attributes and values to be
+            stored in the Staff table
+
+        Returns:
+            :return:
+
+        Exceptions:
+            :raise: Assertion Error exception
+        """
+        assert staff_dict, \
+            'Exception: Cannot add tuple into the table. Required ' \
+            'attributes are not specified.\n'
+        assert 'name' in staff_dict and staff_dict['name'], \
+            'Exception: Name of the staff member must be specified ' \
+            'and must be non-empty.\n'
+        assert 'title' in staff_dict and staff_dict['title'], \
+            'Exception: Title of the staff member must be specified ' \
+            'and must be non-empty.\n'
+        assert 'date_of_birth' in staff_dict and \
+               datetime.strptime(staff_dict['date_of_birth'],
+                                 '%Y-%m-%d'), \
+            'Exception: Date of birth must follow the DATE format: ' \
+            'YYYY-MM-DD.\n'
+        assert 'department' in staff_dict and \
+               staff_dict['department'], \
+            'Exception: Department under which staff member works ' \
+            'must be specified and must be non-empty.\n'
+        assert 'phone_number' in staff_dict and \
+               staff_dict['phone_number'], \
+            'Contact phone number of the staff member must be ' \
+            'specified and must be non-empty.\n'
+        assert 'street' in staff_dict and staff_dict['street'], \
+            'Street address of the staff member must be specified ' \
+            'and must be and must be non-empty.\n'
+        if 'assigned_hotel_id' not in staff_dict:
+            assert 'assigned_room_number' not in staff_dict, \
+                'Exception: Hotel ID for a given room number that ' \
+                'staff member is assigned to as dedicated staff must ' \
+                'be specified.\n'
+        else:
+            assert 'assigned_room_number' in staff_dict, \
+                'Exception: Room number for a given hotel ID that ' \
+                'staff member is assigned to as dedicated staff must ' \
+                'be specified.\n'
+
     def add_staff(self, staff_dict):
         """
         Adds new tuple of staff member into Staff table.
@@ -1178,46 +3023,14 @@ class Apps(object):
         try:
             if self.check:
                 # Perform validation
-                assert staff_dict, \
-                    'Exception: Cannot add tuple into the table. Required ' \
-                    'attributes are not specified.\n'
-                assert 'name' in staff_dict and staff_dict['name'], \
-                    'Exception: Name of the staff member must be specified ' \
-                    'and must be non-empty.\n'
-                assert 'title' in staff_dict and staff_dict['title'], \
-                    'Exception: Title of the staff member must be specified ' \
-                    'and must be non-empty.\n'
-                assert 'date_of_birth' in staff_dict and \
-                       datetime.strptime(staff_dict['date_of_birth'],
-                                         '%Y-%m-%d'), \
-                    'Exception: Date of birth must follow the DATE format: ' \
-                    'YYYY-MM-DD.\n'
-                assert 'department' in staff_dict and \
-                       staff_dict['department'], \
-                    'Exception: Department under which staff member works ' \
-                    'must be specified and must be non-empty.\n'
-                assert 'phone_number' in staff_dict and \
-                       staff_dict['phone_number'], \
-                    'Contact phone number of the staff member must be ' \
-                    'specified and must be non-empty.\n'
-                assert 'street' in staff_dict and staff_dict['street'], \
-                    'Street address of the staff member must be specified ' \
-                    'and must be and must be non-empty.\n'
-                if 'assigned_hotel_id' not in staff_dict:
-                    assert 'assigned_room_number' not in staff_dict, \
-                        'Exception: Hotel ID for a given room number that ' \
-                        'staff member is assigned to as dedicated staff must ' \
-                        'be specified.\n'
-                else:
-                    assert 'assigned_room_number' in staff_dict, \
-                        'Exception: Room number for a given hotel ID that ' \
-                        'staff member is assigned to as dedicated staff must ' \
-                        'be specified.\n'
+                self._check_add_staff(staff_dict)
             # Execute insert query
-            self._execute_insert_query(staff_dict, 'Staff')
-            staff_id = self.cursor.lastrowid
+            staff_id = self._execute_insert_query(staff_dict,
+                                                  'Staff').lastrowid
             # Query for inserted Staff tuple and return it as Pandas DataFrame
-            data_frame = self.get_data_frame('*', 'Staff', {'id': staff_id})
+            data_frame = self._get_inserted_data_frame('Staff', staff_dict,
+                                                       {'id': staff_id})
+            self._update_staff_pool()
             # If staff gets assigned to a room, add it into Serves table
             if 'assigned_hotel_id' in staff_dict and \
                     'assigned_room_number' in staff_dict and \
@@ -1235,6 +3048,50 @@ class Apps(object):
         except maria_db.Error as error:
             raise error
 
+    def add_staff_bulk(self, staff_rows, chunk_size=BULK_CHUNK_SIZE):
+        """
+        Adds multiple tuples of staff members into Staff table at once.
+
+        The Staff table must exist. It validates all given rows first (if check
+        boolean parameter is enabled) and then inserts them with multi-row
+        INSERT query statements of at most chunk_size tuples each by calling
+        private helper function _execute_bulk_insert(). Unlike add_staff(), the
+        inserted tuples are not queried back.
+        Staff members that immediately get assigned to a room are added one by
+        one by calling add_staff(), since they also need to be added into
+        Serves table.
+
+        Parameters:
+            :param staff_rows: List of dictionaries or Pandas DataFrame of
+            staff attributes and values to be stored in the Staff table. Each
+            row may include the same attributes as the dictionary of
+            add_staff().
+            :param chunk_size: Maximum number of tuples inserted by one INSERT
+            query statement
+
+        Returns:
+            :return: Pandas DataFrame with the ID of each added tuple, in the
+            order of the given rows
+
+        Exceptions:
+            :raise: Assertion Error or MySQL Connector Error exceptions
+
+        TODO:
+        """
+        try:
+            data_frame = self._execute_bulk_insert(
+                staff_rows, 'Staff', self._check_add_staff, chunk_size,
+                add_row=self.add_staff,
+                needs_add_row=lambda row:
+                row.get('assigned_hotel_id') is not None and
+                row.get('assigned_room_number') is not None)
+            self._update_staff_pool()
+            return data_frame
+        except AssertionError, error:
+            raise error
+        except maria_db.Error as error:
+            raise error
+
     def update_staff(self, staff_dict, where_clause_dict, reservation_id=None):
         """
         Updates a tuple in the Staff table.
@@ -1327,9 +3184,8 @@ class Apps(object):
                     where_clause_dict['id']:
                 staff_tuples = [where_clause_dict['id']]
             else:
-                self._execute_simple_select_query('id', 'Staff',
-                                                  where_clause_dict)
-                staff_tuples = [x[0] for x in self.cursor.fetchall()]
+                staff_tuples = [x[0] for x in self._execute_simple_select_query(
+                    'id', 'Staff', where_clause_dict).fetchall()]
             # If staff gets assigned to a room, add it into Serves table
             if staff_tuples and staff_tuples is not None and \
                     'assigned_hotel_id' in staff_dict and \
@@ -1356,6 +3212,7 @@ class Apps(object):
                     # Execute update query
                     staff_df = self._execute_update_query(
                         select_attr, 'Staff', staff_dict, where_clause_dict)
+                    self._update_staff_pool(staff_tuples, staff_dict)
                     staff_df = staff_df.rename(
                         index=str, columns={'id': 'Staff_id',
                                             'name': 'Staff_name',
@@ -1379,6 +3236,7 @@ class Apps(object):
                     # Execute update query
                     data_frame = self._execute_update_query(
                         select_attr, 'Staff', staff_dict, where_clause_dict)
+                    self._update_staff_pool(staff_tuples, staff_dict)
                     data_frame = pd.concat((data_frame, staff_df_result),
                                            axis=1)
                     return data_frame
@@ -1386,6 +3244,7 @@ class Apps(object):
             # Also queries for updated tuple and returns it as Pandas DataFrame
             data_frame = self._execute_update_query(
                 select_attr, 'Staff', staff_dict, where_clause_dict)
+            self._update_staff_pool(staff_tuples, staff_dict)
             return data_frame
         except AssertionError, error:
             raise error
@@ -1415,21 +3274,69 @@ class Apps(object):
             heterogeneous tabular data structure with labeled axes)
 
         Exceptions:
-            :raise: MySQL Connector Error exception
-
-        TODO:
+            :raise: MySQL Connector Error exception
+
+        TODO:
+        """
+        try:
+            if self.check:
+                # Perform validation
+                assert staff_dict, \
+                    'Exception: Cannot identify tuple(s) to be deleted from ' \
+                    'the table.\n'
+            data_frame = self._execute_delete_query('Staff', staff_dict)
+            self._update_staff_pool()
+            return data_frame
+        except maria_db.Error as error:
+            raise error
+
+    # Implementation of the program applications for the Customers table
+    def _check_add_customer(self, customer_dict):
+        """
+        Performs assertions ensuring that customer data to be added obeys MySQL
+        constraints that are ignored by current MySQL MariaDB version.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced by
+        add_customer() and add_customer_bulk() when check boolean parameter is
+        enabled.
+
+        Parameters:
+            :param customer_dict: Dictionary of attributes and values to be
+            stored in the Customers table
+
+        Returns:
+            :return:
+
+        Exceptions:
+            :raise: Assertion Error exception
         """
-        try:
-            if self.check:
-                # Perform validation
-                assert staff_dict, \
-                    'Exception: Cannot identify tuple(s) to be deleted from ' \
-                    'the table.\n'
-            return self._execute_delete_query('Staff', staff_dict)
-        except maria_db.Error as error:
-            raise error
+        assert customer_dict, \
+            'Exception: Cannot add tuple into the table. Required ' \
+            'attributes are not specified.\n'
+        assert 'name' in customer_dict and customer_dict['name'], \
+            'Exception: Name of the customer must be specified and ' \
+            'must be non-empty.\n'
+        assert 'date_of_birth' in customer_dict and \
+               datetime.strptime(customer_dict['date_of_birth'],
+                                 '%Y-%m-%d'), \
+            'Exception: Date of birth must be specified and must ' \
+            'follow the DATE format: YYYY-MM-DD.\n'
+        assert 'phone_number' in customer_dict and \
+               customer_dict['phone_number'], \
+            'Exception: Contact phone number of the customer must be ' \
+            'specified and must be non-empty.\n'
+        assert 'email' in customer_dict and customer_dict['email'], \
+            'Exception: Contact email address the customer must be ' \
+            'specified and must be non-empty.\n'
+        assert 'street' in customer_dict and customer_dict['street'], \
+            'Exception: Street address of the customer must be ' \
+            'specified and must be and must be non-empty.\n'
+        assert 'ssn' in customer_dict and \
+               len(customer_dict['ssn']) == 11, \
+            'Exception: Social Security Number must be specified and ' \
+            'must follow the NNN-NN-NNNN format.\n'
 
-    # Implementation of the program applications for the Customers table
     def add_customer(self, customer_dict):
         """
         Adds new tuple of customer into Customers table.
@@ -1484,36 +3391,50 @@ class Apps(object):
         try:
             if self.check:
                 # Perform validation
-                assert customer_dict, \
-                    'Exception: Cannot add tuple into the table. Required ' \
-                    'attributes are not specified.\n'
-                assert 'name' in customer_dict and customer_dict['name'], \
-                    'Exception: Name of the customer must be specified and ' \
-                    'must be non-empty.\n'
-                assert 'date_of_birth' in customer_dict and \
-                       datetime.strptime(customer_dict['date_of_birth'],
-                                         '%Y-%m-%d'), \
-                    'Exception: Date of birth must be specified and must ' \
-                    'follow the DATE format: YYYY-MM-DD.\n'
-                assert 'phone_number' in customer_dict and \
-                       customer_dict['phone_number'], \
-                    'Exception: Contact phone number of the customer must be ' \
-                    'specified and must be non-empty.\n'
-                assert 'email' in customer_dict and customer_dict['email'], \
-                    'Exception: Contact email address the customer must be ' \
-                    'specified and must be non-empty.\n'
-                assert 'street' in customer_dict and customer_dict['street'], \
-                    'Exception: Street address of the customer must be ' \
-                    'specified and must be and must be non-empty.\n'
-                assert 'ssn' in customer_dict and \
-                       len(customer_dict['ssn']) == 11, \
-                    'Exception: Social Security Number must be specified and ' \
-                    'must follow the NNN-NN-NNNN format.\n'
+                self._check_add_customer(customer_dict)
             # Execute insert query
-            self._execute_insert_query(customer_dict, 'Customers')
+            cursor = self._execute_insert_query(customer_dict, 'Customers')
             # Query for this inserted tuple and return it as Pandas DataFrame
-            data_frame = self.get_data_frame(
-                '*', 'Customers', {'id': self.cursor.lastrowid})
+            data_frame = self._get_inserted_data_frame(
+                'Customers', customer_dict, {'id': cursor.lastrowid})
+            return data_frame
+        except AssertionError, error:
+            raise error
+        except maria_db.Error as error:
+            raise error
+
+    def add_customer_bulk(self, customer_rows,
+                          chunk_size=BULK_CHUNK_SIZE):
+        """
+        Adds multiple tuples of customers into Customers table at once.
+
+        The Customers table must exist. It validates all given rows first (if
+        check boolean parameter is enabled) and then inserts them with multi-
+        row INSERT query statements of at most chunk_size tuples each by
+        calling private helper function _execute_bulk_insert(). Unlike
+        add_customer(), the inserted tuples are not queried back.
+
+        Parameters:
+            :param customer_rows: List of dictionaries or Pandas DataFrame of
+            customer attributes and values to be stored in the Customers table.
+            Each row may include the same attributes as the dictionary of
+            add_customer().
+            :param chunk_size: Maximum number of tuples inserted by one INSERT
+            query statement
+
+        Returns:
+            :return: Pandas DataFrame with the ID of each added tuple, in the
+            order of the given rows
+
+        Exceptions:
+            :raise: Assertion Error or MySQL Connector Error exceptions
+
+        TODO:
+        """
+        try:
+            data_frame = self._execute_bulk_insert(
+                customer_rows, 'Customers', self._check_add_customer,
+                chunk_size)
             return data_frame
         except AssertionError, error:
             raise error
@@ -1627,6 +3548,67 @@ class Apps(object):
             raise error
 
     # Implementation of the program applications for the Reservations table
+    def _check_add_reservation(self, reservation_dict):
+        """
+        Performs assertions ensuring that reservation data to be added obeys
+        MySQL constraints that are ignored by current MySQL MariaDB version.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced by
+        add_reservation() and add_reservation_bulk() when check boolean
+        parameter is enabled.
+
+        Parameters:
+            :param reservation_dict: Dictionary of attributes and values to be
+            stored in the Reservations table
+
+        Returns:
+            :return:
+
+        Exceptions:
+            :raise: Assertion Error exception
+        """
+        assert reservation_dict, \
+            'Exception: Cannot add tuple into the table. Required ' \
+            'attributes are not specified.\n'
+        assert 'number_of_guests' in reservation_dict and \
+               0 < reservation_dict['number_of_guests'] < 10, \
+            'Exception: Number of guests must be specified and must ' \
+            'be between 1 and 9 inclusive.\n'
+        assert 'start_date' in reservation_dict and \
+               datetime.strptime(reservation_dict['start_date'],
+                                 '%Y-%m-%d'), \
+            'Exception: Start date of the reservation must be ' \
+            'specified and must follow the DATE format: YYYY-MM-DD.\n'
+        assert 'end_date' in reservation_dict and \
+               datetime.strptime(reservation_dict['end_date'],
+                                 '%Y-%m-%d'), \
+            'Exception: End date of the reservation must be ' \
+            'specified and must follow the DATE format: YYYY-MM-DD.\n'
+        start_date = datetime.strptime(reservation_dict['start_date'],
+                                       '%Y-%m-%d')
+        end_date = datetime.strptime(reservation_dict['end_date'],
+                                     '%Y-%m-%d')
+        assert start_date <= end_date, \
+            'Exception: Start date must be prior the end date.\n'
+        if 'check_in_time' in reservation_dict:
+            assert pd.to_datetime(reservation_dict['check_in_time'],
+                                  errors='coerce') is not pd.NaT, \
+                'Exception: Check-in time of the reservation must be ' \
+                'specified and must follow the DATETIME format: ' \
+                'YYYY-MM-DD HH:MM:SS.\n'
+        if 'check_out_time' in reservation_dict:
+            assert pd.to_datetime(reservation_dict['check_out_time'],
+                                  errors='coerce') is not pd.NaT, \
+                'Exception: Check-out time of the reservation must ' \
+                'be specified and must follow the DATETIME format: ' \
+                'YYYY-MM-DD HH:MM:SS.\n'
+            assert pd.to_datetime(reservation_dict['check_in_time'],
+                                  errors='coerce') is not pd.NaT, \
+                'Exception: Check-in time of the reservation must be ' \
+                'specified and must follow the DATETIME format: ' \
+                'YYYY-MM-DD HH:MM:SS.\n'
+
     def add_reservation(self, reservation_dict):
         """
         Adds new tuple of reservation into Reservations table.
@@ -1694,78 +3676,190 @@ class Apps(object):
         try:
             if self.check:
                 # Perform validation
-                assert reservation_dict, \
-                    'Exception: Cannot add tuple into the table. Required ' \
-                    'attributes are not specified.\n'
-                assert 'number_of_guests' in reservation_dict and \
-                       0 < reservation_dict['number_of_guests'] < 10, \
-                    'Exception: Number of guests must be specified and must ' \
-                    'be between 1 and 9 inclusive.\n'
-                assert 'start_date' in reservation_dict and \
-                       datetime.strptime(reservation_dict['start_date'],
-                                         '%Y-%m-%d'), \
-                    'Exception: Start date of the reservation must be ' \
-                    'specified and must follow the DATE format: YYYY-MM-DD.\n'
-                assert 'end_date' in reservation_dict and \
-                       datetime.strptime(reservation_dict['end_date'],
-                                         '%Y-%m-%d'), \
-                    'Exception: End date of the reservation must be ' \
-                    'specified and must follow the DATE format: YYYY-MM-DD.\n'
-                start_date = datetime.strptime(reservation_dict['start_date'],
-                                               '%Y-%m-%d')
-                end_date = datetime.strptime(reservation_dict['end_date'],
-                                             '%Y-%m-%d')
-                assert start_date <= end_date, \
-                    'Exception: Start date must be prior the end date.\n'
-                if 'check_in_time' in reservation_dict:
-                    assert pd.to_datetime(reservation_dict['check_in_time'],
-                                          errors='coerce') is not pd.NaT, \
-                        'Exception: Check-in time of the reservation must be ' \
-                        'specified and must follow the DATETIME format: ' \
-                        'YYYY-MM-DD HH:MM:SS.\n'
-                if 'check_out_time' in reservation_dict:
-                    assert pd.to_datetime(reservation_dict['check_out_time'],
-                                          errors='coerce') is not pd.NaT, \
-                        'Exception: Check-out time of the reservation must ' \
-                        'be specified and must follow the DATETIME format: ' \
-                        'YYYY-MM-DD HH:MM:SS.\n'
-                    assert pd.to_datetime(reservation_dict['check_in_time'],
-                                          errors='coerce') is not pd.NaT, \
-                        'Exception: Check-in time of the reservation must be ' \
-                        'specified and must follow the DATETIME format: ' \
-                        'YYYY-MM-DD HH:MM:SS.\n'
+                self._check_add_reservation(reservation_dict)
+            return self._insert_reservation(reservation_dict)
+        except AssertionError, error:
+            raise error
+        except maria_db.Error as error:
+            raise error
 
-            # Execute insert query
-            self._execute_insert_query(reservation_dict, 'Reservations')
-            reservation_id = self.cursor.lastrowid
-            # Query for inserted tuple and return it as Pandas DataFrame
-            data_frame = self.get_data_frame('*', 'Reservations',
-                                             {'id': reservation_id})
-            # If check-in, do all check-in logic: i) Check whether this
-            # reservation is Presidential suite ii) Assign one Catering Staff
-            # and one Room Service Staff to this reservation
-            if 'check_in_time' in reservation_dict and \
-                    reservation_dict['check_in_time'] and \
-                    'check_out_time' not in reservation_dict:
-                staff_df = self._assign_staff_to_room(
-                    reservation_dict['hotel_id'],
-                    reservation_dict['room_number'],
-                    staff_id=None,
-                    reservation_id=reservation_id)
-                data_frame = pd.concat((data_frame, staff_df), axis=1)
-                # Check for reservation conflicts:
-                self._check_reservation_conflict()
-                return data_frame
-            # If check-out, do all check-out logic: i) Free dedicated staff
-            # (should not be any dedicated staff since this is new reservation)
-            # ii) Add new Room Charge transaction into Transactions table
-            if 'check_out_time' in reservation_dict and \
-                    reservation_dict['check_out_time']:
-                staff_transact_df = self._check_out(
-                    reservation_id, reservation_dict['check_out_time'])
-                data_frame = pd.concat((data_frame, staff_transact_df), axis=1)
+    def book_room(self, reservation_dict):
+        """
+        Adds new tuple of reservation into Reservations table, unless its room
+        is already reserved on any of its dates.
+
+        The Reservations table must exist. Unlike add_reservation(), which
+        detects reservation conflicts after the reservation is inserted, it
+        locks the row of the reserved room in the Rooms table by SELECT ...
+        FOR UPDATE first. Then it looks for reservations of that room alone
+        overlapping the given dates and inserts the reservation only if there
+        are none, so two concurrent bookings of the same room cannot both
+        succeed. Concurrent bookings of the same room wait for each other,
+        while bookings of other rooms are not blocked. The lock is held until
+        the transaction ends, so the reservation must be added within a
+        transaction (e.g. by AppsClient or util.sql_transaction()).
+        If check boolean parameter is enabled, it performs assertions ensuring
+        that data to be added obeys MySQL constraints that are ignored by
+        current MySQL MariaDB version.
+
+        Parameters:
+            :param reservation_dict: Dictionary of reservation attributes and
+            values to be stored in the Reservations table (see
+            add_reservation()). Hotel ID, room number, start date and end date
+            are required.
+
+        Returns:
+            :return: Pandas DataFrame (two-dimensional size-mutable,
+            heterogeneous tabular data structure with labeled axes), which
+            contains a tuple with successfully stored data in the Reservations
+            table (see add_reservation())
+
+        Exceptions:
+            :raise: Assertion Error, Exception if the room is already reserved
+            or MySQL Connector Error exceptions
+        """
+        try:
+            if self.check:
+                # Perform validation
+                self._check_add_reservation(reservation_dict)
+            assert all(reservation_dict.get(attr) for attr in (
+                'hotel_id', 'room_number', 'start_date', 'end_date')), \
+                'Exception: Hotel ID, room number, start date and end date ' \
+                'must be specified to book a room.\n'
+            hotel_id = reservation_dict['hotel_id']
+            room_number = reservation_dict['room_number']
+            # Lock the room, so concurrent bookings of the room wait for this
+            # transaction to end
+            room = self._execute_statement(
+                ('LOCK', 'Rooms', 'hotel_id', 'room_number'),
+                lambda: LOCK_ROOM, [hotel_id, room_number]).fetchall()
+            assert room, \
+                'Exception: Room {} does not exist in hotel {}.\n'.format(
+                    room_number, hotel_id)
+            # Check the reservations of this room only
+            if self._execute_statement(
+                    ('OVERLAP', 'Reservations', 'hotel_id', 'room_number'),
+                    lambda: CHECK_ROOM_OVERLAP,
+                    [hotel_id, room_number, reservation_dict['end_date'],
+                     reservation_dict['start_date']]).fetchall():
+                raise Exception('Exception: A room can only be reserved by '
+                                'one reservation at any given time.')
+            return self._insert_reservation(reservation_dict,
+                                            check_conflict=False)
+        except AssertionError, error:
+            raise error
+        except maria_db.Error as error:
+            raise error
+
+    def _insert_reservation(self, reservation_dict, check_conflict=True):
+        """
+        Inserts new reservation and performs its check-in and check-out logic.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced only by
+        add_reservation() and book_room() once the reservation is validated.
+
+        Parameters:
+            :param reservation_dict: Dictionary of reservation attributes and
+            values to be stored in the Reservations table
+            :param check_conflict: Boolean whether reservation conflicts are
+            checked after the reservation is inserted. book_room() checks them
+            before.
+
+        Returns:
+            :return: Pandas DataFrame of the inserted reservation (see
+            add_reservation())
+        """
+        # Execute insert query
+        reservation_id = self._execute_insert_query(
+            reservation_dict, 'Reservations').lastrowid
+        self._index_reservations([dict(reservation_dict,
+                                       id=reservation_id)])
+        self._summarize_reservations(added=[reservation_dict])
+        # Query for inserted tuple and return it as Pandas DataFrame
+        data_frame = self._get_inserted_data_frame(
+            'Reservations', reservation_dict, {'id': reservation_id})
+        # If check-in, do all check-in logic: i) Check whether this
+        # reservation is Presidential suite ii) Assign one Catering Staff
+        # and one Room Service Staff to this reservation
+        if 'check_in_time' in reservation_dict and \
+                reservation_dict['check_in_time'] and \
+                'check_out_time' not in reservation_dict:
+            staff_df = self._assign_staff_to_room(
+                reservation_dict['hotel_id'],
+                reservation_dict['room_number'],
+                staff_id=None,
+                reservation_id=reservation_id)
+            data_frame = pd.concat((data_frame, staff_df), axis=1)
+            # Check for reservation conflicts:
+            if check_conflict:
+                self._check_reservation_conflict([reservation_id])
+            return data_frame
+        # If check-out, do all check-out logic: i) Free dedicated staff
+        # (should not be any dedicated staff since this is new reservation)
+        # ii) Add new Room Charge transaction into Transactions table
+        if 'check_out_time' in reservation_dict and \
+                reservation_dict['check_out_time']:
+            staff_transact_df = self._check_out(
+                reservation_id, reservation_dict['check_out_time'])
+            data_frame = pd.concat((data_frame, staff_transact_df), axis=1)
+        # Check for reservation conflicts:
+        if check_conflict:
+            self._check_reservation_conflict([reservation_id])
+        return data_frame
+
+    def add_reservation_bulk(self, reservation_rows,
+                             chunk_size=BULK_CHUNK_SIZE):
+        """
+        Adds multiple tuples of reservations into Reservations table at once.
+
+        The Reservations table must exist. It validates all given rows first
+        (if check boolean parameter is enabled) and then inserts them with
+        multi-row INSERT query statements of at most chunk_size tuples each by
+        calling private helper function _execute_bulk_insert(). Unlike
+        add_reservation(), the inserted tuples are not queried back.
+        Reservations that immediately check-in or check-out are added one by
+        one by calling add_reservation(), since they also need the check-in and
+        check-out logic. Reservation conflicts are checked once, after all
+        reservations are added, and only for the added reservations.
+
+        Parameters:
+            :param reservation_rows: List of dictionaries or Pandas DataFrame
+            of reservation attributes and values to be stored in the
+            Reservations table. Each row may include the same attributes as the
+            dictionary of add_reservation().
+            :param chunk_size: Maximum number of tuples inserted by one INSERT
+            query statement
+
+        Returns:
+            :return: Pandas DataFrame with the ID of each added tuple, in the
+            order of the given rows
+
+        Exceptions:
+            :raise: Assertion Error or MySQL Connector Error exceptions
+
+        TODO:
+        """
+        try:
+            def needs_add_row(row):
+                return bool(row.get('check_in_time') or
+                            row.get('check_out_time'))
+            data_frame = self._execute_bulk_insert(
+                reservation_rows, 'Reservations', self._check_add_reservation,
+                chunk_size, add_row=self.add_reservation,
+                needs_add_row=needs_add_row)
+            if self.interval_index is not None and \
+                    self.interval_index.loaded:
+                self._index_reservations(
+                    [dict(row, id=reservation_id) for row, reservation_id in
+                     zip(get_bulk_rows(reservation_rows), data_frame['id'])])
+            # Reservations added by add_reservation() are already summarized
+            self._summarize_reservations(
+                added=[row for row in get_bulk_rows(reservation_rows)
+                       if not needs_add_row(row)])
             # Check for reservation conflicts:
-            self._check_reservation_conflict()
+            self._check_reservation_conflict(
+                [int(reservation_id) for reservation_id in data_frame['id']])
             return data_frame
         except AssertionError, error:
             raise error
@@ -1858,10 +3952,37 @@ class Apps(object):
             if 'id' not in reservation_dict and 'id' in where_clause_dict:
                 select_attr = 'id, ' + select_attr
             # Determine all Reservation tuples
-            self._execute_simple_select_query(
-                'id, check_in_time, check_out_time, hotel_id, room_number',
-                'Reservations', where_clause_dict)
-            reservation_tuples = self.cursor.fetchall()
+            reservation_tuples = self._execute_simple_select_query(
+                'id, check_in_time, check_out_time, hotel_id, room_number, '
+                'start_date, end_date', 'Reservations',
+                where_clause_dict).fetchall()
+            # Determine updated reservations that may conflict with another
+            # reservation. Only room and date changes may cause a conflict.
+            if 'id' in reservation_dict:
+                conflict_ids = [reservation_dict['id']]
+            else:
+                conflict_ids = [reservation[0] for reservation in
+                                reservation_tuples]
+            if not any(attr in reservation_dict for attr in
+                       ('hotel_id', 'room_number', 'start_date', 'end_date')):
+                conflict_ids = []
+            # Updated rooms and dates of the reservations for the interval
+            # index
+            indexed_reservations = []
+            if conflict_ids:
+                for reservation in reservation_tuples:
+                    indexed_reservation = dict(zip(
+                        ('id', 'hotel_id', 'room_number', 'start_date',
+                         'end_date'),
+                        (reservation[0],) + tuple(reservation[3:7])))
+                    indexed_reservation.update(reservation_dict)
+                    indexed_reservations.append(indexed_reservation)
+            removed_ids = [reservation[0] for reservation in
+                           reservation_tuples] if conflict_ids else []
+            removed_reservations = [
+                dict(zip(('hotel_id', 'room_number', 'start_date',
+                          'end_date'), reservation[3:7]))
+                for reservation in reservation_tuples] if conflict_ids else []
             # If check-in, do all check-in logic: i) Ensure that check-out
             # has never been done previously, ii) check whether reservation is
             # associated with Presidential suite, and iii) assign one Catering
@@ -1883,12 +4004,15 @@ class Apps(object):
                             staff_df_result = staff_df.append(staff_df_result,
                                                               ignore_index=True)
                 # Execute update query
-                data_frame = self._execute_update_query(
-                    select_attr, 'Reservations', reservation_dict,
-                    where_clause_dict)
+                data_frame = self._execute_reservation_update(
+                    select_attr, reservation_dict, where_clause_dict,
+                    [reservation[0] for reservation in reservation_tuples])
                 data_frame = pd.concat((data_frame, staff_df_result), axis=1)
+                self._index_reservations(indexed_reservations, removed_ids)
+                self._summarize_reservations(indexed_reservations,
+                                             removed_reservations)
                 # Check for reservation conflicts:
-                self._check_reservation_conflict()
+                self._check_reservation_conflict(conflict_ids)
                 return data_frame
             # If check-out, do all check-out logic: i) Free dedicated staff,
             # ii) Add new Room Charge transaction into Transactions table
@@ -1904,26 +4028,133 @@ class Apps(object):
                         df_result = staff_transact_df.append(df_result,
                                                              ignore_index=True)
                 # Execute update query
-                data_frame = self._execute_update_query(
-                    select_attr, 'Reservations', reservation_dict,
-                    where_clause_dict)
+                data_frame = self._execute_reservation_update(
+                    select_attr, reservation_dict, where_clause_dict,
+                    [reservation[0] for reservation in reservation_tuples])
                 data_frame = pd.concat((data_frame, df_result), axis=1)
+                self._index_reservations(indexed_reservations, removed_ids)
+                self._summarize_reservations(indexed_reservations,
+                                             removed_reservations)
                 # Check for reservation conflicts:
-                self._check_reservation_conflict()
+                self._check_reservation_conflict(conflict_ids)
                 return data_frame
             # Execute update query - It is not check-in or check-out
             # Also queries for updated tuple and returns it as Pandas DataFrame
-            data_frame = self._execute_update_query(
-                select_attr, 'Reservations', reservation_dict,
-                where_clause_dict)
+            data_frame = self._execute_reservation_update(
+                select_attr, reservation_dict, where_clause_dict,
+                [reservation[0] for reservation in reservation_tuples])
+            self._index_reservations(indexed_reservations, removed_ids)
+            self._summarize_reservations(indexed_reservations,
+                                         removed_reservations)
             # Check for reservation conflicts:
-            self._check_reservation_conflict()
+            self._check_reservation_conflict(conflict_ids)
             return data_frame
         except AssertionError, error:
             raise error
         except maria_db.Error as error:
             raise error
 
+    def check_out_bulk(self, check_out_time, reservation_ids=None,
+                       departure_date=None, chunk_size=BULK_CHUNK_SIZE):
+        """
+        Checks out many reservations at once, e.g. all departures of a day at
+        the night audit.
+
+        The Reservations table must exist. Unlike update_reservation(), which
+        checks out one reservation at a time, it checks out all given
+        reservations that are not checked out yet with set-based statements of
+        at most chunk_size reservations each:
+        1) Locks the reservations and determines their room charges
+        (SELECT ... FOR UPDATE)
+        2) Frees all dedicated staff assigned to their rooms with one UPDATE
+        3) Inserts all room charges of type 'x-night(s) Room Reservation
+        Charge' into the Transactions table with one INSERT ... SELECT
+        4) Registers the check-out time with one UPDATE
+        The statements do not commit, so the caller (e.g. the client) runs
+        them in one transaction. Updated tuples are not queried back.
+
+        Parameters:
+            :param check_out_time: Check-out time of the reservations. It must
+            follow the DATETIME format YYYY-MM-DD HH:MM:SS. Used for
+            transaction date.
+            :param reservation_ids: List of Reservation IDs
+            :param departure_date: End date of the reservations (YYYY-MM-DD)
+            :param chunk_size: Maximum number of reservations per statement
+
+        Returns:
+            :return: Pandas DataFrame with a row per checked out reservation
+            and the columns: | id | check_out_time | Transaction_amount |
+            Transaction_type
+
+        Exceptions:
+            :raise: Assertion Error or MySQL Connector Error exceptions
+
+        TODO:
+        """
+        try:
+            if self.check:
+                # Perform validation
+                assert pd.to_datetime(check_out_time,
+                                      errors='coerce') is not pd.NaT, \
+                    'Exception: Check-out time must be specified and must ' \
+                    'follow the DATETIME format: YYYY-MM-DD HH:MM:SS.\n'
+            assert (reservation_ids is None) != (departure_date is None), \
+                'Exception: Specify either Reservation IDs or departure ' \
+                'date.\n'
+            # Lock reservations to be checked out and determine their charges
+            if departure_date is not None:
+                reservations = self._execute_statement(
+                    ('CHECK_OUT', 'Reservations', 'end_date'),
+                    lambda: QUERY_CHECK_OUT_RESERVATIONS.format(
+                        'Reservations.end_date = %s'),
+                    [departure_date]).fetchall()
+            else:
+                reservation_ids = list(reservation_ids)
+                reservations = []
+                for start in xrange(0, len(reservation_ids), chunk_size):
+                    chunk = reservation_ids[start:start + chunk_size]
+                    reservations.extend(self._execute_statement(
+                        ('CHECK_OUT', 'Reservations', len(chunk)),
+                        lambda: QUERY_CHECK_OUT_RESERVATIONS.format(
+                            'Reservations.id IN ({})'.format(
+                                ', '.join(['%s'] * len(chunk)))),
+                        chunk).fetchall())
+            checked_out_ids = [reservation[0] for reservation in reservations]
+            for start in xrange(0, len(checked_out_ids), chunk_size):
+                chunk = checked_out_ids[start:start + chunk_size]
+                placeholders = ', '.join(['%s'] * len(chunk))
+                # Free all dedicated staff
+                self._execute_statement(
+                    ('FREE_STAFF', 'Staff', len(chunk)),
+                    lambda: FREE_ASSIGNED_STAFF.format(placeholders), chunk)
+                # Add Room Charge transactions into Transactions table
+                self._execute_statement(
+                    ('ROOM_CHARGES', 'Transactions', len(chunk)),
+                    lambda: INSERT_ROOM_CHARGES.format(placeholders),
+                    [check_out_time] + chunk)
+                self._execute_statement(
+                    ('CHECK_OUT_TIME', 'Reservations', len(chunk)),
+                    lambda: UPDATE_CHECK_OUT_TIME.format(placeholders),
+                    [check_out_time] + chunk)
+            if checked_out_ids:
+                for table_name in ('Staff', 'Transactions', 'Reservations'):
+                    self._invalidate_local_state(table_name)
+                self._update_staff_pool()
+                self._summarize_transactions(added=[
+                    {'reservation_id': reservation[0],
+                     'amount': reservation[1], 'date': check_out_time}
+                    for reservation in reservations])
+            return pd.DataFrame.from_records(
+                [(reservation[0], check_out_time, reservation[1],
+                  '{}-night(s) Room Reservation Charge'.format(reservation[2]))
+                 for reservation in reservations],
+                columns=['id', 'check_out_time', 'Transaction_amount',
+                         'Transaction_type'], coerce_float=True)
+        except AssertionError, error:
+            raise error
+        except maria_db.Error as error:
+            raise error
+
     def delete_reservation(self, reservation_dict):
         """
         Deletes a tuple(s) from Reservations table.
@@ -1958,11 +4189,74 @@ class Apps(object):
                 assert reservation_dict, \
                     'Exception: Cannot identify tuple(s) to be deleted from ' \
                     'the table.\n'
-            return self._execute_delete_query('Reservations', reservation_dict)
+            # Determine deleted reservations for the interval index and the
+            # summary tables
+            deleted_tuples = []
+            if self.interval_index is not None and \
+                    self.interval_index.loaded or \
+                    self._has_summary_table(DAILY_OCCUPANCY_TABLE) or \
+                    self._has_summary_table(DAILY_REVENUE_TABLE):
+                deleted_tuples = self._execute_simple_select_query(
+                    'id, hotel_id, room_number, start_date, end_date',
+                    'Reservations', reservation_dict).fetchall()
+            # Their transactions get deleted by the cascading foreign key
+            if deleted_tuples and \
+                    self._has_summary_table(DAILY_REVENUE_TABLE):
+                self._summarize_transactions(removed=[
+                    dict(zip(('reservation_id', 'amount', 'date'),
+                             transaction))
+                    for transaction in get_reservation_transactions(
+                        self.cursor, [reservation[0]
+                                      for reservation in deleted_tuples])])
+            data_frame = self._execute_delete_query('Reservations',
+                                                    reservation_dict)
+            self._index_reservations(
+                [], [reservation[0] for reservation in deleted_tuples])
+            self._summarize_reservations(removed=[
+                dict(zip(('hotel_id', 'room_number', 'start_date', 'end_date'),
+                         reservation[1:5]))
+                for reservation in deleted_tuples])
+            return data_frame
         except maria_db.Error as error:
             raise error
 
     # Implementation of the program applications for the Reservations table
+    def _check_add_transaction(self, transaction_dict):
+        """
+        Performs assertions ensuring that transaction data to be added obeys
+        MySQL constraints that are ignored by current MySQL MariaDB version.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced by
+        add_transaction() and add_transaction_bulk() when check boolean
+        parameter is enabled.
+
+        Parameters:
+            :param transaction_dict: Dictionary of attributes and values to be
+            stored in the Transactions table
+
+        Returns:
+            :return:
+
+        Exceptions:
+            :raise: Assertion Error exception
+        """
+        assert transaction_dict, \
+            'Exception: Cannot add tuple into the table. Required ' \
+            'attributes are not specified.\n'
+        assert 'amount' in transaction_dict, \
+            'Exception: Amount of the transaction must be specified ' \
+            'in US dollars.\n'
+        assert 'type' in transaction_dict and \
+               transaction_dict['type'], \
+            'Exception: Description of type of the transaction must ' \
+            'be specified and must be non-empty.\n'
+        assert 'date' in transaction_dict and \
+               pd.to_datetime(transaction_dict['date'],
+                              errors='coerce') is not pd.NaT, \
+            'Exception: Date of the transaction must follow the DATE ' \
+            'format: YYYY-MM-DD HH:MM:SS.\n'
+
     def add_transaction(self, transaction_dict):
         """
         Adds new tuple of transaction into Transactions table.
@@ -2010,26 +4304,54 @@ class Apps(object):
         try:
             if self.check:
                 # Perform validation
-                assert transaction_dict, \
-                    'Exception: Cannot add tuple into the table. Required ' \
-                    'attributes are not specified.\n'
-                assert 'amount' in transaction_dict, \
-                    'Exception: Amount of the transaction must be specified ' \
-                    'in US dollars.\n'
-                assert 'type' in transaction_dict and \
-                       transaction_dict['type'], \
-                    'Exception: Description of type of the transaction must ' \
-                    'be specified and must be non-empty.\n'
-                assert 'date' in transaction_dict and \
-                       pd.to_datetime(transaction_dict['date'],
-                                      errors='coerce') is not pd.NaT, \
-                    'Exception: Date of the transaction must follow the DATE ' \
-                    'format: YYYY-MM-DD HH:MM:SS.\n'
+                self._check_add_transaction(transaction_dict)
             # Execute insert query
-            self._execute_insert_query(transaction_dict, 'Transactions')
+            cursor = self._execute_insert_query(transaction_dict,
+                                                'Transactions')
+            self._summarize_transactions(added=[transaction_dict])
             # Query for this inserted tuple and return it as Pandas DataFrame
-            data_frame = self.get_data_frame(
-                '*', 'Transactions', {'id': self.cursor.lastrowid})
+            data_frame = self._get_inserted_data_frame(
+                'Transactions', transaction_dict, {'id': cursor.lastrowid})
+            return data_frame
+        except AssertionError, error:
+            raise error
+        except maria_db.Error as error:
+            raise error
+
+    def add_transaction_bulk(self, transaction_rows,
+                             chunk_size=BULK_CHUNK_SIZE):
+        """
+        Adds multiple tuples of transactions into Transactions table at once.
+
+        The Transactions table must exist. It validates all given rows first
+        (if check boolean parameter is enabled) and then inserts them with
+        multi-row INSERT query statements of at most chunk_size tuples each by
+        calling private helper function _execute_bulk_insert(). Unlike
+        add_transaction(), the inserted tuples are not queried back.
+
+        Parameters:
+            :param transaction_rows: List of dictionaries or Pandas DataFrame
+            of transaction attributes and values to be stored in the
+            Transactions table. Each row may include the same attributes as the
+            dictionary of add_transaction().
+            :param chunk_size: Maximum number of tuples inserted by one INSERT
+            query statement
+
+        Returns:
+            :return: Pandas DataFrame with the ID of each added tuple, in the
+            order of the given rows
+
+        Exceptions:
+            :raise: Assertion Error or MySQL Connector Error exceptions
+
+        TODO:
+        """
+        try:
+            data_frame = self._execute_bulk_insert(
+                transaction_rows, 'Transactions', self._check_add_transaction,
+                chunk_size)
+            self._summarize_transactions(
+                added=get_bulk_rows(transaction_rows))
             return data_frame
         except AssertionError, error:
             raise error
@@ -2094,11 +4416,30 @@ class Apps(object):
                 [attr for attr in transaction_dict.iterkeys()])
             if 'id' not in transaction_dict:
                 select_attr = 'id, ' + select_attr
+            # Updated transactions move to their new reservation, amount or
+            # date in the summary table
+            updated_transactions = []
+            if any(attr in transaction_dict for attr in
+                   ('reservation_id', 'amount', 'date')) and \
+                    self._has_summary_table(DAILY_REVENUE_TABLE):
+                updated_transactions = [
+                    dict(zip(('reservation_id', 'amount', 'date'),
+                             transaction))
+                    for transaction in self._execute_simple_select_query(
+                        'reservation_id, amount, date', 'Transactions',
+                        where_clause_dict).fetchall()]
             # Execute update query
             # Also queries for updated tuple and returns it as Pandas DataFrame
             data_frame = self._execute_update_query(
                 select_attr, 'Transactions', transaction_dict,
                 where_clause_dict)
+            self._summarize_transactions(
+                [dict(transaction, **{
+                    attr: transaction_dict[attr] for attr in
+                    ('reservation_id', 'amount', 'date')
+                    if attr in transaction_dict})
+                 for transaction in updated_transactions],
+                updated_transactions)
             return data_frame
         except AssertionError, error:
             raise error
@@ -2139,11 +4480,47 @@ class Apps(object):
                 assert transaction_dict, \
                     'Exception: Cannot identify tuple(s) to be deleted from ' \
                     'the table.\n'
-            return self._execute_delete_query('Transactions', transaction_dict)
+            # Determine deleted transactions for the summary table
+            deleted_transactions = []
+            if self._has_summary_table(DAILY_REVENUE_TABLE):
+                deleted_transactions = [
+                    dict(zip(('reservation_id', 'amount', 'date'),
+                             transaction))
+                    for transaction in self._execute_simple_select_query(
+                        'reservation_id, amount, date', 'Transactions',
+                        transaction_dict).fetchall()]
+            data_frame = self._execute_delete_query('Transactions',
+                                                    transaction_dict)
+            self._summarize_transactions(removed=deleted_transactions)
+            return data_frame
         except maria_db.Error as error:
             raise error
 
     # Implementation of the program applications for the Serves table
+    def _check_add_serves(self, serves_dict):
+        """
+        Performs assertions ensuring that serves data to be added obeys MySQL
+        constraints that are ignored by current MySQL MariaDB version.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced by
+        add_serves() and add_serves_bulk() when check boolean parameter is
+        enabled.
+
+        Parameters:
+            :param serves_dict: Dictionary of attributes and values to be
+            stored in the Serves table
+
+        Returns:
+            :return:
+
+        Exceptions:
+            :raise: Assertion Error exception
+        """
+        assert serves_dict, \
+            'Exception: Cannot add tuple into the table. Required ' \
+            'attributes are not specified.\n'
+
     def add_serves(self, serves_dict):
         """
         Adds new tuple of staff serves reservation into Serves table.
@@ -2184,14 +4561,12 @@ class Apps(object):
         try:
             if self.check:
                 # Perform validation
-                assert serves_dict, \
-                    'Exception: Cannot add tuple into the table. Required ' \
-                    'attributes are not specified.\n'
+                self._check_add_serves(serves_dict)
             # Execute insert query
             self._execute_insert_query(serves_dict, 'Serves')
             # Query for this inserted tuple and return it as Pandas DataFrame
-            data_frame = self.get_data_frame(
-                '*', 'Serves', {
+            data_frame = self._get_inserted_data_frame(
+                'Serves', serves_dict, {
                     'staff_id': serves_dict['staff_id'],
                     'reservation_id': serves_dict['reservation_id']})
             return data_frame
@@ -2200,6 +4575,43 @@ class Apps(object):
         except maria_db.Error as error:
             raise error
 
+    def add_serves_bulk(self, serves_rows, chunk_size=BULK_CHUNK_SIZE):
+        """
+        Adds multiple tuples of staff-reservation interactions into Serves
+        table at once.
+
+        The Serves table must exist. It validates all given rows first (if
+        check boolean parameter is enabled) and then inserts them with multi-
+        row INSERT query statements of at most chunk_size tuples each by
+        calling private helper function _execute_bulk_insert(). Unlike
+        add_serves(), the inserted tuples are not queried back.
+
+        Parameters:
+            :param serves_rows: List of dictionaries or Pandas DataFrame of
+            serves attributes and values to be stored in the Serves table. Each
+            row may include the same attributes as the dictionary of
+            add_serves().
+            :param chunk_size: Maximum number of tuples inserted by one INSERT
+            query statement
+
+        Returns:
+            :return: Pandas DataFrame with the staff ID and reservation ID of
+            each added tuple, in the order of the given rows
+
+        Exceptions:
+            :raise: Assertion Error or MySQL Connector Error exceptions
+
+        TODO:
+        """
+        try:
+            data_frame = self._execute_bulk_insert(
+                serves_rows, 'Serves', self._check_add_serves, chunk_size)
+            return data_frame
+        except AssertionError, error:
+            raise error
+        except maria_db.Error as error:
+            raise error
+
     def update_serves(self, serves_dict, where_clause_dict):
         """
         Updates a tuple in the Serves table.
@@ -2300,13 +4712,17 @@ class Apps(object):
         for start and end dates, this function does the following:
         1) Generates a string of attributes names displayed in Pandas DataFrame
         2) Generates a table statement followed by FROM in a query
-        3) Generates nested WHERE clause which is used in Reservations table to
-        query for specific dates
+        3) Generates nested WHERE clause which excludes rooms having a
+        reservation that overlaps with the specific dates (anti-join with the
+        Reservations table)
         4) Generate complete where clause with attributes and values specified
         in the dictionary argument
         5) Gets Pandas DataFrame for available room(s) by calling internal
         helper function get_data_frame() with arguments generated in this
         function
+        If the interval index is enabled, steps 2 to 5 are replaced by a lookup
+        of the rooms in the room catalog and the interval index kept in memory,
+        unless some of the filtering options are not supported by the catalog.
 
         Parameters:
             :param dictionary: Dictionary of attributes and values used as
@@ -2358,14 +4774,16 @@ class Apps(object):
             # Zip is ambiguous so change it to a Hotels.zip
             if 'zip' in dictionary:
                 dictionary['Hotels.zip'] = dictionary.pop('zip')
+            # Check availability in memory if the interval index is enabled
+            if self.interval_index is not None:
+                result = self._get_available_rooms(dictionary, start_date,
+                                                   end_date)
+                if result is not None:
+                    return result.to_data_frame() \
+                        if self.result_mode == RESULT_FRAME else result
             # Generate the entire SELECT query
             nested_where_clause = ROOM_AVAILABILITY_NESTED_WHERE_CLAUSE
             # Generate final WHERE clause
-            if 'hotel_id' in dictionary:
-                nested_where_clause = nested_where_clause + \
-                               ' AND hotel_id = %s ))'
-            else:
-                nested_where_clause = nested_where_clause + '))'
             where_clause = ' AND '.join(
                 [attr + '=%s' for attr in dictionary.iterkeys()]) + ' AND ' \
                 if dictionary else ''
@@ -2377,14 +4795,10 @@ class Apps(object):
                 ROOM_AVAILABILITY_TABLE_STATEMENT,
                 where_clause
             )
-            params = dictionary.values() + [start_date, end_date] * 3
-            if 'hotel_id' in dictionary:
-                params.append(dictionary['hotel_id'])
+            params = dictionary.values() + [end_date, start_date]
             # SELECT statement is ready. Get Pandas DataFrame and return it.
             # Execute select query
-            data_frame = pd.read_sql(select_query,
-                                     params=params,
-                                     con=self.maria_db_connection)
+            data_frame = self._read_replica(select_query, params)
             return data_frame
         except AssertionError, error:
             raise error
@@ -2398,54 +4812,131 @@ class Apps(object):
 
         For a given reservation ID, specified as an argument, this function
         does the following:
-        1) Constructs total amount due Pandas DataFrame with three columns:
-        | Cost | Discount | Total Amount Due
+        1) Retrieves the itemized charges and whether the customer pays with
+        the hotel credit card by a single query
         2) Constructs a list of itemized charges as Pandas DataFrame with four
         columns: | Transaction ID | Amount | Description | Date
-        3) Concatenates two Pandas DataFrames and returns it to the caller
-        function
+        3) Constructs total amount due Pandas DataFrame with three columns:
+        | Cost | Discount | Total Amount Due
+        computed from the itemized charges
 
         Parameters:
             :param reservation_id: Reservation ID for which total amount due is
             calculated applying discount and a list of itemized charges is
-            calculated (does not include discount). The same ID is used for
-            two different queries.
+            calculated (does not include discount).
 
         Returns:
             :return: List with two Pandas DataFrames (two-dimensional
             size-mutable, heterogeneous tabular data structure with labeled
-            axes) retrieved from pandas.read_sql() function for two queries in
-            stored in the list respectively:
-                - GENERATE_BILL_TOTAL_AMOUNT_DUE: generates a bill for total
-                amount
-                - GENERATE_BILL_ITEMIZED_CHARGES: generates a bill for itemized
-                charges
+            axes) stored in the list respectively:
+                - itemized charges
+                - total amount due
         """
         if self.check:
             # Perform validation
             assert reservation_id is not None and reservation_id, \
                 'Exception: Invalid Reservation ID. Please specify valid ' \
                 'Reservation ID.\n'
-        # Construct total amount due Pandas DataFrame
-        total_due_df = pd.read_sql(GENERATE_BILL_TOTAL_AMOUNT_DUE,
-                                   con=self.maria_db_connection,
-                                   params=[reservation_id] * 2)
-        # Construct list of itemized charges as Pandas DataFrame
-        itemized_df = pd.read_sql(GENERATE_BILL_ITEMIZED_CHARGES,
-                                  con=self.maria_db_connection,
-                                  params=[reservation_id])
-        # Return two concatenated Pandas DataFrames
-        return [itemized_df, total_due_df]
-        # return pd.concat((total_due_df, itemized_df), axis=1)
+        bills = self._generate_bills('Reservations.id = %s', [reservation_id])
+        if bills:
+            return bills.values()[0]
+        return self._get_bill_result(_build_bill(False, []))
+
+    def generate_bills(self, reservation_ids=None, departure_date=None):
+        """
+        Generates the bills of many reservations at once, e.g. of all
+        departures on the check-out morning.
+
+        The itemized charges of all reservations are retrieved by a single
+        query, either for the list of reservation IDs or for the reservations
+        ending on the departure date. Exactly one of them must be specified.
+
+        Parameters:
+            :param reservation_ids: List of Reservation IDs
+            :param departure_date: End date of the reservations (YYYY-MM-DD)
+
+        Returns:
+            :return: Ordered dictionary of Reservation ID and its bill in the
+            order of Reservation IDs. Each bill is a list with two Pandas
+            DataFrames as returned by generate_bill(). Reservation IDs that do
+            not exist are left out.
+
+        Exceptions:
+            :raise: Assertion Error if not exactly one of the arguments is
+            specified
+        """
+        assert (reservation_ids is None) != (departure_date is None), \
+            'Exception: Specify either Reservation IDs or departure date.\n'
+        if departure_date is not None:
+            return self._generate_bills('Reservations.end_date = %s',
+                                        [departure_date])
+        reservation_ids = list(reservation_ids)
+        if not reservation_ids:
+            return OrderedDict()
+        return self._generate_bills(
+            'Reservations.id IN ({})'.format(
+                ', '.join(['%s'] * len(reservation_ids))), reservation_ids)
+
+    def _generate_bills(self, condition, values):
+        """
+        Generates the bills of the reservations satisfying a condition.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers. It is referenced by
+        generate_bill() and generate_bills(). The charges are fetched once and
+        the totals are computed from them.
+
+        Parameters:
+            :param condition: Condition on the Reservations table in python
+            format
+            :param values: List of values used for the condition
+
+        Returns:
+            :return: Ordered dictionary of Reservation ID and its bill
+        """
+        charges = self._read_replica(GENERATE_BILLS.format(condition), values,
+                                     RESULT_ROWS)
+        bills = OrderedDict()
+        reservation_id = None
+        for row in charges:
+            if row[0] != reservation_id:
+                reservation_id = row[0]
+                bill = bills[reservation_id] = (row[1], [])
+            if row[2] is not None:
+                bill[1].append(row[2:])
+        for reservation_id, (is_hotel_card, items) in bills.iteritems():
+            bills[reservation_id] = self._get_bill_result(
+                _build_bill(is_hotel_card, items))
+        return bills
+
+    def _get_bill_result(self, bill):
+        """
+        Converts a bill into the result mode of the class.
+
+        This is private function of the class and not intended to be referenced
+        by either front-end or back-end layers.
+
+        Parameters:
+            :param bill: List of ResultSets built by _build_bill()
+
+        Returns:
+            :return: List of Pandas DataFrames or ResultSets
+        """
+        if self.result_mode == RESULT_FRAME:
+            return [result.to_data_frame() for result in bill]
+        return bill
 
     # Reports apps implemented below.
-    def report_occupancy_by_hotel(self, query_date):
+    def report_occupancy_by_hotel(self, query_date, result_mode=None):
         """
         Generates a report of occupancy for all hotels on the query date,
         showing the number of rooms occupied and the percentage occupancy.
 
         Parameters:
             :param query_date: The date for which the occupancy will be reported
+            :param result_mode: RESULT_FRAME or RESULT_ROWS. If None, the
+            result mode of the class is used. In the rows result mode, a
+            ResultSet with the same columns is returned instead.
 
         Returns:
             :return: Pandas dataframe containing a row for each hotel, with the
@@ -2459,17 +4950,25 @@ class Apps(object):
                            the rooms occupied divided by the total rooms.
         """
 
-        df = pd.read_sql(REPORT_OCCUPANCY_BY_HOTEL,
-                         con=self.maria_db_connection,
-                         params=[query_date] * 2)
+        if self.rollups:
+            return self._read_report('report_occupancy_by_hotel',
+                                     REPORT_OCCUPANCY_BY_HOTEL_ROLLUP,
+                                     [query_date], result_mode)
+        df = self._read_report('report_occupancy_by_hotel',
+                               REPORT_OCCUPANCY_BY_HOTEL,
+                               [query_date] * 2,
+                               result_mode)
         return df
 
-    def report_occupancy_by_room_type(self, query_date):
+    def report_occupancy_by_room_type(self, query_date, result_mode=None):
         """
         Generates a report of occupancy across all hotels, grouped by room type.
 
         Parameters:
             :param query_date: The date for which the occupancy will be reported
+            :param result_mode: RESULT_FRAME or RESULT_ROWS. If None, the
+            result mode of the class is used. In the rows result mode, a
+            ResultSet with the same columns is returned instead.
 
         Returns:
             :return: Pandas dataframe containing a row for each room type,
@@ -2481,17 +4980,25 @@ class Apps(object):
               % Occupancy: The percent occupancy for the room type.
         """
 
-        df = pd.read_sql(REPORT_OCCUPANCY_BY_ROOM_TYPE,
-                         con=self.maria_db_connection,
-                         params=[query_date] * 2)
+        if self.rollups:
+            return self._read_report('report_occupancy_by_room_type',
+                                     REPORT_OCCUPANCY_BY_ROOM_TYPE_ROLLUP,
+                                     [query_date], result_mode)
+        df = self._read_report('report_occupancy_by_room_type',
+                               REPORT_OCCUPANCY_BY_ROOM_TYPE,
+                               [query_date] * 2,
+                               result_mode)
         return df
 
-    def report_occupancy_by_city(self, query_date):
+    def report_occupancy_by_city(self, query_date, result_mode=None):
         """
         Generates a report of occupancy from all hotels, grouped by city.
 
         Parameters:
             :param query_date: The date for which the occupancy will be reported
+            :param result_mode: RESULT_FRAME or RESULT_ROWS. If None, the
+            result mode of the class is used. In the rows result mode, a
+            ResultSet with the same columns is returned instead.
 
         Returns:
             :return: Pandas dataframe containing a row for each city,
@@ -2503,18 +5010,65 @@ class Apps(object):
               % Occupancy: The percent occupancy for the room type.
         """
 
-        df = pd.read_sql(REPORT_OCCUPANCY_BY_CITY,
-                         con=self.maria_db_connection,
-                         params=[query_date] * 2)
+        if self.rollups:
+            return self._read_report('report_occupancy_by_city',
+                                     REPORT_OCCUPANCY_BY_CITY_ROLLUP,
+                                     [query_date], result_mode)
+        df = self._read_report('report_occupancy_by_city',
+                               REPORT_OCCUPANCY_BY_CITY,
+                               [query_date] * 2,
+                               result_mode)
         return df
 
-    def report_occupancy_by_date_range(self, query_start, query_end):
+    def report_occupancy_combined(self, query_date, result_mode=None):
+        """
+        Generates the reports of occupancy by hotel, by room type and by city
+        on the query date at once.
+
+        The occupied and total rooms are queried once per hotel and room type
+        and the three reports are grouped from that single result, instead of
+        executing the three report queries.
+
+        Parameters:
+            :param query_date: The date for which the occupancy will be reported
+            :param result_mode: RESULT_FRAME or RESULT_ROWS. If None, the
+            result mode of the class is used. In the rows result mode,
+            ResultSets with the same columns are returned instead.
+
+        Returns:
+            :return: List of three Pandas dataframes with the same columns as
+            returned by report_occupancy_by_hotel(),
+            report_occupancy_by_room_type() and report_occupancy_by_city()
+        """
+        if result_mode is None:
+            result_mode = self.result_mode
+        if self.rollups:
+            df = self._read_report('report_occupancy_combined',
+                                   REPORT_OCCUPANCY_COMBINED_ROLLUP,
+                                   [query_date], RESULT_FRAME)
+        else:
+            df = self._read_report('report_occupancy_combined',
+                                   REPORT_OCCUPANCY_COMBINED,
+                                   [query_date] * 2, RESULT_FRAME)
+        reports = [_group_occupancy(df, ['Hotel ID', 'Hotel Name']),
+                   _group_occupancy(df, ['Room Type']),
+                   _group_occupancy(df, ['City, State'])]
+        if result_mode == RESULT_ROWS:
+            return [ResultSet(report.columns, report.itertuples(index=False))
+                    for report in reports]
+        return reports
+
+    def report_occupancy_by_date_range(self, query_start, query_end,
+                                       result_mode=None):
         """
         Generates a report of the occupancy over a date range
 
         Parameters:
             :param query_start: The date for which to start the report
             :param query_end: The date for which to end the report
+            :param result_mode: RESULT_FRAME or RESULT_ROWS. If None, the
+            result mode of the class is used. In the rows result mode, a
+            ResultSet with the same columns is returned instead.
 
         Returns:
             :return: Pandas dataframe containing a single row with the columns:
@@ -2528,19 +5082,94 @@ class Apps(object):
                            possible bookings.
         """
 
-        df = pd.read_sql(REPORT_OCCUPANCY_BY_DATE_RANGE,
-                         con=self.maria_db_connection,
-                         params=[query_end,
-                                 query_start] * 4)
+        df = self._read_report('report_occupancy_by_date_range',
+                               REPORT_OCCUPANCY_BY_DATE_RANGE,
+                               [query_end, query_start] * 4,
+                               result_mode)
         return df
 
-    def report_staff_by_role(self, hotel_id):
+    def report_occupancy_time_series(self, query_start, query_end,
+                                     result_mode=None):
+        """
+        Generates a report of the daily occupancy of every hotel over a date
+        window, e.g. 90 or 365 days for forecasting.
+
+        The reservations overlapping the window are queried once. Each of them
+        adds 1 to a hotel x day matrix on its (clipped) start day and subtracts
+        1 on its (clipped) end day, so the cumulative sums along the days give
+        the number of occupied rooms of every hotel on every day. A room is
+        occupied on a day as in report_occupancy_by_hotel(), i.e. from the
+        start date up to the day before the end date.
+
+        Parameters:
+            :param query_start: The first date of the window
+            :param query_end: The date following the last date of the window,
+            as in report_occupancy_by_date_range()
+            :param result_mode: RESULT_FRAME or RESULT_ROWS. If None, the
+            result mode of the class is used. In the rows result mode, a
+            ResultSet with the same columns is returned instead.
+
+        Returns:
+            :return: Pandas dataframe with a row per hotel and day, ordered by
+            hotel ID and date, with the columns:
+              Date: The day
+              Hotel ID: ID of the hotel
+              Hotel Name: Name of the hotel
+              Rooms Occupied: The number of rooms occupied on the day
+              Total Rooms: The number of rooms of the hotel
+              % Occupancy: Rooms Occupied divided by Total Rooms
+            The matrix of hotels and days is obtained by
+            df.pivot('Date', 'Hotel ID', '% Occupancy').
+
+        Exceptions:
+            :raise: Assertion Error if the window is empty
+        """
+        if result_mode is None:
+            result_mode = self.result_mode
+        start = np.datetime64(to_date(query_start), 'D')
+        days = int((np.datetime64(to_date(query_end), 'D') - start) /
+                   np.timedelta64(1, 'D'))
+        assert days > 0, 'Exception: End date must follow start date.\n'
+        df = self._read_report('report_occupancy_time_series',
+                               REPORT_OCCUPANCY_TIME_SERIES,
+                               [query_end, query_start], RESULT_FRAME)
+        hotels = df.drop_duplicates('Hotel ID')
+        hotel_ids = hotels['Hotel ID'].values
+        total_rooms = hotels['Total Rooms'].values.astype(np.int64)
+        reservations = df[df['start_date'].notnull()]
+        # Reservations are ordered by hotel ID like the hotels
+        rows = np.searchsorted(hotel_ids, reservations['Hotel ID'].values)
+        starts = (pd.to_datetime(reservations['start_date']).values.astype(
+            'datetime64[D]') - start) / np.timedelta64(1, 'D')
+        ends = (pd.to_datetime(reservations['end_date']).values.astype(
+            'datetime64[D]') - start) / np.timedelta64(1, 'D')
+        changes = np.zeros((len(hotel_ids), days + 1), dtype=np.int64)
+        np.add.at(changes, (rows, np.clip(starts, 0, days).astype(int)), 1)
+        np.add.at(changes, (rows, np.clip(ends, 0, days).astype(int)), -1)
+        occupied = changes.cumsum(axis=1)[:, :days]
+        occupancy = _occupancy_percent(occupied, total_rooms[:, np.newaxis])
+        dates = pd.date_range(str(start), periods=days)
+        report = pd.DataFrame(OrderedDict([
+            ('Date', np.tile(dates.values, len(hotel_ids))),
+            ('Hotel ID', np.repeat(hotel_ids, days)),
+            ('Hotel Name', np.repeat(hotels['Hotel Name'].values, days)),
+            ('Rooms Occupied', occupied.ravel()),
+            ('Total Rooms', np.repeat(total_rooms, days)),
+            ('% Occupancy', occupancy.ravel())]))
+        if result_mode == RESULT_ROWS:
+            return ResultSet(report.columns, report.itertuples(index=False))
+        return report
+
+    def report_staff_by_role(self, hotel_id, result_mode=None):
         """
         Report all the staff in a given hotel
         sorted by their role (department and title)
 
         Parameters:
             :param hotel_id: The hotel id for which to report staff.
+            :param result_mode: RESULT_FRAME or RESULT_ROWS. If None, the
+            result mode of the class is used. In the rows result mode, a
+            ResultSet with the same columns is returned instead.
 
         Returns:
             :return: Pandas dataframe containing a list of staff that work
@@ -2551,18 +5180,22 @@ class Apps(object):
               Staff ID
         """
 
-        df = pd.read_sql(REPORT_STAFF_BY_ROLE,
-                         con=self.maria_db_connection,
-                         params=[hotel_id])
+        df = self._read_report('report_staff_by_role',
+                               REPORT_STAFF_BY_ROLE,
+                               [hotel_id],
+                               result_mode)
         return df
 
-    def report_customer_interactions(self, reservation_id):
+    def report_customer_interactions(self, reservation_id, result_mode=None):
         """
         Generates a report of all customer interactions for a given reservation
 
         Parameters:
             :param reservation_id: The reservation for which to report
             customer interactions.
+            :param result_mode: RESULT_FRAME or RESULT_ROWS. If None, the
+            result mode of the class is used. In the rows result mode, a
+            ResultSet with the same columns is returned instead.
 
         Returns:
             :return: Pandas dataframe containing a list of all staff that
@@ -2571,12 +5204,14 @@ class Apps(object):
               Staff ID
         """
 
-        df = pd.read_sql(REPORT_CUSTOMER_INTERACTIONS,
-                         con=self.maria_db_connection,
-                         params=[reservation_id])
+        df = self._read_report('report_customer_interactions',
+                               REPORT_CUSTOMER_INTERACTIONS,
+                               [reservation_id],
+                               result_mode)
         return df
 
-    def report_revenue_single_hotel(self, start_date, end_date, hotel_id):
+    def report_revenue_single_hotel(self, start_date, end_date, hotel_id,
+                                    result_mode=None):
         """
         Generate a report of the revenue for a given hotel.
 
@@ -2584,6 +5219,9 @@ class Apps(object):
             :param start_date: The revenue report query start date.
             :param end_date: The revenue report query end date.
             :param hotel_id: The hotel id for which to report revenue.
+            :param result_mode: RESULT_FRAME or RESULT_ROWS. If None, the
+            result mode of the class is used. In the rows result mode, a
+            ResultSet with the same columns is returned instead.
 
         Returns:
             :return: Pandas dataframe containing the revenue for the given hotel
@@ -2592,18 +5230,27 @@ class Apps(object):
               Revenue
         """
 
-        df = pd.read_sql(REPORT_REVENUE_SINGLE_HOTEL,
-                         con=self.maria_db_connection,
-                         params=[start_date, end_date, hotel_id])
+        if self.rollups:
+            return self._read_report('report_revenue_single_hotel',
+                                     REPORT_REVENUE_SINGLE_HOTEL_ROLLUP,
+                                     [start_date, end_date, hotel_id],
+                                     result_mode)
+        df = self._read_report('report_revenue_single_hotel',
+                               REPORT_REVENUE_SINGLE_HOTEL,
+                               [start_date, end_date, hotel_id],
+                               result_mode)
         return df
 
-    def report_revenue_all_hotels(self, start_date, end_date):
+    def report_revenue_all_hotels(self, start_date, end_date, result_mode=None):
         """
         Generate a report of the revenue for all hotels.
 
         Parameters:
             :param start_date: The revenue report query start date.
             :param end_date: The revenue report query end date.
+            :param result_mode: RESULT_FRAME or RESULT_ROWS. If None, the
+            result mode of the class is used. In the rows result mode, a
+            ResultSet with the same columns is returned instead.
 
         Returns:
             :return: Pandas dataframe containing the revenue for all hotels
@@ -2612,7 +5259,12 @@ class Apps(object):
               Revenue
         """
 
-        df = pd.read_sql(REPORT_REVENUE_ALL_HOTELS,
-                         con=self.maria_db_connection,
-                         params=[start_date, end_date])
+        if self.rollups:
+            return self._read_report('report_revenue_all_hotels',
+                                     REPORT_REVENUE_ALL_HOTELS_ROLLUP,
+                                     [start_date, end_date], result_mode)
+        df = self._read_report('report_revenue_all_hotels',
+                               REPORT_REVENUE_ALL_HOTELS,
+                               [start_date, end_date],
+                               result_mode)
         return df
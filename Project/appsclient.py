@@ -26,8 +26,12 @@ See hotelsoft.py for execution instructions.
           Preston Scott
 """
 
-from apps import Apps
+from apps import Apps, BULK_CHUNK_SIZE, EXPORT_CHUNK_SIZE, get_bulk_rows
+from export import export_chunks
+from rows import RESULT_ROWS
 import pandas as pd
+from collections import OrderedDict
+from contextlib import contextmanager
 from util import sql_transaction
 
 
@@ -190,15 +194,22 @@ class AppsParams(object):
          'set': ['e.g. 1', 'e.g. 2']})
     gen_bill = ReportAttributes(
         'Generate_bill', {'set': ['reservation_id']}, {'set': ['e.g. 1']})
+    gen_bills = ReportAttributes(
+        'Generate_bills', {'set': ['departure_date']}, {'set': ['YYYY-MM-DD']})
     occ_hotel = ReportAttributes(
         'Occupancy_hotel', {'set': ['query_date']}, {'set': ['YYYY-MM-DD']})
     occ_room = ReportAttributes(
         'Occupancy_room', {'set': ['query_date']}, {'set': ['YYYY-MM-DD']})
     occ_city = ReportAttributes(
         'Occupancy_city', {'set': ['query_date']}, {'set': ['YYYY-MM-DD']})
+    occ_all = ReportAttributes(
+        'Occupancy_all', {'set': ['query_date']}, {'set': ['YYYY-MM-DD']})
     occ_date = ReportAttributes(
         'Occupancy_date', {'set': ['start_date', 'end_date']},
         {'set': ['YYYY-MM-DD', 'YYYY-MM-DD']})
+    occ_series = ReportAttributes(
+        'Occupancy_series', {'set': ['start_date', 'end_date']},
+        {'set': ['YYYY-MM-DD', 'YYYY-MM-DD']})
     list_staff = ReportAttributes(
         'List_staff', {'set': ['hotel_id']}, {'set': ['e.g. 1']})
     cust_inter = ReportAttributes(
@@ -226,19 +237,76 @@ class AppsClient(object):
     """
     Client interface to Apps API
     """
-    def __init__(self, db, check=False):
+    def __init__(self, db, check=False, **apps_args):
         """
         Instantiates client class.
         This class in turn instantiations the Apps API class and passes the db
         connection
 
         Parameters:
-            :param db: a mysql.connector connection
+            :param db: a mysql.connector connection or a ConnectionPool, in
+            which case every operation checks out its own connection
             :param check: Boolean indicating whether SQL checks should be used
+            :param apps_args: Additional keyword arguments of the Apps API
+            class (e.g. prepared, read_back)
         """
-        self.apps = Apps(db, check)
+        self.apps = Apps(db, check, **apps_args)
         self.db = db
 
+    @contextmanager
+    def _transaction(self):
+        """
+        Binds a connection to the Apps API (checked out of the pool, if one is
+        used) and wraps the code in a SQL transaction on that connection. If
+        the transaction gets rolled back, the data the Apps API keeps in memory
+        (e.g. the interval index) is discarded, since it may contain the rolled
+        back writes. If it gets committed, its writes are published to the
+        report cache.
+
+        Returns:
+            :return: The database connection used for the transaction
+        """
+        with self.apps.connection() as con:
+            try:
+                with sql_transaction(con):
+                    yield con
+            except Exception:
+                self.apps.discard_local_state()
+                raise
+            self.apps.commit_local_state()
+
+    def check_out_bulk(self, check_out_time, reservation_ids=None,
+                       departure_date=None):
+        """
+        Used to check out many reservations at once (e.g. all departures of a
+        day) within one transaction. Interfaces with check_out_bulk method in
+        Apps.py
+
+        Parameters:
+            :param check_out_time: Check-out time (YYYY-MM-DD HH:MM:SS)
+            :param reservation_ids: List of Reservation IDs
+            :param departure_date: End date of the reservations (YYYY-MM-DD)
+
+        Returns:
+            :return: Pandas data frame with the checked out reservations and
+            their room charges or Error
+        """
+        with self._transaction():
+            return self.apps.check_out_bulk(check_out_time, reservation_ids,
+                                            departure_date)
+
+    def report_cache_stats(self):
+        """
+        Reports the hit and miss statistics of the report cache.
+
+        Returns:
+            :return: Dictionary returned by ReportCache.stats(), or empty
+            dictionary if reports are not cached
+        """
+        if self.apps.report_cache is None:
+            return {}
+        return self.apps.report_cache.stats()
+
     # Helper interfaces
     def select(self, where_dict, table_name):
         """
@@ -250,10 +318,36 @@ class AppsClient(object):
         Returns:
             :return: Pandas data frame or Error
         """
-        if where_dict is not None:
-            return self.apps.get_data_frame('*', table_name, where_dict)
-        else:
-            return self.apps.get_data_frame('*', table_name)
+        with self.apps.connection():
+            if where_dict is not None:
+                return self.apps.get_data_frame('*', table_name, where_dict)
+            else:
+                return self.apps.get_data_frame('*', table_name)
+
+    def export(self, where_dict, table_name, path, date_window=None,
+               chunk_size=EXPORT_CHUNK_SIZE):
+        """
+        Used to export a table (e.g. Transactions for accounting) into a CSV,
+        gzip compressed CSV or Parquet file with bounded memory. Interfaces
+        with iter_data_frame method in Apps.py
+
+        Parameters:
+            :param where_dict: dictionary of attributes for the select clause,
+            or None to export all tuples
+            :param table_name: Name of SQL table to export
+            :param path: Path of the file (.csv, .csv.gz or .parquet)
+            :param date_window: Tuple of date attribute name, start date and
+            end date (YYYY-MM-DD), or None
+            :param chunk_size: Number of tuples read and written at once
+
+        Returns:
+            :return: Number of exported rows or Error
+        """
+        with self.apps.connection():
+            return export_chunks(
+                self.apps.iter_data_frame('*', table_name, where_dict,
+                                          date_window, chunk_size,
+                                          RESULT_ROWS), path)
 
     def zip_is_present(self, zip_code):
         """
@@ -265,8 +359,10 @@ class AppsClient(object):
         Returns:
             :return: Pandas data frame or Error
         """
-        result = self.apps.get_data_frame('*', 'ZipToCityState',
-                                          {'zip': zip_code})
+        with self.apps.connection():
+            result = self.apps.get_data_frame('zip', 'ZipToCityState',
+                                              {'zip': zip_code},
+                                              result_mode=RESULT_ROWS)
         if len(result) == 0:
             return False
         else:
@@ -291,7 +387,7 @@ class AppsClient(object):
         set_dict = param_dict['set']
         zip_result = None
 
-        with sql_transaction(self.db):
+        with self._transaction():
             # If a city and state is present, insert the new zip
             if 'zip' in set_dict and 'city' in set_dict and 'state' in set_dict:
                 zip_dict = {k: set_dict[k] for k in ('city', 'state', 'zip')
@@ -302,13 +398,14 @@ class AppsClient(object):
             # Remove extra arguments (city, state)
             item_dict = {k: set_dict[k] for k in api_info.attr_names['set']
                          if k in set_dict}
-            # select the correct API and submit
+            # select the correct API and submit. Reservations lock their room
+            # to prevent double-booking by concurrent clients.
             result = {
                 'Hotels': lambda x: self.apps.add_hotel(x),
                 'Rooms': lambda x: self.apps.add_room(x),
                 'Staff': lambda x: self.apps.add_staff(x),
                 'Customers': lambda x: self.apps.add_customer(x),
-                'Reservations': lambda x: self.apps.add_reservation(x),
+                'Reservations': lambda x: self.apps.book_room(x),
                 'Transactions': lambda x: self.apps.add_transaction(x),
                 'Serves': lambda x: self.apps.add_serves(x)
             }[api_info.table_name](item_dict)
@@ -317,6 +414,55 @@ class AppsClient(object):
                                       right_on='zip', how='outer')
             return result
 
+    def insert_bulk(self, rows, api_info, chunk_size=BULK_CHUNK_SIZE):
+        """
+        Used to make bulk INSERT transactions on the database. Interfaces with
+        the bulk insert method of the appropriate entity in Apps.py. All rows
+        are inserted within one transaction. Since zip is a foreign key
+        constraint, the zip information of all rows is entered first.
+
+        Parameters:
+            :param rows: List of attribute dictionaries (like the 'set'
+            dictionary of insert()) or Pandas data frame
+            :param api_info: The api information (attribute lists) for the
+            relevant entity
+            :param chunk_size: Maximum number of rows inserted by one INSERT
+            statement
+
+        Returns:
+            :return: Pandas data frame with the keys of the inserted rows or
+            Error
+        """
+        rows = get_bulk_rows(rows)
+
+        with self._transaction():
+            # If a city and state is present, insert the new zips once
+            zip_rows = OrderedDict()
+            for set_dict in rows:
+                if 'zip' in set_dict and 'city' in set_dict and \
+                        'state' in set_dict:
+                    zip_rows[set_dict['zip']] = {
+                        k: set_dict[k] for k in ('city', 'state', 'zip')}
+            if zip_rows:
+                self.apps.add_zip_bulk(zip_rows.values(), chunk_size)
+            # Remove extra arguments (city, state)
+            item_rows = [{k: set_dict[k] for k in api_info.attr_names['set']
+                          if k in set_dict} for set_dict in rows]
+            # select the correct API and submit
+            result = {
+                'Hotels': lambda x: self.apps.add_hotel_bulk(x, chunk_size),
+                'Rooms': lambda x: self.apps.add_room_bulk(x, chunk_size),
+                'Staff': lambda x: self.apps.add_staff_bulk(x, chunk_size),
+                'Customers':
+                    lambda x: self.apps.add_customer_bulk(x, chunk_size),
+                'Reservations':
+                    lambda x: self.apps.add_reservation_bulk(x, chunk_size),
+                'Transactions':
+                    lambda x: self.apps.add_transaction_bulk(x, chunk_size),
+                'Serves': lambda x: self.apps.add_serves_bulk(x, chunk_size)
+            }[api_info.table_name](item_rows)
+            return result
+
     def update(self, param_dict, api_info):
         """
         Used to make UPDATE transactions on the database. Interfaces with the
@@ -337,7 +483,7 @@ class AppsClient(object):
         zip_result = None
         print set_dict
         print where_dict
-        with sql_transaction(self.db):
+        with self._transaction():
             # If a city and state is present, insert the new zip
             if 'zip' in set_dict and 'city' in set_dict and 'state' in set_dict:
                 zip_dict = {k: set_dict[k] for k in ('city', 'state', 'zip')
@@ -385,7 +531,7 @@ class AppsClient(object):
         """
         where_dict = param_dict['where']
         print where_dict
-        with sql_transaction(self.db):
+        with self._transaction():
             # select the correct API and submit
             result = {
                 'Hotels': lambda x: self.apps.delete_hotel(x),
@@ -416,17 +562,24 @@ class AppsClient(object):
         set_dict = param_dict['set']
         arg_list = [set_dict[key] for key in api_info.attr_names['set']]
 
-        with sql_transaction(self.db):
+        with self._transaction():
             result = {
                 'Generate_bill': lambda x: self.apps.generate_bill(x[0]),
+                'Generate_bills': lambda x: [
+                    bill for bills in self.apps.generate_bills(
+                        departure_date=x[0]).values() for bill in bills],
                 'Occupancy_hotel': lambda x:
                 self.apps.report_occupancy_by_hotel(x[0]),
                 'Occupancy_room': lambda x:
                 self.apps.report_occupancy_by_room_type(x[0]),
                 'Occupancy_city': lambda x:
                 self.apps.report_occupancy_by_city(x[0]),
+                'Occupancy_all': lambda x:
+                self.apps.report_occupancy_combined(x[0]),
                 'Occupancy_date': lambda x:
                 self.apps.report_occupancy_by_date_range(x[0], x[1]),
+                'Occupancy_series': lambda x:
+                self.apps.report_occupancy_time_series(x[0], x[1]),
                 'List_staff': lambda x:
                 self.apps.report_staff_by_role(x[0]),
                 'Customer_inter': lambda x:
@@ -457,7 +610,7 @@ class AppsClient(object):
         """
         set_dict = param_dict['set']
         print set_dict
-        with sql_transaction(self.db):
+        with self._transaction():
             result = {
                 'Room_avail': lambda x: self.apps.room_availability(x)
             }[api_info.report_name](set_dict)
@@ -0,0 +1,305 @@
+"""
+asyncapps.py
+
+CSC 540 (601) - Database Management Concepts and Systems
+Project for CSC 540
+
+Description of the Project and Software read in the main program: hotelsoft.py
+
+Description of the asyncapps.py file:
+This file provides the asynchronous variants of the APIs (apps.py) and of the
+client (appsclient.py). Every API of Apps and AppsClient blocks until its
+queries complete, so a service fronting several desks could overlap the
+database I/O only by spawning its own threads. The asynchronous classes do the
+following:
+1) Run the calls on a bounded pool of worker threads sharing one Apps (or
+AppsClient) object, with connections checked out of a ConnectionPool (pool.py)
+per call
+2) Return an AsyncResult for every call right away. Its get() method waits for
+the result of the call and re-raises its exception, so many availability
+lookups and reports run concurrently.
+3) Run every Apps call, or a function of several calls, in its own SQL
+transaction, like util.sql_transaction() and AppsClient do
+Python 2 has no asyncio event loop, therefore the calls return the results of
+the multiprocessing thread pool instead of coroutines.
+
+async_apps = AsyncApps(ConnectionPool(size=4, host=HOST, user=USER,
+                                      password=PASSWORD, database=DATABASE))
+results = [async_apps.report_occupancy_by_hotel(date) for date in dates]
+reports = gather(results)
+
+@version: 1.0
+@todo: None
+@since: October 18, 2026
+
+@status: Complete
+@requires: ConnectionPool
+@contact: nfschnoo@ncsu.edu
+          ngtitov@ncsu.edu
+          pdscott2@ncsu.edu
+
+@authors: Nathan Schnoor
+          Nikolay Titov
+          Preston Scott
+"""
+
+from multiprocessing.pool import ThreadPool
+from Queue import Queue
+
+from apps import Apps, UNINSTRUMENTED_METHODS
+from appsclient import AppsClient
+from pool import ConnectionPool
+from util import sql_transaction
+
+# Public methods of the AppsClient class that are not run asynchronously
+SYNC_CLIENT_METHODS = ('report_cache_stats',)
+
+
+def gather(results, timeout=None):
+    """
+    Waits for the results of several asynchronous calls.
+
+    Parameters:
+        :param results: Iterable of AsyncResult objects
+        :param timeout: Number of seconds to wait for each result. If None,
+        waits indefinitely.
+
+    Returns:
+        :return: List of results in the order of the calls
+
+    Exceptions:
+        :raise: Exception raised by the first failed call
+    """
+    return [result.get(timeout) for result in results]
+
+
+class _AsyncWorkers(object):
+    """
+    Bounded pool of worker threads running calls on a pool of objects.
+
+    This is private class of the module and not intended to be referenced
+    outside of the module. Each call borrows one of the objects for its
+    duration. The same object may be given once per worker if it is safe to
+    share across threads.
+    """
+    def __init__(self, objects):
+        """
+        Constructor method for the _AsyncWorkers class
+
+        Parameters:
+            :param objects: List of objects, one per worker thread
+
+        Returns:
+            :return:
+        """
+        self.workers = len(objects)
+        self._objects = Queue()
+        for obj in objects:
+            self._objects.put(obj)
+        self._executor = ThreadPool(self.workers)
+
+    def _submit(self, function, args=(), kwargs=None):
+        """
+        Schedules a call of a function with a borrowed object as first
+        argument.
+
+        Parameters:
+            :param function: Function of the object and given arguments
+            :param args: Tuple of positional arguments
+            :param kwargs: Dictionary of keyword arguments
+
+        Returns:
+            :return: AsyncResult of the call
+        """
+        return self._executor.apply_async(self._call,
+                                           (function, args, kwargs or {}))
+
+    def _call(self, function, args, kwargs):
+        """
+        Runs a scheduled call on a worker thread with a borrowed object.
+        """
+        obj = self._objects.get()
+        try:
+            return function(obj, *args, **kwargs)
+        finally:
+            self._objects.put(obj)
+
+    def close(self):
+        """
+        Waits for the scheduled calls to complete and stops the worker
+        threads. No call may be scheduled afterwards.
+
+        Returns:
+            :return:
+        """
+        self._executor.close()
+        self._executor.join()
+
+
+class AsyncApps(_AsyncWorkers):
+    """
+    Asynchronous variant of the Apps class.
+
+    Creates and returns an AsyncApps object with the same public APIs as Apps
+    (CRUD, room availability, billing and reports). Every API returns an
+    AsyncResult right away and runs in its own transaction on a worker thread.
+    All workers share one Apps object, and so its statement cache, staff pool
+    and report cache. The interval index cannot be enabled (see Apps).
+
+    async_apps = AsyncApps(pool, workers=4, staff_pool=True)
+    availability = async_apps.room_availability({'hotel_id': 1})
+    bill = async_apps.generate_bill(8)
+    print availability.get(), bill.get()
+    """
+    def __init__(self, connection_pool, workers=None, check=False,
+                 **apps_args):
+        """
+        Constructor method for the AsyncApps class
+
+        Parameters:
+            :param connection_pool: ConnectionPool the connections of the calls
+            are checked out of
+            :param workers: Number of worker threads, i.e. maximum number of
+            concurrent calls. If None, the size of the connection pool.
+            :param check: MySQL CHECK constraint boolean (see Apps)
+            :param apps_args: Other arguments of the Apps object (e.g.
+            report_cache)
+
+        Returns:
+            :return:
+        """
+        assert isinstance(connection_pool, ConnectionPool), \
+            'Exception: Asynchronous APIs require a connection pool.\n'
+        self.apps = Apps(connection_pool, check, **apps_args)
+        super(AsyncApps, self).__init__(
+            [self.apps] * (workers or connection_pool.size))
+        for name in dir(Apps):
+            if not name.startswith('_') and \
+                    name not in UNINSTRUMENTED_METHODS and \
+                    callable(getattr(Apps, name)):
+                setattr(self, name, self._get_api(name))
+
+    def _get_api(self, name):
+        """
+        Creates the asynchronous variant of an API.
+
+        Parameters:
+            :param name: Name of the API of the Apps class
+
+        Returns:
+            :return: Function with the arguments of the API returning an
+            AsyncResult
+        """
+        def api(*args, **kwargs):
+            return self.transaction(
+                lambda apps: getattr(apps, name)(*args, **kwargs))
+        api.__name__ = name
+        api.__doc__ = getattr(Apps, name).__doc__
+        return api
+
+    def transaction(self, function, *args):
+        """
+        Schedules a function calling several APIs in one SQL transaction,
+        which is committed if the function succeeds and rolled back otherwise.
+
+        Example:
+        result = async_apps.transaction(
+            lambda apps: (apps.add_customer(customer_dict),
+                          apps.add_reservation(reservation_dict)))
+
+        Parameters:
+            :param function: Function of an Apps object and given arguments
+            :param args: Positional arguments of the function
+
+        Returns:
+            :return: AsyncResult of the function
+        """
+        return self._submit(_run_transaction, (function,) + args)
+
+
+def _run_transaction(apps, function, *args):
+    """
+    Runs a function of an Apps object in a SQL transaction on a connection
+    checked out of its pool, like AppsClient does.
+
+    This is private function of the module and not intended to be referenced
+    outside of the module.
+
+    Parameters:
+        :param apps: Apps object
+        :param function: Function of the Apps object and given arguments
+        :param args: Positional arguments of the function
+
+    Returns:
+        :return: Result of the function
+    """
+    with apps.connection() as con:
+        try:
+            with sql_transaction(con):
+                result = function(apps, *args)
+        except Exception:
+            apps.discard_local_state()
+            raise
+        apps.commit_local_state()
+        return result
+
+
+class AsyncAppsClient(_AsyncWorkers):
+    """
+    Asynchronous variant of the AppsClient class.
+
+    Creates and returns an AsyncAppsClient object with the same public methods
+    as AppsClient (insert, update, delete, select, get_report, etc.). Every
+    method returns an AsyncResult right away and runs on a worker thread in
+    the transaction of the AppsClient method.
+
+    client = AsyncAppsClient(pool, workers=4)
+    report = client.get_report(param_dict, AppsParams.occ_hotel)
+    print report.get()
+    """
+    def __init__(self, connection_pool, workers=None, check=False,
+                 **apps_args):
+        """
+        Constructor method for the AsyncAppsClient class
+
+        Parameters:
+            :param connection_pool: ConnectionPool the connections of the calls
+            are checked out of
+            :param workers: Number of worker threads, i.e. maximum number of
+            concurrent calls. If None, the size of the connection pool.
+            :param check: MySQL CHECK constraint boolean (see Apps)
+            :param apps_args: Other arguments of the Apps object (e.g.
+            report_cache)
+
+        Returns:
+            :return:
+        """
+        assert isinstance(connection_pool, ConnectionPool), \
+            'Exception: Asynchronous client requires a connection pool.\n'
+        self.client = AppsClient(connection_pool, check, **apps_args)
+        super(AsyncAppsClient, self).__init__(
+            [self.client] * (workers or connection_pool.size))
+        self.report_cache_stats = self.client.report_cache_stats
+        for name in dir(AppsClient):
+            if not name.startswith('_') and \
+                    name not in SYNC_CLIENT_METHODS and \
+                    callable(getattr(AppsClient, name)):
+                setattr(self, name, self._get_method(name))
+
+    def _get_method(self, name):
+        """
+        Creates the asynchronous variant of a client method.
+
+        Parameters:
+            :param name: Name of the method of the AppsClient class
+
+        Returns:
+            :return: Function with the arguments of the method returning an
+            AsyncResult
+        """
+        def method(*args, **kwargs):
+            return self._submit(
+                lambda client: getattr(client, name)(*args, **kwargs))
+        method.__name__ = name
+        method.__doc__ = getattr(AppsClient, name).__doc__
+        return method
@@ -0,0 +1,187 @@
+"""
+bundle.py
+
+CSC 540 (601) - Database Management Concepts and Systems
+Project for CSC 540
+
+Description of the Project and Software read in the main program: hotelsoft.py
+
+Description of the bundle.py file:
+This file provides the executor of report bundles, e.g. the management packet
+of the occupancy, revenue and staff reports. Calling the reports one after
+another over one connection takes as long as all of them together. The
+executor does the following:
+1) Takes a list of report requests, each the parameter dictionary and the
+report attributes (AppsParams) dispatched by AppsClient.get_report()
+2) Runs the reports concurrently on a bounded pool of worker threads sharing
+one AppsClient object, each report in its own transaction on a connection
+checked out of a ConnectionPool (pool.py)
+3) Returns the outcomes in the order of the requests, with the result or the
+error and the run time of every report, so one failed report does not fail the
+whole bundle
+The bundle takes about as long as its slowest report. Threads suffice, since
+the workers wait for the database server most of the time.
+
+executor = ReportBundleExecutor(ConnectionPool(size=5, host=HOST, user=USER,
+                                               password=PASSWORD,
+                                               database=DATABASE))
+outcomes = executor.run(management_packet('2018-01-19', '2018-01-01',
+                                          '2018-01-31', 1))
+
+@version: 1.0
+@todo: None
+@since: October 18, 2026
+
+@status: Complete
+@requires: ConnectionPool
+@contact: nfschnoo@ncsu.edu
+          ngtitov@ncsu.edu
+          pdscott2@ncsu.edu
+
+@authors: Nathan Schnoor
+          Nikolay Titov
+          Preston Scott
+"""
+
+import time
+from collections import namedtuple
+from multiprocessing.pool import ThreadPool
+
+from appsclient import AppsClient, AppsParams
+from pool import ConnectionPool
+
+# Report of a bundle: parameter dictionary with embedded 'set' dictionary and
+# report attributes (AppsParams), like the arguments of AppsClient.get_report()
+ReportRequest = namedtuple('ReportRequest', ['param_dict', 'api_info'])
+
+# Outcome of a report of a bundle: name of the report, its result (None if it
+# failed), its exception (None if it succeeded) and its run time in seconds
+ReportOutcome = namedtuple('ReportOutcome',
+                           ['report_name', 'result', 'error', 'seconds'])
+
+
+def management_packet(query_date, start_date, end_date, hotel_id):
+    """
+    Creates the report requests of the management packet.
+
+    Parameters:
+        :param query_date: Date of the occupancy reports (YYYY-MM-DD)
+        :param start_date: Start date of the occupancy and revenue reports over
+        a date range (YYYY-MM-DD)
+        :param end_date: End date of the occupancy and revenue reports over a
+        date range (YYYY-MM-DD)
+        :param hotel_id: ID of the hotel whose staff is listed
+
+    Returns:
+        :return: List of ReportRequest of occupancy by hotel, occupancy by
+        city, occupancy by date range, revenue of all hotels and staff by role
+    """
+    return [
+        ReportRequest({'set': {'query_date': query_date}},
+                      AppsParams.occ_hotel),
+        ReportRequest({'set': {'query_date': query_date}},
+                      AppsParams.occ_city),
+        ReportRequest({'set': {'start_date': start_date,
+                               'end_date': end_date}}, AppsParams.occ_date),
+        ReportRequest({'set': {'start_date': start_date,
+                               'end_date': end_date}}, AppsParams.rev_all),
+        ReportRequest({'set': {'hotel_id': hotel_id}}, AppsParams.list_staff)]
+
+
+class ReportBundleExecutor(object):
+    """
+    Runs bundles of reports concurrently.
+
+    Creates and returns a ReportBundleExecutor object with a bounded pool of
+    worker threads sharing one AppsClient object. The workers check out their
+    connections of the given ConnectionPool, so at most workers connections
+    are used at a time.
+
+    executor = ReportBundleExecutor(pool, workers=5)
+    for outcome in executor.run(requests):
+        print outcome.report_name, outcome.seconds, outcome.error
+    executor.close()
+    """
+    def __init__(self, connection_pool, workers=None, check=False,
+                 **apps_args):
+        """
+        Constructor method for the ReportBundleExecutor class
+
+        Parameters:
+            :param connection_pool: ConnectionPool the connections of the
+            reports are checked out of
+            :param workers: Number of worker threads, i.e. maximum number of
+            concurrent reports. If None, the size of the connection pool.
+            :param check: MySQL CHECK constraint boolean (see Apps)
+            :param apps_args: Other arguments of the Apps object (e.g.
+            report_cache or rollups)
+
+        Returns:
+            :return:
+        """
+        assert isinstance(connection_pool, ConnectionPool), \
+            'Exception: Report bundles require a connection pool.\n'
+        self.client = AppsClient(connection_pool, check, **apps_args)
+        self.workers = workers or connection_pool.size
+        self._executor = ThreadPool(self.workers)
+
+    def run(self, requests, timeout=None):
+        """
+        Runs the reports of a bundle concurrently and waits for all of them.
+
+        Parameters:
+            :param requests: Iterable of ReportRequest, or of (param_dict,
+            api_info) tuples
+            :param timeout: Number of seconds to wait for each report. If None,
+            waits indefinitely. A report that does not complete in time gets
+            multiprocessing.TimeoutError as its error, while it keeps running
+            on its worker thread.
+
+        Returns:
+            :return: List of ReportOutcome in the order of the requests
+        """
+        requests = [ReportRequest(*request) for request in requests]
+        results = [self._executor.apply_async(self._run_report, request)
+                   for request in requests]
+        outcomes = []
+        for request, result in zip(requests, results):
+            try:
+                outcomes.append(result.get(timeout))
+            except Exception as error:
+                outcomes.append(ReportOutcome(
+                    request.api_info.report_name, None, error, None))
+        return outcomes
+
+    def _run_report(self, param_dict, api_info):
+        """
+        Runs one report of a bundle on a worker thread.
+
+        This is private function of the class and not intended to be referenced
+        outside of the class.
+
+        Parameters:
+            :param param_dict: Parameter dictionary of the report
+            :param api_info: Report attributes (AppsParams)
+
+        Returns:
+            :return: ReportOutcome of the report
+        """
+        start_time = time.time()
+        try:
+            result = self.client.get_report(param_dict, api_info)
+        except Exception as error:
+            return ReportOutcome(api_info.report_name, None, error,
+                                 time.time() - start_time)
+        return ReportOutcome(api_info.report_name, result, None,
+                             time.time() - start_time)
+
+    def close(self):
+        """
+        Waits for the running reports to complete and stops the worker
+        threads. No bundle may be run afterwards.
+
+        Returns:
+            :return:
+        """
+        self._executor.close()
+        self._executor.join()
@@ -50,6 +50,9 @@ scp * unity_id@remote.eos.ncsu.edu:/afs/unity.ncsu.edu/users/u/unity_id/CSC540
 """
 
 import mysql.connector as maria_db
+from migrations import SCHEMA_VERSION_TABLE, migrate
+from rollups import DAILY_OCCUPANCY_TABLE, DAILY_REVENUE_TABLE, \
+    rebuild_summary_tables
 
 
 def _drop_tables(db):
@@ -70,6 +73,14 @@ def _drop_tables(db):
         :return: None
     """
     cursor = db.cursor()
+    try:
+        cursor.execute('DROP TABLE {}'.format(DAILY_OCCUPANCY_TABLE))
+    except maria_db.Error:
+        pass
+    try:
+        cursor.execute('DROP TABLE {}'.format(DAILY_REVENUE_TABLE))
+    except maria_db.Error:
+        pass
     try:
         cursor.execute('DROP TABLE Serves')
     except maria_db.Error:
@@ -102,6 +113,10 @@ def _drop_tables(db):
         cursor.execute('DROP TABLE ZipToCityState')
     except maria_db.Error:
         pass
+    try:
+        cursor.execute('DROP TABLE {}'.format(SCHEMA_VERSION_TABLE))
+    except maria_db.Error:
+        pass
     db.commit()
 
 
@@ -115,6 +130,8 @@ def _create_tables(db):
     All of the tables get created with accordance of the Project Design stated
     in the Project Report 1 and Project Report 2. The following CREATE queries
     are directly taken from the Project Report 2 without any modifications.
+    The secondary indexes are added by applying all schema migrations
+    (migrations.py).
 
     Parameters:
         :param db: The database connection
@@ -214,6 +231,8 @@ def _create_tables(db):
             hotel_id INT NOT NULL,
             room_number SMALLINT UNSIGNED NOT NULL,
             customer_id INT NOT NULL,
+            INDEX idx_reservations_room_dates 
+                (hotel_id, room_number, start_date, end_date),
             CONSTRAINT fk_reservations_rooms_hotel_id_room_number FOREIGN KEY 
                 (hotel_id, room_number) REFERENCES Rooms(hotel_id, room_number) 
                 ON UPDATE CASCADE ON DELETE RESTRICT,
@@ -249,6 +268,8 @@ def _create_tables(db):
             CONSTRAINT uc_serves UNIQUE (staff_id, reservation_id)
         );""")
     db.commit()
+    # Add the secondary indexes and record the schema version
+    migrate(db)
 
 
 def load_demo_data(db):
@@ -390,6 +411,8 @@ def load_demo_data(db):
                        "Transactions(amount, type, date, reservation_id)"
                        "VALUES(%s, %s, %s, %s)", row)
 
+    # Demo data is inserted without the APIs maintaining the summary tables
+    rebuild_summary_tables(cursor)
     cursor.close()
     db.commit()
 
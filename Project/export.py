@@ -0,0 +1,252 @@
+"""
+export.py
+
+CSC 540 (601) - Database Management Concepts and Systems
+Project for CSC 540
+
+Description of the Project and Software read in the main program: hotelsoft.py
+
+Description of the export.py file:
+This file provides the writers of exported tables and report results (e.g.
+Transactions table exported for accounting). The chunks generated by
+Apps.iter_data_frame() are written one by one, so the memory used by an export
+is bounded by the chunk size rather than the size of the table. The writers do
+the following:
+1) Write CSV files with a header line, optionally compressed by gzip
+2) Write Parquet files, one row group per chunk (requires pyarrow). The
+schema is inferred from the first chunk, except for attributes that are NULL
+in all its tuples, whose types are taken from the MySQL field types of the
+chunk (e.g. check_out_time of reservations not checked out yet)
+3) Determine the format from the file name (.csv, .csv.gz, .parquet) unless
+it is given
+A report result already in memory is written as a list of one chunk.
+
+with apps.connection():
+    rows = export_chunks(apps.iter_data_frame('*', 'Transactions'),
+                         'transactions.csv.gz')
+
+@version: 1.0
+@todo: None
+@since: October 18, 2026
+
+@status: Complete
+@requires: mysql.connector, pyarrow for Parquet export
+@contact: nfschnoo@ncsu.edu
+          ngtitov@ncsu.edu
+          pdscott2@ncsu.edu
+
+@authors: Nathan Schnoor
+          Nikolay Titov
+          Preston Scott
+"""
+
+import csv
+import gzip
+
+import pandas as pd
+from mysql.connector.constants import FieldType
+
+try:
+    import pyarrow
+    import pyarrow.parquet as parquet
+except ImportError:
+    pyarrow = None
+
+# Formats of the exported files
+EXPORT_CSV = 'csv'
+EXPORT_PARQUET = 'parquet'
+EXPORT_FORMATS = (EXPORT_CSV, EXPORT_PARQUET)
+
+# MySQL field types by the Parquet types of the values the DataFrames hold
+# (DECIMAL values are coerced to floats). Other types are written as strings.
+_INTEGER_TYPES = (FieldType.TINY, FieldType.SHORT, FieldType.LONG,
+                  FieldType.LONGLONG, FieldType.INT24, FieldType.YEAR,
+                  FieldType.BIT)
+_FLOAT_TYPES = (FieldType.FLOAT, FieldType.DOUBLE, FieldType.DECIMAL,
+                FieldType.NEWDECIMAL)
+_DATE_TYPES = (FieldType.DATE, FieldType.NEWDATE)
+_TIMESTAMP_TYPES = (FieldType.DATETIME, FieldType.TIMESTAMP)
+
+
+def get_export_format(path):
+    """
+    Determines the format of an exported file from its name.
+
+    Parameters:
+        :param path: Path of the file
+
+    Returns:
+        :return: Tuple of format of EXPORT_FORMATS and boolean whether the
+        file is compressed by gzip
+    """
+    name = path.lower()
+    compress = name.endswith('.gz')
+    if compress:
+        name = name[:-len('.gz')]
+    if name.endswith('.parquet'):
+        return EXPORT_PARQUET, compress
+    return EXPORT_CSV, compress
+
+
+def export_chunks(chunks, path, export_format=None, compress=None):
+    """
+    Writes chunks of a table or report result into a file.
+
+    Parameters:
+        :param chunks: Iterable of Pandas DataFrames or ResultSets with the
+        same attributes, e.g. generator of Apps.iter_data_frame()
+        :param path: Path of the file, which gets overwritten
+        :param export_format: Format of EXPORT_FORMATS. If None, it is
+        determined from the file name.
+        :param compress: Boolean whether a CSV file is compressed by gzip. If
+        None, it is determined from the file name (.gz).
+
+    Returns:
+        :return: Number of exported rows
+
+    Exceptions:
+        :raise: Assertion Error exception
+    """
+    path_format, path_compress = get_export_format(path)
+    if export_format is None:
+        export_format = path_format
+    if compress is None:
+        compress = path_compress
+    assert export_format in EXPORT_FORMATS, \
+        'Exception: Export format must be one of: {}.\n'.format(
+            ', '.join(EXPORT_FORMATS))
+    if export_format == EXPORT_PARQUET:
+        assert not compress, \
+            'Exception: Parquet files are compressed by the format itself.\n'
+        return _write_parquet(chunks, path)
+    return _write_csv(chunks, path, compress)
+
+
+def _write_csv(chunks, path, compress):
+    """
+    Writes chunks into a CSV file with a header line.
+
+    This is private function of the module and not intended to be referenced
+    outside of the module.
+
+    Parameters:
+        :param chunks: Iterable of Pandas DataFrames or ResultSets
+        :param path: Path of the file
+        :param compress: Boolean whether the file is compressed by gzip
+
+    Returns:
+        :return: Number of written rows
+    """
+    output = gzip.open(path, 'wb') if compress else open(path, 'wb')
+    rows = 0
+    header = True
+    try:
+        writer = csv.writer(output)
+        for chunk in chunks:
+            if isinstance(chunk, pd.DataFrame):
+                chunk.to_csv(output, header=header, index=False,
+                             encoding='utf-8')
+            else:
+                if header:
+                    writer.writerow(chunk.columns)
+                writer.writerows([_encode(value) for value in row]
+                                 for row in chunk)
+            header = False
+            rows += len(chunk)
+    finally:
+        output.close()
+    return rows
+
+
+def _encode(value):
+    """
+    Encodes a value of a row for the csv module, which writes only byte
+    strings.
+
+    This is private function of the module and not intended to be referenced
+    outside of the module.
+
+    Parameters:
+        :param value: Value of an attribute
+
+    Returns:
+        :return: UTF-8 byte string if the value is unicode, otherwise the
+        value itself
+    """
+    if isinstance(value, unicode):
+        return value.encode('utf-8')
+    return value
+
+
+def _get_parquet_type(type_code):
+    """
+    Determines the Parquet (Arrow) type of the values of a MySQL field type.
+
+    This is private function of the module and not intended to be referenced
+    outside of the module.
+
+    Parameters:
+        :param type_code: MySQL field type code, or None if not known
+
+    Returns:
+        :return: pyarrow DataType
+    """
+    if type_code in _INTEGER_TYPES:
+        return pyarrow.int64()
+    if type_code in _FLOAT_TYPES:
+        return pyarrow.float64()
+    if type_code in _DATE_TYPES:
+        return pyarrow.date32()
+    if type_code in _TIMESTAMP_TYPES:
+        return pyarrow.timestamp('ns')
+    if type_code == FieldType.TIME:
+        return pyarrow.duration('ns')
+    return pyarrow.string()
+
+
+def _write_parquet(chunks, path):
+    """
+    Writes chunks into a Parquet file, one row group per chunk. The schema of
+    the file is inferred from the first chunk. Attributes that are NULL in all
+    tuples of the first chunk get the types of their MySQL field types if the
+    chunk is a ResultSet generated by Apps.iter_data_frame(), otherwise they
+    are written as strings. The later chunks are converted to the schema.
+
+    This is private function of the module and not intended to be referenced
+    outside of the module.
+
+    Parameters:
+        :param chunks: Iterable of Pandas DataFrames or ResultSets
+        :param path: Path of the file
+
+    Returns:
+        :return: Number of written rows
+    """
+    assert pyarrow is not None, \
+        'Exception: Parquet export requires the pyarrow package.\n'
+    writer = None
+    rows = 0
+    try:
+        for chunk in chunks:
+            types = getattr(chunk, 'types', None)
+            if not isinstance(chunk, pd.DataFrame):
+                chunk = chunk.to_data_frame()
+            if writer is None:
+                schema = pyarrow.Table.from_pandas(
+                    chunk, preserve_index=False).schema
+                # Type of an attribute that is NULL in all tuples cannot be
+                # inferred, and the later chunks would not convert to it
+                for position, field in enumerate(schema):
+                    if field.type == pyarrow.null():
+                        schema = schema.set(position, pyarrow.field(
+                            field.name, _get_parquet_type(
+                                types[position] if types else None)))
+                writer = parquet.ParquetWriter(path, schema)
+            table = pyarrow.Table.from_pandas(chunk, schema=writer.schema,
+                                              preserve_index=False)
+            writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
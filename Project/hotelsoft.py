@@ -651,6 +651,9 @@ def main():
     wolf_inn.add_menu_action(
         MenuAction('report_gen_bill', 'GENERATE BILL',
                    AppsParams.gen_bill, wolf_inn.client.get_report))
+    wolf_inn.add_menu_action(
+        MenuAction('report_gen_bills', 'GENERATE BILLS OF DEPARTURES',
+                   AppsParams.gen_bills, wolf_inn.client.get_report))
     wolf_inn.add_menu_action(
         MenuAction('report_occ_hotel', 'OCCUPANCY BY HOTEL',
                    AppsParams.occ_hotel, wolf_inn.client.get_report))
@@ -660,9 +663,15 @@ def main():
     wolf_inn.add_menu_action(
         MenuAction('report_occ_city', 'OCCUPANCY BY CITY',
                    AppsParams.occ_city, wolf_inn.client.get_report))
+    wolf_inn.add_menu_action(
+        MenuAction('report_occ_all', 'OCCUPANCY BY HOTEL, ROOM TYPE AND CITY',
+                   AppsParams.occ_all, wolf_inn.client.get_report))
     wolf_inn.add_menu_action(
         MenuAction('report_occ_date', 'OCCUPANCY BY DATE',
                    AppsParams.occ_date, wolf_inn.client.get_report))
+    wolf_inn.add_menu_action(
+        MenuAction('report_occ_series', 'DAILY OCCUPANCY BY HOTEL',
+                   AppsParams.occ_series, wolf_inn.client.get_report))
     wolf_inn.add_menu_action(
         MenuAction('report_list_staff', 'STAFF BY ROLE',
                    AppsParams.list_staff, wolf_inn.client.get_report))
@@ -839,6 +848,9 @@ def main():
     wolf_inn.get_menu('billing').add(
         MenuOption('Generate bill',
                    wolf_inn.store_action('report_gen_bill', 'billing')))
+    wolf_inn.get_menu('billing').add(
+        MenuOption('Generate bills of departures',
+                   wolf_inn.store_action('report_gen_bills', 'billing')))
     wolf_inn.get_menu('billing').add(
         MenuOption('Back to main menu', wolf_inn.store_menu('main')))
 
@@ -852,9 +864,15 @@ def main():
     wolf_inn.get_menu('reports').add(
         MenuOption('Occupancy by city',
                    wolf_inn.store_action('report_occ_city', 'reports')))
+    wolf_inn.get_menu('reports').add(
+        MenuOption('Occupancy by hotel, room type and city',
+                   wolf_inn.store_action('report_occ_all', 'reports')))
     wolf_inn.get_menu('reports').add(
         MenuOption('Occupancy by date range',
                    wolf_inn.store_action('report_occ_date', 'reports')))
+    wolf_inn.get_menu('reports').add(
+        MenuOption('Daily occupancy by hotel',
+                   wolf_inn.store_action('report_occ_series', 'reports')))
     wolf_inn.get_menu('reports').add(
         MenuOption('List staff by role',
                    wolf_inn.store_action('report_list_staff', 'reports')))
@@ -0,0 +1,361 @@
+"""
+intervals.py
+
+CSC 540 (601) - Database Management Concepts and Systems
+Project for CSC 540
+
+Description of the Project and Software read in the main program: hotelsoft.py
+
+Description of the intervals.py file:
+This file provides the in-process index of reservation dates used by the APIs
+(apps.py) to check room availability and reservation conflicts without a query
+to the database. Availability searches are the most frequent read of the
+system, while reservations change comparatively rarely, so the APIs keep the
+dates of all reservations in memory. The index does the following:
+1) Keeps the reservations of every room (hotel ID and room number) as a list of
+date intervals sorted by start date, together with the running maximum of their
+end dates
+2) Answers whether a room is free for given dates and which rooms are free for
+given dates by binary search, i.e. O(log n) per room. Reservation dates are
+half-open intervals, so a room is free from the end date of its previous
+reservation
+3) Checks whether a reservation conflicts with another reservation of the same
+room
+4) Is loaded lazily from the Reservations table and kept up to date by the APIs
+that add, update and delete reservations
+
+@version: 1.0
+@todo: None
+@since: October 18, 2026
+
+@status: Complete
+@requires:
+@contact: nfschnoo@ncsu.edu
+          ngtitov@ncsu.edu
+          pdscott2@ncsu.edu
+
+@authors: Nathan Schnoor
+          Nikolay Titov
+          Preston Scott
+"""
+
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+
+
+def to_date(value):
+    """
+    Converts a date given as date, datetime or string (YYYY-MM-DD, optionally
+    followed by time) into date.
+
+    Parameters:
+        :param value: Date value
+
+    Returns:
+        :return: datetime.date object
+
+    Exceptions:
+        :raise: ValueError if the string does not follow the DATE format
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value).strip().split(' ')[0],
+                             '%Y-%m-%d').date()
+
+
+class _RoomIntervals(object):
+    """
+    Reservation dates of a single room sorted by start date.
+
+    This is private class of the module and not intended to be referenced
+    outside of the module.
+    """
+    __slots__ = ('starts', 'entries', 'max_ends')
+
+    def __init__(self):
+        # Start dates, used for the binary search
+        self.starts = []
+        # (start date, end date, reservation ID) in the same order
+        self.entries = []
+        # max_ends[i] is the latest end date of entries[0..i]
+        self.max_ends = []
+
+    def load(self, entries):
+        """
+        Replaces the intervals with given entries, sorting them once and
+        computing the running maximum of their end dates in one pass.
+        """
+        self.entries = sorted(entries)
+        self.starts = [entry[0] for entry in self.entries]
+        self.max_ends = [None] * len(self.entries)
+        if self.entries:
+            self._update_max_ends(0)
+
+    def add(self, entry):
+        position = bisect_right(self.entries, entry)
+        self.entries.insert(position, entry)
+        self.starts.insert(position, entry[0])
+        self.max_ends.insert(position, entry[1])
+        self._update_max_ends(position)
+
+    def remove(self, entry):
+        position = bisect_left(self.entries, entry)
+        del self.entries[position]
+        del self.starts[position]
+        del self.max_ends[position]
+        self._update_max_ends(position)
+
+    def overlaps(self, start, end):
+        """
+        Returns True if any interval overlaps with given dates. Intervals
+        overlap if they start before end and end after start.
+        """
+        count = bisect_left(self.starts, end)
+        return count > 0 and self.max_ends[count - 1] > start
+
+    def conflicts(self, entry):
+        """
+        Returns True if the interval of given entry overlaps with any other
+        interval of the room.
+        """
+        start, end = entry[0], entry[1]
+        # Only entries that start before the end date may overlap
+        count = bisect_left(self.starts, end)
+        position = min(bisect_left(self.entries, entry), count)
+        if position > 0 and self.max_ends[position - 1] > start:
+            return True
+        # Entries after the given one start on or after its start date
+        return any(other[1] > start
+                   for other in self.entries[position + 1:count])
+
+    def _update_max_ends(self, position):
+        latest = self.max_ends[position - 1] if position > 0 else None
+        for index in xrange(position, len(self.entries)):
+            end = self.entries[index][1]
+            latest = end if latest is None or end > latest else latest
+            self.max_ends[index] = latest
+
+
+class RoomIntervalIndex(object):
+    """
+    Thread-safe in-memory index of reservation dates per room.
+
+    Creates and returns an empty RoomIntervalIndex object. The index must be
+    loaded with all rooms and reservations before it is used, and every change
+    of the reservations must be applied to it afterwards.
+
+    index = RoomIntervalIndex()
+    index.load(rooms, reservations)
+    index.add(reservation_id, hotel_id, room_number, start_date, end_date)
+    if index.is_free(hotel_id, room_number, start_date, end_date):
+        <book_room>
+    """
+    def __init__(self):
+        """
+        Constructor method for the RoomIntervalIndex class
+
+        Returns:
+            :return:
+        """
+        # (hotel ID, room number) -> _RoomIntervals
+        self._rooms = {}
+        # Reservation ID -> ((hotel ID, room number), interval entry)
+        self._reservations = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        """
+        Boolean whether the index is loaded.
+        """
+        return self._loaded
+
+    def load(self, rooms, reservations):
+        """
+        Replaces the content of the index.
+
+        Parameters:
+            :param rooms: Iterable of (hotel ID, room number) of all rooms
+            :param reservations: Iterable of (reservation ID, hotel ID, room
+            number, start date, end date) of all reservations
+
+        Returns:
+            :return:
+        """
+        with self._lock:
+            self._rooms = dict(((hotel_id, room_number), _RoomIntervals())
+                               for hotel_id, room_number in rooms)
+            self._reservations = {}
+            # Entries are sorted once per room rather than inserted one by
+            # one, which would take quadratic time for rooms with long history
+            entries = {}
+            for reservation_id, hotel_id, room_number, start_date, end_date \
+                    in reservations:
+                room = (hotel_id, room_number)
+                entry = (to_date(start_date), to_date(end_date),
+                         reservation_id)
+                entries.setdefault(room, []).append(entry)
+                self._reservations[reservation_id] = (room, entry)
+            for room, room_entries in entries.iteritems():
+                intervals = self._rooms.get(room)
+                if intervals is None:
+                    intervals = self._rooms[room] = _RoomIntervals()
+                intervals.load(room_entries)
+            self._loaded = True
+
+    def clear(self):
+        """
+        Empties the index. It must be loaded again before it is used.
+
+        Returns:
+            :return:
+        """
+        with self._lock:
+            self._rooms = {}
+            self._reservations = {}
+            self._loaded = False
+
+    def add(self, reservation_id, hotel_id, room_number, start_date,
+            end_date):
+        """
+        Adds a reservation into the index, or moves it to new room or dates if
+        it is already present.
+
+        Parameters:
+            :param reservation_id: Reservation ID
+            :param hotel_id: Hotel ID of the reserved room
+            :param room_number: Room number of the reserved room
+            :param start_date: Start date of the reservation
+            :param end_date: End date of the reservation
+
+        Returns:
+            :return:
+        """
+        with self._lock:
+            self._remove(reservation_id)
+            self._add(reservation_id, hotel_id, room_number, start_date,
+                      end_date)
+
+    def remove(self, reservation_id):
+        """
+        Removes a reservation from the index. Unknown reservations are ignored.
+
+        Parameters:
+            :param reservation_id: Reservation ID
+
+        Returns:
+            :return:
+        """
+        with self._lock:
+            self._remove(reservation_id)
+
+    def is_free(self, hotel_id, room_number, start_date, end_date):
+        """
+        Checks whether a room has no reservation for given dates.
+
+        Parameters:
+            :param hotel_id: Hotel ID of the room
+            :param room_number: Room number of the room
+            :param start_date: Start date
+            :param end_date: End date
+
+        Returns:
+            :return: Boolean whether the room is free
+        """
+        start_date, end_date = to_date(start_date), to_date(end_date)
+        with self._lock:
+            intervals = self._rooms.get((hotel_id, room_number))
+            return intervals is None or \
+                not intervals.overlaps(start_date, end_date)
+
+    def free_rooms(self, start_date, end_date, rooms=None):
+        """
+        Determines rooms that have no reservation for given dates.
+
+        Parameters:
+            :param start_date: Start date
+            :param end_date: End date
+            :param rooms: Iterable of (hotel ID, room number) of the candidate
+            rooms. If None, all rooms of the index are candidates.
+
+        Returns:
+            :return: List of (hotel ID, room number) of free rooms, in the
+            order of the candidate rooms
+        """
+        start_date, end_date = to_date(start_date), to_date(end_date)
+        with self._lock:
+            if rooms is None:
+                rooms = sorted(self._rooms)
+            free = []
+            for room in rooms:
+                intervals = self._rooms.get(room)
+                if intervals is None or \
+                        not intervals.overlaps(start_date, end_date):
+                    free.append(room)
+            return free
+
+    def has_conflict(self, reservation_id):
+        """
+        Checks whether a reservation overlaps with another reservation of the
+        same room. Reservation dates are treated as half-open intervals.
+
+        Parameters:
+            :param reservation_id: Reservation ID
+
+        Returns:
+            :return: Boolean whether the reservation conflicts. Unknown
+            reservations do not conflict.
+        """
+        with self._lock:
+            reservation = self._reservations.get(reservation_id)
+            if reservation is None:
+                return False
+            room, entry = reservation
+            return self._rooms[room].conflicts(entry)
+
+    def stats(self):
+        """
+        Reports the size of the index.
+
+        Returns:
+            :return: Dictionary with the following items:
+                - loaded: Boolean whether the index is loaded
+                - rooms: Number of indexed rooms
+                - reservations: Number of indexed reservations
+        """
+        with self._lock:
+            return {'loaded': self._loaded,
+                    'rooms': len(self._rooms),
+                    'reservations': len(self._reservations)}
+
+    def _add(self, reservation_id, hotel_id, room_number, start_date,
+             end_date):
+        """
+        Adds a reservation into the index without locking.
+
+        This is private function of the class and not intended to be referenced
+        outside of the class.
+        """
+        room = (hotel_id, room_number)
+        entry = (to_date(start_date), to_date(end_date), reservation_id)
+        intervals = self._rooms.get(room)
+        if intervals is None:
+            intervals = self._rooms[room] = _RoomIntervals()
+        intervals.add(entry)
+        self._reservations[reservation_id] = (room, entry)
+
+    def _remove(self, reservation_id):
+        """
+        Removes a reservation from the index without locking.
+
+        This is private function of the class and not intended to be referenced
+        outside of the class.
+        """
+        reservation = self._reservations.pop(reservation_id, None)
+        if reservation is not None:
+            room, entry = reservation
+            self._rooms[room].remove(entry)
@@ -0,0 +1,367 @@
+"""
+migrations.py
+
+CSC 540 (601) - Database Management Concepts and Systems
+Project for CSC 540
+
+Description of the Project and Software read in the main program: hotelsoft.py
+
+Description of the migrations.py file:
+This file provides the versioned schema migrations applied to an existing
+database without dropping and reloading its tables. Each migration has a
+version number, a description and a list of operations (e.g. adding an index).
+The migration runner does the following:
+1) Records the version of every applied migration in the SchemaVersion table
+2) Applies all migrations newer than the recorded version in the order of
+their versions, up to an optional target version
+3) Applies every operation idempotently: an operation is skipped if the
+database already contains its change (e.g. an index with the same name or with
+the same leading attributes), so an interrupted migration may be re-run
+4) Serializes concurrent runners with a MariaDB named lock
+The file may also be executed as independent Python program:
+
+python migrations.py --user user --password password --database db status
+python migrations.py --user user --password password --database db migrate
+
+@version: 1.0
+@todo: None
+@since: October 18, 2026
+
+@status: Complete
+@requires: mysql.connector
+@contact: nfschnoo@ncsu.edu
+          ngtitov@ncsu.edu
+          pdscott2@ncsu.edu
+
+@authors: Nathan Schnoor
+          Nikolay Titov
+          Preston Scott
+"""
+
+import argparse
+
+import mysql.connector as maria_db
+from mysql.connector import errorcode
+
+from rollups import CREATE_DAILY_OCCUPANCY, CREATE_DAILY_REVENUE, \
+    DAILY_OCCUPANCY_TABLE, DAILY_REVENUE_TABLE, rebuild_daily_occupancy, \
+    rebuild_daily_revenue
+
+# Table recording the applied migrations
+SCHEMA_VERSION_TABLE = 'SchemaVersion'
+
+# Named lock held while migrations are applied
+MIGRATION_LOCK = 'csc540_schema_migration'
+
+# Number of seconds to wait for the migration lock
+MIGRATION_LOCK_TIMEOUT = 60
+
+
+class AddIndex(object):
+    """
+    Migration operation that adds a secondary index to a table.
+
+    operation = AddIndex('Serves', 'idx_serves_reservation',
+                         ('reservation_id',))
+    """
+    def __init__(self, table_name, index_name, attributes):
+        """
+        Constructor method for the AddIndex class
+
+        Parameters:
+            :param table_name: Name of the table
+            :param index_name: Name of the index
+            :param attributes: Tuple of attributes of the index in their order
+
+        Returns:
+            :return:
+        """
+        self.table_name = table_name
+        self.index_name = index_name
+        self.attributes = tuple(attributes)
+
+    def is_applied(self, cursor):
+        """
+        Checks whether the table already has this index, or another index
+        whose leading attributes are the attributes of this index (e.g. the
+        index created by MariaDB for a foreign key).
+
+        Parameters:
+            :param cursor: Cursor of the migrated database
+
+        Returns:
+            :return: Boolean whether the operation is applied
+        """
+        cursor.execute(
+            'SELECT index_name, column_name FROM information_schema.statistics '
+            'WHERE table_schema = DATABASE() AND table_name = %s '
+            'ORDER BY index_name, seq_in_index', (self.table_name,))
+        indexes = {}
+        for index_name, column_name in cursor.fetchall():
+            indexes.setdefault(index_name, []).append(column_name.lower())
+        attributes = [attribute.lower() for attribute in self.attributes]
+        return self.index_name in indexes or any(
+            columns[:len(attributes)] == attributes
+            for columns in indexes.itervalues())
+
+    def apply(self, cursor):
+        """
+        Creates the index.
+
+        Parameters:
+            :param cursor: Cursor of the migrated database
+
+        Returns:
+            :return:
+        """
+        cursor.execute('CREATE INDEX {} ON {} ({})'.format(
+            self.index_name, self.table_name, ', '.join(self.attributes)))
+
+    def __str__(self):
+        return 'Add index {} on {}({})'.format(
+            self.index_name, self.table_name, ', '.join(self.attributes))
+
+
+class CreateTable(object):
+    """
+    Migration operation that creates a table and optionally populates it from
+    the existing data (e.g. a summary table).
+
+    operation = CreateTable('DailyOccupancy', CREATE_DAILY_OCCUPANCY,
+                            rebuild_daily_occupancy)
+    """
+    def __init__(self, table_name, statement, populate=None):
+        """
+        Constructor method for the CreateTable class
+
+        Parameters:
+            :param table_name: Name of the table
+            :param statement: CREATE TABLE statement
+            :param populate: Function of a cursor populating the created
+            table, or None
+
+        Returns:
+            :return:
+        """
+        self.table_name = table_name
+        self.statement = statement
+        self.populate = populate
+
+    def is_applied(self, cursor):
+        """
+        Checks whether the database already has the table.
+
+        Parameters:
+            :param cursor: Cursor of the migrated database
+
+        Returns:
+            :return: Boolean whether the operation is applied
+        """
+        cursor.execute(
+            'SELECT COUNT(*) FROM information_schema.tables '
+            'WHERE table_schema = DATABASE() AND table_name = %s',
+            (self.table_name,))
+        return cursor.fetchall()[0][0] > 0
+
+    def apply(self, cursor):
+        """
+        Creates and populates the table.
+
+        Parameters:
+            :param cursor: Cursor of the migrated database
+
+        Returns:
+            :return:
+        """
+        cursor.execute(self.statement)
+        if self.populate is not None:
+            self.populate(cursor)
+
+    def __str__(self):
+        return 'Create table {}'.format(self.table_name)
+
+
+class Migration(object):
+    """
+    Versioned group of migration operations.
+
+    migration = Migration(1, 'Description', [AddIndex(...), AddIndex(...)])
+    """
+    def __init__(self, version, description, operations):
+        """
+        Constructor method for the Migration class
+
+        Parameters:
+            :param version: Version number. It must be unique and positive.
+            :param description: Description of the migration
+            :param operations: List of migration operations
+
+        Returns:
+            :return:
+        """
+        self.version = version
+        self.description = description
+        self.operations = operations
+
+
+# All migrations in the order of their versions
+MIGRATIONS = [
+    Migration(1, 'Index reservation dates of each room', [
+        AddIndex('Reservations', 'idx_reservations_room_dates',
+                 ('hotel_id', 'room_number', 'start_date', 'end_date'))]),
+    Migration(2, 'Index bills, reports, staff assignment and interactions', [
+        AddIndex('Transactions', 'idx_transactions_reservation_date',
+                 ('reservation_id', 'date')),
+        AddIndex('Staff', 'idx_staff_hotel_title',
+                 ('works_for_hotel_id', 'title')),
+        AddIndex('Reservations', 'idx_reservations_dates',
+                 ('start_date', 'end_date')),
+        AddIndex('Serves', 'idx_serves_reservation', ('reservation_id',))]),
+    Migration(3, 'Summarize occupied rooms per date, hotel and category', [
+        CreateTable(DAILY_OCCUPANCY_TABLE, CREATE_DAILY_OCCUPANCY,
+                    rebuild_daily_occupancy)]),
+    Migration(4, 'Summarize revenue per hotel and day', [
+        CreateTable(DAILY_REVENUE_TABLE, CREATE_DAILY_REVENUE,
+                    rebuild_daily_revenue)])
+]
+
+
+def get_schema_version(db):
+    """
+    Determines the version of the latest applied migration.
+
+    Parameters:
+        :param db: The database connection
+
+    Returns:
+        :return: Version number, or 0 if no migration is applied
+    """
+    cursor = db.cursor()
+    try:
+        cursor.execute('SELECT MAX(version) FROM {}'.format(
+            SCHEMA_VERSION_TABLE))
+        version = cursor.fetchall()[0][0]
+    except maria_db.Error as error:
+        if error.errno != errorcode.ER_NO_SUCH_TABLE:
+            raise error
+        version = None
+    finally:
+        cursor.close()
+    return version or 0
+
+
+def get_pending_migrations(db, target=None):
+    """
+    Determines migrations that are not applied yet.
+
+    Parameters:
+        :param db: The database connection
+        :param target: Latest version to be applied. If None, all migrations
+        are considered.
+
+    Returns:
+        :return: List of migrations in the order of their versions
+    """
+    version = get_schema_version(db)
+    return [migration for migration in
+            sorted(MIGRATIONS, key=lambda migration: migration.version)
+            if migration.version > version and
+            (target is None or migration.version <= target)]
+
+
+def migrate(db, target=None, log=None):
+    """
+    Applies all pending migrations up to the target version.
+
+    Data definition statements are committed implicitly by MariaDB, therefore
+    each migration is recorded in the SchemaVersion table right after its
+    operations succeed. If a migration fails, the migrations applied before it
+    stay recorded and the failed one is applied again on the next run.
+
+    Parameters:
+        :param db: The database connection
+        :param target: Latest version to be applied. If None, all migrations
+        are applied.
+        :param log: Function called with a message for every applied
+        operation. If None, nothing is logged.
+
+    Returns:
+        :return: List of applied versions
+
+    Exceptions:
+        :raise: Exception if the migration lock cannot be acquired or MySQL
+        Connector Error exceptions
+    """
+    cursor = db.cursor()
+    try:
+        cursor.execute('SELECT GET_LOCK(%s, %s)',
+                       (MIGRATION_LOCK, MIGRATION_LOCK_TIMEOUT))
+        if cursor.fetchall()[0][0] != 1:
+            raise Exception('Exception: Another process is migrating the '
+                            'database schema.')
+        try:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS {} (
+                    version INT PRIMARY KEY,
+                    description VARCHAR(256) NOT NULL,
+                    applied_at DATETIME NOT NULL
+                );""".format(SCHEMA_VERSION_TABLE))
+            applied = []
+            for migration in get_pending_migrations(db, target):
+                for operation in migration.operations:
+                    if operation.is_applied(cursor):
+                        continue
+                    if log is not None:
+                        log('Migration {}: {}'.format(migration.version,
+                                                      operation))
+                    operation.apply(cursor)
+                cursor.execute(
+                    'INSERT INTO {} (version, description, applied_at) '
+                    'VALUES (%s, %s, NOW())'.format(SCHEMA_VERSION_TABLE),
+                    (migration.version, migration.description))
+                db.commit()
+                applied.append(migration.version)
+            return applied
+        finally:
+            cursor.execute('SELECT RELEASE_LOCK(%s)', (MIGRATION_LOCK,))
+            cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def _print_message(message):
+    """
+    Prints a message of the migration runner.
+
+    Parameters:
+        :param message: Message
+
+    Returns:
+        :return:
+    """
+    print message
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Applies schema migrations to an existing database.')
+    parser.add_argument('--host', default='classdb2.csc.ncsu.edu')
+    parser.add_argument('--user', required=True)
+    parser.add_argument('--password', required=True)
+    parser.add_argument('--database', required=True)
+    parser.add_argument('--target', type=int, default=None,
+                        help='Latest version to be applied')
+    parser.add_argument('command', choices=['status', 'migrate'])
+    args = parser.parse_args()
+    con = maria_db.connect(host=args.host, user=args.user,
+                           password=args.password, database=args.database)
+    if args.command == 'status':
+        print 'Schema version: {}'.format(get_schema_version(con))
+        for pending in get_pending_migrations(con, args.target):
+            print 'Pending migration {}: {}'.format(pending.version,
+                                                    pending.description)
+    else:
+        versions = migrate(con, args.target, log=_print_message)
+        print 'Applied migrations: {}'.format(
+            ', '.join(str(version) for version in versions) or 'None')
+    con.close()
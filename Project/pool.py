@@ -0,0 +1,314 @@
+"""
+pool.py
+
+CSC 540 (601) - Database Management Concepts and Systems
+Project for CSC 540
+
+Description of the Project and Software read in the main program: hotelsoft.py
+
+Description of the pool.py file:
+This file provides a pooled connection manager for the MariaDB connections used
+by the APIs (apps.py), the client (appsclient.py) and the transaction wrapper
+(util.py). Instead of holding one long-lived connection per front-desk terminal
+or reporting job, every operation checks a connection out of the pool and
+returns it once the operation is complete. The pool does the following:
+1) Lazily creates connections up to a configurable size and blocks (with an
+optional timeout) when all of them are in use
+2) Performs a health check on every checkout and transparently reconnects or
+replaces broken connections
+3) Rolls back any uncommitted work when a connection is returned, so the next
+borrower always starts with a clean connection
+4) Keeps pool statistics: connections created, in use, idle, checkouts, number
+of waits and total/maximum wait time
+
+@version: 1.0
+@todo: None
+@since: October 18, 2026
+
+@status: Complete
+@requires: mysql.connector
+@contact: nfschnoo@ncsu.edu
+          ngtitov@ncsu.edu
+          pdscott2@ncsu.edu
+
+@authors: Nathan Schnoor
+          Nikolay Titov
+          Preston Scott
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+import mysql.connector as maria_db
+
+
+class ConnectionPool(object):
+    """
+    Thread-safe pool of MariaDB connections.
+
+    Creates and returns a ConnectionPool object that opens at most size
+    connections with the given mysql.connector connect() arguments. A custom
+    connection_factory may be given instead of the connect() arguments (e.g. a
+    function returning a connection to a test database).
+
+    pool = ConnectionPool(size=5, host=HOST, user=USER, password=PASSWORD,
+                          database=DATABASE)
+    with pool.connection() as db:
+        <sql_operation_1>
+        <sql_operation_2>
+    """
+    def __init__(self, size=5, timeout=None, health_check=True,
+                 connection_factory=None, **connect_args):
+        """
+        Constructor method for the ConnectionPool class
+
+        Parameters:
+            :param size: Maximum number of connections opened by the pool
+            :param timeout: Number of seconds to wait for a free connection
+            when all connections are in use. If None, waits indefinitely.
+            :param health_check: Boolean whether every checked out connection
+            is verified (and reconnected if required) before it is handed out
+            :param connection_factory: Function without arguments that returns
+            new connection. If None, mysql.connector.connect() is called with
+            connect_args.
+            :param connect_args: Arguments for mysql.connector.connect() (host,
+            user, password, database, etc.)
+
+        Returns:
+            :return:
+        """
+        assert size > 0, \
+            'Exception: Size of the connection pool must be positive.\n'
+        self.size = size
+        self.timeout = timeout
+        self.health_check = health_check
+        if connection_factory is None:
+            connection_factory = lambda: maria_db.connect(**connect_args)
+        self._connection_factory = connection_factory
+        # Most recently returned connection is handed out first, so idle
+        # connections stay warm while the rest of them may time out
+        self._idle = []
+        self._lock = threading.Lock()
+        # Notified whenever a connection is returned or its slot is freed
+        self._available = threading.Condition(self._lock)
+        self._closed = False
+        self._created = 0
+        self._in_use = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+        self._replaced = 0
+
+    def get_connection(self):
+        """
+        Checks a connection out of the pool.
+
+        Hands out an idle connection if there is one, otherwise opens a new
+        connection if the pool size allows it, otherwise waits until another
+        borrower returns its connection or the slot of a broken connection is
+        freed. The connection must be returned with
+        put_connection() (or use the connection() context manager).
+
+        Returns:
+            :return: MariaDB connection
+
+        Exceptions:
+            :raise: Exception if no connection becomes free within timeout or
+            the pool is closed, or MySQL Connector Error exceptions
+        """
+        start_time = time.time()
+        waited = False
+        con = None
+        with self._available:
+            while True:
+                if self._closed:
+                    raise Exception('Exception: Connection pool is closed.')
+                if self._idle:
+                    con = self._idle.pop()
+                    break
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                # Wait for a returned connection or a freed slot
+                waited = True
+                remaining = None
+                if self.timeout is not None:
+                    remaining = start_time + self.timeout - time.time()
+                    if remaining <= 0:
+                        self._waits += 1
+                        self._wait_time += time.time() - start_time
+                        raise Exception(
+                            'Exception: Timed out waiting for a free database '
+                            'connection. All {} connections are in '
+                            'use.'.format(self.size))
+                self._available.wait(remaining)
+        if con is None:
+            try:
+                con = self._connection_factory()
+            except Exception:
+                with self._available:
+                    self._created -= 1
+                    self._available.notify()
+                raise
+        if self.health_check:
+            con = self._check_connection(con)
+        wait_time = time.time() - start_time
+        with self._lock:
+            self._in_use += 1
+            self._checkouts += 1
+            if waited:
+                self._waits += 1
+            self._wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+        return con
+
+    def put_connection(self, con):
+        """
+        Returns a checked out connection back into the pool.
+
+        Any uncommitted work is rolled back. If the connection cannot be rolled
+        back it is considered broken, gets closed, and its slot is freed for a
+        new connection. If the pool is closed, the connection gets closed.
+
+        Parameters:
+            :param con: MariaDB connection previously checked out of the pool
+
+        Returns:
+            :return:
+        """
+        try:
+            con.rollback()
+            broken = False
+        except maria_db.Error:
+            broken = True
+        with self._available:
+            self._in_use -= 1
+            if not broken and not self._closed:
+                self._idle.append(con)
+                self._available.notify()
+                return
+        self._discard_connection(con)
+
+    @contextmanager
+    def connection(self):
+        """
+        Checks out a connection for the duration of the wrapped code and
+        returns it into the pool afterwards.
+
+        Example:
+        with pool.connection() as db:
+            <sql_operation_1>
+            <sql_operation_2>
+
+        Returns:
+            :return: MariaDB connection
+        """
+        con = self.get_connection()
+        try:
+            yield con
+        finally:
+            self.put_connection(con)
+
+    def stats(self):
+        """
+        Reports the pool statistics.
+
+        Returns:
+            :return: Dictionary with the following items:
+                - size: Maximum number of connections
+                - created: Number of currently open connections
+                - in_use: Number of connections checked out
+                - idle: Number of connections waiting in the pool
+                - checkouts: Total number of checkouts
+                - waits: Number of checkouts that had to wait for a connection
+                - total_wait_time: Total time (seconds) spent in checkouts
+                - max_wait_time: Longest time (seconds) spent in one checkout
+                - replaced: Number of broken connections that got replaced
+        """
+        with self._lock:
+            return {'size': self.size,
+                    'created': self._created,
+                    'in_use': self._in_use,
+                    'idle': len(self._idle),
+                    'checkouts': self._checkouts,
+                    'waits': self._waits,
+                    'total_wait_time': self._wait_time,
+                    'max_wait_time': self._max_wait_time,
+                    'replaced': self._replaced}
+
+    def close(self):
+        """
+        Closes all idle connections. Connections that are still checked out
+        are closed once they are returned. No connection may be checked out
+        afterwards, and borrowers waiting for a connection get an exception.
+
+        Returns:
+            :return:
+        """
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._available.notify_all()
+        for con in idle:
+            self._discard_connection(con)
+
+    def _check_connection(self, con):
+        """
+        Verifies that connection is still alive.
+
+        This is private function of the class and not intended to be referenced
+        outside of the class. It tries to reconnect broken connection once and
+        replaces it with a new connection if reconnect fails.
+
+        Parameters:
+            :param con: MariaDB connection checked out of the pool
+
+        Returns:
+            :return: Healthy MariaDB connection
+        """
+        if con.is_connected():
+            return con
+        try:
+            con.reconnect(attempts=1, delay=0)
+            return con
+        except maria_db.Error:
+            pass
+        # The replacement keeps the slot of the broken connection, so no
+        # waiting borrower can take it in between
+        try:
+            con.close()
+        except maria_db.Error:
+            pass
+        with self._lock:
+            self._replaced += 1
+        try:
+            return self._connection_factory()
+        except Exception:
+            with self._available:
+                self._created -= 1
+                self._available.notify()
+            raise
+
+    def _discard_connection(self, con):
+        """
+        Closes connection and frees its slot in the pool.
+
+        This is private function of the class and not intended to be referenced
+        outside of the class.
+
+        Parameters:
+            :param con: MariaDB connection to be discarded
+
+        Returns:
+            :return:
+        """
+        try:
+            con.close()
+        except maria_db.Error:
+            pass
+        with self._available:
+            self._created -= 1
+            # Borrower waiting for a connection may open a new one instead
+            self._available.notify()
@@ -76,6 +76,97 @@ ZipToCityState NATURAL LEFT JOIN ((SELECT * from Reservations WHERE
 GROUP BY city, state
 """
 
+# Total number of rooms per hotel and category joined with the number of
+# occupied rooms on the query date from the DailyOccupancy summary table.
+# Used by the occupancy reports read from the summary (rollups.py).
+OCCUPANCY_ROLLUP_TABLE_STATEMENT = """
+(SELECT hotel_id, category, COUNT(*) AS total_rooms FROM Rooms
+GROUP BY hotel_id, category) AS RoomTotals
+JOIN Hotels ON RoomTotals.hotel_id = Hotels.id
+LEFT JOIN DailyOccupancy ON DailyOccupancy.date = DATE(%s) AND
+DailyOccupancy.hotel_id = RoomTotals.hotel_id AND
+DailyOccupancy.category = RoomTotals.category
+"""
+
+# Occupancy columns of the reports read from the DailyOccupancy summary table
+OCCUPANCY_ROLLUP_COLUMN_NAMES = """
+CAST(IFNULL(SUM(rooms_occupied), 0) AS SIGNED) AS 'Rooms Occupied',
+CAST(SUM(total_rooms) AS SIGNED) AS 'Total Rooms',
+(CAST(IFNULL(SUM(rooms_occupied), 0) AS SIGNED) /
+CAST(SUM(total_rooms) AS SIGNED) * 100) AS '% Occupancy'
+"""
+
+# Query to report the occupancy grouped by hotel from the summary table
+# Parameters:
+#     - query_date: The date for which to query the occupancy
+REPORT_OCCUPANCY_BY_HOTEL_ROLLUP = """
+SELECT name AS 'Hotel Name', {} FROM {} GROUP BY RoomTotals.hotel_id
+""".format(OCCUPANCY_ROLLUP_COLUMN_NAMES, OCCUPANCY_ROLLUP_TABLE_STATEMENT)
+
+# Query to report the occupancy grouped by room type from the summary table
+# Parameters:
+#     - query_date: The date for which to query the occupancy
+REPORT_OCCUPANCY_BY_ROOM_TYPE_ROLLUP = """
+SELECT RoomTotals.category AS 'Room Type', {} FROM {}
+GROUP BY RoomTotals.category
+""".format(OCCUPANCY_ROLLUP_COLUMN_NAMES, OCCUPANCY_ROLLUP_TABLE_STATEMENT)
+
+# Query to report the occupancy grouped by city from the summary table
+# Parameters:
+#     - query_date: The date for which to query the occupancy
+REPORT_OCCUPANCY_BY_CITY_ROLLUP = """
+SELECT concat(city, ', ', state) AS 'City, State', {} FROM {}
+JOIN ZipToCityState ON Hotels.zip = ZipToCityState.zip
+GROUP BY city, state
+""".format(OCCUPANCY_ROLLUP_COLUMN_NAMES, OCCUPANCY_ROLLUP_TABLE_STATEMENT)
+
+# Query for the number of occupied and total rooms per hotel and room type,
+# from which the occupancy by hotel, by room type and by city are grouped
+# Parameters:
+#     - query_date: The date for which to query the occupancy
+#     - query_date: The date for which to query the occupancy
+REPORT_OCCUPANCY_COMBINED = """
+SELECT hotel_id AS 'Hotel ID', name AS 'Hotel Name', category AS 'Room Type',
+concat(city, ', ', state) AS 'City, State',
+count(number_of_guests) AS 'Rooms Occupied',
+count(room_number) AS 'Total Rooms'
+FROM ((SELECT name, room_number, hotel_id, category, zip FROM Rooms JOIN
+Hotels ON Rooms.hotel_id = Hotels.id) AS HotelRooms) NATURAL JOIN
+ZipToCityState NATURAL LEFT JOIN ((SELECT * from Reservations WHERE
+(DATEDIFF(start_date, %s) <= 0 AND DATEDIFF(end_date, %s) > 0)) AS CurrentRes)
+GROUP BY hotel_id, category
+"""
+
+# Query for the number of occupied and total rooms per hotel and room type
+# from the summary table
+# Parameters:
+#     - query_date: The date for which to query the occupancy
+REPORT_OCCUPANCY_COMBINED_ROLLUP = """
+SELECT RoomTotals.hotel_id AS 'Hotel ID', name AS 'Hotel Name',
+RoomTotals.category AS 'Room Type',
+concat(city, ', ', state) AS 'City, State',
+{} FROM {}
+JOIN ZipToCityState ON Hotels.zip = ZipToCityState.zip
+GROUP BY RoomTotals.hotel_id, RoomTotals.category
+""".format(OCCUPANCY_ROLLUP_COLUMN_NAMES, OCCUPANCY_ROLLUP_TABLE_STATEMENT)
+
+# Query for the total rooms of every hotel together with its reservations
+# overlapping a date window, one tuple per reservation (or a single tuple with
+# NULL dates for a hotel without such reservations)
+# Parameters:
+#     - query_end: The date for which to end the window
+#     - query_start: The date for which to start the window
+REPORT_OCCUPANCY_TIME_SERIES = """
+SELECT Hotels.id AS 'Hotel ID', name AS 'Hotel Name',
+total_rooms AS 'Total Rooms', start_date, end_date
+FROM Hotels JOIN (SELECT hotel_id, count(room_number) AS total_rooms
+FROM Rooms GROUP BY hotel_id) AS RoomTotals ON Hotels.id = RoomTotals.hotel_id
+LEFT JOIN (SELECT hotel_id, start_date, end_date FROM Reservations
+WHERE start_date < %s AND end_date > %s) AS Overlapping
+ON Hotels.id = Overlapping.hotel_id
+ORDER BY Hotels.id
+"""
+
 # Query to report the occupancy grouped by city
 # Parameters:
 #     - query_end: The date for which to end the query
@@ -138,6 +229,30 @@ Hotels ON Hotels.id = Reservations.hotel_id
 WHERE date >= %s AND date <= %s GROUP BY Hotels.id ORDER BY Hotels.name;
 """
 
+# Query to report the revenue for a single hotel from the DailyRevenue summary
+# table. Both dates are included as whole days.
+# Parameters:
+#     - start_date: The date for the start of the query
+#     - end_date: The date for the end of the query
+#     - hotel_id: The hotel ID for which to query the revenue
+REPORT_REVENUE_SINGLE_HOTEL_ROLLUP = """
+SELECT Hotels.name as 'Hotel Name', SUM(revenue) as Revenue
+FROM DailyRevenue JOIN Hotels ON DailyRevenue.hotel_id = Hotels.id
+WHERE day >= DATE(%s) AND day <= DATE(%s) AND hotel_id = %s;
+"""
+
+# Query to report the revenue for all hotels from the DailyRevenue summary
+# table. Both dates are included as whole days.
+# Parameters:
+#     - start_date: The date for the start of the query
+#     - end_date: The date for the end of the query
+REPORT_REVENUE_ALL_HOTELS_ROLLUP = """
+SELECT Hotels.name as 'Hotel Name', SUM(revenue) as Revenue
+FROM DailyRevenue JOIN Hotels ON DailyRevenue.hotel_id = Hotels.id
+WHERE day >= DATE(%s) AND day <= DATE(%s)
+GROUP BY Hotels.id ORDER BY Hotels.name;
+"""
+
 # Desired column names for Room Availability query displayed in Pandas DataFrame
 # Parameters: None
 ROOM_AVAILABILITY_COLUMN_NAMES = """
@@ -154,56 +269,192 @@ ZipToCityState JOIN Hotels ON ZipToCityState.zip = Hotels.zip JOIN Rooms ON
 Rooms.hotel_id = Hotels.id
 """
 
-# Nested WHERE clause for Room Availability query used for Reservations table
-# Parameters: None
+# Nested WHERE clause for Room Availability query used for Reservations table.
+# Anti-join of each room with its reservations overlapping the given dates.
+# Reservation dates are half-open intervals, so a room is available from the
+# end date of its previous reservation, the same as it can be booked. The
+# equality on the room and the range on start_date are
+# answered by the idx_reservations_room_dates index of the Reservations table.
+# Parameters:
+#     - end_date: End date of the desired stay
+#     - start_date: Start date of the desired stay
 ROOM_AVAILABILITY_NESTED_WHERE_CLAUSE = """
-(Rooms.hotel_id, room_number) NOT IN (SELECT hotel_id, room_number FROM Reservations 
-WHERE (((%s BETWEEN start_date AND end_date) OR (%s between start_date 
-AND end_date) OR (start_date BETWEEN %s AND %s) OR (end_date BETWEEN %s 
-AND %s))
+NOT EXISTS (SELECT * FROM Reservations 
+WHERE Reservations.hotel_id = Rooms.hotel_id AND 
+Reservations.room_number = Rooms.room_number AND 
+Reservations.start_date < %s AND Reservations.end_date > %s)
 """
 
-# Check reservations for conflicts - same room at same time.
+# Catalog of all rooms with the same columns as Room Availability query. Used
+# by the in-process interval index (intervals.py) to filter rooms without a
+# query.
 # Parameters: None
+ROOM_CATALOG = """
+SELECT {} FROM {} ORDER BY Rooms.hotel_id, room_number
+""".format(ROOM_AVAILABILITY_COLUMN_NAMES, ROOM_AVAILABILITY_TABLE_STATEMENT)
+
+# Filtering options of Room Availability query and the corresponding columns
+# of the room catalog
+ROOM_CATALOG_FILTERS = {
+    'hotel_id': 'Hotel ID',
+    'name': 'Hotel Name',
+    'street': 'Street',
+    'city': 'City',
+    'state': 'State',
+    'Hotels.zip': 'ZIP',
+    'phone_number': 'Phone Number',
+    'room_number': 'Room Number',
+    'category': 'Category',
+    'occupancy': 'Occupancy',
+    'rate': 'Rate per Night'
+}
+
+# Dates of all reservations loaded into the in-process interval index, in the
+# order the index keeps them
+# Parameters: None
+RESERVATION_INTERVALS = """
+SELECT id, hotel_id, room_number, start_date, end_date FROM Reservations
+ORDER BY hotel_id, room_number, start_date
+"""
+
+# Check given reservations for conflicts - same room at same time. Only the
+# rooms and dates of the given reservations are checked. The dates of a
+# reservation are treated as half-open interval [start_date, end_date), so a
+# room may be reserved again starting on the end date of previous reservation.
+# Parameters: Reservation IDs (the IN list is formatted with one placeholder
+# per reservation)
 CHECK_RESERVATION_CONFLICT = """
-SELECT *
-FROM Reservations as R1
-WHERE EXISTS
-    (SELECT id from Reservations as R2
-     WHERE ((R1.id <> R2.id) AND
-            (R1.hotel_id = R2.hotel_id) AND
-            (R1.room_number = R2.room_number) AND
-            ((R1.start_date BETWEEN R2.start_date AND R2.end_date) OR 
-             (R1.end_date BETWEEN R2.start_date AND R2.end_date) OR
-             (R2.start_date BETWEEN R1.start_date AND R1.end_date) OR
-             (R2.end_date BETWEEN R1.start_date AND R1.end_date)))
-    )
-"""
-
-# Query to generate a bill for total amount per specific reservation
-# Parameters:
-#     - reservation_id: Reservation ID for which total amount due is
-#       calculated applying discount
-GENERATE_BILL_TOTAL_AMOUNT_DUE = """
-SELECT SUM(amount) AS 'Cost', 
-ROUND(discount_percentage * SUM(amount), 2) AS 'Discount', 
-ROUND(SUM(amount) - (discount_percentage * SUM(amount)), 2) AS 
-'Total Amount Due' 
-FROM Transactions, (SELECT IFNULL(is_hotel_card, 0) * 0.05 AS 
-'discount_percentage' FROM Reservations JOIN Customers ON 
-Reservations.customer_id = Customers.id WHERE Reservations.id = %s) as Discount
-WHERE reservation_id = %s
-"""
-
-# Query to generate a bill for itemized charges per specific reservation
-# Parameters:
-#     - reservation_id: Reservation ID for which a list of itemized charges is
-#       calculated (does not include discount)
-GENERATE_BILL_ITEMIZED_CHARGES = """
-SELECT id AS 'Transaction ID', amount AS 'Amount', type AS 'Description', 
-date AS 'Date'  
-FROM Transactions
-WHERE reservation_id = %s
+SELECT R1.id
+FROM Reservations AS R1 JOIN Reservations AS R2
+ON R2.hotel_id = R1.hotel_id AND R2.room_number = R1.room_number
+WHERE R1.id IN ({}) AND R2.id <> R1.id AND
+      R2.start_date < R1.end_date AND R2.end_date > R1.start_date
+LIMIT 1
+"""
+
+# Query to lock the row of a room, serializing the bookings of the room without
+# blocking the bookings of other rooms
+# Parameters:
+#     - hotel_id: Hotel ID of the room
+#     - room_number: Room number of the room
+LOCK_ROOM = """
+SELECT hotel_id, room_number FROM Rooms
+WHERE hotel_id = %s AND room_number = %s
+FOR UPDATE
+"""
+
+# Query to find a reservation of a room overlapping given dates, answered by
+# the idx_reservations_room_dates index. It reads the latest committed
+# reservations, not the snapshot of the transaction.
+# Parameters:
+#     - hotel_id: Hotel ID of the room
+#     - room_number: Room number of the room
+#     - end_date: End date of the new reservation
+#     - start_date: Start date of the new reservation
+CHECK_ROOM_OVERLAP = """
+SELECT id FROM Reservations
+WHERE hotel_id = %s AND room_number = %s AND start_date < %s AND end_date > %s
+LIMIT 1
+LOCK IN SHARE MODE
+"""
+
+# Query to generate the bills of reservations: whether the customer pays with
+# the hotel credit card and the itemized charges (NULL if a reservation has no
+# charges) of every reservation, in the order of reservation IDs
+# Parameters:
+#     - Condition on Reservations, e.g. 'Reservations.id IN (%s, %s)' or
+#       'Reservations.end_date = %s', formatted into the query, and its values
+GENERATE_BILLS = """
+SELECT Reservations.id AS reservation_id,
+IFNULL(is_hotel_card, 0) AS is_hotel_card,
+Transactions.id AS 'Transaction ID', amount AS 'Amount',
+type AS 'Description', date AS 'Date'
+FROM Reservations JOIN Customers ON Reservations.customer_id = Customers.id
+LEFT JOIN Transactions ON Transactions.reservation_id = Reservations.id
+WHERE {}
+ORDER BY Reservations.id, Transactions.id
+"""
+
+# Query to lock the reservations to be checked out together and determine
+# their room charges
+# Parameters:
+#     - Condition on Reservations, e.g. 'Reservations.id IN (%s, %s)' or
+#       'Reservations.end_date = %s', formatted into the query, and its values
+QUERY_CHECK_OUT_RESERVATIONS = """
+SELECT Reservations.id, rate * DATEDIFF(end_date, start_date),
+DATEDIFF(end_date, start_date)
+FROM Reservations JOIN Rooms ON Reservations.hotel_id = Rooms.hotel_id
+AND Reservations.room_number = Rooms.room_number
+WHERE {} AND check_out_time IS NULL
+ORDER BY Reservations.id
+FOR UPDATE
+"""
+
+# Query to free all the dedicated staff assigned to the rooms of reservations
+# Parameters:
+#     - Reservations.id: IDs of the reservations, formatted into the query as
+#       placeholders
+FREE_ASSIGNED_STAFF = """
+UPDATE Staff INNER JOIN Reservations
+ON assigned_hotel_id = Reservations.hotel_id
+AND assigned_room_number = Reservations.room_number
+SET assigned_hotel_id = NULL, assigned_room_number = NULL
+WHERE Reservations.id IN ({})
+"""
+
+# Query to insert the room charge transactions of checked out reservations
+# Parameters:
+#     - check_out_time: Check-out time used for the transaction date
+#     - Reservations.id: IDs of the reservations, formatted into the query as
+#       placeholders
+INSERT_ROOM_CHARGES = """
+INSERT INTO Transactions (amount, type, date, reservation_id)
+SELECT rate * DATEDIFF(end_date, start_date),
+CONCAT(DATEDIFF(end_date, start_date), '-night(s) Room Reservation Charge'),
+%s, Reservations.id
+FROM Reservations JOIN Rooms ON Reservations.hotel_id = Rooms.hotel_id
+AND Reservations.room_number = Rooms.room_number
+WHERE Reservations.id IN ({})
+"""
+
+# Query to register the check-out time of reservations
+# Parameters:
+#     - check_out_time: Check-out time of the reservations
+#     - Reservations.id: IDs of the reservations, formatted into the query as
+#       placeholders
+UPDATE_CHECK_OUT_TIME = """
+UPDATE Reservations SET check_out_time = %s WHERE id IN ({})
+"""
+
+# Query to lock one free staff member of a role working for a hotel
+# Parameters:
+#     - works_for_hotel_id: ID of the hotel
+#     - title: Role of the staff as LIKE pattern, e.g. '%Catering%'
+#     - Locking clause, e.g. 'FOR UPDATE SKIP LOCKED', formatted into the query
+QUERY_FREE_STAFF = """
+SELECT id FROM Staff
+WHERE works_for_hotel_id = %s AND title LIKE %s AND
+(assigned_hotel_id IS NULL OR assigned_hotel_id = '') AND
+(assigned_room_number IS NULL OR assigned_room_number = '')
+ORDER BY id LIMIT 1 {}
+"""
+
+# Query to lock a staff member proposed by the staff pool if it is still free
+# Parameters:
+#     - id: Staff ID
+#     - Locking clause, e.g. 'FOR UPDATE SKIP LOCKED', formatted into the query
+QUERY_LOCK_FREE_STAFF = """
+SELECT id FROM Staff
+WHERE id = %s AND
+(assigned_hotel_id IS NULL OR assigned_hotel_id = '') AND
+(assigned_room_number IS NULL OR assigned_room_number = '')
+{}
+"""
+
+# Query to load the staff pool with all staff that may be dedicated staff
+DEDICATED_STAFF = """
+SELECT id, works_for_hotel_id, title, assigned_hotel_id, assigned_room_number
+FROM Staff WHERE title LIKE '%Catering%' OR title LIKE '%Room Service%'
 """
 
 # Query to find all the staff (staff_id) assigned to a particular reservation
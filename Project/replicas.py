@@ -0,0 +1,265 @@
+"""
+replicas.py
+
+CSC 540 (601) - Database Management Concepts and Systems
+Project for CSC 540
+
+Description of the Project and Software read in the main program: hotelsoft.py
+
+Description of the replicas.py file:
+This file provides the set of read replicas used by the APIs (apps.py) to move
+reports and previews (room availability, bills) off the primary connection, so
+heavy reports do not slow down check-ins and other writes. The replica set
+does the following:
+1) Hands out the connections of the replicas (single MariaDB connections or
+ConnectionPool objects) in round-robin order
+2) Guards against stale data: the replication lag of every replica is checked
+at most once per check interval, and replicas lagging behind the primary more
+than the maximum lag (or not replicating at all) are skipped
+3) Reports that no replica is usable, so the APIs read from the primary
+instead
+4) Keeps statistics: reads per replica, fallbacks to the primary and the last
+measured lag
+The APIs keep writes on the primary, as well as the reads of a thread that
+wrote in its open transaction or committed writes within the read-your-writes
+window.
+
+replicas = ReplicaSet([ConnectionPool(size=4, host=REPLICA_HOST, user=USER,
+                                      password=PASSWORD, database=DATABASE)],
+                      max_lag=5)
+apps = Apps(primary_pool, replicas=replicas)
+
+@version: 1.0
+@todo: None
+@since: October 18, 2026
+
+@status: Complete
+@requires: mysql.connector
+@contact: nfschnoo@ncsu.edu
+          ngtitov@ncsu.edu
+          pdscott2@ncsu.edu
+
+@authors: Nathan Schnoor
+          Nikolay Titov
+          Preston Scott
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+import mysql.connector as maria_db
+
+from pool import ConnectionPool
+
+# Query reporting the replication status of a replica
+REPLICA_STATUS = 'SHOW SLAVE STATUS'
+
+
+class _Replica(object):
+    """
+    Connection source and replication state of one replica.
+
+    This is private class of the module and not intended to be referenced
+    outside of the module.
+    """
+    def __init__(self, source):
+        # ConnectionPool, or single MariaDB connection used by one thread at
+        # a time
+        self.source = source
+        self.lock = None if isinstance(source, ConnectionPool) else \
+            threading.Lock()
+        # Seconds behind the primary (None if not replicating) and time of
+        # the last check
+        self.lag = 0
+        self.checked_at = None
+        self.usable = True
+        self.reads = 0
+
+    def get_connection(self):
+        """
+        Checks out a connection of the replica, waiting for the single
+        connection to be returned by another thread.
+        """
+        if self.lock is None:
+            return self.source.get_connection()
+        self.lock.acquire()
+        return self.source
+
+    def put_connection(self, con):
+        """
+        Returns a checked out connection of the replica.
+        """
+        if self.lock is None:
+            self.source.put_connection(con)
+            return
+        try:
+            # End the transaction, so the next read sees new data
+            con.rollback()
+        except maria_db.Error:
+            pass
+        finally:
+            self.lock.release()
+
+
+class ReplicaSet(object):
+    """
+    Thread-safe set of read replicas with a replication lag guard.
+
+    Creates and returns a ReplicaSet object of the given replicas. If max_lag
+    is None, the replication lag is not checked.
+
+    replicas = ReplicaSet([replica_pool], max_lag=5, read_your_writes=10)
+    with replicas.connection() as con:
+        if con is not None:
+            <read_from_replica>
+    """
+    def __init__(self, replicas, max_lag=None, check_interval=1.0,
+                 read_your_writes=5.0):
+        """
+        Constructor method for the ReplicaSet class
+
+        Parameters:
+            :param replicas: List of ConnectionPool objects or MariaDB
+            connections of the replicas. A single connection is used by one
+            thread at a time.
+            :param max_lag: Maximum number of seconds a replica may lag behind
+            the primary. If None, the lag is not checked.
+            :param check_interval: Number of seconds the measured lag of a
+            replica is trusted before it is checked again
+            :param read_your_writes: Number of seconds the reads of a thread go
+            to the primary after the thread committed writes
+
+        Returns:
+            :return:
+        """
+        assert replicas, 'Exception: At least one replica is required.\n'
+        assert max_lag is None or max_lag >= 0, \
+            'Exception: Maximum replication lag must not be negative.\n'
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.read_your_writes = read_your_writes
+        self._replicas = [_Replica(source) for source in replicas]
+        self._lock = threading.Lock()
+        self._next = 0
+        self._fallbacks = 0
+
+    @contextmanager
+    def connection(self):
+        """
+        Checks out a connection of the next usable replica for the duration
+        of the wrapped code and returns it afterwards.
+
+        Example:
+        with replicas.connection() as con:
+            if con is None:
+                <read_from_primary>
+
+        Returns:
+            :return: MariaDB connection of a replica, or None if no replica is
+            usable (e.g. all of them lag too much or are not reachable)
+        """
+        replica, con = self._get_connection()
+        if replica is None:
+            yield None
+            return
+        try:
+            yield con
+        finally:
+            replica.put_connection(con)
+
+    def stats(self):
+        """
+        Reports the replica statistics.
+
+        Returns:
+            :return: Dictionary with the following items:
+                - reads: List of number of reads served by every replica
+                - lag: List of last measured lag of every replica in seconds
+                (None if not replicating)
+                - usable: List of booleans whether every replica is usable
+                - fallbacks: Number of reads sent to the primary since no
+                replica was usable
+        """
+        with self._lock:
+            return {'reads': [replica.reads for replica in self._replicas],
+                    'lag': [replica.lag for replica in self._replicas],
+                    'usable': [replica.usable for replica in self._replicas],
+                    'fallbacks': self._fallbacks}
+
+    def _get_connection(self):
+        """
+        Checks out a connection of the next usable replica.
+
+        This is private function of the class and not intended to be referenced
+        outside of the class. Replicas are tried in round-robin order, and the
+        lag of a replica is checked once its last check is older than the
+        check interval.
+
+        Returns:
+            :return: Tuple of _Replica and its MariaDB connection, or (None,
+            None) if no replica is usable
+        """
+        with self._lock:
+            start = self._next
+            self._next = (self._next + 1) % len(self._replicas)
+        for offset in xrange(len(self._replicas)):
+            replica = self._replicas[(start + offset) % len(self._replicas)]
+            now = time.time()
+            due = replica.checked_at is None or \
+                now - replica.checked_at >= self.check_interval
+            if not replica.usable and not due:
+                continue
+            try:
+                con = replica.get_connection()
+            except Exception:
+                replica.usable = False
+                replica.checked_at = now
+                continue
+            if self.max_lag is not None and due:
+                self._check_lag(replica, con)
+            elif due:
+                replica.usable = True
+                replica.checked_at = now
+            if replica.usable:
+                with self._lock:
+                    replica.reads += 1
+                return replica, con
+            replica.put_connection(con)
+        with self._lock:
+            self._fallbacks += 1
+        return None, None
+
+    def _check_lag(self, replica, con):
+        """
+        Measures the replication lag of a replica and determines whether the
+        replica is usable.
+
+        This is private function of the class and not intended to be referenced
+        outside of the class. A server that is not configured as replica (e.g.
+        a second instance loaded with the same data) does not lag.
+
+        Parameters:
+            :param replica: _Replica to be checked
+            :param con: MariaDB connection of the replica
+
+        Returns:
+            :return:
+        """
+        try:
+            cursor = con.cursor()
+            try:
+                cursor.execute(REPLICA_STATUS)
+                rows = cursor.fetchall()
+                if not rows:
+                    lag = 0
+                else:
+                    lag = rows[0][list(cursor.column_names).index(
+                        'Seconds_Behind_Master')]
+            finally:
+                cursor.close()
+        except (maria_db.Error, ValueError):
+            lag = None
+        replica.lag = lag
+        replica.usable = lag is not None and lag <= self.max_lag
+        replica.checked_at = time.time()
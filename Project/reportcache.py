@@ -0,0 +1,212 @@
+"""
+reportcache.py
+
+CSC 540 (601) - Database Management Concepts and Systems
+Project for CSC 540
+
+Description of the Project and Software read in the main program: hotelsoft.py
+
+Description of the reportcache.py file:
+This file provides the report cache of the APIs (apps.py). Managers run the
+same reports with the same dates over and over again, and every call would
+execute the full report query. When an Apps object is given a ReportCache, the
+results of the report APIs are kept in memory and the cache does the
+following:
+1) Keys every result by report name and parameters and keeps it for a limited
+time (TTL)
+2) Bounds the number of cached results and evicts the least recently used
+result once the bound is reached
+3) Keeps a write version counter per table, which the APIs bump on every
+insert, update and delete. Every result remembers the versions of the tables
+its report reads, and it is not used anymore once any of them changes, so the
+cached reports stay exact.
+4) Counts cache hits, misses, invalidated and expired results and evictions
+
+@version: 1.0
+@todo: None
+@since: October 18, 2026
+
+@status: Complete
+@requires:
+@contact: nfschnoo@ncsu.edu
+          ngtitov@ncsu.edu
+          pdscott2@ncsu.edu
+
+@authors: Nathan Schnoor
+          Nikolay Titov
+          Preston Scott
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class ReportCache(object):
+    """
+    Thread-safe LRU cache of report results with TTL and write-driven
+    invalidation.
+
+    Creates and returns a ReportCache object holding at most max_size results
+    for at most ttl seconds each. One object may be shared by several Apps
+    objects, as long as all writes into the reported tables go through them.
+
+    report_cache = ReportCache(max_size=128, ttl=300)
+    apps = Apps(maria_db_connection, report_cache=report_cache)
+    """
+    def __init__(self, max_size=128, ttl=300):
+        """
+        Constructor method for the ReportCache class
+
+        Parameters:
+            :param max_size: Maximum number of cached results
+            :param ttl: Number of seconds a result is kept
+
+        Returns:
+            :return:
+        """
+        assert max_size > 0, \
+            'Exception: Size of the report cache must be positive.\n'
+        assert ttl > 0, \
+            'Exception: TTL of the report cache must be positive.\n'
+        self.max_size = max_size
+        self.ttl = ttl
+        # Key -> (result, expiration time, versions of the read tables), in
+        # least recently used order
+        self._results = OrderedDict()
+        # Table name -> write version
+        self._versions = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidated = 0
+        self._expired = 0
+        self._evictions = 0
+
+    def get_versions(self, tables):
+        """
+        Determines the current write versions of tables.
+
+        It must be called before the report query is executed, so that a write
+        that happens meanwhile invalidates the result.
+
+        Parameters:
+            :param tables: Tuple of table names
+
+        Returns:
+            :return: Tuple of write versions in the order of the tables
+        """
+        with self._lock:
+            return tuple(self._versions.get(table, 0) for table in tables)
+
+    def get(self, key, tables):
+        """
+        Looks up a cached result.
+
+        Parameters:
+            :param key: Hashable key, e.g. (report name, parameters)
+            :param tables: Tuple of table names the report reads
+
+        Returns:
+            :return: Cached result, or None if it is not cached, expired or
+            any of the tables got written since it was cached
+        """
+        with self._lock:
+            entry = self._results.pop(key, None)
+            if entry is None:
+                self._misses += 1
+                return None
+            result, expires, versions = entry
+            if expires <= time.time():
+                self._expired += 1
+                self._misses += 1
+                return None
+            if versions != tuple(self._versions.get(table, 0)
+                                 for table in tables):
+                self._invalidated += 1
+                self._misses += 1
+                return None
+            self._results[key] = entry
+            self._hits += 1
+            return result
+
+    def put(self, key, tables, versions, result, ttl=None):
+        """
+        Caches a result, unless any of the tables got written while it was
+        queried.
+
+        Parameters:
+            :param key: Hashable key, e.g. (report name, parameters)
+            :param tables: Tuple of table names the report reads
+            :param versions: Write versions returned by get_versions() before
+            the report query was executed
+            :param result: Result of the report
+            :param ttl: Number of seconds the result is kept, at most the TTL
+            of the cache (e.g. the maximum lag of the replica the result was
+            read from). If None, the TTL of the cache.
+
+        Returns:
+            :return: Boolean whether the result got cached
+        """
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return False
+        with self._lock:
+            if versions != tuple(self._versions.get(table, 0)
+                                 for table in tables):
+                return False
+            self._results.pop(key, None)
+            if len(self._results) >= self.max_size:
+                self._results.popitem(last=False)
+                self._evictions += 1
+            self._results[key] = (result, time.time() + ttl, versions)
+            return True
+
+    def invalidate(self, table_name):
+        """
+        Bumps the write version of a table, which invalidates all cached
+        results of reports reading it.
+
+        Parameters:
+            :param table_name: Name of the written table
+
+        Returns:
+            :return:
+        """
+        with self._lock:
+            self._versions[table_name] = self._versions.get(table_name, 0) + 1
+
+    def stats(self):
+        """
+        Reports the cache statistics.
+
+        Returns:
+            :return: Dictionary with the following items:
+                - size: Number of cached results
+                - max_size: Maximum number of cached results
+                - hits: Number of lookups served from the cache
+                - misses: Number of lookups that executed the report
+                - invalidated: Number of results dropped since a table they
+                read got written
+                - expired: Number of results dropped since their TTL passed
+                - evictions: Number of results evicted from the cache
+        """
+        with self._lock:
+            return {'size': len(self._results),
+                    'max_size': self.max_size,
+                    'hits': self._hits,
+                    'misses': self._misses,
+                    'invalidated': self._invalidated,
+                    'expired': self._expired,
+                    'evictions': self._evictions}
+
+    def clear(self):
+        """
+        Removes all cached results, e.g. after a transaction that wrote into
+        the reported tables got rolled back. Statistics are kept.
+
+        Returns:
+            :return:
+        """
+        with self._lock:
+            self._results.clear()
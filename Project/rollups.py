@@ -0,0 +1,391 @@
+"""
+rollups.py
+
+CSC 540 (601) - Database Management Concepts and Systems
+Project for CSC 540
+
+Description of the Project and Software read in the main program: hotelsoft.py
+
+Description of the rollups.py file:
+This file provides the summary tables read by the reports of the APIs
+(apps.py) instead of the whole history of reservations. The summary tables are
+created by the schema migrations (migrations.py) and maintained incrementally
+by the APIs in the same transaction as the change they summarize:
+1) DailyOccupancy keeps the number of occupied rooms per date, hotel and room
+category. A reservation occupies its room from its start date up to the day
+before its end date, the same as in the occupancy reports. Rows with no
+occupied room are removed, and the total number of rooms is taken from the
+Rooms table, so the summary grows only with the occupied days.
+2) DailyRevenue keeps the total amount and number of transactions per hotel
+and day. The hotel of a transaction is the hotel of its reservation, so the
+transactions of a reservation move along when the reservation changes hotel.
+3) Rebuild functions recompute a summary from scratch, e.g. after data got
+loaded without the APIs
+The file may also be executed as independent Python program rebuilding the
+summary tables once:
+
+python rollups.py --user user --password password --database db rebuild
+
+@version: 1.0
+@todo: None
+@since: October 18, 2026
+
+@status: Complete
+@requires: mysql.connector
+@contact: nfschnoo@ncsu.edu
+          ngtitov@ncsu.edu
+          pdscott2@ncsu.edu
+
+@authors: Nathan Schnoor
+          Nikolay Titov
+          Preston Scott
+"""
+
+import argparse
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+
+import mysql.connector as maria_db
+
+from intervals import to_date
+
+# Maximum number of tuples written or looked up by one statement
+ROLLUP_CHUNK_SIZE = 500
+
+DAILY_OCCUPANCY_TABLE = 'DailyOccupancy'
+
+# Parameters: None
+CREATE_DAILY_OCCUPANCY = """
+CREATE TABLE DailyOccupancy (
+    date DATE NOT NULL,
+    hotel_id INT NOT NULL,
+    category VARCHAR(64) NOT NULL,
+    rooms_occupied INT NOT NULL,
+    PRIMARY KEY (date, hotel_id, category),
+    CONSTRAINT fk_dailyoccupancy_hotels_id FOREIGN KEY (hotel_id)
+        REFERENCES Hotels(id) ON UPDATE CASCADE ON DELETE CASCADE
+);"""
+
+DAILY_REVENUE_TABLE = 'DailyRevenue'
+
+# Parameters: None
+CREATE_DAILY_REVENUE = """
+CREATE TABLE DailyRevenue (
+    hotel_id INT NOT NULL,
+    day DATE NOT NULL,
+    revenue DECIMAL(14,2) NOT NULL,
+    transactions INT NOT NULL,
+    PRIMARY KEY (hotel_id, day),
+    CONSTRAINT fk_dailyrevenue_hotels_id FOREIGN KEY (hotel_id)
+        REFERENCES Hotels(id) ON UPDATE CASCADE ON DELETE CASCADE
+);"""
+
+# Parameters: date, hotel_id, category, change of rooms_occupied
+UPSERT_DAILY_OCCUPANCY = """
+INSERT INTO DailyOccupancy (date, hotel_id, category, rooms_occupied)
+VALUES (%s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE rooms_occupied = rooms_occupied +
+VALUES(rooms_occupied)
+"""
+
+# Parameters: first date, last date
+DELETE_EMPTY_DAILY_OCCUPANCY = """
+DELETE FROM DailyOccupancy
+WHERE date BETWEEN %s AND %s AND rooms_occupied <= 0
+"""
+
+
+# Parameters: hotel_id, day, change of revenue, change of transactions
+UPSERT_DAILY_REVENUE = """
+INSERT INTO DailyRevenue (hotel_id, day, revenue, transactions)
+VALUES (%s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE revenue = revenue + VALUES(revenue),
+transactions = transactions + VALUES(transactions)
+"""
+
+# Parameters: first day, last day
+DELETE_EMPTY_DAILY_REVENUE = """
+DELETE FROM DailyRevenue
+WHERE day BETWEEN %s AND %s AND transactions <= 0
+"""
+
+# Parameters: None
+POPULATE_DAILY_REVENUE = """
+INSERT INTO DailyRevenue (hotel_id, day, revenue, transactions)
+SELECT hotel_id, DATE(date), SUM(amount), COUNT(*)
+FROM Transactions JOIN Reservations
+ON Transactions.reservation_id = Reservations.id
+GROUP BY hotel_id, DATE(date)
+"""
+
+
+def get_occupied_dates(start_date, end_date):
+    """
+    Determines dates on which a reservation occupies its room.
+
+    Parameters:
+        :param start_date: Start date of the reservation
+        :param end_date: End date of the reservation
+
+    Returns:
+        :return: List of dates from the start date up to the day before the
+        end date
+    """
+    start_date, end_date = to_date(start_date), to_date(end_date)
+    return [start_date + timedelta(days=day)
+            for day in xrange((end_date - start_date).days)]
+
+
+def _select_by_ids(cursor, attributes, table_name, key, ids):
+    """
+    Queries tuples of a table identified by the values of one attribute.
+
+    This is private function of the module and not intended to be referenced
+    outside of the module.
+
+    Parameters:
+        :param cursor: Cursor of the database
+        :param attributes: Attributes to be selected
+        :param table_name: Name of the table
+        :param key: Attribute identifying the tuples
+        :param ids: List of values of the attribute
+
+    Returns:
+        :return: List of selected tuples
+    """
+    ids = list(ids)
+    tuples = []
+    for start in xrange(0, len(ids), ROLLUP_CHUNK_SIZE):
+        chunk = ids[start:start + ROLLUP_CHUNK_SIZE]
+        cursor.execute('SELECT {} FROM {} WHERE {} IN ({})'.format(
+            attributes, table_name, key, ', '.join(['%s'] * len(chunk))),
+            chunk)
+        tuples.extend(cursor.fetchall())
+    return tuples
+
+
+def _select_by_rooms(cursor, attributes, table_name, rooms):
+    """
+    Queries tuples of a table that belong to any of the given rooms.
+
+    This is private function of the module and not intended to be referenced
+    outside of the module.
+
+    Parameters:
+        :param cursor: Cursor of the database
+        :param attributes: Attributes to be selected
+        :param table_name: Name of the table with hotel_id and room_number
+        attributes
+        :param rooms: List of (hotel ID, room number)
+
+    Returns:
+        :return: List of selected tuples
+    """
+    rooms = list(rooms)
+    tuples = []
+    for start in xrange(0, len(rooms), ROLLUP_CHUNK_SIZE):
+        chunk = rooms[start:start + ROLLUP_CHUNK_SIZE]
+        cursor.execute(
+            'SELECT {} FROM {} WHERE '.format(attributes, table_name) +
+            ' OR '.join(['(hotel_id = %s AND room_number = %s)'] * len(chunk)),
+            [value for room in chunk for value in room])
+        tuples.extend(cursor.fetchall())
+    return tuples
+
+
+def get_room_reservations(cursor, rooms):
+    """
+    Queries reservations of the given rooms, e.g. before the rooms change
+    their category.
+
+    Parameters:
+        :param cursor: Cursor of the database
+        :param rooms: List of (hotel ID, room number)
+
+    Returns:
+        :return: List of (hotel ID, room number, start date, end date)
+    """
+    return _select_by_rooms(cursor, 'hotel_id, room_number, start_date, '
+                            'end_date', 'Reservations', rooms)
+
+
+def update_daily_occupancy(cursor, added=(), removed=()):
+    """
+    Applies added and removed reservations to the DailyOccupancy table.
+
+    The categories of the rooms are looked up in the Rooms table, therefore
+    removed reservations must be applied before their room changes category.
+
+    Parameters:
+        :param cursor: Cursor of the database
+        :param added: List of (hotel ID, room number, start date, end date) of
+        reservations that start occupying their rooms
+        :param removed: List of (hotel ID, room number, start date, end date)
+        of reservations that stop occupying their rooms
+
+    Returns:
+        :return:
+    """
+    reservations = [(reservation, 1) for reservation in added] + \
+        [(reservation, -1) for reservation in removed]
+    if not reservations:
+        return
+    categories = dict(
+        ((hotel_id, room_number), category)
+        for hotel_id, room_number, category in _select_by_rooms(
+            cursor, 'hotel_id, room_number, category', 'Rooms',
+            set((int(reservation[0]), int(reservation[1]))
+                for reservation, _ in reservations)))
+    changes = defaultdict(int)
+    for (hotel_id, room_number, start_date, end_date), change in \
+            reservations:
+        category = categories.get((int(hotel_id), int(room_number)))
+        if category is None:
+            continue
+        for occupied_date in get_occupied_dates(start_date, end_date):
+            changes[(occupied_date, int(hotel_id), category)] += change
+    rows = [key + (change,) for key, change in sorted(changes.iteritems())
+            if change]
+    for start in xrange(0, len(rows), ROLLUP_CHUNK_SIZE):
+        cursor.executemany(UPSERT_DAILY_OCCUPANCY,
+                           rows[start:start + ROLLUP_CHUNK_SIZE])
+    if any(row[3] < 0 for row in rows):
+        cursor.execute(DELETE_EMPTY_DAILY_OCCUPANCY,
+                       (str(rows[0][0]), str(rows[-1][0])))
+
+
+def rebuild_daily_occupancy(cursor):
+    """
+    Recomputes the DailyOccupancy table from all reservations.
+
+    Parameters:
+        :param cursor: Cursor of the database
+
+    Returns:
+        :return:
+    """
+    cursor.execute('DELETE FROM DailyOccupancy')
+    cursor.execute('SELECT hotel_id, room_number, start_date, end_date '
+                   'FROM Reservations')
+    update_daily_occupancy(cursor, added=cursor.fetchall())
+
+
+def get_reservation_transactions(cursor, reservation_ids):
+    """
+    Queries transactions of the given reservations, e.g. before the
+    reservations get deleted or change hotel.
+
+    Parameters:
+        :param cursor: Cursor of the database
+        :param reservation_ids: List of reservation IDs
+
+    Returns:
+        :return: List of (reservation ID, amount, date)
+    """
+    return _select_by_ids(cursor, 'reservation_id, amount, date',
+                          'Transactions', 'reservation_id', reservation_ids)
+
+
+def update_daily_revenue(cursor, added=(), removed=()):
+    """
+    Applies added and removed transactions to the DailyRevenue table.
+
+    The hotels of the transactions are looked up in the Reservations table,
+    therefore removed transactions must be applied before their reservation
+    gets deleted or changes hotel.
+
+    Parameters:
+        :param cursor: Cursor of the database
+        :param added: List of (reservation ID, amount, date) of added
+        transactions
+        :param removed: List of (reservation ID, amount, date) of removed
+        transactions
+
+    Returns:
+        :return:
+    """
+    transactions = [(transaction, 1) for transaction in added] + \
+        [(transaction, -1) for transaction in removed]
+    if not transactions:
+        return
+    hotels = dict(_select_by_ids(
+        cursor, 'id, hotel_id', 'Reservations', 'id',
+        set(int(transaction[0]) for transaction, _ in transactions)))
+    changes = defaultdict(lambda: [Decimal(0), 0])
+    for (reservation_id, amount, date), change in transactions:
+        hotel_id = hotels.get(int(reservation_id))
+        if hotel_id is None:
+            continue
+        totals = changes[(hotel_id, to_date(date))]
+        totals[0] += Decimal(str(amount)) * change
+        totals[1] += change
+    rows = [key + tuple(totals) for key, totals in sorted(
+        changes.iteritems(), key=lambda item: item[0][1]) if any(totals)]
+    for start in xrange(0, len(rows), ROLLUP_CHUNK_SIZE):
+        cursor.executemany(UPSERT_DAILY_REVENUE,
+                           rows[start:start + ROLLUP_CHUNK_SIZE])
+    if any(row[3] < 0 for row in rows):
+        cursor.execute(DELETE_EMPTY_DAILY_REVENUE,
+                       (str(rows[0][1]), str(rows[-1][1])))
+
+
+def rebuild_daily_revenue(cursor):
+    """
+    Recomputes the DailyRevenue table from all transactions.
+
+    Parameters:
+        :param cursor: Cursor of the database
+
+    Returns:
+        :return:
+    """
+    cursor.execute('DELETE FROM DailyRevenue')
+    cursor.execute(POPULATE_DAILY_REVENUE)
+
+
+# Summary tables and their rebuild functions
+REBUILDS = [(DAILY_OCCUPANCY_TABLE, rebuild_daily_occupancy),
+            (DAILY_REVENUE_TABLE, rebuild_daily_revenue)]
+
+
+def rebuild_summary_tables(cursor, tables=None):
+    """
+    Recomputes summary tables from scratch.
+
+    Parameters:
+        :param cursor: Cursor of the database
+        :param tables: List of names of the summary tables to be rebuilt. If
+        None, all summary tables are rebuilt.
+
+    Returns:
+        :return: List of names of the rebuilt tables
+    """
+    rebuilt = []
+    for table, rebuild in REBUILDS:
+        if tables is None or table in tables:
+            rebuild(cursor)
+            rebuilt.append(table)
+    return rebuilt
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Rebuilds the summary tables from scratch.')
+    parser.add_argument('--host', default='classdb2.csc.ncsu.edu')
+    parser.add_argument('--user', required=True)
+    parser.add_argument('--password', required=True)
+    parser.add_argument('--database', required=True)
+    parser.add_argument('--table', action='append',
+                        choices=[table for table, _ in REBUILDS],
+                        help='Summary table to be rebuilt (default: all)')
+    parser.add_argument('command', choices=['rebuild'])
+    args = parser.parse_args()
+    con = maria_db.connect(host=args.host, user=args.user,
+                           password=args.password, database=args.database)
+    cursor = con.cursor()
+    for rebuilt_table in rebuild_summary_tables(cursor, args.table):
+        print 'Rebuilt {}'.format(rebuilt_table)
+    con.commit()
+    cursor.close()
+    con.close()
@@ -0,0 +1,134 @@
+"""
+rows.py
+
+CSC 540 (601) - Database Management Concepts and Systems
+Project for CSC 540
+
+Description of the Project and Software read in the main program: hotelsoft.py
+
+Description of the rows.py file:
+This file provides the lightweight result type returned by the APIs (apps.py)
+that read data (get_data_frame() and report APIs) when they are called in the
+rows result mode. Building a Pandas DataFrame often costs more than the query
+itself for small results, such as a single tuple looked up by its key. The
+ResultSet does the following:
+1) Keeps the names of the attributes and the fetched tuples as compact named
+tuples (no per-row dictionary), so values are accessible both by position and
+by attribute name
+2) Converts attribute names that are not valid Python identifiers (e.g.
+'Hotel Name') into valid field names (e.g. Hotel_Name)
+3) Builds the Pandas DataFrame on demand, identical to the one returned by the
+default DataFrame result mode
+
+@version: 1.0
+@todo: None
+@since: October 18, 2026
+
+@status: Complete
+@requires: pandas
+@contact: nfschnoo@ncsu.edu
+          ngtitov@ncsu.edu
+          pdscott2@ncsu.edu
+
+@authors: Nathan Schnoor
+          Nikolay Titov
+          Preston Scott
+"""
+
+import re
+import threading
+from collections import namedtuple
+
+import pandas as pd
+
+# Result modes of the APIs that read data
+RESULT_FRAME = 'frame'
+RESULT_ROWS = 'rows'
+RESULT_MODES = (RESULT_FRAME, RESULT_ROWS)
+
+# Named tuple types are expensive to create, so they are shared by all result
+# sets with the same attribute names
+_row_types = {}
+_row_types_lock = threading.Lock()
+
+
+def _get_row_type(columns):
+    """
+    Returns named tuple type for given attribute names.
+
+    Characters that are not allowed in Python identifiers are replaced with
+    underscores. Names that still are not valid field names (e.g. keywords or
+    duplicates) are replaced with positional names (_0, _1, ...).
+
+    Parameters:
+        :param columns: Tuple of attribute names
+
+    Returns:
+        :return: Named tuple type
+    """
+    with _row_types_lock:
+        row_type = _row_types.get(columns)
+        if row_type is None:
+            field_names = [re.sub(r'\W', '_', str(column)).strip('_') or '_'
+                           for column in columns]
+            row_type = namedtuple('Row', field_names, rename=True)
+            _row_types[columns] = row_type
+        return row_type
+
+
+class ResultSet(object):
+    """
+    Result of a SELECT query as a list of named tuples.
+
+    Creates and returns a ResultSet object with the given attribute names and
+    tuples fetched from a cursor.
+
+    result = ResultSet(cursor.column_names, cursor.fetchall())
+    if result:
+        print result[0].city
+    data_frame = result.to_data_frame()
+    """
+    __slots__ = ('columns', 'rows', 'types')
+
+    def __init__(self, columns, rows, types=None):
+        """
+        Constructor method for the ResultSet class
+
+        Parameters:
+            :param columns: Sequence of attribute names
+            :param rows: Sequence of tuples with values of the attributes
+            :param types: Sequence of MySQL field type codes of the attributes
+            (second items of cursor.description), or None if not known
+
+        Returns:
+            :return:
+        """
+        self.columns = tuple(columns)
+        row_type = _get_row_type(self.columns)
+        self.rows = [row_type._make(row) for row in rows]
+        self.types = tuple(types) if types is not None else None
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __getitem__(self, index):
+        return self.rows[index]
+
+    def __repr__(self):
+        return 'ResultSet(columns={!r}, rows={})'.format(self.columns,
+                                                          len(self.rows))
+
+    def to_data_frame(self):
+        """
+        Builds Pandas DataFrame with the same content and types as the one
+        returned by the DataFrame result mode (pandas.read_sql()).
+
+        Returns:
+            :return: Pandas DataFrame (two-dimensional size-mutable,
+            heterogeneous tabular data structure with labeled axes)
+        """
+        return pd.DataFrame.from_records(self.rows, columns=self.columns,
+                                         coerce_float=True)
@@ -0,0 +1,237 @@
+"""
+slowlog.py
+
+CSC 540 (601) - Database Management Concepts and Systems
+Project for CSC 540
+
+Description of the Project and Software read in the main program: hotelsoft.py
+
+Description of the slowlog.py file:
+This file provides the slow query log of the APIs (apps.py). When an Apps
+object is given a SlowQueryLog, every statement it executes through its query
+helpers (reports, room availability, bill, reservation conflict check, loads of
+the interval index, room catalog and staff pool, and the generated INSERT,
+UPDATE, DELETE and SELECT statements) is timed, and the statements slower than
+a configurable threshold are logged. The log does the following:
+1) Writes one JSON line per slow statement with its fingerprint (query text
+with literals and placeholders replaced by '?'), bound parameters, duration
+and number of rows into a local file rotated by size
+2) Captures the EXPLAIN plan of every fingerprint once, the first time a
+statement with that fingerprint is slow, and writes it as a separate line
+3) Keeps statistics: number of slow statements and captured plans
+
+@version: 1.0
+@todo: None
+@since: October 18, 2026
+
+@status: Complete
+@requires: mysql.connector
+@contact: nfschnoo@ncsu.edu
+          ngtitov@ncsu.edu
+          pdscott2@ncsu.edu
+
+@authors: Nathan Schnoor
+          Nikolay Titov
+          Preston Scott
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from logging.handlers import RotatingFileHandler
+
+import mysql.connector as maria_db
+
+# Maximum number of characters of the logged parameters
+MAX_PARAMS_LENGTH = 1024
+
+# Maximum number of fingerprints waiting for their EXPLAIN plan
+MAX_PENDING_PLANS = 64
+
+# Literals and placeholders replaced in the fingerprint of a query
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER = re.compile(r'%s|\?')
+_VALUE_LIST = re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def get_fingerprint(query):
+    """
+    Normalizes a query into its fingerprint, which is the same for all
+    executions of a query template regardless of the values.
+
+    Parameters:
+        :param query: Query text
+
+    Returns:
+        :return: Tuple of fingerprint ID (12 hexadecimal characters) and
+        normalized query text
+    """
+    text = _STRING_LITERAL.sub('?', query)
+    text = _NUMBER_LITERAL.sub('?', text)
+    text = _PLACEHOLDER.sub('?', text)
+    text = _VALUE_LIST.sub('(?+)', text)
+    text = _WHITESPACE.sub(' ', text).strip()
+    return hashlib.md5(text.encode('utf-8')).hexdigest()[:12], text
+
+
+class SlowQueryLog(object):
+    """
+    Thread-safe log of statements slower than a threshold.
+
+    Creates and returns a SlowQueryLog object writing into the given file,
+    which is rotated once it reaches max_bytes. One object may be shared by
+    several Apps objects.
+
+    slow_query_log = SlowQueryLog('slow_queries.log', threshold=0.2)
+    apps = Apps(maria_db_connection, slow_query_log=slow_query_log)
+    """
+    def __init__(self, path='slow_queries.log', threshold=0.5,
+                 max_bytes=10 * 1024 * 1024, backup_count=5, explain=True):
+        """
+        Constructor method for the SlowQueryLog class
+
+        Parameters:
+            :param path: Path of the log file
+            :param threshold: Number of seconds above which a statement is
+            logged
+            :param max_bytes: Size of the log file in bytes at which it gets
+            rotated
+            :param backup_count: Number of rotated log files kept
+            :param explain: Boolean whether the EXPLAIN plan of each
+            fingerprint is captured
+
+        Returns:
+            :return:
+        """
+        assert threshold >= 0, \
+            'Exception: Threshold of the slow query log must not be ' \
+            'negative.\n'
+        self.threshold = threshold
+        self.explain = explain
+        self._handler = RotatingFileHandler(path, maxBytes=max_bytes,
+                                            backupCount=backup_count)
+        self._handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+        # Every object logs into its own file only
+        self._logger = logging.getLogger('{}.{}'.format(__name__, id(self)))
+        self._logger.propagate = False
+        self._logger.setLevel(logging.INFO)
+        self._logger.addHandler(self._handler)
+        self._lock = threading.Lock()
+        # Fingerprints with captured plans
+        self._explained = set()
+        # Fingerprint ID -> (query, params) waiting for their plans
+        self._pending = OrderedDict()
+        self._slow = 0
+        self._plans = 0
+
+    def record(self, query, params, duration, rows=None):
+        """
+        Logs a statement if it is slower than the threshold.
+
+        If it is the first slow statement of its fingerprint, its EXPLAIN plan
+        is scheduled to be captured by capture_plans().
+
+        Parameters:
+            :param query: Executed query text
+            :param params: Bound parameters
+            :param duration: Duration of the statement in seconds
+            :param rows: Number of returned or affected rows, or None if not
+            known
+
+        Returns:
+            :return: Boolean whether the statement got logged
+        """
+        if duration < self.threshold:
+            return False
+        fingerprint, text = get_fingerprint(query)
+        params_text = repr(params) if params is not None else None
+        if params_text is not None and len(params_text) > MAX_PARAMS_LENGTH:
+            params_text = params_text[:MAX_PARAMS_LENGTH] + '...'
+        with self._lock:
+            self._slow += 1
+            if self.explain and fingerprint not in self._explained and \
+                    fingerprint not in self._pending and \
+                    len(self._pending) < MAX_PENDING_PLANS:
+                self._pending[fingerprint] = (query, params)
+        self._logger.info(json.dumps(OrderedDict([
+            ('type', 'slow_query'), ('fingerprint', fingerprint),
+            ('duration_ms', round(duration * 1000, 3)), ('rows', rows),
+            ('params', params_text), ('query', text)])))
+        return True
+
+    def has_pending_plans(self):
+        """
+        Checks whether any EXPLAIN plan waits to be captured.
+
+        Returns:
+            :return: Boolean
+        """
+        return bool(self._pending)
+
+    def capture_plans(self, con):
+        """
+        Captures the EXPLAIN plans of the scheduled fingerprints and logs
+        them.
+
+        It must be called only when the connection has no unread result. A plan
+        that cannot be captured (e.g. the statement cannot be explained) is
+        logged with its error and not captured again.
+
+        Parameters:
+            :param con: MariaDB connection used to execute EXPLAIN
+
+        Returns:
+            :return:
+        """
+        while True:
+            with self._lock:
+                if not self._pending:
+                    return
+                fingerprint, (query, params) = self._pending.popitem(
+                    last=False)
+                self._explained.add(fingerprint)
+            entry = OrderedDict([('type', 'plan'),
+                                 ('fingerprint', fingerprint)])
+            try:
+                cursor = con.cursor()
+                try:
+                    cursor.execute('EXPLAIN ' + query, params)
+                    entry['plan'] = [dict(zip(cursor.column_names, row))
+                                     for row in cursor.fetchall()]
+                finally:
+                    cursor.close()
+            except maria_db.Error as error:
+                entry['error'] = str(error)
+            with self._lock:
+                self._plans += 1
+            self._logger.info(json.dumps(entry, default=str))
+
+    def stats(self):
+        """
+        Reports the log statistics.
+
+        Returns:
+            :return: Dictionary with the following items:
+                - slow: Number of logged slow statements
+                - plans: Number of captured EXPLAIN plans
+                - pending_plans: Number of plans waiting to be captured
+        """
+        with self._lock:
+            return {'slow': self._slow,
+                    'plans': self._plans,
+                    'pending_plans': len(self._pending)}
+
+    def close(self):
+        """
+        Closes the log file.
+
+        Returns:
+            :return:
+        """
+        self._logger.removeHandler(self._handler)
+        self._handler.close()
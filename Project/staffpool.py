@@ -0,0 +1,212 @@
+"""
+staffpool.py
+
+CSC 540 (601) - Database Management Concepts and Systems
+Project for CSC 540
+
+Description of the Project and Software read in the main program: hotelsoft.py
+
+Description of the staffpool.py file:
+This file provides the in-process pool of free dedicated staff used by the
+APIs (apps.py) to assign one Catering and one Room Service staff member to
+every Presidential Suite check-in without scanning the Staff table. The pool
+does the following:
+1) Keeps the free dedicated staff of every hotel and role (Catering, Room
+Service) in the descending order of their IDs, so the free staff member with
+the lowest ID is taken from the end of the list in O(1)
+2) Takes staff out of the pool when they get assigned to a room and puts them
+back when they get freed (e.g. at the check-out)
+3) Is loaded lazily from the Staff table and discarded whenever the Staff
+table is written in a way the pool cannot follow (e.g. staff is added, moves
+to another hotel or a transaction gets rolled back)
+The pool only proposes candidates. The APIs lock every candidate with
+SELECT ... FOR UPDATE SKIP LOCKED, which also verifies that the candidate is
+still free, so concurrent check-ins never assign the same staff member.
+
+@version: 1.0
+@todo: None
+@since: October 18, 2026
+
+@status: Complete
+@requires:
+@contact: nfschnoo@ncsu.edu
+          ngtitov@ncsu.edu
+          pdscott2@ncsu.edu
+
+@authors: Nathan Schnoor
+          Nikolay Titov
+          Preston Scott
+"""
+
+import threading
+from bisect import bisect_left
+
+# Roles of the staff dedicated to Presidential Suites, matched in the titles
+DEDICATED_ROLES = ('Catering', 'Room Service')
+
+
+def get_dedicated_role(title):
+    """
+    Determines the dedicated role of a staff title.
+
+    Parameters:
+        :param title: Title of a staff member
+
+    Returns:
+        :return: Role of DEDICATED_ROLES contained in the title (ignoring the
+        case), or None if the staff member is not dedicated staff
+    """
+    if not title:
+        return None
+    title = title.lower()
+    for role in DEDICATED_ROLES:
+        if role.lower() in title:
+            return role
+    return None
+
+
+class StaffPool(object):
+    """
+    Thread-safe in-memory pool of free dedicated staff per hotel and role.
+
+    Creates and returns an empty StaffPool object. The pool must be loaded
+    with all dedicated staff before it is used, and every assignment of the
+    staff must be applied to it afterwards.
+
+    pool = StaffPool()
+    pool.load(staff)
+    staff_id = pool.take(hotel_id, 'Catering')
+    pool.release([staff_id])
+    """
+    def __init__(self):
+        """
+        Constructor method for the StaffPool class
+
+        Returns:
+            :return:
+        """
+        # (hotel ID, role) -> list of negated free staff IDs in ascending
+        # order, i.e. the lowest staff ID is the last item
+        self._free = {}
+        # Staff ID -> (hotel ID, role) of all dedicated staff
+        self._staff = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        """
+        Boolean whether the pool is loaded.
+        """
+        return self._loaded
+
+    def load(self, staff):
+        """
+        Replaces the content of the pool.
+
+        Parameters:
+            :param staff: Iterable of (staff ID, hotel ID the staff works for,
+            title, assigned hotel ID, assigned room number) of all staff
+
+        Returns:
+            :return:
+        """
+        with self._lock:
+            self._free = {}
+            self._staff = {}
+            for staff_id, hotel_id, title, assigned_hotel_id, \
+                    assigned_room_number in sorted(staff, reverse=True):
+                role = get_dedicated_role(title)
+                if role is None:
+                    continue
+                self._staff[staff_id] = (hotel_id, role)
+                if assigned_hotel_id is None and assigned_room_number is None:
+                    self._free.setdefault((hotel_id, role), []).append(
+                        -staff_id)
+            self._loaded = True
+
+    def clear(self):
+        """
+        Empties the pool. It must be loaded again before it is used.
+
+        Returns:
+            :return:
+        """
+        with self._lock:
+            self._free = {}
+            self._staff = {}
+            self._loaded = False
+
+    def take(self, hotel_id, role):
+        """
+        Takes the free staff member with the lowest ID out of the pool.
+
+        Parameters:
+            :param hotel_id: ID of the hotel the staff works for
+            :param role: Role of DEDICATED_ROLES
+
+        Returns:
+            :return: Staff ID, or None if the pool has no free staff of the
+            role in the hotel
+        """
+        with self._lock:
+            free = self._free.get((hotel_id, role))
+            if not free:
+                return None
+            return -free.pop()
+
+    def assign(self, staff_ids):
+        """
+        Takes staff out of the pool once they get assigned to a room. Staff
+        that is not free or not dedicated staff is ignored.
+
+        Parameters:
+            :param staff_ids: Iterable of staff IDs
+
+        Returns:
+            :return:
+        """
+        with self._lock:
+            for staff_id in staff_ids:
+                key = self._staff.get(staff_id)
+                if key is not None and key in self._free:
+                    free = self._free[key]
+                    position = bisect_left(free, -staff_id)
+                    if position < len(free) and free[position] == -staff_id:
+                        del free[position]
+
+    def release(self, staff_ids):
+        """
+        Puts staff back into the pool once they get freed, in the order of
+        their IDs. Staff that is not dedicated staff or already free is
+        ignored.
+
+        Parameters:
+            :param staff_ids: Iterable of staff IDs
+
+        Returns:
+            :return:
+        """
+        with self._lock:
+            for staff_id in staff_ids:
+                key = self._staff.get(staff_id)
+                if key is None:
+                    continue
+                free = self._free.setdefault(key, [])
+                position = bisect_left(free, -staff_id)
+                if position == len(free) or free[position] != -staff_id:
+                    free.insert(position, -staff_id)
+
+    def free_count(self, hotel_id, role):
+        """
+        Counts the free staff of a role in a hotel.
+
+        Parameters:
+            :param hotel_id: ID of the hotel the staff works for
+            :param role: Role of DEDICATED_ROLES
+
+        Returns:
+            :return: Number of free staff members in the pool
+        """
+        with self._lock:
+            return len(self._free.get((hotel_id, role), ()))
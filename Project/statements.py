@@ -0,0 +1,240 @@
+"""
+statements.py
+
+CSC 540 (601) - Database Management Concepts and Systems
+Project for CSC 540
+
+Description of the Project and Software read in the main program: hotelsoft.py
+
+Description of the statements.py file:
+This file provides the statement cache used by the private query helpers of the
+APIs (apps.py). The helpers generate the same INSERT, UPDATE, DELETE and SELECT
+statements over and over again (e.g. every check-in and every posted charge).
+Instead of rebuilding the query text and letting the server parse it on every
+call, the cache does the following:
+1) Keeps the generated query text per statement shape, i.e. operation, table
+and ordered set of columns, so that the text is built only once
+2) Keeps a server-side prepared statement (binary protocol) per connection and
+statement shape, so that the server parses the query only once per connection
+3) Bounds the number of cached statements and evicts the least recently used
+statement (closing its prepared statements) once the bound is reached
+4) Counts cache hits, misses and evictions
+
+@version: 1.0
+@todo: None
+@since: October 18, 2026
+
+@status: Complete
+@requires: mysql.connector
+@contact: nfschnoo@ncsu.edu
+          ngtitov@ncsu.edu
+          pdscott2@ncsu.edu
+
+@authors: Nathan Schnoor
+          Nikolay Titov
+          Preston Scott
+"""
+
+import threading
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+
+import mysql.connector as maria_db
+
+
+class StatementCache(object):
+    """
+    Thread-safe LRU cache of generated SQL statements and their server-side
+    prepared statements.
+
+    Creates and returns a StatementCache object holding at most max_size
+    statement shapes. If prepared is False, only the query text is cached and
+    the statements are executed with the regular (text protocol) cursor.
+
+    cache = StatementCache()
+    query = cache.get(('DELETE', 'Serves', ('staff_id',)), build_query)
+    cursor = cache.get_cursor(maria_db_connection, query)
+    cursor.execute(query, values)
+    """
+    def __init__(self, max_size=256, prepared=True):
+        """
+        Constructor method for the StatementCache class
+
+        Parameters:
+            :param max_size: Maximum number of cached statement shapes
+            :param prepared: Boolean whether statements are executed as
+            server-side prepared statements
+
+        Returns:
+            :return:
+        """
+        assert max_size > 0, \
+            'Exception: Size of the statement cache must be positive.\n'
+        self.max_size = max_size
+        self.prepared = prepared
+        # Statement shape -> query text, in least recently used order
+        self._statements = OrderedDict()
+        # MariaDB connection -> {query text: prepared cursor}. Connections
+        # are weakly referenced, so closed connections drop their cursors.
+        self._cursors = WeakKeyDictionary()
+        # MariaDB connection -> list of prepared cursors to be closed. A
+        # connection may be in use by another thread, so its evicted cursors
+        # are closed by the next thread getting a cursor of the connection.
+        self._closing = WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key, build_query):
+        """
+        Returns the query text of a statement shape.
+
+        The very same string object is returned on every hit, which lets the
+        prepared cursor recognize the statement and skip preparing it again.
+
+        Parameters:
+            :param key: Hashable statement shape, e.g. ('INSERT', table name,
+            tuple of column names)
+            :param build_query: Function without arguments that generates the
+            query text on a cache miss
+
+        Returns:
+            :return: Query text
+        """
+        evicted = None
+        with self._lock:
+            query = self._statements.pop(key, None)
+            if query is None:
+                self._misses += 1
+                query = build_query()
+                if len(self._statements) >= self.max_size:
+                    evicted = self._statements.popitem(last=False)[1]
+                    self._evictions += 1
+            else:
+                self._hits += 1
+            self._statements[key] = query
+        if evicted is not None:
+            self._close_statement(evicted)
+        return query
+
+    def get_cursor(self, con, query):
+        """
+        Returns the prepared cursor of a query on a given connection.
+
+        Parameters:
+            :param con: MariaDB connection on which the query gets executed
+            :param query: Query text returned by get()
+
+        Returns:
+            :return: Prepared cursor dedicated to the query, or None if
+            prepared statements are disabled
+        """
+        if not self.prepared:
+            return None
+        with self._lock:
+            closing = self._closing.pop(con, ())
+            cursors = self._cursors.get(con)
+            if cursors is None:
+                cursors = self._cursors[con] = {}
+            cursor = cursors.get(query)
+            if cursor is None:
+                cursor = cursors[query] = con.cursor(prepared=True)
+        for closed_cursor in closing:
+            self._close_cursor(closed_cursor)
+        return cursor
+
+    def discard_connection(self, con):
+        """
+        Forgets all prepared statements of a connection, e.g. after the
+        connection got reconnected and the server released its statements.
+
+        Parameters:
+            :param con: MariaDB connection
+
+        Returns:
+            :return:
+        """
+        with self._lock:
+            cursors = self._cursors.pop(con, {}).values() + \
+                self._closing.pop(con, [])
+        for cursor in cursors:
+            self._close_cursor(cursor)
+
+    def stats(self):
+        """
+        Reports the cache statistics.
+
+        Returns:
+            :return: Dictionary with the following items:
+                - size: Number of cached statement shapes
+                - max_size: Maximum number of cached statement shapes
+                - hits: Number of lookups served from the cache
+                - misses: Number of lookups that generated a new query
+                - evictions: Number of statements evicted from the cache
+                - prepared: Number of open prepared statements
+        """
+        with self._lock:
+            return {'size': len(self._statements),
+                    'max_size': self.max_size,
+                    'hits': self._hits,
+                    'misses': self._misses,
+                    'evictions': self._evictions,
+                    'prepared': sum(len(cursors) for cursors in
+                                    self._cursors.values())}
+
+    def clear(self):
+        """
+        Removes all cached statements. Their prepared statements are closed
+        the next time a cursor of their connection is requested. Statistics are
+        kept.
+
+        Returns:
+            :return:
+        """
+        with self._lock:
+            self._statements.clear()
+            for con, con_cursors in self._cursors.items():
+                self._closing.setdefault(con, []).extend(
+                    con_cursors.itervalues())
+            self._cursors.clear()
+
+    def _close_statement(self, query):
+        """
+        Schedules closing the prepared statements of an evicted query on all
+        connections.
+
+        This is private function of the class and not intended to be referenced
+        outside of the class.
+
+        Parameters:
+            :param query: Query text of the evicted statement
+
+        Returns:
+            :return:
+        """
+        with self._lock:
+            for con, con_cursors in self._cursors.items():
+                if query in con_cursors:
+                    self._closing.setdefault(con, []).append(
+                        con_cursors.pop(query))
+
+    @staticmethod
+    def _close_cursor(cursor):
+        """
+        Closes a prepared cursor ignoring errors of already closed or broken
+        connections.
+
+        This is private function of the class and not intended to be referenced
+        outside of the class.
+
+        Parameters:
+            :param cursor: Prepared cursor
+
+        Returns:
+            :return:
+        """
+        try:
+            cursor.close()
+        except (maria_db.Error, ReferenceError):
+            pass
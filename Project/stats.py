@@ -0,0 +1,282 @@
+"""
+stats.py
+
+CSC 540 (601) - Database Management Concepts and Systems
+Project for CSC 540
+
+Description of the Project and Software read in the main program: hotelsoft.py
+
+Description of the stats.py file:
+This file provides the instrumentation of the APIs (apps.py). When it is
+enabled, every public API and every private query helper (_execute_*) of an
+Apps object is wrapped, and each call records the following per API:
+1) Number of calls and number of calls that raised an exception
+2) Latency histogram with logarithmic buckets, which reports the 50th, 95th
+and 99th percentile, the mean and the maximum latency in a constant amount of
+memory
+3) Number of returned rows (tuples of a DataFrame or ResultSet, or rows
+affected by the INSERT, UPDATE or DELETE statement of a cursor). The rows of a
+SELECT statement returned as cursor are not read yet, so they are counted by
+the API reading them.
+The instrumentation is installed per object, so objects created without it
+call the APIs directly and pay nothing.
+
+@version: 1.0
+@todo: None
+@since: October 18, 2026
+
+@status: Complete
+@requires:
+@contact: nfschnoo@ncsu.edu
+          ngtitov@ncsu.edu
+          pdscott2@ncsu.edu
+
+@authors: Nathan Schnoor
+          Nikolay Titov
+          Preston Scott
+"""
+
+import math
+import threading
+import time
+from functools import wraps
+
+# Upper bound (seconds) of the first bucket of the latency histogram
+HISTOGRAM_MIN = 0.00001
+
+# Ratio of upper bounds of two consecutive buckets. Percentiles are reported
+# as bucket upper bounds, so they are at most 20 % above the exact value.
+HISTOGRAM_GROWTH = 1.2
+
+# Number of buckets. The last bucket collects all latencies above ~71 minutes.
+HISTOGRAM_BUCKETS = 110
+
+_LOG_GROWTH = math.log(HISTOGRAM_GROWTH)
+
+
+def count_rows(result):
+    """
+    Determines number of rows returned by an API or a query helper.
+
+    Parameters:
+        :param result: Returned value: Pandas DataFrame, ResultSet, cursor or
+        any other value
+
+    Returns:
+        :return: Number of rows, 0 if the value holds no rows, or None if the
+        value is a cursor whose result set is not read yet (the row count of
+        unbuffered and prepared cursors is not known before the rows are
+        fetched)
+    """
+    if result is None:
+        return 0
+    row_count = getattr(result, 'rowcount', None)
+    if row_count is not None:
+        # Only the row count of INSERT, UPDATE and DELETE statements, which
+        # have no result set, is known after execution
+        if getattr(result, 'description', None) is not None:
+            return None
+        return max(row_count, 0)
+    try:
+        return len(result)
+    except TypeError:
+        return 0
+
+
+class LatencyHistogram(object):
+    """
+    Histogram of latencies with logarithmic buckets.
+
+    This class is not thread-safe. ApiStats serializes access to it.
+
+    histogram = LatencyHistogram()
+    histogram.record(0.0042)
+    p99 = histogram.percentile(99)
+    """
+    __slots__ = ('buckets', 'count', 'total', 'max')
+
+    def __init__(self):
+        """
+        Constructor method for the LatencyHistogram class
+
+        Returns:
+            :return:
+        """
+        self.buckets = [0] * HISTOGRAM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, latency):
+        """
+        Records one latency.
+
+        Parameters:
+            :param latency: Latency in seconds
+
+        Returns:
+            :return:
+        """
+        if latency <= HISTOGRAM_MIN:
+            index = 0
+        else:
+            index = min(int(math.ceil(math.log(latency / HISTOGRAM_MIN) /
+                                      _LOG_GROWTH)), HISTOGRAM_BUCKETS - 1)
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += latency
+        if latency > self.max:
+            self.max = latency
+
+    def percentile(self, percent):
+        """
+        Determines a percentile of the recorded latencies.
+
+        Parameters:
+            :param percent: Percentile between 0 and 100
+
+        Returns:
+            :return: Upper bound (seconds) of the bucket holding the
+            percentile, but at most the maximum recorded latency. 0.0 if
+            nothing is recorded.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(int(math.ceil(self.count * percent / 100.0)), 1)
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank:
+                return min(HISTOGRAM_MIN * HISTOGRAM_GROWTH ** index, self.max)
+        return self.max
+
+
+class _ApiRecord(object):
+    """
+    Statistics of a single API.
+
+    This is private class of the module and not intended to be referenced
+    outside of the module.
+    """
+    __slots__ = ('errors', 'rows', 'histogram')
+
+    def __init__(self):
+        self.errors = 0
+        self.rows = 0
+        self.histogram = LatencyHistogram()
+
+
+class ApiStats(object):
+    """
+    Thread-safe statistics of the calls of the APIs.
+
+    Creates and returns an empty ApiStats object. The APIs of an object get
+    instrumented by instrument(), which returns a wrapped function recording
+    every call.
+
+    api_stats = ApiStats()
+    apps.add_hotel = api_stats.instrument('add_hotel', apps.add_hotel)
+    print api_stats.report()['add_hotel']['p95_ms']
+    """
+    def __init__(self):
+        """
+        Constructor method for the ApiStats class
+
+        Returns:
+            :return:
+        """
+        self._records = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, latency, rows=0, error=False):
+        """
+        Records one call of an API.
+
+        Parameters:
+            :param name: Name of the API
+            :param latency: Latency of the call in seconds
+            :param rows: Number of returned rows. If None, the number is not
+            known and the call does not add to the rows of the API.
+            :param error: Boolean whether the call raised an exception
+
+        Returns:
+            :return:
+        """
+        with self._lock:
+            api_record = self._records.get(name)
+            if api_record is None:
+                api_record = self._records[name] = _ApiRecord()
+            api_record.histogram.record(latency)
+            if rows is not None:
+                api_record.rows += rows
+            if error:
+                api_record.errors += 1
+
+    def instrument(self, name, function):
+        """
+        Wraps a function so that every call gets recorded.
+
+        Parameters:
+            :param name: Name under which the calls are recorded
+            :param function: Function (e.g. bound method) to be wrapped
+
+        Returns:
+            :return: Wrapped function
+        """
+        record = self.record
+
+        @wraps(function)
+        def instrumented(*args, **kwargs):
+            start_time = time.time()
+            try:
+                result = function(*args, **kwargs)
+            except Exception:
+                record(name, time.time() - start_time, error=True)
+                raise
+            record(name, time.time() - start_time, count_rows(result))
+            return result
+        return instrumented
+
+    def report(self):
+        """
+        Reports the statistics of all called APIs.
+
+        Returns:
+            :return: Dictionary of API name and dictionary with the following
+            items:
+                - calls: Number of calls
+                - errors: Number of calls that raised an exception
+                - rows: Total number of returned rows (rows of SELECT
+                statements executed by the query helpers are not counted)
+                - total_ms: Total latency in milliseconds
+                - mean_ms: Mean latency in milliseconds
+                - p50_ms, p95_ms, p99_ms: Percentiles of the latency in
+                milliseconds
+                - max_ms: Maximum latency in milliseconds
+        """
+        with self._lock:
+            report = {}
+            for name, api_record in self._records.iteritems():
+                histogram = api_record.histogram
+                report[name] = {
+                    'calls': histogram.count,
+                    'errors': api_record.errors,
+                    'rows': api_record.rows,
+                    'total_ms': histogram.total * 1000,
+                    'mean_ms': histogram.total * 1000 / histogram.count,
+                    'p50_ms': histogram.percentile(50) * 1000,
+                    'p95_ms': histogram.percentile(95) * 1000,
+                    'p99_ms': histogram.percentile(99) * 1000,
+                    'max_ms': histogram.max * 1000
+                }
+            return report
+
+    def reset(self):
+        """
+        Removes all recorded statistics.
+
+        Returns:
+            :return:
+        """
+        with self._lock:
+            self._records = {}
@@ -0,0 +1,225 @@
+"""
+benchmark_availability.py
+
+CSC 540 (601) - Database Management Concepts and Systems
+Project for CSC 540
+
+Description of the Project and Software read in the main program: hotelsoft.py
+
+Description of the benchmark_availability.py file:
+This is independent Python program that compares the previous Room
+Availability query (row-value NOT IN with four BETWEEN conditions) with the
+current anti-join query (NOT EXISTS with one overlap condition answered by the
+idx_reservations_room_dates index). The program does the following:
+1) Drops and creates all tables and loads a large synthetic data set (hotels,
+rooms and non-overlapping reservations of every room) with the bulk APIs
+2) Runs both queries for the same random date ranges, with and without a hotel
+filter, and verifies that the current query finds all rooms the previous query
+finds (it also finds the rooms whose reservations end on the start date or
+start on the end date, since reservation dates are half-open intervals)
+3) Prints the average and maximum time of both queries and the speedup
+WARNING: All data stored in the tables of the given database gets deleted.
+
+Example:
+python benchmark_availability.py --host localhost --user user
+    --password password --database test --hotels 20 --rooms 50
+    --reservations 100
+
+@version: 1.0
+@todo: None
+@since: October 18, 2026
+
+@status: Complete
+@requires: Connection to MariaDB server
+@contact: nfschnoo@ncsu.edu
+          ngtitov@ncsu.edu
+          pdscott2@ncsu.edu
+
+@authors: Nathan Schnoor
+          Nikolay Titov
+          Preston Scott
+"""
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+import mysql.connector as maria_db
+
+from Project.apps import Apps
+from Project.demo_data import _drop_tables, _create_tables
+from Project.queries import ROOM_AVAILABILITY_COLUMN_NAMES, \
+    ROOM_AVAILABILITY_TABLE_STATEMENT
+from Project.rows import RESULT_ROWS
+
+# Previous Room Availability query
+# Parameters: start_date, end_date, start_date, end_date, start_date, end_date
+OLD_ROOM_AVAILABILITY_QUERY = """
+SELECT {} FROM {} WHERE
+(Rooms.hotel_id, room_number) NOT IN (SELECT hotel_id, room_number FROM
+Reservations WHERE (((%s BETWEEN start_date AND end_date) OR (%s between
+start_date AND end_date) OR (start_date BETWEEN %s AND %s) OR (end_date
+BETWEEN %s AND %s))))
+""".format(ROOM_AVAILABILITY_COLUMN_NAMES, ROOM_AVAILABILITY_TABLE_STATEMENT)
+
+# First date of the synthetic reservations
+FIRST_DATE = date(2015, 1, 1)
+
+
+def load_synthetic_data(db, hotels, rooms, reservations, seed):
+    """
+    Creates all tables and loads synthetic hotels, rooms and reservations.
+
+    Parameters:
+        :param db: The database connection
+        :param hotels: Number of hotels
+        :param rooms: Number of rooms per hotel
+        :param reservations: Number of reservations per room
+        :param seed: Seed of the random generator
+
+    Returns:
+        :return: Last date of the synthetic reservations
+    """
+    generator = random.Random(seed)
+    _drop_tables(db)
+    _create_tables(db)
+    apps = Apps(db, read_back=False)
+    apps.add_zip({'zip': '27606', 'city': 'Raleigh', 'state': 'NC'})
+    apps.add_customer({'id': 1, 'name': 'Benchmark', 'ssn': '000-00-0000',
+                       'date_of_birth': '1980-01-01', 'phone_number': '919',
+                       'email': 'benchmark@ncsu.edu', 'street': '1 Main St',
+                       'zip': '27606', 'account_number': '1',
+                       'is_hotel_card': False})
+    apps.add_hotel_bulk([{'id': hotel_id, 'name': 'Hotel {}'.format(hotel_id),
+                          'street': '1 Main St', 'zip': '27606',
+                          'phone_number': '919'}
+                         for hotel_id in xrange(1, hotels + 1)])
+    apps.add_room_bulk([{'hotel_id': hotel_id, 'room_number': room_number,
+                         'category': 'Economy', 'occupancy': 2, 'rate': 100}
+                        for hotel_id in xrange(1, hotels + 1)
+                        for room_number in xrange(1, rooms + 1)])
+    last_date = FIRST_DATE
+    for hotel_id in xrange(1, hotels + 1):
+        reservation_rows = []
+        for room_number in xrange(1, rooms + 1):
+            start_date = FIRST_DATE
+            for _ in xrange(reservations):
+                start_date += timedelta(days=generator.randint(0, 3))
+                end_date = start_date + timedelta(
+                    days=generator.randint(1, 5))
+                reservation_rows.append({
+                    'number_of_guests': 1, 'hotel_id': hotel_id,
+                    'room_number': room_number, 'customer_id': 1,
+                    'start_date': str(start_date), 'end_date': str(end_date)})
+                start_date = end_date + timedelta(days=1)
+            last_date = max(last_date, start_date)
+        apps.add_reservation_bulk(reservation_rows)
+        db.commit()
+    apps.cursor.close()
+    return last_date
+
+
+def _measure(function, dates):
+    """
+    Runs function for all given date ranges.
+
+    Parameters:
+        :param function: Function of start date and end date returning the
+        set of available rooms
+        :param dates: List of (start date, end date)
+
+    Returns:
+        :return: Tuple of list of results, average and maximum time in ms
+    """
+    results = []
+    times = []
+    for start_date, end_date in dates:
+        start_time = time.time()
+        results.append(function(start_date, end_date))
+        times.append((time.time() - start_time) * 1000)
+    return results, sum(times) / len(times), max(times)
+
+
+def run_benchmark(db, last_date, searches, hotel_id, seed):
+    """
+    Runs the previous and current Room Availability queries and prints their
+    times.
+
+    Parameters:
+        :param db: The database connection
+        :param last_date: Last date of the synthetic reservations
+        :param searches: Number of searches of each query
+        :param hotel_id: ID of the hotel to search in, or None for all hotels
+        :param seed: Seed of the random generator
+
+    Returns:
+        :return:
+    """
+    generator = random.Random(seed)
+    span = (last_date - FIRST_DATE).days
+    dates = []
+    for _ in xrange(searches):
+        start_date = FIRST_DATE + timedelta(days=generator.randint(0, span))
+        end_date = start_date + timedelta(days=generator.randint(1, 7))
+        dates.append((str(start_date), str(end_date)))
+    apps = Apps(db, result_mode=RESULT_ROWS)
+    cursor = db.cursor()
+
+    def old_query(start_date, end_date):
+        query = OLD_ROOM_AVAILABILITY_QUERY
+        params = [start_date, end_date] * 3
+        if hotel_id is not None:
+            query += ' AND Rooms.hotel_id = %s'
+            params.append(hotel_id)
+        cursor.execute(query, params)
+        return set((row[0], row[7]) for row in cursor.fetchall())
+
+    def new_query(start_date, end_date):
+        dictionary = {'start_date': start_date, 'end_date': end_date}
+        if hotel_id is not None:
+            dictionary['hotel_id'] = hotel_id
+        return set((row.Hotel_ID, row.Room_Number)
+                   for row in apps.room_availability(dictionary))
+
+    old_results, old_average, old_max = _measure(old_query, dates)
+    new_results, new_average, new_max = _measure(new_query, dates)
+    assert all(old <= new for old, new in zip(old_results, new_results)), \
+        'Exception: Current query missed available rooms.\n'
+    print '{:<24} {:>12} {:>12}'.format(
+        'Hotel {}'.format(hotel_id) if hotel_id else 'All hotels',
+        'Average ms', 'Max ms')
+    print '{:<24} {:>12.2f} {:>12.2f}'.format('NOT IN / BETWEEN',
+                                             old_average, old_max)
+    print '{:<24} {:>12.2f} {:>12.2f}'.format('NOT EXISTS / overlap',
+                                             new_average, new_max)
+    print 'Speedup: {:.1f}x\n'.format(old_average / new_average)
+    cursor.close()
+    apps.cursor.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Benchmark of the Room Availability query. WARNING: '
+                    'drops all tables of the database.')
+    parser.add_argument('--host', default='classdb2.csc.ncsu.edu')
+    parser.add_argument('--user', required=True)
+    parser.add_argument('--password', required=True)
+    parser.add_argument('--database', required=True)
+    parser.add_argument('--hotels', type=int, default=20)
+    parser.add_argument('--rooms', type=int, default=50,
+                        help='Number of rooms per hotel')
+    parser.add_argument('--reservations', type=int, default=100,
+                        help='Number of reservations per room')
+    parser.add_argument('--searches', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=540)
+    args = parser.parse_args()
+    con = maria_db.connect(host=args.host, user=args.user,
+                           password=args.password, database=args.database)
+    print 'Loading {} reservations'.format(
+        args.hotels * args.rooms * args.reservations)
+    last = load_synthetic_data(con, args.hotels, args.rooms,
+                               args.reservations, args.seed)
+    run_benchmark(con, last, args.searches, None, args.seed)
+    run_benchmark(con, last, args.searches, 1, args.seed)
+    con.close()
@@ -0,0 +1,170 @@
+"""
+benchmark_booking.py
+
+CSC 540 (601) - Database Management Concepts and Systems
+Project for CSC 540
+
+Description of the Project and Software read in the main program: hotelsoft.py
+
+Description of the benchmark_booking.py file:
+This is independent Python program that compares the booking paths of the
+APIs under contention: add_reservation(), which detects reservation conflicts
+after the insert, and book_room(), which locks the row of the room first. The
+program does the following:
+1) Drops and creates all tables and loads synthetic hotels and rooms (see
+stress_apps.py)
+2) Books random dates by many threads sharing one Apps object, once all
+bookings targeting the same room and once spread over all rooms, with both
+booking paths
+3) Prints the throughput, average and 95th percentile latency, the number of
+accepted, rejected and failed (e.g. deadlocked) bookings and the number of
+double-booked pairs of reservations of every run
+WARNING: All data stored in the tables of the given database gets deleted.
+
+Example:
+python benchmark_booking.py --host localhost --user user
+    --password password --database test --threads 16 --bookings 500
+
+@version: 1.0
+@todo: None
+@since: October 18, 2026
+
+@status: Complete
+@requires: Connection to MariaDB server
+@contact: nfschnoo@ncsu.edu
+          ngtitov@ncsu.edu
+          pdscott2@ncsu.edu
+
+@authors: Nathan Schnoor
+          Nikolay Titov
+          Preston Scott
+"""
+
+import argparse
+import random
+import time
+from datetime import timedelta
+from multiprocessing.pool import ThreadPool
+
+import mysql.connector as maria_db
+
+from Project.apps import Apps
+from Project.pool import ConnectionPool
+from Project.rows import RESULT_ROWS
+from Project.test.stress_apps import CONFLICT_MESSAGE, FIRST_DATE, \
+    OVERLAPPING_RESERVATIONS, _run_operation, load_synthetic_data
+
+# Booking paths compared by the benchmark
+BOOKING_APIS = ('add_reservation', 'book_room')
+
+
+def generate_bookings(bookings, hotels, rooms, days, same_room, seed):
+    """
+    Generates random bookings.
+
+    Parameters:
+        :param bookings: Number of bookings
+        :param hotels: Number of hotels
+        :param rooms: Number of rooms per hotel
+        :param days: Number of days the bookings fall into
+        :param same_room: Boolean whether all bookings target the first room
+        of the first hotel
+        :param seed: Seed of the random generator
+
+    Returns:
+        :return: List of dictionaries of reservation attributes and values
+    """
+    generator = random.Random(seed)
+    result = []
+    for _ in xrange(bookings):
+        start_date = FIRST_DATE + timedelta(
+            days=generator.randint(0, days - 1))
+        result.append({
+            'number_of_guests': 1,
+            'hotel_id': 1 if same_room else generator.randint(1, hotels),
+            'room_number': 1 if same_room else generator.randint(1, rooms),
+            'customer_id': 1, 'start_date': str(start_date),
+            'end_date': str(start_date + timedelta(
+                days=generator.randint(1, 3)))})
+    return result
+
+
+def run_benchmark(db, pool, threads, api, bookings):
+    """
+    Books all given reservations concurrently and prints the results.
+
+    Parameters:
+        :param db: The database connection
+        :param pool: ConnectionPool of the threads
+        :param threads: Number of threads
+        :param api: Name of the booking API of BOOKING_APIS
+        :param bookings: List of dictionaries of reservation attributes and
+        values
+
+    Returns:
+        :return:
+    """
+    cursor = db.cursor()
+    cursor.execute('DELETE FROM Reservations WHERE start_date >= %s',
+                   (str(FIRST_DATE),))
+    db.commit()
+    apps = Apps(pool, read_back=False, result_mode=RESULT_ROWS)
+    executor = ThreadPool(threads)
+    start_time = time.time()
+    results = executor.map(
+        lambda booking: _run_operation(apps, api, booking), bookings,
+        chunksize=1)
+    elapsed = time.time() - start_time
+    executor.close()
+    executor.join()
+    latencies = sorted(result[4] for result in results)
+    accepted = sum(1 for result in results if result[3] is None)
+    rejected = sum(1 for result in results if result[3] is not None and
+                   CONFLICT_MESSAGE in result[3])
+    db.rollback()
+    cursor.execute(OVERLAPPING_RESERVATIONS)
+    overlapping = cursor.fetchall()[0][0]
+    cursor.close()
+    print '{:<16} {:>8.1f} {:>8.2f} {:>8.2f} {:>8} {:>8} {:>8} {:>8}'.format(
+        api, len(results) / elapsed, sum(latencies) / len(latencies),
+        latencies[max(int(len(latencies) * 0.95) - 1, 0)], accepted,
+        rejected, len(results) - accepted - rejected, overlapping)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Benchmark of the booking paths under contention. '
+                    'WARNING: drops all tables of the database.')
+    parser.add_argument('--host', default='classdb2.csc.ncsu.edu')
+    parser.add_argument('--user', required=True)
+    parser.add_argument('--password', required=True)
+    parser.add_argument('--database', required=True)
+    parser.add_argument('--hotels', type=int, default=5)
+    parser.add_argument('--rooms', type=int, default=20,
+                        help='Number of rooms per hotel')
+    parser.add_argument('--days', type=int, default=60,
+                        help='Number of days the bookings fall into')
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--bookings', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=540)
+    args = parser.parse_args()
+    connect_args = dict(host=args.host, user=args.user,
+                        password=args.password, database=args.database)
+    con = maria_db.connect(**connect_args)
+    load_synthetic_data(con, args.hotels, args.rooms)
+    connection_pool = ConnectionPool(size=args.threads, **connect_args)
+    for same in (True, False):
+        print '{} ({} threads, {} bookings)'.format(
+            'Same room' if same else 'Different rooms', args.threads,
+            args.bookings)
+        print '{:<16} {:>8} {:>8} {:>8} {:>8} {:>8} {:>8} {:>8}'.format(
+            'API', 'Ops/s', 'Avg ms', 'P95 ms', 'Accepted', 'Rejected',
+            'Failed', 'Doubled')
+        for booking_api in BOOKING_APIS:
+            run_benchmark(con, connection_pool, args.threads, booking_api,
+                          generate_bookings(args.bookings, args.hotels,
+                                            args.rooms, args.days, same,
+                                            args.seed))
+        print
+    connection_pool.close()
+    con.close()
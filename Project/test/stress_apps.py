@@ -0,0 +1,333 @@
+"""
+stress_apps.py
+
+CSC 540 (601) - Database Management Concepts and Systems
+Project for CSC 540
+
+Description of the Project and Software read in the main program: hotelsoft.py
+
+Description of the stress_apps.py file:
+This is independent Python program that stresses one Apps object shared by a
+pool of threads, each call running in its own transaction on a connection
+checked out of a ConnectionPool. The program does the following:
+1) Drops and creates all tables and loads synthetic hotels, rooms and one
+reservation per room with the bulk APIs
+2) Runs a random mix of concurrent book_room, add_transaction and
+report_occupancy_by_hotel calls on the shared Apps object
+3) Prints the number of calls, throughput, average and 95th percentile
+latency of every operation
+4) Verifies that no room got reserved twice on the same night, that the
+Transactions table contains exactly the committed transactions and that the
+occupancy reports of the shared Apps object match the ones of a new object
+WARNING: All data stored in the tables of the given database gets deleted.
+
+Example:
+python stress_apps.py --host localhost --user user --password password
+    --database test --threads 8 --operations 2000
+
+@version: 1.0
+@todo: None
+@since: October 18, 2026
+
+@status: Complete
+@requires: Connection to MariaDB server
+@contact: nfschnoo@ncsu.edu
+          ngtitov@ncsu.edu
+          pdscott2@ncsu.edu
+
+@authors: Nathan Schnoor
+          Nikolay Titov
+          Preston Scott
+"""
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from multiprocessing.pool import ThreadPool
+
+import mysql.connector as maria_db
+
+from Project.apps import Apps
+from Project.demo_data import _drop_tables, _create_tables
+from Project.pool import ConnectionPool
+from Project.reportcache import ReportCache
+from Project.rows import RESULT_ROWS
+from Project.util import sql_transaction
+
+# First date of the synthetic reservations
+FIRST_DATE = date(2019, 1, 1)
+
+# Query counting pairs of reservations of the same room overlapping by a night
+OVERLAPPING_RESERVATIONS = """
+SELECT COUNT(*) FROM Reservations AS First JOIN Reservations AS Second
+ON First.hotel_id = Second.hotel_id AND First.room_number = Second.room_number
+AND First.id < Second.id AND First.start_date < Second.end_date
+AND Second.start_date < First.end_date
+""".strip()
+
+# Message of the rejected reservations of already reserved rooms
+CONFLICT_MESSAGE = 'A room can only be reserved by one reservation'
+
+# Operations of the stress test and their relative frequencies
+OPERATIONS = (('book_room', 4), ('add_transaction', 4),
+              ('report_occupancy_by_hotel', 2))
+
+
+def load_synthetic_data(db, hotels, rooms):
+    """
+    Creates all tables and loads synthetic hotels, rooms and one reservation
+    of every room before the dates of the stress test.
+
+    Parameters:
+        :param db: The database connection
+        :param hotels: Number of hotels
+        :param rooms: Number of rooms per hotel
+
+    Returns:
+        :return: List of IDs of the loaded reservations
+    """
+    _drop_tables(db)
+    _create_tables(db)
+    apps = Apps(db, read_back=False)
+    apps.add_zip({'zip': '27606', 'city': 'Raleigh', 'state': 'NC'})
+    apps.add_customer({'id': 1, 'name': 'Stress', 'ssn': '000-00-0000',
+                       'date_of_birth': '1980-01-01', 'phone_number': '919',
+                       'email': 'stress@ncsu.edu', 'street': '1 Main St',
+                       'zip': '27606', 'account_number': '1',
+                       'is_hotel_card': False})
+    apps.add_hotel_bulk([{'id': hotel_id, 'name': 'Hotel {}'.format(hotel_id),
+                          'street': '1 Main St', 'zip': '27606',
+                          'phone_number': '919'}
+                         for hotel_id in xrange(1, hotels + 1)])
+    apps.add_room_bulk([{'hotel_id': hotel_id, 'room_number': room_number,
+                         'category': 'Economy', 'occupancy': 2, 'rate': 100}
+                        for hotel_id in xrange(1, hotels + 1)
+                        for room_number in xrange(1, rooms + 1)])
+    data_frame = apps.add_reservation_bulk(
+        [{'number_of_guests': 1, 'hotel_id': hotel_id,
+          'room_number': room_number, 'customer_id': 1,
+          'start_date': str(FIRST_DATE - timedelta(days=2)),
+          'end_date': str(FIRST_DATE)}
+         for hotel_id in xrange(1, hotels + 1)
+         for room_number in xrange(1, rooms + 1)])
+    db.commit()
+    apps.cursor.close()
+    return [int(reservation_id) for reservation_id in data_frame['id']]
+
+
+def generate_operations(operations, hotels, rooms, days, reservation_ids,
+                        seed):
+    """
+    Generates a random mix of operations of the stress test.
+
+    Parameters:
+        :param operations: Number of operations
+        :param hotels: Number of hotels
+        :param rooms: Number of rooms per hotel
+        :param days: Number of days the reservations and reports fall into
+        :param reservation_ids: List of IDs of reservations the transactions
+        are charged to
+        :param seed: Seed of the random generator
+
+    Returns:
+        :return: List of (operation name, argument)
+    """
+    generator = random.Random(seed)
+    names = [name for name, weight in OPERATIONS for _ in xrange(weight)]
+    result = []
+    for _ in xrange(operations):
+        name = generator.choice(names)
+        start_date = FIRST_DATE + timedelta(
+            days=generator.randint(0, days - 1))
+        if name == 'book_room':
+            argument = {
+                'number_of_guests': 1,
+                'hotel_id': generator.randint(1, hotels),
+                'room_number': generator.randint(1, rooms),
+                'customer_id': 1, 'start_date': str(start_date),
+                'end_date': str(start_date + timedelta(
+                    days=generator.randint(1, 4)))}
+        elif name == 'add_transaction':
+            argument = {
+                'amount': generator.randint(1, 100), 'type': 'Gym',
+                'date': '{} 12:00:00'.format(start_date),
+                'reservation_id': generator.choice(reservation_ids)}
+        else:
+            argument = str(start_date)
+        result.append((name, argument))
+    return result
+
+
+def _run_operation(apps, name, argument):
+    """
+    Runs one operation on the shared Apps object in its own transaction.
+
+    Parameters:
+        :param apps: Apps object shared by all threads
+        :param name: Name of the API
+        :param argument: Argument of the API
+
+    Returns:
+        :return: Tuple of operation name, argument, result (None if the call
+        failed), error message (None if the call succeeded) and latency in ms
+    """
+    start_time = time.time()
+    result = error = None
+    try:
+        with apps.connection() as con:
+            try:
+                with sql_transaction(con):
+                    result = getattr(apps, name)(argument)
+            except Exception:
+                apps.discard_local_state()
+                raise
+            apps.commit_local_state()
+    except Exception as exception:
+        error = str(exception)
+    return name, argument, result, error, (time.time() - start_time) * 1000
+
+
+def run_stress_test(pool, threads, operations):
+    """
+    Runs the operations concurrently on one shared Apps object and prints
+    their throughput.
+
+    Parameters:
+        :param pool: ConnectionPool of the threads
+        :param threads: Number of threads
+        :param operations: List of (operation name, argument)
+
+    Returns:
+        :return: Tuple of the shared Apps object and list of results of
+        _run_operation()
+    """
+    apps = Apps(pool, read_back=False, result_mode=RESULT_ROWS,
+                report_cache=ReportCache())
+    executor = ThreadPool(threads)
+    start_time = time.time()
+    results = executor.map(
+        lambda operation: _run_operation(apps, *operation), operations,
+        chunksize=1)
+    elapsed = time.time() - start_time
+    executor.close()
+    executor.join()
+    print '{:<28} {:>8} {:>8} {:>10} {:>10} {:>10}'.format(
+        'Operation', 'Calls', 'Failed', 'Ops/s', 'Avg ms', 'P95 ms')
+    for name, _ in OPERATIONS:
+        latencies = sorted(result[4] for result in results
+                           if result[0] == name)
+        if not latencies:
+            continue
+        failed = sum(1 for result in results
+                     if result[0] == name and result[3] is not None)
+        print '{:<28} {:>8} {:>8} {:>10.1f} {:>10.2f} {:>10.2f}'.format(
+            name, len(latencies), failed, len(latencies) / elapsed,
+            sum(latencies) / len(latencies),
+            latencies[int(len(latencies) * 0.95) - 1 if
+                      len(latencies) > 1 else 0])
+    print 'Total: {} calls in {:.2f} s ({:.1f} ops/s)\n'.format(
+        len(results), elapsed, len(results) / elapsed)
+    return apps, results
+
+
+def verify_results(db, shared_apps, results, days):
+    """
+    Verifies the data written and read by the stress test and prints the
+    outcome of every check.
+
+    Parameters:
+        :param db: The database connection
+        :param shared_apps: Apps object shared by the threads
+        :param results: List of results of _run_operation()
+        :param days: Number of days the reservations and reports fall into
+
+    Returns:
+        :return: Boolean whether all checks passed
+    """
+    db.rollback()
+    cursor = db.cursor()
+    checks = []
+    cursor.execute(OVERLAPPING_RESERVATIONS)
+    overlapping = cursor.fetchall()[0][0]
+    checks.append(('No room reserved twice on the same night',
+                   overlapping == 0,
+                   '{} overlapping pairs'.format(overlapping)))
+    transactions = [result[1] for result in results
+                    if result[0] == 'add_transaction' and result[3] is None]
+    cursor.execute('SELECT COUNT(*), COALESCE(SUM(amount), 0) '
+                   'FROM Transactions')
+    count, total = cursor.fetchall()[0]
+    expected_total = sum(Decimal(transaction['amount'])
+                         for transaction in transactions)
+    checks.append(('Transactions match the committed calls',
+                   count == len(transactions) and
+                   Decimal(total) == expected_total,
+                   '{} of {} rows, {} of {} total'.format(
+                       count, len(transactions), total, expected_total)))
+    apps = Apps(db, result_mode=RESULT_ROWS)
+    reports = dict((result[1], result[2]) for result in results
+                   if result[0] == 'report_occupancy_by_hotel' and
+                   result[3] is None)
+    invalid = [query_date for query_date, report in reports.iteritems()
+               if any(row[1] > row[2] for row in report)]
+    checks.append(('Reports never exceed the number of rooms', not invalid,
+                   ', '.join(sorted(invalid))))
+    # The shared report may be served by the report cache
+    mismatched = []
+    for day in xrange(days):
+        query_date = str(FIRST_DATE + timedelta(days=day))
+        shared_report = _run_operation(
+            shared_apps, 'report_occupancy_by_hotel', query_date)[2]
+        if shared_report is None or \
+                [list(row) for row in shared_report] != \
+                [list(row) for row in
+                 apps.report_occupancy_by_hotel(query_date)]:
+            mismatched.append(query_date)
+    checks.append(('Shared reports match a new Apps object', not mismatched,
+                   ', '.join(mismatched)))
+    errors = sorted(set(result[3] for result in results
+                        if result[3] is not None and
+                        CONFLICT_MESSAGE not in result[3]))
+    checks.append(('No call failed except rejected reservations',
+                   not errors, '; '.join(errors)))
+    for description, passed, details in checks:
+        print '{:<44} {:<6} {}'.format(description,
+                                       'OK' if passed else 'FAILED',
+                                       '' if passed else details)
+    cursor.close()
+    apps.cursor.close()
+    return all(passed for _, passed, _ in checks)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Stress test of Apps shared by threads. WARNING: drops '
+                    'all tables of the database.')
+    parser.add_argument('--host', default='classdb2.csc.ncsu.edu')
+    parser.add_argument('--user', required=True)
+    parser.add_argument('--password', required=True)
+    parser.add_argument('--database', required=True)
+    parser.add_argument('--hotels', type=int, default=5)
+    parser.add_argument('--rooms', type=int, default=10,
+                        help='Number of rooms per hotel')
+    parser.add_argument('--days', type=int, default=30,
+                        help='Number of days the reservations fall into')
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--operations', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=540)
+    args = parser.parse_args()
+    connect_args = dict(host=args.host, user=args.user,
+                        password=args.password, database=args.database)
+    con = maria_db.connect(**connect_args)
+    ids = load_synthetic_data(con, args.hotels, args.rooms)
+    connection_pool = ConnectionPool(size=args.threads, **connect_args)
+    stress_apps, stress_results = run_stress_test(
+        connection_pool, args.threads,
+        generate_operations(args.operations, args.hotels, args.rooms,
+                            args.days, ids, args.seed))
+    passed_all = verify_results(con, stress_apps, stress_results, args.days)
+    connection_pool.close()
+    con.close()
+    exit(0 if passed_all else 1)
@@ -1,11 +1,18 @@
 
 import unittest
 import mysql.connector as mariadb
+import json
 import math
+import os
+import pandas as pd
+import tempfile
 
 from unittest_base import SQLUnitTestBase
-from Project.apps import Apps
+from Project.apps import Apps, get_cascading_tables
 from Project.demo_data import load_demo_data
+from Project.reportcache import ReportCache
+from Project.rows import RESULT_ROWS
+from Project.slowlog import SlowQueryLog
 
 
 class TestApps(SQLUnitTestBase):
@@ -58,6 +65,24 @@ class TestApps(SQLUnitTestBase):
         self.assertEqual('90050', row['zip'])
         apps.cursor.close()
 
+    def test_get_data_frame_rows(self):
+        apps = Apps(self._con, True, result_mode=RESULT_ROWS)
+        self._insert_test_data()
+        result = apps.get_data_frame('*', 'Hotels', {'zip': '27606'})
+        self.assertEqual(2, len(result))
+        self.assertEqual('Wolf Inn Raleigh Wolfpack', result[0].name)
+        self.assertEqual('27606', result[1].zip)
+        self.assertEqual('Nikolay Test Inn', result[1][1])
+        df = result.to_data_frame()
+        self.assertEqual(2, len(df.index))
+        self.assertEqual('Nikolay Test Inn', df.ix[1]['name'])
+        result = apps.get_data_frame('*', 'Hotels', {'zip': '00000'})
+        self.assertFalse(result)
+        # Writes still return DataFrames
+        df = apps.add_zip({'zip': '27511', 'city': 'Cary', 'state': 'NC'})
+        self.assertEqual('Cary', df['city'].ix[0])
+        apps.cursor.close()
+
     def test_get_data_frame_single_field(self):
         apps = Apps(self._con, True)
         self._insert_test_data()
@@ -147,6 +172,53 @@ class TestApps(SQLUnitTestBase):
         self.assertEqual('Wolf Inn Raleigh Wolfpack', row[1])
         apps.cursor.close()
 
+    def test_statement_cache_reuses_statement(self):
+        apps = Apps(self._con, True)
+        self._insert_test_data()
+        apps.add_zip({'zip': '27111', 'city': 'Raleigh', 'state': 'NC'})
+        apps.add_zip({'state': 'NC', 'city': 'Cary', 'zip': '27112'})
+        stats = apps.statements.stats()
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual(1, stats['hits'])
+        self.assertEqual(1, stats['prepared'])
+        df = apps.get_data_frame('*', 'ZipToCityState', {'zip': '27112'})
+        self.assertEqual('Cary', df.ix[0]['city'])
+        apps.cursor.close()
+
+    def test_statement_cache_not_prepared(self):
+        apps = Apps(self._con, True, prepared=False)
+        self._insert_test_data()
+        cursor = apps._execute_simple_select_query('name', 'Hotels',
+                                                   {'zip': '27606'})
+        self.assertIs(apps.cursor, cursor)
+        self.assertEqual(2, len(cursor.fetchall()))
+        apps._execute_simple_select_query('name', 'Hotels', {'zip': '27606'})
+        self.assertEqual(2, len(apps.cursor.fetchall()))
+        stats = apps.statements.stats()
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual(1, stats['hits'])
+        self.assertEqual(0, stats['prepared'])
+        apps.cursor.close()
+
+    def test_api_stats(self):
+        apps = Apps(self._con, True, stats=True)
+        self._insert_test_data()
+        apps.add_zip({'zip': '27111', 'city': 'Raleigh', 'state': 'NC'})
+        apps.get_data_frame('*', 'Hotels')
+        with self.assertRaises(AssertionError):
+            apps.add_zip({})
+        stats = apps.stats()
+        self.assertEqual(2, stats['add_zip']['calls'])
+        self.assertEqual(1, stats['add_zip']['errors'])
+        self.assertEqual(1, stats['_execute_insert_query']['calls'])
+        self.assertEqual(9, stats['get_data_frame']['rows'])
+        self.assertTrue(0 < stats['get_data_frame']['p50_ms'] <=
+                        stats['get_data_frame']['max_ms'])
+        apps.reset_stats()
+        self.assertEqual({}, apps.stats())
+        self.assertEqual({}, Apps(self._con).stats())
+        apps.cursor.close()
+
     def test_add_zip(self):
         apps = Apps(self._con, True)
         df = apps.add_zip({'zip': '27511', 'city': 'Cary', 'state': 'NC'})
@@ -182,6 +254,46 @@ class TestApps(SQLUnitTestBase):
         self.assertEqual(0, len(df.index))
         apps.cursor.close()
 
+    def test_add_zip_no_read_back(self):
+        apps = Apps(self._con, True, read_back=False)
+        df = apps.add_zip({'zip': '27511', 'city': 'Cary', 'state': 'NC'})
+        self.assertEqual(1, len(df.index))
+        self.assertListEqual(['zip', 'city', 'state'], list(df.columns))
+        self.assertEqual('27511', df['zip'].ix[0])
+        self.assertEqual('Cary', df['city'].ix[0])
+        self.assertEqual('NC', df['state'].ix[0])
+        apps.cursor.close()
+
+    def test_execute_update_query_no_read_back(self):
+        apps = Apps(self._con, True, read_back=False)
+        self._insert_test_data()
+        df = apps._execute_update_query(
+            'name, zip', 'Hotels',
+            {'name': 'Same Name Hotel'},
+            {'zip': '27606'})
+        self.assertEqual(2, len(df.index))
+        self.assertListEqual(['Same Name Hotel'] * 2, list(df['name']))
+        self.assertListEqual(['27606'] * 2, list(df['zip']))
+        # Unknown attributes are still queried back
+        df = apps._execute_update_query(
+            '*', 'Hotels',
+            {'name': 'Test Hotel'},
+            {'phone_number': '213-628-8344'})
+        self.assertEqual(1, len(df.index))
+        self.assertEqual('Test Hotel', df.ix[0]['name'])
+        self.assertEqual('9000 Lincoln Ave', df.ix[0]['street'])
+        apps.cursor.close()
+
+    def test_delete_zip_no_read_back(self):
+        apps = Apps(self._con, True, read_back=False)
+        apps.add_zip({'zip': '27511', 'city': 'Cary', 'state': 'NC'})
+        df = apps.delete_zip({'zip': '27511'})
+        self.assertEqual(0, len(df.index))
+        self.assertListEqual(['zip', 'city', 'state'], list(df.columns))
+        df = apps.get_data_frame('*', 'ZipToCityState')
+        self.assertEqual(0, len(df.index))
+        apps.cursor.close()
+
     def test_add_hotel_no_id(self):
         apps = Apps(self._con, True)
         self._insert_test_data()
@@ -199,6 +311,53 @@ class TestApps(SQLUnitTestBase):
         self.assertEqual('919-123-4567', row['phone_number'])
         apps.cursor.close()
 
+    def test_add_hotel_bulk(self):
+        apps = Apps(self._con, True)
+        self._insert_test_data()
+        hotels = [{'name': 'Test Hotel {}'.format(i), 'street': '123 Test St',
+                   'zip': '90050', 'phone_number': '919-123-4567'}
+                  for i in range(5)]
+        hotels.insert(2, {'id': 100, 'name': 'Test Hotel 100',
+                          'street': '123 Test St', 'zip': '90050',
+                          'phone_number': '919-123-4567'})
+        df = apps.add_hotel_bulk(hotels, chunk_size=2)
+        self.assertEqual(6, len(df.index))
+        self.assertEqual(100, df['id'].ix[2])
+        for index, hotel in enumerate(hotels):
+            hotel_df = apps.get_data_frame('*', 'Hotels',
+                                           {'id': int(df['id'].ix[index])})
+            self.assertEqual(hotel['name'], hotel_df['name'].ix[0])
+        apps.cursor.close()
+
+    def test_add_hotel_bulk_data_frame(self):
+        apps = Apps(self._con, True)
+        self._insert_test_data()
+        hotels = pd.DataFrame([
+            {'id': None, 'name': 'Test Hotel', 'street': '123 Test St',
+             'zip': '90050', 'phone_number': '919-123-4567'},
+            {'id': 200, 'name': 'Test Hotel 200', 'street': '123 Test St',
+             'zip': '90050', 'phone_number': '919-123-4567'}])
+        df = apps.add_hotel_bulk(hotels)
+        self.assertEqual(2, len(df.index))
+        self.assertEqual(200, df['id'].ix[1])
+        hotel_df = apps.get_data_frame('*', 'Hotels',
+                                       {'id': int(df['id'].ix[0])})
+        self.assertEqual('Test Hotel', hotel_df['name'].ix[0])
+        apps.cursor.close()
+
+    def test_add_hotel_bulk_invalid(self):
+        apps = Apps(self._con, True)
+        self._insert_test_data()
+        hotels = [{'name': 'Test Hotel', 'street': '123 Test St',
+                   'zip': '90050', 'phone_number': '919-123-4567'},
+                  {'name': '', 'street': '123 Test St', 'zip': '90050',
+                   'phone_number': '919-123-4567'}]
+        with self.assertRaises(AssertionError):
+            apps.add_hotel_bulk(hotels)
+        df = apps.get_data_frame('*', 'Hotels', {'name': 'Test Hotel'})
+        self.assertEqual(0, len(df.index))
+        apps.cursor.close()
+
     def test_add_hotel_id(self):
         apps = Apps(self._con, True)
         self._insert_test_data()
@@ -576,6 +735,59 @@ class TestApps(SQLUnitTestBase):
         self.assertEqual(1, row['is_hotel_card'])
         apps.cursor.close()
 
+    def test_add_reservation_bulk(self):
+        apps = Apps(self._con, True)
+        self._insert_test_data()
+        df = apps.add_reservation_bulk([
+            {'number_of_guests': 2, 'start_date': '2018-04-11',
+             'end_date': '2018-04-18', 'hotel_id': 9, 'room_number': 100,
+             'customer_id': 1},
+            {'number_of_guests': 1, 'start_date': '2018-04-20',
+             'end_date': '2018-04-21', 'hotel_id': 9, 'room_number': 500,
+             'customer_id': 1, 'check_in_time': '2018-04-20 15:00:00'}])
+        self.assertEqual(2, len(df.index))
+        result = apps.get_data_frame('*', 'Reservations',
+                                     {'id': int(df['id'].ix[0])})
+        self.assertEqual('2018-04-11', str(result['start_date'].ix[0]))
+        # Checked-in Presidential Suite reservation gets dedicated staff
+        result = apps.get_data_frame('*', 'Serves',
+                                     {'reservation_id': int(df['id'].ix[1])})
+        self.assertEqual(2, len(result.index))
+        # Conflicting reservations are rejected
+        with self.assertRaises(Exception):
+            apps.add_reservation_bulk([
+                {'number_of_guests': 2, 'start_date': '2018-04-12',
+                 'end_date': '2018-04-13', 'hotel_id': 9, 'room_number': 100,
+                 'customer_id': 1}])
+        apps.cursor.close()
+
+    def test_book_room(self):
+        apps = Apps(self._con, True)
+        self._insert_test_data()
+        # Reservation of the same room starting on the previous end date
+        df = apps.book_room(
+            {'number_of_guests': 2, 'start_date': '2018-04-10',
+             'end_date': '2018-04-12', 'hotel_id': 9, 'room_number': 100,
+             'customer_id': 1})
+        self.assertEqual(1, len(df.index))
+        self.assertEqual('2018-04-10', str(df['start_date'].ix[0]))
+        # Overlapping reservation of the room is rejected before the insert
+        with self.assertRaises(Exception):
+            apps.book_room(
+                {'number_of_guests': 1, 'start_date': '2018-04-09',
+                 'end_date': '2018-04-11', 'hotel_id': 9, 'room_number': 100,
+                 'customer_id': 1})
+        result = apps.get_data_frame('*', 'Reservations',
+                                     {'hotel_id': 9, 'room_number': 100})
+        self.assertEqual(2, len(result.index))
+        # Room must exist
+        with self.assertRaises(AssertionError):
+            apps.book_room(
+                {'number_of_guests': 1, 'start_date': '2018-04-09',
+                 'end_date': '2018-04-11', 'hotel_id': 9, 'room_number': 999,
+                 'customer_id': 1})
+        apps.cursor.close()
+
     def test_add_reservation(self):
         apps = Apps(self._con, True)
         self._insert_test_data()
@@ -712,6 +924,39 @@ class TestApps(SQLUnitTestBase):
              'end_date': '2018-04-20', 'hotel_id': 2,
              'room_number': 200, 'customer_id': 1})
 
+    def test_reservation_no_conflict_same_room_turnover(self):
+        apps = Apps(self._con, True)
+        self._insert_test_data()
+        # Create Reservation
+        apps.add_reservation(
+            {'number_of_guests': 2, 'start_date': '2018-04-11',
+             'end_date': '2018-04-18', 'hotel_id': 9,
+             'room_number': 100, 'customer_id': 1})
+        # Next reservation of the same room starts on the end date
+        df = apps.add_reservation(
+            {'number_of_guests': 2, 'start_date': '2018-04-18',
+             'end_date': '2018-04-20', 'hotel_id': 9,
+             'room_number': 100, 'customer_id': 1})
+        self.assertEqual(1, len(df.index))
+
+    def test_reservation_conflict_update(self):
+        apps = Apps(self._con, True)
+        self._insert_test_data()
+        # Create Reservation
+        df = apps.add_reservation(
+            {'number_of_guests': 2, 'start_date': '2018-04-11',
+             'end_date': '2018-04-18', 'hotel_id': 9,
+             'room_number': 100, 'customer_id': 1})
+        reservation_id = int(df['id'].ix[0])
+        # Moving the reservation into the existing one causes a conflict
+        with self.assertRaises(Exception):
+            apps.update_reservation({'start_date': '2018-04-09'},
+                                    {'id': reservation_id})
+        # Updates that do not change room or dates are not checked
+        df = apps.update_reservation({'number_of_guests': 1},
+                                     {'id': reservation_id})
+        self.assertEqual(1, df['number_of_guests'].ix[0])
+
     def test_add_reservation_check_in_time_non_presidential(self):
         # Create Non-Presidential reservation with check-in time, but no
         # check-out time
@@ -832,6 +1077,44 @@ class TestApps(SQLUnitTestBase):
         self.assertNotIn('Transaction_date', row2)
         apps.cursor.close()
 
+    def test_add_reservation_presidential_check_in_staff_pool(self):
+        apps = Apps(self._con, True, staff_pool=True)
+        self._insert_test_data()
+        df = apps.add_reservation(
+            {'number_of_guests': 5, 'start_date': '2018-04-08',
+             'end_date': '2018-04-12', 'hotel_id': 9,
+             'room_number': 500, 'customer_id': 2,
+             'check_in_time': '2018-04-08 15:15:15'})
+        self.assertListEqual([9, 10], list(df['Staff_id']))
+        self.assertEqual(0, apps.staff_pool.free_count(9, 'Catering'))
+        self.assertEqual(0, apps.staff_pool.free_count(9, 'Room Service'))
+        # Check-out frees the dedicated staff
+        apps.update_reservation({'check_out_time': '2018-04-12 10:00:00'},
+                                {'id': 10})
+        self.assertEqual(1, apps.staff_pool.free_count(9, 'Catering'))
+        self.assertEqual(1, apps.staff_pool.free_count(9, 'Room Service'))
+        df = apps.add_reservation(
+            {'number_of_guests': 5, 'start_date': '2018-04-12',
+             'end_date': '2018-04-14', 'hotel_id': 9,
+             'room_number': 500, 'customer_id': 2,
+             'check_in_time': '2018-04-12 15:15:15'})
+        self.assertListEqual([9, 10], list(df['Staff_id']))
+        self.assertListEqual([11, 11], list(df['Serves_reservation_id']))
+        # Staff assigned without the APIs is not assigned again
+        apps.update_staff({'assigned_hotel_id': None,
+                           'assigned_room_number': None}, {'id': 9})
+        self._con.cursor().execute(
+            'UPDATE Staff SET assigned_hotel_id = 9, '
+            'assigned_room_number = 500 WHERE id = 9')
+        df = apps.add_reservation(
+            {'number_of_guests': 5, 'start_date': '2018-04-14',
+             'end_date': '2018-04-16', 'hotel_id': 9,
+             'room_number': 500, 'customer_id': 2,
+             'check_in_time': '2018-04-14 15:15:15'})
+        self.assertNotIn('Staff_id', df)
+        self.assertEqual(0, apps.staff_pool.free_count(9, 'Catering'))
+        apps.cursor.close()
+
     def test_add_reservation_presidential_check_in_check_out(self):
         # Create Presidential reservation with check-in and check-out time.
         # No Staff must be freed. But must add new transaction 'Room Charge'.
@@ -1329,11 +1612,11 @@ class TestApps(SQLUnitTestBase):
             'end_date': '2017-5-10',
             'hotel_id': 1
         })
-        self.assertEqual(1, len(df.index))
+        # Rooms 1 and 2 are reserved from the end date of the stay
+        self.assertEqual(3, len(df.index))
         print df
-        row = df.ix[0]
-        self.assertEqual(1, row['Hotel ID'])
-        self.assertEqual(5, row['Room Number'])
+        self.assertEqual([1, 1, 1], list(df['Hotel ID']))
+        self.assertEqual([1, 2, 5], list(df['Room Number']))
         apps.cursor.close()
 
     def test_availability_right_boundary(self):
@@ -1344,11 +1627,68 @@ class TestApps(SQLUnitTestBase):
             'end_date': '2017-5-15',
             'hotel_id': 1
         })
-        self.assertEqual(1, len(df.index))
+        # Reservations of rooms 1 and 2 end on the start date of the stay
+        self.assertEqual(3, len(df.index))
         print df
-        row = df.ix[0]
-        self.assertEqual(1, row['Hotel ID'])
-        self.assertEqual(5, row['Room Number'])
+        self.assertEqual([1, 1, 1], list(df['Hotel ID']))
+        self.assertEqual([1, 2, 5], list(df['Room Number']))
+        apps.cursor.close()
+
+    def test_availability_interval_index_matches_query(self):
+        apps = Apps(self._con, False)
+        indexed_apps = Apps(self._con, False, interval_index=True)
+        load_demo_data(self._con)
+        for dates in [('2012-1-12', '2012-1-15'), ('2017-1-1', '2018-1-1'),
+                      ('2017-5-9', '2017-5-10'), ('2017-5-11', '2017-5-12'),
+                      ('2017-5-13', '2017-5-15')]:
+            for filters in [{}, {'hotel_id': 1}, {'city': 'raleigh'}]:
+                dictionary = dict(filters, start_date=dates[0],
+                                  end_date=dates[1])
+                expected = apps.room_availability(dict(dictionary))
+                df = indexed_apps.room_availability(dict(dictionary))
+                self.assertEqual(
+                    zip(expected['Hotel ID'], expected['Room Number']),
+                    zip(df['Hotel ID'], df['Room Number']))
+        self.assertEqual(list(expected.columns), list(df.columns))
+        apps.cursor.close()
+        indexed_apps.cursor.close()
+
+    def test_availability_interval_index_reservations(self):
+        apps = Apps(self._con, False, interval_index=True)
+        load_demo_data(self._con)
+        dictionary = {'start_date': '2017-5-11', 'end_date': '2017-5-12',
+                      'hotel_id': 1}
+        df = apps.room_availability(dict(dictionary))
+        self.assertEqual(1, len(df.index))
+        # Reserve the only available room
+        df = apps.add_reservation(
+            {'number_of_guests': 1, 'start_date': '2017-05-11',
+             'end_date': '2017-05-12', 'hotel_id': 1, 'room_number': 5,
+             'customer_id': 1001})
+        self.assertEqual(1, len(df.index))
+        df = apps.room_availability(dict(dictionary))
+        self.assertEqual(0, len(df.index))
+        # Conflicting reservation is detected by the index
+        with self.assertRaises(Exception):
+            apps.add_reservation(
+                {'number_of_guests': 1, 'start_date': '2017-05-10',
+                 'end_date': '2017-05-12', 'hotel_id': 1, 'room_number': 5,
+                 'customer_id': 1001})
+        self._con.rollback()
+        self.assertFalse(apps.interval_index.loaded)
+        df = apps.room_availability(dict(dictionary))
+        self.assertEqual(1, len(df.index))
+        # Reservation moved to other dates frees the room
+        df = apps.add_reservation(
+            {'number_of_guests': 1, 'start_date': '2017-05-11',
+             'end_date': '2017-05-12', 'hotel_id': 1, 'room_number': 5,
+             'customer_id': 1001})
+        self.assertEqual(0, len(apps.room_availability(dict(dictionary))))
+        apps.update_reservation({'start_date': '2017-06-11',
+                                 'end_date': '2017-06-12'},
+                                {'id': int(df['id'].ix[0])})
+        df = apps.room_availability(dict(dictionary))
+        self.assertEqual(1, len(df.index))
         apps.cursor.close()
 
     def test_check_out(self):
@@ -1601,6 +1941,74 @@ class TestApps(SQLUnitTestBase):
         self.assertEquals(10000.00, row['Total Amount Due'])
         apps.cursor.close()
 
+    def test_generate_bills(self):
+        apps = Apps(self._con, True)
+        self._insert_test_data()
+        bills = apps.generate_bills([9, 7, 8, 100])
+        self.assertListEqual([7, 8, 9], list(bills.keys()))
+        itemized_df, total_amount_due_df = bills[7]
+        self.assertEquals(1, len(itemized_df))
+        self.assertEquals(3, itemized_df['Transaction ID'].ix[0])
+        row = total_amount_due_df.ix[0]
+        self.assertEquals(485.68, row['Cost'])
+        # Discount and total are rounded half up
+        self.assertEquals(24.28, row['Discount'])
+        self.assertEquals(461.40, row['Total Amount Due'])
+        itemized_df, total_amount_due_df = bills[8]
+        self.assertListEqual([1, 7], list(itemized_df['Transaction ID']))
+        row = total_amount_due_df.ix[0]
+        self.assertEquals(8976.37, row['Cost'])
+        self.assertEquals(448.82, row['Discount'])
+        self.assertEquals(8527.55, row['Total Amount Due'])
+        # Reservation without charges
+        self.assertEquals(0, len(bills[9][0]))
+        self.assertEquals(1, len(bills[9][1]))
+        # Bills of all departures on a date
+        bills = apps.generate_bills(departure_date='2018-01-20')
+        self.assertListEqual([7], list(bills.keys()))
+        self.assertEquals(461.40, bills[7][1]['Total Amount Due'].ix[0])
+        self.assertEquals(0, len(apps.generate_bills([])))
+        self.assertRaises(AssertionError, apps.generate_bills, [7],
+                          '2018-01-20')
+        self.assertRaises(AssertionError, apps.generate_bills)
+        apps.cursor.close()
+
+    def test_check_out_bulk(self):
+        apps = Apps(self._con, True)
+        self._insert_test_data()
+        # Rory McDonald is dedicated to room 200 of hotel 2
+        apps.add_reservation({'number_of_guests': 1,
+                              'start_date': '2018-04-07',
+                              'end_date': '2018-04-10', 'hotel_id': 2,
+                              'room_number': 200, 'customer_id': 2})
+        df = apps.check_out_bulk('2018-04-10 10:30:00',
+                                 departure_date='2018-04-10')
+        self.assertListEqual([9, 10], list(df['id']))
+        self.assertListEqual([200.00, 480.00], list(df['Transaction_amount']))
+        self.assertListEqual(['2-night(s) Room Reservation Charge',
+                              '3-night(s) Room Reservation Charge'],
+                             list(df['Transaction_type']))
+        df = apps.get_data_frame('assigned_hotel_id, assigned_room_number',
+                                 'Staff', {'name': 'Rory McDonald'})
+        self.assertTrue(pd.isnull(df['assigned_hotel_id'].ix[0]))
+        self.assertTrue(pd.isnull(df['assigned_room_number'].ix[0]))
+        df = apps.get_data_frame('amount, type, date', 'Transactions',
+                                 {'reservation_id': 10})
+        self.assertEqual(1, len(df))
+        self.assertEqual(480.00, df['amount'].ix[0])
+        self.assertEqual('2018-04-10 10:30:00', str(df['date'].ix[0]))
+        df = apps.get_data_frame('check_out_time', 'Reservations',
+                                 {'id': 9})
+        self.assertEqual('2018-04-10 10:30:00',
+                         str(df['check_out_time'].ix[0]))
+        # Checked out reservations are not checked out again
+        self.assertEqual(0, len(apps.check_out_bulk(
+            '2018-04-11 10:30:00', reservation_ids=[4, 9, 10])))
+        self.assertRaises(AssertionError, apps.check_out_bulk,
+                          '2018-04-11 10:30:00')
+        self._con.commit()
+        apps.cursor.close()
+
     def test_report_occupancy_by_hotel(self):
         apps = Apps(self._con, True)
         self._insert_test_data()
@@ -1613,6 +2021,44 @@ class TestApps(SQLUnitTestBase):
         self._con.commit()
         apps.cursor.close()
 
+    def test_report_slow_query_log(self):
+        path = os.path.join(tempfile.mkdtemp(), 'slow_queries.log')
+        slow_query_log = SlowQueryLog(path, threshold=0)
+        apps = Apps(self._con, True, slow_query_log=slow_query_log)
+        self._insert_test_data()
+        apps.report_occupancy_by_hotel('2017-01-16')
+        apps.report_occupancy_by_hotel('2017-01-17')
+        # Both reports are logged, the plan is captured once
+        self.assertEqual({'slow': 2, 'plans': 1, 'pending_plans': 0},
+                         slow_query_log.stats())
+        slow_query_log.close()
+        entries = [json.loads(line.split(' ', 2)[2]) for line in open(path)]
+        self.assertEqual(['slow_query', 'plan', 'slow_query'],
+                         [entry['type'] for entry in entries])
+        self.assertEqual(9, entries[0]['rows'])
+        self.assertEqual(entries[0]['fingerprint'], entries[2]['fingerprint'])
+        self.assertTrue(entries[1]['plan'])
+        apps.cursor.close()
+
+    def test_report_occupancy_by_hotel_rows(self):
+        apps = Apps(self._con, True)
+        self._insert_test_data()
+        result = apps.report_occupancy_by_hotel('2017-01-16',
+                                                result_mode=RESULT_ROWS)
+        self.assertEqual(9, len(result))
+        row = result[5]
+        self.assertEqual('Wolf Inn Miami Panthers', row.Hotel_Name)
+        self.assertEqual(1, row.Rooms_Occupied)
+        self.assertEqual(1, row.Total_Rooms)
+        self.assertEqual(100.0, row.Occupancy)
+        df = result.to_data_frame()
+        self.assertListEqual(['Hotel Name', 'Rooms Occupied', 'Total Rooms',
+                              '% Occupancy'], list(df.columns))
+        self.assertEqual('Wolf Inn Miami Panthers', df['Hotel Name'].ix[5])
+        self.assertEqual(100.0, df['% Occupancy'].ix[5])
+        self._con.commit()
+        apps.cursor.close()
+
     def test_report_occupancy_by_room_type(self):
         apps = Apps(self._con, True)
         self._insert_test_data()
@@ -1637,6 +2083,161 @@ class TestApps(SQLUnitTestBase):
         self._con.commit()
         apps.cursor.close()
 
+    def test_report_occupancy_combined(self):
+        apps = Apps(self._con, True)
+        rollup_apps = Apps(self._con, True, rollups=True)
+        self._insert_test_data()
+        for query_date in ('2017-01-16', '2018-01-19'):
+            expected = [apps.report_occupancy_by_hotel(query_date),
+                        apps.report_occupancy_by_room_type(query_date),
+                        apps.report_occupancy_by_city(query_date)]
+            for reports in (apps.report_occupancy_combined(query_date),
+                            rollup_apps.report_occupancy_combined(query_date)):
+                self.assertEqual(3, len(reports))
+                for expected_df, df in zip(expected, reports):
+                    self.assertListEqual(list(expected_df.columns),
+                                         list(df.columns))
+                    self.assertListEqual(expected_df.values.tolist(),
+                                         df.values.tolist())
+        hotels, room_types, cities = apps.report_occupancy_combined(
+            '2017-01-16', result_mode=RESULT_ROWS)
+        self.assertEqual(9, len(hotels))
+        self.assertEqual('Wolf Inn Miami Panthers', hotels[5].Hotel_Name)
+        self.assertEqual(50.0, room_types[2].Occupancy)
+        self.assertEqual('Miami, FL', cities[2][0])
+        self._con.commit()
+        apps.cursor.close()
+        rollup_apps.cursor.close()
+
+    def test_report_occupancy_combined_rounding(self):
+        apps = Apps(self._con, True)
+        self._insert_test_data()
+        # One of six rooms of the Miami hotel is occupied: 16.67 %
+        apps.add_room_bulk([{'hotel_id': 6, 'room_number': room_number,
+                             'category': 'Economy', 'occupancy': 2,
+                             'rate': 100} for room_number in xrange(1, 6)])
+        expected = [apps.report_occupancy_by_hotel('2017-01-16'),
+                    apps.report_occupancy_by_room_type('2017-01-16'),
+                    apps.report_occupancy_by_city('2017-01-16')]
+        reports = apps.report_occupancy_combined('2017-01-16')
+        for expected_df, df in zip(expected, reports):
+            self.assertListEqual(expected_df.values.tolist(),
+                                 df.values.tolist())
+        self.assertEqual(16.67, reports[0]['% Occupancy'].ix[5])
+        self._con.commit()
+        apps.cursor.close()
+
+    def test_report_occupancy_time_series_rounding(self):
+        apps = Apps(self._con, True)
+        self._insert_test_data()
+        # One of six rooms of the Miami hotel is occupied: 16.67 %
+        apps.add_room_bulk([{'hotel_id': 6, 'room_number': room_number,
+                             'category': 'Economy', 'occupancy': 2,
+                             'rate': 100} for room_number in xrange(1, 6)])
+        expected = apps.report_occupancy_by_hotel('2017-01-16')
+        df = apps.report_occupancy_time_series('2017-01-16', '2017-01-17')
+        self.assertListEqual(
+            expected[['Hotel Name', 'Rooms Occupied', 'Total Rooms',
+                      '% Occupancy']].values.tolist(),
+            df[['Hotel Name', 'Rooms Occupied', 'Total Rooms',
+                '% Occupancy']].values.tolist())
+        self.assertEqual(16.67, df['% Occupancy'].ix[5])
+        self._con.commit()
+        apps.cursor.close()
+
+    def test_report_occupancy_time_series(self):
+        apps = Apps(self._con, True)
+        self._insert_test_data()
+        df = apps.report_occupancy_time_series('2017-01-14', '2017-01-20')
+        self.assertListEqual(['Date', 'Hotel ID', 'Hotel Name',
+                              'Rooms Occupied', 'Total Rooms', '% Occupancy'],
+                             list(df.columns))
+        self.assertEqual(9 * 6, len(df.index))
+        # Every day equals the point-in-time report of that day
+        for day in pd.date_range('2017-01-14', periods=6):
+            expected = apps.report_occupancy_by_hotel(str(day.date()))
+            daily = df[df['Date'] == day]
+            self.assertListEqual(
+                expected[['Hotel Name', 'Rooms Occupied', 'Total Rooms',
+                          '% Occupancy']].values.tolist(),
+                daily[['Hotel Name', 'Rooms Occupied', 'Total Rooms',
+                       '% Occupancy']].values.tolist())
+        result = apps.report_occupancy_time_series(
+            '2017-01-16', '2017-01-17', result_mode=RESULT_ROWS)
+        self.assertEqual(9, len(result))
+        self.assertEqual('Wolf Inn Miami Panthers', result[5].Hotel_Name)
+        self.assertEqual(100.0, result[5].Occupancy)
+        self.assertRaises(AssertionError, apps.report_occupancy_time_series,
+                          '2017-01-16', '2017-01-16')
+        self._con.commit()
+        apps.cursor.close()
+
+    def test_report_cache(self):
+        report_cache = ReportCache()
+        apps = Apps(self._con, True, report_cache=report_cache)
+        self._insert_test_data()
+        df = apps.report_occupancy_by_hotel('2017-01-16')
+        df['Rooms Occupied'] = 0
+        df = apps.report_occupancy_by_hotel('2017-01-16')
+        self.assertEqual(1, df['Rooms Occupied'].ix[5])
+        apps.report_staff_by_role(1)
+        self.assertEqual(1, report_cache.stats()['hits'])
+        # A reservation invalidates the occupancy report only
+        apps.add_reservation({'number_of_guests': 1,
+                              'start_date': '2017-01-16',
+                              'end_date': '2017-01-18', 'hotel_id': 1,
+                              'room_number': 100, 'customer_id': 2})
+        df = apps.report_occupancy_by_hotel('2017-01-16')
+        self.assertEqual(1, df['Rooms Occupied'].ix[0])
+        apps.report_staff_by_role(1)
+        stats = report_cache.stats()
+        self.assertEqual(2, stats['hits'])
+        self.assertEqual(1, stats['invalidated'])
+        # Hotels cascade into Staff
+        self.assertIn('Staff', get_cascading_tables('Hotels'))
+        apps.update_hotel({'phone_number': '919-000-0000'}, {'id': 1})
+        apps.report_staff_by_role(1)
+        self.assertEqual(2, report_cache.stats()['invalidated'])
+        self._con.commit()
+        apps.cursor.close()
+
+    def _assert_occupancy_rollups(self, apps, rollup_apps, dates):
+        for query_date in dates:
+            for report in ('report_occupancy_by_hotel',
+                           'report_occupancy_by_room_type',
+                           'report_occupancy_by_city'):
+                expected = getattr(apps, report)(query_date)
+                df = getattr(rollup_apps, report)(query_date)
+                self.assertListEqual(list(expected.columns), list(df.columns))
+                self.assertListEqual(expected.values.tolist(),
+                                     df.values.tolist())
+
+    def test_report_occupancy_rollups(self):
+        apps = Apps(self._con, True)
+        rollup_apps = Apps(self._con, True, rollups=True)
+        self._insert_test_data()
+        dates = ['2015-03-30', '2015-04-05', '2015-04-06', '2017-01-10',
+                 '2017-01-16', '2018-01-19']
+        self._assert_occupancy_rollups(apps, rollup_apps, dates)
+        # The APIs keep the summary up to date
+        apps.add_reservation({'number_of_guests': 1,
+                              'start_date': '2015-04-05',
+                              'end_date': '2015-04-08', 'hotel_id': 1,
+                              'room_number': 100, 'customer_id': 2})
+        apps.update_reservation({'start_date': '2017-01-10',
+                                 'end_date': '2017-01-17'}, {'id': 4})
+        apps.update_room({'category': 'Deluxe'},
+                         {'hotel_id': 1, 'room_number': 100})
+        apps.delete_reservation({'id': 7})
+        self._assert_occupancy_rollups(apps, rollup_apps, dates)
+        df = rollup_apps.report_occupancy_by_room_type('2015-04-06')
+        self.assertEqual('Deluxe', df['Room Type'].ix[0])
+        self.assertEqual(1, df['Rooms Occupied'].ix[0])
+        self.assertEqual(3, df['Total Rooms'].ix[0])
+        self._con.commit()
+        apps.cursor.close()
+        rollup_apps.cursor.close()
+
     def test_report_occupancy_by_date_range(self):
         apps = Apps(self._con, True)
         self._insert_test_data()
@@ -1752,6 +2353,46 @@ class TestApps(SQLUnitTestBase):
         self._con.commit()
         apps.cursor.close()
 
+    def _assert_revenue_rollups(self, apps, rollup_apps, hotel_ids):
+        for start_date, end_date in (('2015-01-01', '2017-12-31'),
+                                     ('2018-01-01', '2018-12-31')):
+            expected = apps.report_revenue_all_hotels(start_date, end_date)
+            df = rollup_apps.report_revenue_all_hotels(start_date, end_date)
+            self.assertListEqual(expected.values.tolist(), df.values.tolist())
+            for hotel_id in hotel_ids:
+                expected = apps.report_revenue_single_hotel(
+                    start_date, end_date, hotel_id)
+                df = rollup_apps.report_revenue_single_hotel(
+                    start_date, end_date, hotel_id)
+                self.assertListEqual(expected.values.tolist(),
+                                     df.values.tolist())
+
+    def test_report_revenue_rollups(self):
+        apps = Apps(self._con, True)
+        rollup_apps = Apps(self._con, True, rollups=True)
+        self._insert_test_data()
+        hotel_ids = [1, 5, 6, 9]
+        self._assert_revenue_rollups(apps, rollup_apps, hotel_ids)
+        # The APIs keep the summary up to date
+        apps.add_transaction({'amount': 100, 'type': 'Dry Cleaning',
+                              'date': '2015-04-04 10:00:00',
+                              'reservation_id': 1})
+        apps.update_transaction({'amount': 500}, {'id': 2})
+        apps.delete_transaction({'id': 4})
+        apps.update_reservation({'hotel_id': 9, 'room_number': 100},
+                                {'id': 4})
+        apps.delete_reservation({'id': 6})
+        self._assert_revenue_rollups(apps, rollup_apps, hotel_ids)
+        df = rollup_apps.report_revenue_single_hotel('2015-01-01',
+                                                     '2017-12-31', 1)
+        self.assertEqual(600.00, df['Revenue'].ix[0])
+        df = rollup_apps.report_revenue_single_hotel('2015-01-01',
+                                                     '2017-12-31', 9)
+        self.assertEqual(12.00, df['Revenue'].ix[0])
+        self._con.commit()
+        apps.cursor.close()
+        rollup_apps.cursor.close()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import mysql.connector as mariadb
+
+from unittest_base import SQLUnitTestBase
+from Project.appsclient import AppsParams
+from Project.asyncapps import AsyncApps, AsyncAppsClient, gather
+from Project.pool import ConnectionPool
+from Project.reportcache import ReportCache
+
+
+class TestAsyncApps(SQLUnitTestBase):
+
+    @staticmethod
+    def _connect_to_test_db():
+        con = mariadb.connect(host='classdb2.csc.ncsu.edu', user='nfschnoo',
+                              password='001027748',
+                              database='nfschnoo')
+        return con
+
+    def _create_pool(self, size=3):
+        return ConnectionPool(size=size,
+                              connection_factory=self._connect_to_test_db)
+
+    def test_concurrent_reports(self):
+        pool = self._create_pool()
+        async_apps = AsyncApps(pool, check=True)
+        self._insert_test_data()
+        self._con.commit()
+        dates = ['2017-01-16', '2018-01-19', '2018-02-25', '2018-04-09']
+        results = [async_apps.report_occupancy_by_hotel(date)
+                   for date in dates]
+        results.append(async_apps.generate_bill(8))
+        reports = gather(results)
+        self.assertEqual(9, len(reports[0].index))
+        self.assertEqual('Wolf Inn Miami Panthers',
+                         reports[0]['Hotel Name'].ix[5])
+        self.assertEqual(8976.37, reports[4][1]['Cost'].ix[0])
+        self.assertEqual(0, pool.stats()['in_use'])
+        self.assertLessEqual(pool.stats()['created'], 3)
+        async_apps.close()
+        pool.close()
+
+    def test_transaction(self):
+        pool = self._create_pool()
+        async_apps = AsyncApps(pool, workers=2, check=True,
+                               report_cache=ReportCache())
+        self._insert_test_data()
+        self._con.commit()
+        before = async_apps.report_staff_by_role(1).get()
+        result = async_apps.transaction(
+            lambda apps: apps.add_staff(
+                {'name': 'Async Staff', 'title': 'Manager',
+                 'date_of_birth': '1980-01-01', 'department': 'Management',
+                 'phone_number': '919-555-0000', 'street': '1 Main St',
+                 'zip': '27606', 'works_for_hotel_id': 1}))
+        self.assertEqual('Async Staff', result.get()['name'].ix[0])
+        after = async_apps.report_staff_by_role(1).get()
+        self.assertNotEqual(before.values.tolist(), after.values.tolist())
+        # Failed transaction is rolled back and its exception re-raised
+        result = async_apps.transaction(
+            lambda apps: (apps.delete_staff({'name': 'Async Staff'}),
+                          apps.add_hotel({})))
+        self.assertRaises(Exception, result.get)
+        self.assertEqual(after.values.tolist(),
+                         async_apps.report_staff_by_role(1).get()
+                         .values.tolist())
+        async_apps.close()
+        pool.close()
+
+    def test_shared_apps(self):
+        pool = self._create_pool()
+        self.assertRaises(AssertionError, AsyncApps, pool,
+                          interval_index=True)
+        async_apps = AsyncApps(pool, check=True, staff_pool=True)
+        self._insert_test_data()
+        self._con.commit()
+        reservation = {'number_of_guests': 1, 'hotel_id': 2,
+                       'room_number': 200, 'customer_id': 1,
+                       'start_date': '2019-01-01', 'end_date': '2019-01-03'}
+        # Only one of the concurrent reservations of the same room succeeds
+        results = [async_apps.book_room(dict(reservation))
+                   for _ in xrange(3)]
+        failed = 0
+        for result in results:
+            try:
+                result.get()
+            except Exception:
+                failed += 1
+        self.assertEqual(2, failed)
+        availability = async_apps.room_availability(
+            {'hotel_id': 2, 'start_date': '2019-01-01',
+             'end_date': '2019-01-02'}).get()
+        self.assertNotIn(200, availability['Room Number'].tolist())
+        self.assertEqual(0, pool.stats()['in_use'])
+        async_apps.close()
+        pool.close()
+
+    def test_client(self):
+        pool = self._create_pool()
+        client = AsyncAppsClient(pool, workers=2, check=True)
+        self._insert_test_data()
+        self._con.commit()
+        results = [client.get_report({'set': {'query_date': date}},
+                                     AppsParams.occ_hotel)
+                   for date in ('2017-01-16', '2018-01-19')]
+        results.append(client.select({'name': 'Wolf Inn Miami Panthers'},
+                                     'Hotels'))
+        hotel_df, _, selected_df = gather(results)
+        self.assertEqual(9, len(hotel_df.index))
+        self.assertEqual(1, len(selected_df.index))
+        self.assertEqual({}, client.report_cache_stats())
+        client.close()
+        pool.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
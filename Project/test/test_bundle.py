@@ -0,0 +1,58 @@
+import unittest
+import mysql.connector as mariadb
+
+from unittest_base import SQLUnitTestBase
+from Project.appsclient import AppsParams
+from Project.bundle import ReportBundleExecutor, ReportRequest, \
+    management_packet
+from Project.pool import ConnectionPool
+
+
+class TestReportBundleExecutor(SQLUnitTestBase):
+
+    @staticmethod
+    def _connect_to_test_db():
+        con = mariadb.connect(host='classdb2.csc.ncsu.edu', user='nfschnoo',
+                              password='001027748',
+                              database='nfschnoo')
+        return con
+
+    def test_management_packet(self):
+        pool = ConnectionPool(size=3,
+                              connection_factory=self._connect_to_test_db)
+        executor = ReportBundleExecutor(pool, check=True)
+        self._insert_test_data()
+        self._con.commit()
+        outcomes = executor.run(management_packet(
+            '2018-01-19', '2018-01-01', '2018-01-31', 9))
+        self.assertEqual(['Occupancy_hotel', 'Occupancy_city',
+                          'Occupancy_date', 'Revenue_all', 'List_staff'],
+                         [outcome.report_name for outcome in outcomes])
+        self.assertEqual([None] * 5,
+                         [outcome.error for outcome in outcomes])
+        self.assertEqual(9, len(outcomes[0].result.index))
+        self.assertTrue(all(outcome.seconds >= 0 for outcome in outcomes))
+        self.assertEqual(0, pool.stats()['in_use'])
+        executor.close()
+        pool.close()
+
+    def test_failed_report(self):
+        pool = ConnectionPool(size=2,
+                              connection_factory=self._connect_to_test_db)
+        executor = ReportBundleExecutor(pool, check=True)
+        self._insert_test_data()
+        self._con.commit()
+        # Missing parameter fails its report only
+        outcomes = executor.run([
+            ({'set': {}}, AppsParams.occ_hotel),
+            ReportRequest({'set': {'hotel_id': 9}}, AppsParams.list_staff)])
+        self.assertIsInstance(outcomes[0].error, KeyError)
+        self.assertIsNone(outcomes[0].result)
+        self.assertIsNone(outcomes[1].error)
+        self.assertEqual(0, pool.stats()['in_use'])
+        executor.close()
+        pool.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -44,6 +44,23 @@ class TestApps(SQLUnitTestBase):
         self.assertEqual('Nowhere', row['city'])
         self.assertEqual('PA', row['state'])
 
+    def test_insert_bulk_hotels_with_new_zip(self):
+        client = AppsClient(self._con, True)
+        self._insert_test_data()
+        rows = [{'name': 'WolfInn Test', 'street': '104 Main', 'zip': '00000',
+                 'city': 'Nowhere', 'state': 'PA',
+                 'phone_number': '919-555-1212'},
+                {'name': 'WolfInn Test 2', 'street': '106 Main',
+                 'zip': '00000', 'city': 'Nowhere', 'state': 'PA',
+                 'phone_number': '919-555-1213'}]
+        result = client.insert_bulk(rows, AppsParams.hotels)
+        self.assertEqual(2, len(result.index))
+        hotels = client.select({'zip': '00000'}, 'Hotels')
+        self.assertEqual(2, len(hotels.index))
+        zips = client.select({'zip': '00000'}, 'ZipToCityState')
+        self.assertEqual(1, len(zips.index))
+        self.assertEqual('Nowhere', zips.ix[0]['city'])
+
     def test_update_hotel(self):
         client = AppsClient(self._con, True)
         self._insert_test_data()
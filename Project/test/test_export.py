@@ -0,0 +1,96 @@
+import csv
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+
+from unittest_base import SQLUnitTestBase
+from Project.apps import Apps
+from Project.appsclient import AppsClient
+from Project.export import EXPORT_CSV, EXPORT_PARQUET, export_chunks, \
+    get_export_format, pyarrow
+from Project.rows import RESULT_ROWS
+
+
+class TestExport(SQLUnitTestBase):
+
+    def setUp(self):
+        super(TestExport, self).setUp()
+        self._dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+        super(TestExport, self).tearDown()
+
+    def test_get_export_format(self):
+        self.assertEqual((EXPORT_CSV, False), get_export_format('a.csv'))
+        self.assertEqual((EXPORT_CSV, True), get_export_format('a.CSV.gz'))
+        self.assertEqual((EXPORT_PARQUET, False),
+                         get_export_format('a.parquet'))
+
+    def test_iter_data_frame(self):
+        apps = Apps(self._con, True)
+        self._insert_test_data()
+        chunks = list(apps.iter_data_frame('*', 'Transactions',
+                                           chunk_size=2))
+        self.assertTrue(all(len(chunk.index) <= 2 for chunk in chunks))
+        self.assertEqual(len(apps.get_data_frame('*', 'Transactions').index),
+                         sum(len(chunk.index) for chunk in chunks))
+        # Where filter and date window
+        chunks = list(apps.iter_data_frame(
+            '*', 'Transactions', {'reservation_id': 8},
+            ('date', '2018-01-20', '2018-01-20'), result_mode=RESULT_ROWS))
+        self.assertEqual(1, len(chunks))
+        self.assertEqual(8893.37, float(chunks[0][0].amount))
+        # Empty result still generates the attribute names
+        chunks = list(apps.iter_data_frame(
+            'id, amount', 'Transactions', None,
+            ('date', '2030-01-01', '2030-12-31'), result_mode=RESULT_ROWS))
+        self.assertEqual(('id', 'amount'), chunks[0].columns)
+        self.assertEqual(0, len(chunks[0]))
+        # Connection is usable after the export is stopped
+        generator = apps.iter_data_frame('*', 'Transactions', chunk_size=1)
+        next(generator)
+        generator.close()
+        self.assertEqual(9, len(apps.get_data_frame('*', 'Hotels').index))
+        apps.cursor.close()
+
+    def test_export_csv(self):
+        client = AppsClient(self._con, True)
+        self._insert_test_data()
+        path = os.path.join(self._dir, 'transactions.csv.gz')
+        rows = client.export({'reservation_id': 7}, 'Transactions', path,
+                             chunk_size=1)
+        lines = list(csv.reader(gzip.open(path, 'rb')))
+        self.assertEqual(['id', 'amount', 'type', 'date', 'reservation_id'],
+                         lines[0])
+        self.assertEqual(rows + 1, len(lines))
+        self.assertTrue(all(line[4] == '7' for line in lines[1:]))
+        # Report result is exported as one chunk
+        report = client.apps.report_occupancy_by_hotel('2017-01-16')
+        path = os.path.join(self._dir, 'occupancy.csv')
+        self.assertEqual(9, export_chunks([report], path))
+        self.assertEqual(10, len(open(path).readlines()))
+        client.apps.cursor.close()
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_export_parquet(self):
+        client = AppsClient(self._con, True)
+        self._insert_test_data()
+        path = os.path.join(self._dir, 'transactions.parquet')
+        rows = client.export(None, 'Transactions', path, chunk_size=2)
+        table = pyarrow.parquet.read_table(path)
+        self.assertEqual(rows, table.num_rows)
+        # Assigned hotels of the first chunk of staff are all NULL
+        path = os.path.join(self._dir, 'staff.parquet')
+        rows = client.export(None, 'Staff', path, chunk_size=2)
+        table = pyarrow.parquet.read_table(path)
+        self.assertEqual(rows, table.num_rows)
+        self.assertEqual([None, None, 7],
+                         table.column('assigned_hotel_id').to_pylist()[:3])
+        client.apps.cursor.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
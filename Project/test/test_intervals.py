@@ -0,0 +1,90 @@
+import unittest
+from datetime import date
+
+from Project.intervals import RoomIntervalIndex, to_date
+
+
+class TestIntervals(unittest.TestCase):
+
+    def _create_index(self):
+        index = RoomIntervalIndex()
+        index.load([(1, 1), (1, 2), (2, 1)],
+                   [(1, 1, 1, date(2018, 4, 8), date(2018, 4, 10)),
+                    (2, 1, 1, date(2018, 4, 12), date(2018, 4, 15)),
+                    (3, 1, 2, date(2018, 4, 1), date(2018, 4, 30))])
+        return index
+
+    def test_to_date(self):
+        self.assertEqual(date(2017, 1, 1), to_date('2017-1-1'))
+        self.assertEqual(date(2017, 1, 1), to_date('2017-01-01 10:00:00'))
+        self.assertEqual(date(2017, 1, 1), to_date(date(2017, 1, 1)))
+        with self.assertRaises(ValueError):
+            to_date('01/01/2017')
+
+    def test_is_free(self):
+        index = self._create_index()
+        self.assertTrue(index.is_free(1, 1, '2018-04-10', '2018-04-12'))
+        self.assertFalse(index.is_free(1, 1, '2018-04-09', '2018-04-11'))
+        self.assertFalse(index.is_free(1, 1, '2018-04-01', '2018-05-01'))
+        self.assertFalse(index.is_free(1, 2, '2018-04-10', '2018-04-11'))
+        self.assertTrue(index.is_free(2, 1, '2018-04-10', '2018-04-11'))
+
+    def test_is_free_turnover(self):
+        index = self._create_index()
+        # Room is free up to the start date and from the end date of a
+        # reservation
+        self.assertTrue(index.is_free(1, 1, '2018-04-06', '2018-04-08'))
+        self.assertTrue(index.is_free(1, 1, '2018-04-10', '2018-04-11'))
+        self.assertFalse(index.is_free(1, 1, '2018-04-06', '2018-04-09'))
+
+    def test_free_rooms(self):
+        index = self._create_index()
+        self.assertEqual([(1, 1), (2, 1)],
+                         index.free_rooms('2018-05-01', '2018-05-02',
+                                          [(1, 1), (2, 1)]))
+        self.assertEqual([(2, 1)],
+                         index.free_rooms('2018-04-09', '2018-04-13'))
+
+    def test_add_remove(self):
+        index = self._create_index()
+        index.add(4, 2, 1, '2018-04-10', '2018-04-11')
+        self.assertFalse(index.is_free(2, 1, '2018-04-10', '2018-04-11'))
+        # Moving reservation frees its previous dates
+        index.add(4, 2, 1, '2018-05-10', '2018-05-11')
+        self.assertTrue(index.is_free(2, 1, '2018-04-10', '2018-04-11'))
+        index.remove(4)
+        self.assertTrue(index.is_free(2, 1, '2018-05-10', '2018-05-11'))
+        self.assertEqual(3, index.stats()['reservations'])
+
+    def test_has_conflict(self):
+        index = self._create_index()
+        self.assertFalse(index.has_conflict(1))
+        index.add(4, 1, 1, '2018-04-10', '2018-04-12')
+        self.assertFalse(index.has_conflict(4))
+        index.add(5, 1, 1, '2018-04-09', '2018-04-13')
+        self.assertTrue(index.has_conflict(5))
+        self.assertTrue(index.has_conflict(1))
+        index.remove(5)
+        self.assertFalse(index.has_conflict(1))
+        self.assertFalse(index.has_conflict(99))
+
+    def test_load_unordered(self):
+        index = RoomIntervalIndex()
+        index.load([(1, 1)],
+                   [(1, 1, 1, date(2018, 4, 20), date(2018, 4, 22)),
+                    (2, 1, 1, date(2018, 4, 1), date(2018, 4, 30)),
+                    (3, 1, 1, date(2018, 4, 10), date(2018, 4, 12))])
+        self.assertFalse(index.is_free(1, 1, '2018-04-25', '2018-04-26'))
+        self.assertTrue(index.is_free(1, 1, '2018-04-30', '2018-05-01'))
+        self.assertTrue(index.has_conflict(3))
+        index.remove(2)
+        self.assertTrue(index.is_free(1, 1, '2018-04-25', '2018-04-26'))
+        self.assertFalse(index.has_conflict(3))
+        self.assertEqual(2, index.stats()['reservations'])
+
+    def test_clear(self):
+        index = self._create_index()
+        self.assertTrue(index.loaded)
+        index.clear()
+        self.assertFalse(index.loaded)
+        self.assertTrue(index.is_free(1, 1, '2018-04-08', '2018-04-10'))
@@ -0,0 +1,64 @@
+import unittest
+import mysql.connector as mariadb
+
+from unittest_base import SQLUnitTestBase
+from Project.migrations import MIGRATIONS, SCHEMA_VERSION_TABLE, \
+    get_pending_migrations, get_schema_version, migrate
+from Project.rollups import DAILY_OCCUPANCY_TABLE, DAILY_REVENUE_TABLE
+
+
+class TestMigrations(SQLUnitTestBase):
+
+    @staticmethod
+    def _connect_to_test_db():
+        con = mariadb.connect(host='classdb2.csc.ncsu.edu', user='nfschnoo',
+                              password='001027748',
+                              database='nfschnoo')
+        return con
+
+    def _get_index_names(self, table_name):
+        cursor = self._con.cursor()
+        cursor.execute('SHOW INDEX FROM {}'.format(table_name))
+        index_names = set(row[2] for row in cursor.fetchall())
+        cursor.close()
+        return index_names
+
+    def _has_table(self, table_name):
+        cursor = self._con.cursor()
+        cursor.execute('SHOW TABLES LIKE %s', (table_name,))
+        has_table = len(cursor.fetchall()) > 0
+        cursor.close()
+        return has_table
+
+    def test_schema_is_migrated(self):
+        latest = max(migration.version for migration in MIGRATIONS)
+        self.assertEqual(latest, get_schema_version(self._con))
+        self.assertEqual([], get_pending_migrations(self._con))
+        self.assertIn('idx_transactions_reservation_date',
+                      self._get_index_names('Transactions'))
+        self.assertIn('idx_staff_hotel_title', self._get_index_names('Staff'))
+
+    def test_migrate_is_idempotent(self):
+        self.assertEqual([], migrate(self._con))
+
+    def test_migrate_existing_database(self):
+        # Database created before the migrations were introduced
+        cursor = self._con.cursor()
+        cursor.execute('DROP INDEX idx_reservations_dates ON Reservations')
+        cursor.execute('DROP TABLE {}'.format(DAILY_OCCUPANCY_TABLE))
+        cursor.execute('DROP TABLE {}'.format(DAILY_REVENUE_TABLE))
+        cursor.execute('DROP TABLE {}'.format(SCHEMA_VERSION_TABLE))
+        cursor.close()
+        self.assertEqual(0, get_schema_version(self._con))
+        self.assertEqual([1], migrate(self._con, target=1))
+        self.assertNotIn('idx_reservations_dates',
+                         self._get_index_names('Reservations'))
+        self.assertFalse(self._has_table(DAILY_OCCUPANCY_TABLE))
+        self.assertFalse(self._has_table(DAILY_REVENUE_TABLE))
+        self.assertEqual([migration.version for migration in MIGRATIONS[1:]],
+                         migrate(self._con))
+        self.assertIn('idx_reservations_dates',
+                      self._get_index_names('Reservations'))
+        self.assertTrue(self._has_table(DAILY_OCCUPANCY_TABLE))
+        self.assertTrue(self._has_table(DAILY_REVENUE_TABLE))
+        self.assertEqual(MIGRATIONS[-1].version, get_schema_version(self._con))
@@ -0,0 +1,215 @@
+
+import threading
+import time
+import unittest
+import mysql.connector as mariadb
+
+from unittest_base import SQLUnitTestBase
+from Project.apps import Apps
+from Project.appsclient import *
+from Project.pool import ConnectionPool
+from Project.util import sql_transaction
+
+
+class _PoolConnection(object):
+
+    def __init__(self):
+        self.broken = False
+        self.closed = False
+        self.on_reconnect = None
+
+    def is_connected(self):
+        return not self.broken
+
+    def reconnect(self, attempts=1, delay=0):
+        if self.on_reconnect is not None:
+            self.on_reconnect()
+        raise mariadb.Error('Server is down')
+
+    def rollback(self):
+        if self.broken:
+            raise mariadb.Error('Connection is broken')
+
+    def close(self):
+        self.closed = True
+
+
+class TestPoolWaiters(unittest.TestCase):
+
+    def test_discarded_connection_wakes_waiter(self):
+        pool = ConnectionPool(size=1, timeout=5, health_check=False,
+                              connection_factory=_PoolConnection)
+        con = pool.get_connection()
+        result = []
+        waiter = threading.Thread(
+            target=lambda: result.append(pool.get_connection()))
+        waiter.start()
+        time.sleep(0.2)
+        # Broken connection frees its slot, so the waiter opens a new one
+        con.broken = True
+        pool.put_connection(con)
+        waiter.join(5)
+        self.assertFalse(waiter.is_alive())
+        self.assertTrue(con.closed)
+        self.assertIsNot(con, result[0])
+        self.assertEqual(1, pool.stats()['created'])
+        pool.put_connection(result[0])
+        pool.close()
+
+    def test_failed_reconnect_keeps_slot(self):
+        connections = []
+
+        def connect():
+            if len(connections) == 2:
+                raise mariadb.Error('Server is down')
+            connections.append(_PoolConnection())
+            return connections[-1]
+        pool = ConnectionPool(size=1, timeout=5, connection_factory=connect)
+        pool.put_connection(pool.get_connection())
+        result = []
+        waiter = threading.Thread(
+            target=lambda: result.append(pool.get_connection()))
+
+        def start_waiter():
+            waiter.start()
+            time.sleep(0.2)
+        connections[0].broken = True
+        connections[0].on_reconnect = start_waiter
+        # Broken connection is replaced within its slot, so the waiter
+        # started meanwhile does not open a second connection
+        con = pool.get_connection()
+        time.sleep(0.2)
+        self.assertTrue(connections[0].closed)
+        self.assertIs(connections[1], con)
+        self.assertTrue(waiter.is_alive())
+        self.assertEqual(1, pool.stats()['created'])
+        self.assertEqual(1, pool.stats()['replaced'])
+        # Slot is freed if the replacement cannot be opened either
+        pool.put_connection(con)
+        waiter.join(5)
+        self.assertIs(con, result[0])
+        pool.put_connection(con)
+        con.broken = True
+        with self.assertRaises(mariadb.Error):
+            pool.get_connection()
+        self.assertEqual(0, pool.stats()['created'])
+        pool.close()
+
+    def test_close_closes_returned_connections(self):
+        pool = ConnectionPool(size=2, health_check=False,
+                              connection_factory=_PoolConnection)
+        idle = pool.get_connection()
+        checked_out = pool.get_connection()
+        pool.put_connection(idle)
+        pool.close()
+        self.assertTrue(idle.closed)
+        self.assertFalse(checked_out.closed)
+        pool.put_connection(checked_out)
+        self.assertTrue(checked_out.closed)
+        self.assertEqual(0, pool.stats()['created'])
+        with self.assertRaises(Exception):
+            pool.get_connection()
+
+
+class TestPool(SQLUnitTestBase):
+
+    @staticmethod
+    def _connect_to_test_db():
+        con = mariadb.connect(host='classdb2.csc.ncsu.edu', user='nfschnoo',
+                              password='001027748',
+                              database='nfschnoo')
+        return con
+
+    def _create_pool(self, size=2, timeout=None):
+        return ConnectionPool(size=size, timeout=timeout,
+                              connection_factory=self._connect_to_test_db)
+
+    def test_checkout_reuses_connection(self):
+        pool = self._create_pool()
+        with pool.connection() as con:
+            first = con
+        with pool.connection() as con:
+            self.assertIs(first, con)
+        stats = pool.stats()
+        self.assertEqual(1, stats['created'])
+        self.assertEqual(0, stats['in_use'])
+        self.assertEqual(1, stats['idle'])
+        self.assertEqual(2, stats['checkouts'])
+        pool.close()
+
+    def test_checkout_size_limit(self):
+        pool = self._create_pool(size=1, timeout=0.1)
+        con = pool.get_connection()
+        self.assertEqual(1, pool.stats()['in_use'])
+        with self.assertRaises(Exception):
+            pool.get_connection()
+        self.assertEqual(1, pool.stats()['waits'])
+        pool.put_connection(con)
+        pool.close()
+
+    def test_checkout_replaces_closed_connection(self):
+        pool = self._create_pool(size=1)
+        with pool.connection() as con:
+            con.close()
+        with pool.connection() as con:
+            self.assertTrue(con.is_connected())
+        pool.close()
+
+    def test_put_connection_rolls_back(self):
+        pool = self._create_pool(size=1)
+        with pool.connection() as con:
+            cursor = con.cursor()
+            cursor.execute("INSERT INTO ZipToCityState(zip, city, state) "
+                           "VALUES ('27965', 'Raleigh', 'NC')")
+            cursor.close()
+        with pool.connection() as con:
+            cursor = con.cursor()
+            cursor.execute('SELECT * FROM ZipToCityState')
+            self.assertEqual(0, len(cursor.fetchall()))
+            cursor.close()
+        pool.close()
+
+    def test_sql_transaction_pool(self):
+        pool = self._create_pool()
+        with sql_transaction(pool) as con:
+            cursor = con.cursor()
+            cursor.execute("INSERT INTO ZipToCityState(zip, city, state) "
+                           "VALUES ('27965', 'Raleigh', 'NC')")
+            cursor.close()
+        self.assertEqual(0, pool.stats()['in_use'])
+        with pool.connection() as con:
+            cursor = con.cursor()
+            cursor.execute('SELECT * FROM ZipToCityState')
+            self.assertEqual(1, len(cursor.fetchall()))
+            cursor.close()
+        pool.close()
+
+    def test_apps_connection_pool(self):
+        pool = self._create_pool()
+        apps = Apps(pool, True)
+        self._insert_test_data()
+        with apps.connection():
+            df = apps.get_data_frame('*', 'Hotels')
+            self.assertEqual(9, len(df.index))
+            self.assertEqual(1, pool.stats()['in_use'])
+        self.assertIsNone(apps.cursor)
+        self.assertEqual(0, pool.stats()['in_use'])
+        pool.close()
+
+    def test_client_connection_pool(self):
+        pool = self._create_pool()
+        client = AppsClient(pool, True)
+        self._insert_test_data()
+        param_dict = {'set': {'name': 'WolfInn Test', 'street': '104 Main',
+                              'zip': '27965', 'phone_number': '919-555-1212'}}
+        result = client.insert(param_dict, AppsParams.hotels)
+        self.assertEqual(1, len(result.index))
+        self.assertEqual('WolfInn Test', result.ix[0]['name'])
+        result = client.select({'name': 'WolfInn Test'}, 'Hotels')
+        self.assertEqual(1, len(result.index))
+        self.assertEqual(0, pool.stats()['in_use'])
+        pool.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+import unittest
+import mysql.connector as mariadb
+
+from unittest_base import SQLUnitTestBase
+from Project.apps import Apps
+from Project.pool import ConnectionPool
+from Project.replicas import ReplicaSet
+from Project.reportcache import ReportCache
+
+
+class _ReplicaCursor(object):
+
+    column_names = ('Slave_IO_State', 'Seconds_Behind_Master')
+
+    def __init__(self, lag):
+        self._lag = lag
+
+    def execute(self, query, params=None):
+        pass
+
+    def fetchall(self):
+        return [('Waiting for master to send event', self._lag)]
+
+    def close(self):
+        pass
+
+
+class _ReplicaConnection(object):
+
+    def __init__(self, lag):
+        self.lag = lag
+
+    def cursor(self):
+        return _ReplicaCursor(self.lag)
+
+    def rollback(self):
+        pass
+
+
+class TestReplicaSet(unittest.TestCase):
+
+    def test_round_robin(self):
+        first, second = _ReplicaConnection(0), _ReplicaConnection(0)
+        replicas = ReplicaSet([first, second], max_lag=5)
+        used = []
+        for _ in xrange(4):
+            with replicas.connection() as con:
+                used.append(con)
+        self.assertEqual([first, second, first, second], used)
+        self.assertEqual([2, 2], replicas.stats()['reads'])
+
+    def test_lag_guard(self):
+        lagging = _ReplicaConnection(10)
+        replicas = ReplicaSet([lagging], max_lag=5, check_interval=0)
+        with replicas.connection() as con:
+            self.assertIsNone(con)
+        self.assertEqual(1, replicas.stats()['fallbacks'])
+        self.assertEqual([10], replicas.stats()['lag'])
+        # Replica that is not replicating is not used either
+        lagging.lag = None
+        with replicas.connection() as con:
+            self.assertIsNone(con)
+        # Replica that caught up is used again
+        lagging.lag = 2
+        with replicas.connection() as con:
+            self.assertIs(lagging, con)
+        self.assertEqual([True], replicas.stats()['usable'])
+
+    def test_lag_checked_once_per_interval(self):
+        replica = _ReplicaConnection(0)
+        replicas = ReplicaSet([replica], max_lag=5, check_interval=3600)
+        with replicas.connection() as con:
+            self.assertIs(replica, con)
+        replica.lag = 10
+        with replicas.connection() as con:
+            self.assertIs(replica, con)
+        self.assertEqual([0], replicas.stats()['lag'])
+
+
+class TestReadRouting(SQLUnitTestBase):
+
+    @staticmethod
+    def _connect_to_test_db():
+        con = mariadb.connect(host='classdb2.csc.ncsu.edu', user='nfschnoo',
+                              password='001027748',
+                              database='nfschnoo')
+        return con
+
+    def test_reads_routed_to_replica(self):
+        replicas = ReplicaSet([self._connect_to_test_db()],
+                              read_your_writes=0)
+        apps = Apps(self._con, True, replicas=replicas)
+        self._insert_test_data()
+        self._con.commit()
+        df = apps.report_occupancy_by_hotel('2017-01-16')
+        self.assertEqual(9, len(df.index))
+        self.assertEqual(8976.37, apps.generate_bill(8)[1]['Cost'].ix[0])
+        self.assertEqual([2], replicas.stats()['reads'])
+        # Reads after a write of the open transaction stay on the primary
+        apps.add_zip({'zip': '27695', 'city': 'Raleigh', 'state': 'NC'})
+        apps.report_occupancy_by_city('2017-01-16')
+        self.assertEqual(1, len(apps.get_data_frame(
+            '*', 'ZipToCityState', {'zip': '27695'}).index))
+        self.assertEqual([2], replicas.stats()['reads'])
+        self._con.commit()
+        apps.commit_local_state()
+        apps.report_occupancy_by_city('2017-01-16')
+        self.assertEqual([3], replicas.stats()['reads'])
+        # Callers needing fresh data read from the primary
+        with apps.fresh_reads():
+            apps.generate_bill(8)
+        self.assertEqual([3], replicas.stats()['reads'])
+        apps.cursor.close()
+
+    def test_read_your_writes_window(self):
+        replicas = ReplicaSet([self._connect_to_test_db()],
+                              read_your_writes=3600)
+        apps = Apps(self._con, True, replicas=replicas)
+        self._insert_test_data()
+        self._con.commit()
+        apps.add_zip({'zip': '27695', 'city': 'Raleigh', 'state': 'NC'})
+        self._con.commit()
+        apps.commit_local_state()
+        apps.report_occupancy_by_hotel('2017-01-16')
+        self.assertEqual([0], replicas.stats()['reads'])
+        apps.cursor.close()
+
+    def test_replica_reports_cached(self):
+        replicas = ReplicaSet([self._connect_to_test_db()], max_lag=3600,
+                              read_your_writes=0)
+        report_cache = ReportCache()
+        apps = Apps(self._con, True, replicas=replicas,
+                    report_cache=report_cache)
+        self._insert_test_data()
+        self._con.commit()
+        df = apps.report_occupancy_by_hotel('2017-01-16')
+        self.assertEqual(df.values.tolist(), apps.report_occupancy_by_hotel(
+            '2017-01-16').values.tolist())
+        self.assertEqual([1], replicas.stats()['reads'])
+        self.assertEqual(1, report_cache.stats()['hits'])
+        # Fresh reads do not get the report read from the replica
+        with apps.fresh_reads():
+            apps.report_occupancy_by_hotel('2017-01-16')
+        self.assertEqual(1, report_cache.stats()['hits'])
+        # Replica reports expire after the maximum lag
+        replicas.max_lag = 0
+        apps.report_occupancy_by_city('2017-01-16')
+        apps.report_occupancy_by_city('2017-01-16')
+        self.assertEqual([3], replicas.stats()['reads'])
+        apps.cursor.close()
+
+    def test_unreachable_replica(self):
+        def connect():
+            raise mariadb.Error('Replica is down')
+        replicas = ReplicaSet([ConnectionPool(size=1,
+                                              connection_factory=connect)])
+        apps = Apps(self._con, True, replicas=replicas)
+        self._insert_test_data()
+        self._con.commit()
+        df = apps.report_occupancy_by_hotel('2017-01-16')
+        self.assertEqual(9, len(df.index))
+        self.assertEqual({'reads': [0], 'lag': [0], 'usable': [False],
+                          'fallbacks': 1}, replicas.stats())
+        apps.cursor.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import time
+import unittest
+
+from Project.reportcache import ReportCache
+
+
+class TestReportCache(unittest.TestCase):
+
+    def _query(self, cache, key, tables, result):
+        cached = cache.get(key, tables)
+        if cached is not None:
+            return cached
+        cache.put(key, tables, cache.get_versions(tables), result)
+        return result
+
+    def test_hit_and_miss(self):
+        cache = ReportCache()
+        self.assertEqual('a', self._query(cache, 'r1', ('Rooms',), 'a'))
+        self.assertEqual('a', self._query(cache, 'r1', ('Rooms',), 'b'))
+        stats = cache.stats()
+        self.assertEqual(1, stats['hits'])
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual(1, stats['size'])
+
+    def test_invalidate(self):
+        cache = ReportCache()
+        self._query(cache, 'r1', ('Rooms', 'Hotels'), 'a')
+        self._query(cache, 'r2', ('Staff',), 'b')
+        cache.invalidate('Hotels')
+        self.assertIsNone(cache.get('r1', ('Rooms', 'Hotels')))
+        self.assertEqual('b', cache.get('r2', ('Staff',)))
+        self.assertEqual(1, cache.stats()['invalidated'])
+
+    def test_write_during_query(self):
+        cache = ReportCache()
+        versions = cache.get_versions(('Rooms',))
+        cache.invalidate('Rooms')
+        self.assertFalse(cache.put('r1', ('Rooms',), versions, 'a'))
+        self.assertIsNone(cache.get('r1', ('Rooms',)))
+
+    def test_lru_eviction(self):
+        cache = ReportCache(max_size=2)
+        self._query(cache, 'r1', (), 'a')
+        self._query(cache, 'r2', (), 'b')
+        cache.get('r1', ())
+        self._query(cache, 'r3', (), 'c')
+        self.assertEqual('a', cache.get('r1', ()))
+        self.assertIsNone(cache.get('r2', ()))
+        self.assertEqual(1, cache.stats()['evictions'])
+
+    def test_ttl(self):
+        cache = ReportCache(ttl=0.01)
+        self._query(cache, 'r1', (), 'a')
+        time.sleep(0.02)
+        self.assertIsNone(cache.get('r1', ()))
+        self.assertEqual(1, cache.stats()['expired'])
+
+    def test_result_ttl(self):
+        cache = ReportCache(ttl=300)
+        self.assertTrue(cache.put('r1', (), (), 'a', ttl=0.01))
+        self.assertTrue(cache.put('r2', (), (), 'b', ttl=3600))
+        self.assertFalse(cache.put('r3', (), (), 'c', ttl=0))
+        time.sleep(0.02)
+        self.assertIsNone(cache.get('r1', ()))
+        self.assertEqual('b', cache.get('r2', ()))
+        self.assertIsNone(cache.get('r3', ()))
+
+    def test_clear(self):
+        cache = ReportCache()
+        self._query(cache, 'r1', (), 'a')
+        cache.clear()
+        self.assertIsNone(cache.get('r1', ()))
+        self.assertEqual(0, cache.stats()['size'])
+
+
+if __name__ == '__main__':
+    unittest.main()
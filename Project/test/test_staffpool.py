@@ -0,0 +1,62 @@
+import unittest
+
+from Project.staffpool import StaffPool, get_dedicated_role
+
+# (ID, works for hotel ID, title, assigned hotel ID, assigned room number)
+STAFF = [
+    (3, 1, 'Catering Staff', None, None),
+    (1, 1, 'Catering Staff', None, None),
+    (2, 1, 'Room Service Staff', 1, 500),
+    (4, 1, 'Manager', None, None),
+    (5, 2, 'catering staff', None, None),
+    (6, 1, 'Room Service Staff', None, None)
+]
+
+
+class TestStaffPool(unittest.TestCase):
+
+    def test_get_dedicated_role(self):
+        self.assertEqual('Catering', get_dedicated_role('Catering Staff'))
+        self.assertEqual('Room Service',
+                         get_dedicated_role('room service staff'))
+        self.assertIsNone(get_dedicated_role('Manager'))
+        self.assertIsNone(get_dedicated_role(None))
+
+    def test_take_in_order_of_ids(self):
+        pool = StaffPool()
+        self.assertFalse(pool.loaded)
+        pool.load(STAFF)
+        self.assertTrue(pool.loaded)
+        self.assertEqual(1, pool.take(1, 'Catering'))
+        self.assertEqual(3, pool.take(1, 'Catering'))
+        self.assertIsNone(pool.take(1, 'Catering'))
+        self.assertEqual(5, pool.take(2, 'Catering'))
+        # Assigned staff is not free
+        self.assertEqual(6, pool.take(1, 'Room Service'))
+        self.assertIsNone(pool.take(1, 'Room Service'))
+        self.assertIsNone(pool.take(3, 'Catering'))
+
+    def test_assign_and_release(self):
+        pool = StaffPool()
+        pool.load(STAFF)
+        pool.assign([1, 4, 99])
+        self.assertEqual(1, pool.free_count(1, 'Catering'))
+        pool.release([2, 1, 4, 99, 1])
+        self.assertEqual(2, pool.free_count(1, 'Catering'))
+        self.assertEqual(2, pool.free_count(1, 'Room Service'))
+        # Released staff is taken in the order of IDs, like the SQL query
+        self.assertEqual(1, pool.take(1, 'Catering'))
+        self.assertEqual(3, pool.take(1, 'Catering'))
+        self.assertEqual(2, pool.take(1, 'Room Service'))
+        self.assertEqual(6, pool.take(1, 'Room Service'))
+
+    def test_clear(self):
+        pool = StaffPool()
+        pool.load(STAFF)
+        pool.clear()
+        self.assertFalse(pool.loaded)
+        self.assertIsNone(pool.take(1, 'Catering'))
+
+
+if __name__ == '__main__':
+    unittest.main()
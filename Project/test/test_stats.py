@@ -0,0 +1,55 @@
+import unittest
+
+from Project.stats import ApiStats, LatencyHistogram, count_rows
+
+
+class _Cursor(object):
+
+    def __init__(self, rowcount, description=None):
+        self.rowcount = rowcount
+        self.description = description
+
+
+class TestStats(unittest.TestCase):
+
+    def test_histogram_percentiles(self):
+        histogram = LatencyHistogram()
+        for millisecond in xrange(1, 101):
+            histogram.record(millisecond / 1000.0)
+        self.assertEqual(100, histogram.count)
+        self.assertEqual(0.1, histogram.max)
+        # Percentiles are upper bounds of buckets growing by 20 %
+        self.assertTrue(0.050 <= histogram.percentile(50) <= 0.050 * 1.2)
+        self.assertTrue(0.095 <= histogram.percentile(95) <= 0.1)
+        self.assertEqual(0.1, histogram.percentile(100))
+
+    def test_histogram_empty(self):
+        self.assertEqual(0.0, LatencyHistogram().percentile(99))
+
+    def test_count_rows(self):
+        self.assertEqual(0, count_rows(None))
+        self.assertEqual(3, count_rows([1, 2, 3]))
+        self.assertEqual(0, count_rows(42))
+        self.assertEqual(2, count_rows(_Cursor(2)))
+        self.assertEqual(0, count_rows(_Cursor(-1)))
+        # Rows of a SELECT statement are not known before they are fetched
+        self.assertIsNone(count_rows(_Cursor(-1, [('id', 3)])))
+        self.assertIsNone(count_rows(_Cursor(0, [('id', 3)])))
+
+    def test_instrument(self):
+        api_stats = ApiStats()
+        add = api_stats.instrument('add', lambda x: [x] * x)
+        self.assertEqual([2, 2], add(2))
+        add(3)
+        with self.assertRaises(TypeError):
+            add(None)
+        report = api_stats.report()['add']
+        self.assertEqual(3, report['calls'])
+        self.assertEqual(1, report['errors'])
+        self.assertEqual(5, report['rows'])
+        select = api_stats.instrument('select', lambda: _Cursor(-1, []))
+        select()
+        self.assertEqual(0, api_stats.report()['select']['rows'])
+        self.assertTrue(report['p99_ms'] <= report['max_ms'])
+        api_stats.reset()
+        self.assertEqual({}, api_stats.report())
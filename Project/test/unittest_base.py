@@ -3,6 +3,9 @@ import unittest
 import mysql.connector as mariadb
 import pandas as pd
 
+from Project.migrations import SCHEMA_VERSION_TABLE, migrate
+from Project.rollups import DAILY_OCCUPANCY_TABLE, DAILY_REVENUE_TABLE, \
+    rebuild_summary_tables
 from Project.util import sql_transaction
 
 
@@ -21,6 +24,7 @@ class SQLUnitTestBase(unittest.TestCase):
         print 'Creating tables'
         self._create_tables(cursor)
         cursor.close()
+        migrate(self._con)
 
     def tearDown(self):
         self._con.close()
@@ -110,6 +114,7 @@ class SQLUnitTestBase(unittest.TestCase):
                 hotel_id INT NOT NULL,
                 room_number SMALLINT UNSIGNED NOT NULL,
                 customer_id INT NOT NULL,
+                INDEX idx_reservations_room_dates (hotel_id, room_number, start_date, end_date),
                 CONSTRAINT fk_reservations_rooms_hotel_id_room_number FOREIGN KEY (hotel_id, room_number) 
                     REFERENCES Rooms(hotel_id, room_number) ON UPDATE CASCADE ON DELETE RESTRICT,
                 CONSTRAINT fk_reservations_customers_id FOREIGN KEY (customer_id) REFERENCES Customers(id) 
@@ -142,6 +147,14 @@ class SQLUnitTestBase(unittest.TestCase):
         self._con.commit()
 
     def _delete_tables(self, cursor):
+        try:
+            cursor.execute('DROP TABLE {}'.format(DAILY_OCCUPANCY_TABLE))
+        except:
+            pass
+        try:
+            cursor.execute('DROP TABLE {}'.format(DAILY_REVENUE_TABLE))
+        except:
+            pass
         try:
             cursor.execute('DROP TABLE Serves')
         except:
@@ -174,6 +187,10 @@ class SQLUnitTestBase(unittest.TestCase):
             cursor.execute('DROP TABLE ZipToCityState')
         except:
             pass
+        try:
+            cursor.execute('DROP TABLE {}'.format(SCHEMA_VERSION_TABLE))
+        except:
+            pass
         self._con.commit()
 
     def _insert_test_data(self):
@@ -383,5 +400,7 @@ class SQLUnitTestBase(unittest.TestCase):
                            "Serves(staff_id, reservation_id)"
                            "VALUES(%s, %s)", row)
 
+        # Test data is inserted without the APIs maintaining the summary
+        rebuild_summary_tables(cursor)
         cursor.close()
         self._con.commit()
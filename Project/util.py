@@ -10,7 +10,9 @@ Description of the util.py file:
 This file provides a library of functions used throughout the project programs.
 It contains two functions that do the following:
 1) sql_transaction() function provides a simple way to wrap code in a SQL
-transaction, that will automatically commit or rollback on an error.
+transaction, that will automatically commit or rollback on an error. The
+transaction may run on a single connection or on a connection checked out of
+a ConnectionPool (pool.py).
 2) print_error() function provides a mechanism to print any exception caught in
 any of the programs.
 
@@ -29,6 +31,7 @@ any of the programs.
 """
 
 from contextlib import contextmanager
+from pool import ConnectionPool
 
 
 @contextmanager
@@ -44,14 +47,25 @@ def sql_transaction(con):
         <sql_operation_1>
         <sql_operation_2>
 
+    If a ConnectionPool is given, a connection is checked out of the pool for
+    the duration of the transaction and returned afterwards:
+    with sql_transaction(pool) as db:
+        <sql_operation_1>
+        <sql_operation_2>
+
     Parameters:
-        :param con: The database connection
+        :param con: The database connection or ConnectionPool
 
     Returns:
-        :return: None
+        :return: The database connection used for the transaction
     """
+    if isinstance(con, ConnectionPool):
+        with con.connection() as pooled_con:
+            with sql_transaction(pooled_con):
+                yield pooled_con
+        return
     try:
-        yield
+        yield con
         con.commit()
     except Exception as e:
         con.rollback()